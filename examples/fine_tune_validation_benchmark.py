@@ -0,0 +1,80 @@
+#!/usr/bin/env -S poetry run python
+
+import os
+import sys
+import json
+import time
+import random
+import resource
+import tempfile
+import subprocess
+from typing import Any, List
+
+# Validates a synthetic JSONL fine-tuning dataset with the validators run on the whole
+# file in memory, and with `validate_chunks()` reading it 100,000 rows at a time. Each
+# runs in its own process, which reports the time taken and its peak memory. No API key
+# or network is needed. The in-memory run of 5M rows needs several GB of memory.
+#
+# You can run this script from the root directory like so:
+# `python examples/fine_tune_validation_benchmark.py [rows]`
+
+WORDS = ["the", "movie", "was", "great", "terrible", "plot", "acting", "Really", "not", "SO", "good", "bad"]
+
+
+def write_dataset(fname: str, rows: int) -> None:
+    rng = random.Random(0)
+    with open(fname, "w") as f:
+        for _ in range(rows):
+            prompt = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 40))) + "\n\n###\n\n"
+            completion = rng.choice([" positive", " negative", " neutral"])
+            f.write(json.dumps({"prompt": prompt, "completion": completion}) + "\n")
+
+
+def validate(mode: str, fname: str) -> None:
+    from aimlapi.lib._validators import get_validators, read_any_format
+    from aimlapi.lib._chunked_validators import read_chunks, validate_chunks
+
+    start = time.perf_counter()
+    remediations: List[Any] = []
+    if mode == "in-memory":
+        df, _ = read_any_format(fname)
+        assert df is not None
+        for validator in get_validators():
+            remediation = validator(df)
+            if remediation is not None:
+                remediations.append(remediation)
+                if remediation.necessary_fn is not None:
+                    df = remediation.necessary_fn(df)
+    else:
+        chunks, _ = read_chunks(fname)
+        assert chunks is not None
+        remediations = validate_chunks(chunks)
+    elapsed = time.perf_counter() - start
+
+    # kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 if sys.platform == "darwin" else 1)
+    print(json.dumps({"seconds": elapsed, "peak_mb": peak / 1024, "remediations": len(remediations)}))
+
+
+def main() -> None:
+    if len(sys.argv) == 4 and sys.argv[1] == "--validate":
+        validate(sys.argv[2], sys.argv[3])
+        return
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = os.path.join(tmp, "dataset.jsonl")
+        write_dataset(fname, rows)
+        size_mb = os.path.getsize(fname) / 1024 / 1024
+        print(f"{rows:,} rows, {size_mb:,.0f} MB")
+
+        for mode in ("in-memory", "chunked"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--validate", mode, fname], check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:>10}: {result['seconds']:7.1f}s, peak memory {result['peak_mb']:,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
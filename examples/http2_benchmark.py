@@ -0,0 +1,65 @@
+#!/usr/bin/env -S poetry run python
+
+import os
+import sys
+import time
+import asyncio
+import tracemalloc
+
+from aimlapi import AsyncAIMLAPI
+
+# Opens many concurrent streaming chat completions over HTTP/1.1 and then over HTTP/2
+# and reports open file descriptors, peak Python memory and connection reuse for each.
+# Requires `pip install aimlapi[http2]` and the AIML_API_KEY environment variable.
+#
+# You can run this script from the root directory like so:
+# `python examples/http2_benchmark.py [concurrency]`
+
+CONCURRENCY = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+
+def open_fds() -> int:
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except FileNotFoundError:
+        return -1
+
+
+async def run(http2: bool) -> None:
+    peak_fds = open_fds()
+
+    async with AsyncAIMLAPI(http2=http2) as client:
+
+        async def one() -> None:
+            nonlocal peak_fds
+            stream = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "Count from 1 to 20."}],
+                stream=True,
+            )
+            async for _ in stream:
+                peak_fds = max(peak_fds, open_fds())
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        stats = client.connection_stats()
+
+    print(
+        f"{'HTTP/2  ' if http2 else 'HTTP/1.1'} {CONCURRENCY} streams in {elapsed:.1f}s: "
+        f"peak fds {peak_fds}, peak memory {peak_memory / 1024 / 1024:.1f}MiB, "
+        f"{stats.connections_opened} connections for {stats.requests} requests "
+        f"({stats.http2_requests} over HTTP/2)"
+    )
+
+
+async def main() -> None:
+    await run(http2=False)
+    await run(http2=True)
+
+
+asyncio.run(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env -S poetry run python
+
+import os
+import time
+import base64
+import asyncio
+from typing import Any, Optional
+
+from aimlapi.resources.realtime import AsyncRealtimeConnection
+
+# Measures the CPU cost of sending microphone audio over a realtime connection with
+# `input_audio_buffer.append()` and with `append_audio()`. It reports how many sessions
+# a single core could feed at 50 frames a second. No network is used, frames go to a
+# websocket stand-in that drops them.
+#
+# You can run this script from the root directory like so:
+# `python examples/realtime_append_benchmark.py`
+
+SAMPLE_RATE = 24_000
+FRAME_MS = 20
+FRAMES_PER_SECOND = 1000 // FRAME_MS
+FRAMES = 20_000
+
+# 20ms of 16-bit mono PCM
+PCM = os.urandom(SAMPLE_RATE * FRAME_MS // 1000 * 2)
+
+
+class NullWebsocket:
+    async def send(self, message: Any, text: Optional[bool] = None) -> None:
+        pass
+
+
+async def generic_append(connection: AsyncRealtimeConnection) -> None:
+    await connection.input_audio_buffer.append(audio=base64.b64encode(PCM).decode())
+
+
+async def fast_append(connection: AsyncRealtimeConnection) -> None:
+    await connection.append_audio(PCM)
+
+
+async def measure(name: str, append: Any) -> None:
+    connection = AsyncRealtimeConnection(NullWebsocket())  # type: ignore[arg-type]
+
+    start = time.process_time()
+    for _ in range(FRAMES):
+        await append(connection)
+    per_frame = (time.process_time() - start) / FRAMES
+
+    sessions = 1 / (per_frame * FRAMES_PER_SECOND)
+    print(f"{name:>26}: {per_frame * 1e6:7.1f}µs per frame, ~{sessions:,.0f} sessions per core")
+
+
+async def main() -> None:
+    print(f"{len(PCM)} byte frames, {FRAMES_PER_SECOND} frames per second per session")
+    await measure("input_audio_buffer.append", generic_append)
+    await measure("append_audio", fast_append)
+
+
+asyncio.run(main())
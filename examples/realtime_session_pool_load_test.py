@@ -0,0 +1,67 @@
+#!/usr/bin/env -S poetry run python
+
+import sys
+import json
+import time
+import asyncio
+import statistics
+from typing import Any, List
+
+from aimlapi import AsyncAIMLAPI
+from aimlapi.resources.realtime import RealtimeSession
+
+# Opens many realtime sessions in one `session_pool()` against a local websocket server
+# that stands in for the realtime endpoint, runs a few responses on each of them at the
+# same time and reports the time to the first delta. No API key or network is needed.
+#
+# You can run this script from the root directory like so:
+# `python examples/realtime_session_pool_load_test.py [sessions] [responses]`
+
+DELTAS = 20
+
+
+async def stand_in(websocket: Any) -> None:
+    await websocket.send(json.dumps({"type": "session.created", "event_id": "e", "session": {"id": "sess"}}))
+    async for message in websocket:
+        if json.loads(message)["type"] != "response.create":
+            continue
+        for i in range(DELTAS):
+            await websocket.send(json.dumps({"type": "response.output_text.delta", "event_id": "e", "delta": str(i)}))
+        await websocket.send(json.dumps({"type": "response.done", "event_id": "e", "response": {}}))
+
+
+async def converse(session: RealtimeSession, responses: int) -> None:
+    for _ in range(responses):
+        await session.response.create()
+        async for event in session:
+            if event.type == "response.done":
+                break
+
+
+async def main() -> None:
+    from websockets.asyncio.server import serve
+
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    responses = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    async with serve(stand_in, "127.0.0.1", 0) as server:
+        host, port = next(iter(server.sockets)).getsockname()[:2]
+        client = AsyncAIMLAPI(api_key="unused", websocket_base_url=f"ws://{host}:{port}")
+
+        async with client.realtime.session_pool(model="gpt-realtime") as pool:
+            opened = [await pool.open() for _ in range(sessions)]
+
+            start = time.perf_counter()
+            await asyncio.gather(*(converse(session, responses) for session in opened))
+            elapsed = time.perf_counter() - start
+
+            latencies: List[float] = [
+                stats.mean_time_to_first_delta for stats in pool.stats() if stats.mean_time_to_first_delta is not None
+            ]
+
+    events = sessions * responses * (DELTAS + 1)
+    print(f"{sessions} sessions x {responses} responses in {elapsed:.2f}s ({events / elapsed:,.0f} events/s)")
+    print(f"time to first delta: median {statistics.median(latencies) * 1000:.2f}ms, max {max(latencies) * 1000:.2f}ms")
+
+
+asyncio.run(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env -S poetry run python
+
+import time
+import asyncio
+
+from aimlapi import AIMLAPI, AsyncAIMLAPI
+
+# Compares the latency of the first request from a fresh client with and without
+# `client.warmup()`. Uses the AIML_API_KEY environment variable.
+#
+# You can run this script from the root directory like so:
+# `python examples/warmup_benchmark.py`
+
+CONNECTIONS = 4
+
+
+def first_request_seconds(client: AIMLAPI) -> float:
+    start = time.perf_counter()
+    client.models.list()
+    return time.perf_counter() - start
+
+
+async def async_first_requests_seconds(client: AsyncAIMLAPI) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(client.models.list() for _ in range(CONNECTIONS)))
+    return time.perf_counter() - start
+
+
+def sync_main() -> None:
+    with AIMLAPI() as client:
+        cold = first_request_seconds(client)
+
+    with AIMLAPI() as client:
+        client.warmup(connections=1)
+        warm = first_request_seconds(client)
+
+    print(f"sync first request:  cold {cold * 1000:.0f}ms, warmed {warm * 1000:.0f}ms")
+
+
+async def async_main() -> None:
+    async with AsyncAIMLAPI() as client:
+        cold = await async_first_requests_seconds(client)
+
+    async with AsyncAIMLAPI() as client:
+        await client.warmup(connections=CONNECTIONS)
+        warm = await async_first_requests_seconds(client)
+
+    print(f"async first {CONNECTIONS} concurrent requests: cold {cold * 1000:.0f}ms, warmed {warm * 1000:.0f}ms")
+
+
+sync_main()
+asyncio.run(async_main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env -S poetry run python
+
+import hmac
+import json
+import time
+import base64
+import hashlib
+from typing import Dict, List, Tuple, Callable
+
+from aimlapi import AIMLAPI
+
+# Compares `client.webhooks.verify_signature()` with a reusable `client.webhooks.verifier()`,
+# one delivery at a time and in batches, on signed synthetic deliveries. No API key or
+# network is needed.
+#
+# You can run this script from the root directory like so:
+# `python examples/webhook_verify_benchmark.py`
+
+SECRET = "whsec_" + base64.b64encode(b"benchmark-secret-benchmark-secret").decode()
+DELIVERIES = 20_000
+BATCH_SIZE = 100
+
+
+def deliveries() -> List[Tuple[bytes, Dict[str, str]]]:
+    key = base64.b64decode(SECRET[6:])
+    timestamp = str(int(time.time()))
+    result: List[Tuple[bytes, Dict[str, str]]] = []
+    for i in range(DELIVERIES):
+        payload = json.dumps(
+            {
+                "id": f"evt_{i}",
+                "object": "event",
+                "created_at": int(timestamp),
+                "type": "response.completed",
+                "data": {"id": f"resp_{i}", "padding": "x" * 512},
+            }
+        ).encode()
+        webhook_id = f"wh_{i}"
+        signature = hmac.new(key, f"{webhook_id}.{timestamp}.".encode() + payload, hashlib.sha256).digest()
+        headers = {
+            "webhook-id": webhook_id,
+            "webhook-timestamp": timestamp,
+            "webhook-signature": f"v1,{base64.b64encode(signature).decode()}",
+        }
+        result.append((payload, headers))
+    return result
+
+
+def report(name: str, run: Callable[[], None]) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {DELIVERIES / elapsed:>10,.0f} deliveries/s")
+
+
+def main() -> None:
+    client = AIMLAPI(api_key="unused", webhook_secret=SECRET)
+    requests = deliveries()
+
+    def verify_signature() -> None:
+        for payload, headers in requests:
+            client.webhooks.verify_signature(payload, headers)
+
+    def verifier() -> None:
+        verifier = client.webhooks.verifier()
+        for payload, headers in requests:
+            verifier.verify(payload, headers)
+
+    def verify_many() -> None:
+        verifier = client.webhooks.verifier()
+        for start in range(0, len(requests), BATCH_SIZE):
+            assert not any(verifier.verify_many(requests[start : start + BATCH_SIZE]))
+
+    def unwrap() -> None:
+        for payload, headers in requests:
+            client.webhooks.unwrap(payload, headers)
+
+    def unwrap_many() -> None:
+        verifier = client.webhooks.verifier()
+        for start in range(0, len(requests), BATCH_SIZE):
+            verifier.unwrap_many(requests[start : start + BATCH_SIZE])
+
+    report("webhooks.verify_signature()", verify_signature)
+    report("verifier.verify()", verifier)
+    report(f"verifier.verify_many({BATCH_SIZE})", verify_many)
+    report("webhooks.unwrap()", unwrap)
+    report(f"verifier.unwrap_many({BATCH_SIZE})", unwrap_many)
+
+
+main()
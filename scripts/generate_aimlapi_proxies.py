@@ -4,11 +4,19 @@ from __future__ import annotations
 
 from pathlib import Path
 
+# Served at import time by `aimlapi._aliases`, so only `.pyi` stubs are written for these
+# to let type checkers resolve the aliased submodules.
+ALIASED_PACKAGES = {"types"}
+
 
 def build_proxy_content(module: str) -> str:
     return f"from __future__ import annotations\n\nfrom {module} import *  # noqa: F401, F403\n"
 
 
+def build_stub_content(module: str) -> str:
+    return f"from {module} import *  # noqa: F401, F403\n"
+
+
 def main() -> None:
     repo_root = Path(__file__).resolve().parents[1]
     openai_root = repo_root / "src" / "openai"
@@ -24,7 +32,12 @@ def main() -> None:
         if rel_path == Path("__init__.py"):
             continue
 
-        target_path = aimlapi_root / rel_path
+        aliased = rel_path.parts[0] in ALIASED_PACKAGES
+        # the aliased package roots are maintained by hand
+        if aliased and len(rel_path.parts) == 2 and src_path.name == "__init__.py":
+            continue
+
+        target_path = aimlapi_root / (rel_path.with_suffix(".pyi") if aliased else rel_path)
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
         if src_path.name == "__init__.py":
@@ -37,7 +50,7 @@ def main() -> None:
             module_path = rel_path.with_suffix("")
             module = f"openai.{module_path.as_posix().replace('/', '.')}"
 
-        content = build_proxy_content(module)
+        content = build_stub_content(module) if aliased else build_proxy_content(module)
 
         if target_path.exists() and target_path.read_text() == content:
             continue
@@ -9,7 +9,8 @@ from __future__ import annotations
 import os
 import sys
 import types as _types
-from typing import Any, Mapping
+import importlib
+from typing import TYPE_CHECKING, Any, Mapping
 
 import httpx
 
@@ -37,6 +38,11 @@ from ._client import (  # noqa: F401
 )
 from ._version import __title__, __version__  # noqa: F401
 
+if TYPE_CHECKING:
+    from ._tokens import TokenEstimator as TokenEstimator
+    from ._model_router import ModelStats as ModelStats, ModelRouter as ModelRouter
+    from .resources._embedding_cache import EmbeddingCache as EmbeddingCache, EmbeddingCacheStats as EmbeddingCacheStats
+
 AzureOpenAI = AzureAIMLAPI
 AsyncAzureOpenAI = AsyncAzureAIMLAPI
 AzureClient = AzureAIMLAPI
@@ -140,6 +146,11 @@ __all__ = list(
             "AsyncAzureOpenAI",
             "AzureClient",
             "AsyncAzureClient",
+            "EmbeddingCache",
+            "EmbeddingCacheStats",
+            "ModelRouter",
+            "ModelStats",
+            "TokenEstimator",
             "api_key",
             "organization",
             "project",
@@ -160,7 +171,22 @@ def __dir__() -> list[str]:
     return sorted(set(__all__))
 
 
+# exports that pull in heavier modules, resolved on first access
+_LAZY_ATTRS = {
+    "EmbeddingCache": ".resources._embedding_cache",
+    "EmbeddingCacheStats": ".resources._embedding_cache",
+    "ModelRouter": "._model_router",
+    "ModelStats": "._model_router",
+    "TokenEstimator": "._tokens",
+}
+
+
 def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+
     if hasattr(_openai, name):
         return getattr(_openai, name)
 
@@ -1,3 +1,3 @@
-from __future__ import annotations
+from .cli import main
 
-from openai.__main__ import *  # noqa: F401, F403
+main()
@@ -0,0 +1,82 @@
+"""Serve `aimlapi` submodules that add nothing on top of `openai` as the `openai` modules themselves."""
+
+from __future__ import annotations
+
+import sys
+import importlib
+import importlib.abc
+import importlib.machinery
+from types import ModuleType
+from typing import Dict, Optional, Sequence
+from typing_extensions import override
+
+__all__ = ["install_alias"]
+
+
+class _AliasFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Resolves `<alias>.x.y` imports to the already importable `<target>.x.y` module object.
+
+    The target module is imported (and executed) once under its own name; the alias name is
+    just another `sys.modules` entry pointing at the same object, so classes are identical
+    across both namespaces.
+    """
+
+    def __init__(self) -> None:
+        # alias prefix -> target prefix
+        self._prefixes: Dict[str, str] = {}
+
+    def add(self, alias: str, target: str) -> None:
+        self._prefixes[alias] = target
+
+    def _target_name(self, fullname: str) -> Optional[str]:
+        for alias, target in self._prefixes.items():
+            if fullname.startswith(alias + "."):
+                return target + fullname[len(alias) :]
+        return None
+
+    @override
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],  # noqa: ARG002
+        target: Optional[ModuleType] = None,  # noqa: ARG002
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        target_name = self._target_name(fullname)
+        if target_name is None:
+            return None
+
+        try:
+            module = importlib.import_module(target_name)
+        except ModuleNotFoundError as err:
+            if err.name != target_name:
+                raise
+            return None
+
+        return importlib.machinery.ModuleSpec(
+            fullname,
+            self,
+            loader_state=(module, module.__spec__),
+            is_package=hasattr(module, "__path__"),
+        )
+
+    @override
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> ModuleType:
+        module, _ = spec.loader_state
+        return module
+
+    @override
+    def exec_module(self, module: ModuleType) -> None:
+        # the import machinery points `__spec__` at the alias spec, restore the module's own
+        spec = module.__spec__
+        if spec is not None and spec.loader is self:
+            _, module.__spec__ = spec.loader_state
+
+
+_finder = _AliasFinder()
+
+
+def install_alias(alias: str, target: str) -> None:
+    """Make `import <alias>.x` return the `<target>.x` module object."""
+    _finder.add(alias, target)
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder)
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import re
+import time
+import threading
+from typing import List, Tuple, Union, Callable, Iterator, Optional, Sequence, AsyncIterator
+from dataclasses import dataclass
+from typing_extensions import Literal, override
+
+import httpx
+
+__all__ = ["Target", "TargetStats", "BalanceStrategy", "TargetPool", "BalancingTransport", "AsyncBalancingTransport"]
+
+BalanceStrategy = Literal["least_outstanding", "rate_limit"]
+
+DEFAULT_EVICTION_COOLDOWN = 30.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+@dataclass(frozen=True)
+class Target:
+    api_key: str
+    base_url: str
+
+
+@dataclass(frozen=True)
+class TargetStats:
+    base_url: str
+    requests: int
+    failures: int
+    outstanding: int
+    remaining_requests: Optional[int]
+    evicted_for: float
+    """Seconds until the target is used again, `0.0` when it is available."""
+
+
+def _parse_duration(value: str | None) -> Optional[float]:
+    """Parse rate limit reset values such as `1s`, `6m0s` or `250ms`."""
+    if not value:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _parse_int(value: str | None) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class _TargetState:
+    def __init__(self, target: Target) -> None:
+        self.target = target
+        self.url = httpx.URL(target.base_url.rstrip("/") + "/")
+        self.authorization = f"Bearer {target.api_key}"
+        self.requests = 0
+        self.failures = 0
+        self.outstanding = 0
+        self.remaining_requests: Optional[int] = None
+        self.evicted_until = 0.0
+
+
+class TargetPool:
+    """Spreads requests over several `(api_key, base_url)` targets.
+
+    Targets answering with a 429, a 5xx or a connection error are skipped until their
+    cooldown ends; a 429 uses the server's reset hint when there is one.
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[Union[Target, Tuple[str, str]]],
+        *,
+        strategy: BalanceStrategy = "least_outstanding",
+        eviction_cooldown: float = DEFAULT_EVICTION_COOLDOWN,
+    ) -> None:
+        if not targets:
+            raise ValueError("At least one target is required")
+        if strategy not in ("least_outstanding", "rate_limit"):
+            raise ValueError(f"Unknown balance strategy {strategy!r}")
+
+        self._states = [_TargetState(t if isinstance(t, Target) else Target(*t)) for t in targets]
+        self._strategy = strategy
+        self._cooldown = eviction_cooldown
+        self._lock = threading.Lock()
+        # rotates ties so equally loaded targets take turns
+        self._turn = 0
+
+    @property
+    def primary(self) -> Target:
+        return self._states[0].target
+
+    def _sort_key(self, state: _TargetState) -> Tuple[float, ...]:
+        if self._strategy == "rate_limit":
+            # targets that have not reported a budget yet are tried first
+            remaining = float("inf") if state.remaining_requests is None else state.remaining_requests
+            return (-remaining, state.outstanding)
+        return (state.outstanding,)
+
+    def acquire(self) -> _TargetState:
+        with self._lock:
+            now = time.monotonic()
+            available = [state for state in self._states if state.evicted_until <= now]
+            if available:
+                count = len(available)
+                start = self._turn % count
+                self._turn += 1
+                rotated = available[start:] + available[:start]
+                state = min(rotated, key=self._sort_key)
+            else:
+                # everything is evicted, the one that recovers first is the best bet
+                state = min(self._states, key=lambda s: s.evicted_until)
+
+            self._hold(state)
+            return state
+
+    def _hold(self, state: _TargetState) -> None:
+        state.outstanding += 1
+        state.requests += 1
+
+    def release(self, state: _TargetState) -> None:
+        with self._lock:
+            state.outstanding -= 1
+
+    def record_response(self, state: _TargetState, response: httpx.Response) -> None:
+        headers = response.headers
+        with self._lock:
+            remaining = _parse_int(headers.get("x-ratelimit-remaining-requests"))
+            if remaining is not None:
+                state.remaining_requests = remaining
+
+            if response.status_code == 429:
+                cooldown = _parse_duration(headers.get("retry-after")) or _parse_duration(
+                    headers.get("x-ratelimit-reset-requests")
+                )
+                self._evict(state, self._cooldown if cooldown is None else cooldown)
+            elif response.status_code >= 500:
+                self._evict(state, self._cooldown)
+            elif remaining == 0:
+                reset = _parse_duration(headers.get("x-ratelimit-reset-requests"))
+                if reset is not None:
+                    state.evicted_until = time.monotonic() + reset
+
+    def record_error(self, state: _TargetState) -> None:
+        with self._lock:
+            self._evict(state, self._cooldown)
+
+    def _evict(self, state: _TargetState, seconds: float) -> None:
+        state.failures += 1
+        state.evicted_until = time.monotonic() + seconds
+
+    def stats(self) -> List[TargetStats]:
+        with self._lock:
+            now = time.monotonic()
+            return [
+                TargetStats(
+                    base_url=state.target.base_url,
+                    requests=state.requests,
+                    failures=state.failures,
+                    outstanding=state.outstanding,
+                    remaining_requests=state.remaining_requests,
+                    evicted_for=max(state.evicted_until - now, 0.0),
+                )
+                for state in self._states
+            ]
+
+    def route(self, request: httpx.Request) -> _TargetState:
+        """Pick a target for a request built against the primary target and point it there.
+
+        Only requests under the primary base URL can be moved; anything else, such as the
+        `/files` uploads that leave out `/v1`, stays on the primary and is counted there.
+        """
+        primary = self._states[0]
+        url = str(request.url)
+        prefix = str(primary.url)
+        if not url.startswith(prefix):
+            with self._lock:
+                self._hold(primary)
+            return primary
+
+        state = self.acquire()
+        if state is not primary:
+            request.url = httpx.URL(str(state.url) + url[len(prefix) :])
+            request.headers["Host"] = request.url.netloc.decode("ascii")
+        if "Authorization" in request.headers:
+            request.headers["Authorization"] = state.authorization
+        return state
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    @override
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    @override
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    @override
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    @override
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class BalancingTransport(httpx.BaseTransport):
+    def __init__(self, pool: TargetPool, transport: httpx.BaseTransport) -> None:
+        self.pool = pool
+        self._transport = transport
+
+    @override
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        state = self.pool.route(request)
+        try:
+            response = self._transport.handle_request(request)
+        except httpx.TransportError:
+            self.pool.record_error(state)
+            self.pool.release(state)
+            raise
+        except BaseException:
+            self.pool.release(state)
+            raise
+
+        self.pool.record_response(state, response)
+        # the request stays outstanding until its body has been read or the stream is closed
+        response.stream = _ReleasingStream(
+            response.stream,  # type: ignore[arg-type]
+            lambda: self.pool.release(state),
+        )
+        return response
+
+    @override
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncBalancingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, pool: TargetPool, transport: httpx.AsyncBaseTransport) -> None:
+        self.pool = pool
+        self._transport = transport
+
+    @override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        state = self.pool.route(request)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            self.pool.record_error(state)
+            self.pool.release(state)
+            raise
+        except BaseException:
+            self.pool.release(state)
+            raise
+
+        self.pool.record_response(state, response)
+        response.stream = _AsyncReleasingStream(
+            response.stream,  # type: ignore[arg-type]
+            lambda: self.pool.release(state),
+        )
+        return response
+
+    @override
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import uuid
+import itertools
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Set,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Mapping,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    cast,
+)
+from pathlib import Path
+from dataclasses import dataclass
+
+import anyio
+import httpx
+
+from openai._utils import is_dict
+from openai._models import FinalRequestOptions
+from openai._exceptions import APIStatusError, APIConnectionError
+from openai._utils._sync import to_thread
+
+if TYPE_CHECKING:
+    from ._client import AsyncAIMLAPI
+
+__all__ = ["BatchExecution", "execute_batch"]
+
+_CONNECTION_ERROR = "connection_error"
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+BatchInput = Union[str, "os.PathLike[str]", Iterable[Mapping[str, Any]]]
+
+
+@dataclass
+class BatchExecution:
+    output: Path
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+class _RateLimiter:
+    """Spaces out request starts so that no more than `rate` begin per second."""
+
+    def __init__(self, rate: float | None) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self._interval = 0.0 if rate is None else 1.0 / rate
+        self._next_start = 0.0
+        self._lock = anyio.Lock()
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+
+        if delay > 0:
+            await anyio.sleep(delay)
+
+
+def _iter_requests(requests: BatchInput) -> Iterator[Mapping[str, Any]]:
+    if not isinstance(requests, (str, os.PathLike)):
+        yield from requests
+        return
+
+    with open(requests, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _take(requests: Iterator[Mapping[str, Any]], count: int) -> List[Mapping[str, Any]]:
+    return list(itertools.islice(requests, count))
+
+
+def _append(out: IO[str], lines: List[str]) -> None:
+    out.writelines(lines)
+    # the output file doubles as the checkpoint, so persist every line
+    out.flush()
+
+
+def _truncate_partial_line(output: Path) -> None:
+    """Drop a trailing record that was cut short by a crash so it is written again in full."""
+    with open(output, "rb+") as f:
+        end = position = f.seek(0, os.SEEK_END)
+        keep = 0
+        while position > 0:
+            start = max(0, position - _TAIL_BLOCK_SIZE)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b"\n")
+            if newline != -1:
+                keep = start + newline + 1
+                break
+            position = start
+
+        if keep != end:
+            f.truncate(keep)
+
+
+def _parse_record(line: str) -> Optional[Dict[str, Any]]:
+    """Returns the record on `line`, or `None` if its request has to be sent again."""
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError:
+        # written by a run that appended after a cut off line
+        return None
+
+    error = record.get("error")
+    if is_dict(error) and error.get("code") == _CONNECTION_ERROR:
+        # the request never got a response, so it is retried rather than checkpointed
+        return None
+    return cast(Dict[str, Any], record)
+
+
+def _resume_output(output: Path) -> Set[str]:
+    """Prepare the output of a previous, possibly interrupted, run for appending.
+
+    Returns the custom ids that already have a final result. Records that will be retried
+    are removed from the file so that every custom id ends up with exactly one record.
+    """
+    done: Set[str] = set()
+    if not output.exists():
+        return done
+
+    _truncate_partial_line(output)
+
+    retried = False
+    with open(output, "r", encoding="utf-8") as f:
+        for line in f:
+            record = _parse_record(line)
+            if record is None:
+                retried = True
+            else:
+                done.add(record["custom_id"])
+
+    if retried:
+        tmp_path = output.with_name(output.name + ".tmp")
+        with open(output, "r", encoding="utf-8") as src, open(tmp_path, "w", encoding="utf-8") as dst:
+            dst.writelines(line for line in src if _parse_record(line) is not None)
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_path, output)
+
+    return done
+
+
+def _request_path(url: str) -> str:
+    # input files use `/v1/...` urls while the client base URL already ends in `/v1`
+    return url[len("/v1") :] if url.startswith("/v1/") else url
+
+
+def _result_line(custom_id: str, *, response: Optional[Dict[str, Any]], error: Optional[Dict[str, Any]]) -> str:
+    record = {
+        "id": f"batch_req_{uuid.uuid4().hex}",
+        "custom_id": custom_id,
+        "response": response,
+        "error": error,
+    }
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def _response_body(response: httpx.Response) -> object:
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+def _build_options(request: Mapping[str, Any]) -> FinalRequestOptions:
+    return FinalRequestOptions.construct(
+        method=str(request.get("method", "POST")).lower(),
+        url=_request_path(str(request["url"])),
+        json_data=request.get("body"),
+    )
+
+
+async def execute_batch(
+    client: AsyncAIMLAPI,
+    requests: BatchInput,
+    *,
+    output: Union[str, "os.PathLike[str]"],
+    concurrency: int = 16,
+    rate: float | None = None,
+    progress_callback: Callable[[BatchExecution], None] | None = None,
+) -> BatchExecution:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    output_path = Path(output)
+    result = BatchExecution(output=output_path)
+    # file I/O runs in worker threads so that it doesn't hold up the requests in flight
+    done = await to_thread(_resume_output, output_path)
+    limiter = anyio.Semaphore(concurrency)
+    pacer = _RateLimiter(rate)
+
+    # (result line, whether the request succeeded)
+    send_lines, receive_lines = anyio.create_memory_object_stream[Tuple[str, bool]](concurrency)
+
+    async def write_lines(out: IO[str]) -> None:
+        async with receive_lines:
+            async for first in receive_lines:
+                # everything that finished while the last lines were written goes out in one go
+                finished = [first]
+                while True:
+                    try:
+                        finished.append(receive_lines.receive_nowait())
+                    except (anyio.WouldBlock, anyio.EndOfStream):
+                        break
+                await to_thread(_append, out, [line for line, _ in finished])
+
+                # only count results once they are checkpointed
+                for _, succeeded in finished:
+                    if succeeded:
+                        result.succeeded += 1
+                    else:
+                        result.failed += 1
+                    if progress_callback is not None:
+                        progress_callback(result)
+
+    async def run(request: Mapping[str, Any]) -> None:
+        try:
+            # the slot is held until the writer takes the line, so a slow disk holds back new requests
+            await send_lines.send(await send(request))
+        finally:
+            limiter.release()
+
+    async def send(request: Mapping[str, Any]) -> Tuple[str, bool]:
+        custom_id = str(request["custom_id"])
+        try:
+            await pacer.wait()
+            response = await client.request(httpx.Response, _build_options(request))
+        except APIStatusError as err:
+            succeeded = False
+            line = _result_line(
+                custom_id,
+                response={
+                    "status_code": err.status_code,
+                    "request_id": err.request_id,
+                    "body": _response_body(err.response),
+                },
+                error=None,
+            )
+        except APIConnectionError as err:
+            succeeded = False
+            line = _result_line(custom_id, response=None, error={"code": _CONNECTION_ERROR, "message": str(err)})
+        else:
+            succeeded = True
+            line = _result_line(
+                custom_id,
+                response={
+                    "status_code": response.status_code,
+                    "request_id": response.headers.get("x-request-id"),
+                    "body": _response_body(response),
+                },
+                error=None,
+            )
+        return line, succeeded
+
+    out = await to_thread(lambda: open(output_path, "a", encoding="utf-8"))
+    try:
+        async with anyio.create_task_group() as writer:
+            writer.start_soon(write_lines, out)
+            async with send_lines, anyio.create_task_group() as tg:
+                pending = _iter_requests(requests)
+                # reading and parsing the input happens in a thread too, `concurrency` requests at a time
+                while batch := await to_thread(_take, pending, concurrency):
+                    for request in batch:
+                        if str(request["custom_id"]) in done:
+                            result.skipped += 1
+                            if progress_callback is not None:
+                                progress_callback(result)
+                            continue
+
+                        # acquire before spawning so that only `concurrency` requests are held in memory
+                        await limiter.acquire()
+                        tg.start_soon(run, request)
+    finally:
+        await to_thread(out.close)
+
+    return result
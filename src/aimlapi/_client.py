@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List, Tuple, Union, Callable, Optional, cast
 from collections.abc import Sequence, MutableMapping
 from typing_extensions import override
 
+import anyio
+import httpx
+
+from openai._types import NotGiven, not_given
 from openai._client import (
     OpenAI as _OpenAI,
     AsyncOpenAI as _AsyncOpenAI,
@@ -16,13 +20,23 @@ from openai._client import (
 from openai._compat import cached_property
 from openai._models import FinalRequestOptions
 from openai.lib.azure import AzureOpenAI as _AzureOpenAI, AsyncAzureOpenAI as _AsyncAzureOpenAI
+from openai._base_client import SyncAPIClient, AsyncAPIClient
+
+from ._connection_stats import ConnectionStats, counter_for, target_pool_for
 
 if TYPE_CHECKING:
+    from ._balancer import Target, TargetPool, TargetStats, BalanceStrategy
     from .resources.chat import Chat as _AimlChat, AsyncChat as _AimlAsyncChat
+    from ._batch_executor import BatchInput, BatchExecution
     from .resources.audio import Audio as _AimlAudio, AsyncAudio as _AimlAsyncAudio
     from .resources.images import Images as _AimlImages, AsyncImages as _AimlAsyncImages
+    from .resources.models import Models as _AimlModels, AsyncModels as _AimlAsyncModels
     from .resources.videos import Videos as _AimlVideos, AsyncVideos as _AimlAsyncVideos
+    from .resources.batches import Batches as _AimlBatches, AsyncBatches as _AimlAsyncBatches
     from .resources.uploads import Uploads as _AimlUploads, AsyncUploads as _AimlAsyncUploads
+    from .resources.realtime import Realtime as _AimlRealtime, AsyncRealtime as _AimlAsyncRealtime
+    from .resources.webhooks import Webhooks as _AimlWebhooks, AsyncWebhooks as _AimlAsyncWebhooks
+    from .resources.embeddings import Embeddings as _AimlEmbeddings, AsyncEmbeddings as _AimlAsyncEmbeddings
 
 DEFAULT_BASE_URL = "https://api.aimlapi.com/v1"
 AZURE_DEFAULT_BASE_URL = "https://api.aimlapi.com/openai/"
@@ -61,6 +75,31 @@ def _apply_default_client_options(
     kwargs["default_headers"] = {**default_headers, **AIMLAPI_HEADERS}
 
 
+def _apply_targets(
+    kwargs: dict[str, Any],
+    targets: Optional[Sequence[Union[Target, Tuple[str, str]]]],
+    balance: BalanceStrategy,
+) -> Optional[TargetPool]:
+    if targets is None:
+        return None
+
+    if kwargs.get("api_key") is not None or kwargs.get("base_url") is not None:
+        raise ValueError("The `targets` argument replaces `api_key` and `base_url`, pass only one of them")
+
+    from ._balancer import TargetPool
+
+    pool = TargetPool(targets, strategy=balance)
+    # requests are built against the first target and re-routed per request by the transport
+    kwargs["api_key"] = pool.primary.api_key
+    kwargs["base_url"] = pool.primary.base_url
+    return pool
+
+
+def _uses_transport_options(http2: bool, pool: Optional[TargetPool], max_streams_per_host: Optional[int]) -> bool:
+    # the transports and the balancer are only imported for the clients that use them
+    return http2 or pool is not None or max_streams_per_host is not None
+
+
 def _scrub_schema_fields(value: object) -> None:
     if isinstance(value, MutableMapping):
         value.pop("title", None)
@@ -107,17 +146,125 @@ class _ToolSchemaCleanupMixin:
         _prepare_tool_schemas(options)
 
 
-class AIMLAPI(_ToolSchemaCleanupMixin, _OpenAI):
+def _validate_warmup_connections(connections: int) -> None:
+    if connections < 1:
+        raise ValueError("connections must be at least 1")
+
+
+class _WarmupMixin:
+    """Opens keep-alive connections ahead of the first real request."""
+
+    def warmup(self, connections: int = 1, *, timeout: float | httpx.Timeout | None | NotGiven = not_given) -> int:
+        """Pay DNS, TCP and TLS setup for `connections` connections to the API host up front.
+
+        Sends that many concurrent, unauthenticated `HEAD` requests to the base URL; the
+        status code does not matter, only that the connection ends up idle in the pool.
+        Over HTTP/2 every request is multiplexed on a single connection. Failures are not
+        raised, the return value is the number of requests that reached the server.
+        """
+        _validate_warmup_connections(connections)
+        client = cast(SyncAPIClient, self)
+        request_timeout = client.timeout if isinstance(timeout, NotGiven) else timeout
+
+        def probe(_: int) -> bool:
+            try:
+                client._client.request("HEAD", client.base_url, timeout=request_timeout)
+            except httpx.HTTPError:
+                return False
+            return True
+
+        if connections == 1:
+            return int(probe(0))
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="aimlapi-warmup") as pool:
+            return sum(pool.map(probe, range(connections)))
+
+
+class _AsyncWarmupMixin:
+    """Opens keep-alive connections ahead of the first real request."""
+
+    async def warmup(
+        self, connections: int = 1, *, timeout: float | httpx.Timeout | None | NotGiven = not_given
+    ) -> int:
+        """Pay DNS, TCP and TLS setup for `connections` connections to the API host up front.
+
+        Sends that many concurrent, unauthenticated `HEAD` requests to the base URL; the
+        status code does not matter, only that the connection ends up idle in the pool.
+        Over HTTP/2 every request is multiplexed on a single connection. Failures are not
+        raised, the return value is the number of requests that reached the server.
+        """
+        _validate_warmup_connections(connections)
+        client = cast(AsyncAPIClient, self)
+        request_timeout = client.timeout if isinstance(timeout, NotGiven) else timeout
+        results: List[bool] = []
+
+        async def probe() -> None:
+            try:
+                await client._client.request("HEAD", client.base_url, timeout=request_timeout)
+            except httpx.HTTPError:
+                results.append(False)
+            else:
+                results.append(True)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(connections):
+                tg.start_soon(probe)
+
+        return sum(results)
+
+
+class AIMLAPI(_ToolSchemaCleanupMixin, _WarmupMixin, _OpenAI):
     """Synchronous client for the AIML API."""
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        http2: bool = False,
+        max_streams_per_host: Optional[int] = None,
+        targets: Optional[Sequence[Union[Target, Tuple[str, str]]]] = None,
+        balance: BalanceStrategy = "least_outstanding",
+        **kwargs: Any,
+    ) -> None:
+        """Construct a new synchronous AIMLAPI client.
+
+        Pass `http2=True` to multiplex requests over a single HTTP/2 connection per host,
+        this needs the `h2` package (`pip install aimlapi[http2]`) and falls back to
+        HTTP/1.1 with a warning when it is missing.
+        `max_streams_per_host` caps the requests in flight to each host, streams included,
+        which with HTTP/2 is the number of streams multiplexed over its connection.
+
+        Pass `targets=[(api_key, base_url), ...]` instead of `api_key` / `base_url` to spread
+        requests over several keys or regional endpoints. `balance="least_outstanding"`
+        picks the target with the fewest requests in flight, `balance="rate_limit"` the one
+        with the most remaining requests according to the `x-ratelimit-*` headers. Targets
+        that are throttled or failing are skipped until they cool down.
+        """
+        pool = _apply_targets(kwargs, targets, balance)
         _apply_default_client_options(kwargs)
+        if _uses_transport_options(http2, pool, max_streams_per_host):
+            from ._connections import apply_transport_options
+
+            apply_transport_options(kwargs, http2=http2, pool=pool, max_streams_per_host=max_streams_per_host)
         super().__init__(*args, **kwargs)
+        self._connection_counter = counter_for(self._client)
+        self._target_pool = target_pool_for(self._client)
+
+    def connection_stats(self) -> ConnectionStats:
+        """Requests sent and connections opened by this client's connection pool so far."""
+        return self._connection_counter.stats()
+
+    def target_stats(self) -> List[TargetStats]:
+        """Per target load and health when the client was created with `targets`."""
+        return self._target_pool.stats() if self._target_pool is not None else []
 
     @override
     def _build_request(self, options: FinalRequestOptions, *, retries_taken: int = 0):
         self._cleanup_request(options)
-        return super()._build_request(options, retries_taken=retries_taken)
+        request = super()._build_request(options, retries_taken=retries_taken)
+        request.extensions["trace"] = self._connection_counter.chain(request.extensions.get("trace"))
+        return request
 
     @cached_property
     def chat(self) -> "_AimlChat":
@@ -137,12 +284,36 @@ class AIMLAPI(_ToolSchemaCleanupMixin, _OpenAI):
 
         return _AimlAudioImpl(self)
 
+    @cached_property
+    def batches(self) -> "_AimlBatches":  # type: ignore[override]
+        from .resources.batches import Batches as _AimlBatchesImpl
+
+        return _AimlBatchesImpl(self)
+
+    @cached_property
+    def embeddings(self) -> "_AimlEmbeddings":  # type: ignore[override]
+        from .resources.embeddings import Embeddings as _AimlEmbeddingsImpl
+
+        return _AimlEmbeddingsImpl(self)
+
+    @cached_property
+    def models(self) -> "_AimlModels":  # type: ignore[override]
+        from .resources.models import Models as _AimlModelsImpl
+
+        return _AimlModelsImpl(self)
+
     @cached_property
     def images(self) -> "_AimlImages":  # type: ignore[override]
         from .resources.images import Images as _AimlImagesImpl
 
         return _AimlImagesImpl(self)
 
+    @cached_property
+    def realtime(self) -> "_AimlRealtime":  # type: ignore[override]
+        from .resources.realtime import Realtime as _AimlRealtimeImpl
+
+        return _AimlRealtimeImpl(self)
+
     @cached_property
     def uploads(self) -> "_AimlUploads":
         from .resources.uploads import Uploads as _AimlUploadsImpl
@@ -155,18 +326,99 @@ class AIMLAPI(_ToolSchemaCleanupMixin, _OpenAI):
 
         return _AimlVideosImpl(self)
 
+    @cached_property
+    def webhooks(self) -> "_AimlWebhooks":
+        from .resources.webhooks import Webhooks as _AimlWebhooksImpl
+
+        return _AimlWebhooksImpl(self)
+
 
-class AsyncAIMLAPI(_ToolSchemaCleanupMixin, _AsyncOpenAI):
+class AsyncAIMLAPI(_ToolSchemaCleanupMixin, _AsyncWarmupMixin, _AsyncOpenAI):
     """Asynchronous client for the AIML API."""
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        http2: bool = False,
+        max_streams_per_host: Optional[int] = None,
+        targets: Optional[Sequence[Union[Target, Tuple[str, str]]]] = None,
+        balance: BalanceStrategy = "least_outstanding",
+        **kwargs: Any,
+    ) -> None:
+        """Construct a new async AIMLAPI client.
+
+        Pass `http2=True` to multiplex requests over a single HTTP/2 connection per host,
+        this needs the `h2` package (`pip install aimlapi[http2]`) and falls back to
+        HTTP/1.1 with a warning when it is missing.
+        `max_streams_per_host` caps the requests in flight to each host, streams included,
+        which with HTTP/2 is the number of streams multiplexed over its connection.
+
+        Pass `targets=[(api_key, base_url), ...]` instead of `api_key` / `base_url` to spread
+        requests over several keys or regional endpoints. `balance="least_outstanding"`
+        picks the target with the fewest requests in flight, `balance="rate_limit"` the one
+        with the most remaining requests according to the `x-ratelimit-*` headers. Targets
+        that are throttled or failing are skipped until they cool down.
+        """
+        pool = _apply_targets(kwargs, targets, balance)
         _apply_default_client_options(kwargs)
+        if _uses_transport_options(http2, pool, max_streams_per_host):
+            from ._connections import apply_async_transport_options
+
+            apply_async_transport_options(kwargs, http2=http2, pool=pool, max_streams_per_host=max_streams_per_host)
         super().__init__(*args, **kwargs)
+        self._connection_counter = counter_for(self._client)
+        self._target_pool = target_pool_for(self._client)
+
+    def connection_stats(self) -> ConnectionStats:
+        """Requests sent and connections opened by this client's connection pool so far."""
+        return self._connection_counter.stats()
+
+    def target_stats(self) -> List[TargetStats]:
+        """Per target load and health when the client was created with `targets`."""
+        return self._target_pool.stats() if self._target_pool is not None else []
+
+    async def batch_execute(
+        self,
+        requests: BatchInput,
+        *,
+        output: str | os.PathLike[str],
+        concurrency: int = 16,
+        rate: float | None = None,
+        progress_callback: Callable[[BatchExecution], None] | None = None,
+    ) -> BatchExecution:
+        """Run Batch API style requests locally with bounded concurrency.
+
+        `requests` is a path to a JSONL file in the `batches.create` input format, or an
+        iterable of the same records. Results are appended to `output` in the Batch API
+        output format as each request finishes; the output file also serves as the
+        checkpoint, so re-running with the same `output` skips finished `custom_id`s.
+        Requests that failed with a connection error are not checkpointed and are sent
+        again on the next run.
+
+        Args:
+            concurrency: The maximum number of requests in flight at once.
+
+            rate: The maximum number of requests started per second.
+
+            progress_callback: Called with the counts so far each time a request finishes or is skipped.
+        """
+        from ._batch_executor import execute_batch
+
+        return await execute_batch(
+            self,
+            requests,
+            output=output,
+            concurrency=concurrency,
+            rate=rate,
+            progress_callback=progress_callback,
+        )
 
     @override
     def _build_request(self, options: FinalRequestOptions, *, retries_taken: int = 0):
         self._cleanup_request(options)
-        return super()._build_request(options, retries_taken=retries_taken)
+        request = super()._build_request(options, retries_taken=retries_taken)
+        request.extensions["trace"] = self._connection_counter.achain(request.extensions.get("trace"))
+        return request
 
     @cached_property
     def chat(self) -> "_AimlAsyncChat":
@@ -186,12 +438,36 @@ class AsyncAIMLAPI(_ToolSchemaCleanupMixin, _AsyncOpenAI):
 
         return _AimlAsyncAudioImpl(self)
 
+    @cached_property
+    def batches(self) -> "_AimlAsyncBatches":  # type: ignore[override]
+        from .resources.batches import AsyncBatches as _AimlAsyncBatchesImpl
+
+        return _AimlAsyncBatchesImpl(self)
+
+    @cached_property
+    def embeddings(self) -> "_AimlAsyncEmbeddings":  # type: ignore[override]
+        from .resources.embeddings import AsyncEmbeddings as _AimlAsyncEmbeddingsImpl
+
+        return _AimlAsyncEmbeddingsImpl(self)
+
+    @cached_property
+    def models(self) -> "_AimlAsyncModels":  # type: ignore[override]
+        from .resources.models import AsyncModels as _AimlAsyncModelsImpl
+
+        return _AimlAsyncModelsImpl(self)
+
     @cached_property
     def images(self) -> "_AimlAsyncImages":  # type: ignore[override]
         from .resources.images import AsyncImages as _AimlAsyncImagesImpl
 
         return _AimlAsyncImagesImpl(self)
 
+    @cached_property
+    def realtime(self) -> "_AimlAsyncRealtime":  # type: ignore[override]
+        from .resources.realtime import AsyncRealtime as _AimlAsyncRealtimeImpl
+
+        return _AimlAsyncRealtimeImpl(self)
+
     @cached_property
     def uploads(self) -> "_AimlAsyncUploads":
         from .resources.uploads import AsyncUploads as _AimlAsyncUploadsImpl
@@ -204,8 +480,14 @@ class AsyncAIMLAPI(_ToolSchemaCleanupMixin, _AsyncOpenAI):
 
         return _AimlAsyncVideosImpl(self)
 
+    @cached_property
+    def webhooks(self) -> "_AimlAsyncWebhooks":
+        from .resources.webhooks import AsyncWebhooks as _AimlAsyncWebhooksImpl
+
+        return _AimlAsyncWebhooksImpl(self)
+
 
-class AzureAIMLAPI(_ToolSchemaCleanupMixin, _AzureOpenAI):
+class AzureAIMLAPI(_ToolSchemaCleanupMixin, _WarmupMixin, _AzureOpenAI):
     """Synchronous Azure client with AIMLAPI overrides."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -234,12 +516,36 @@ class AzureAIMLAPI(_ToolSchemaCleanupMixin, _AzureOpenAI):
 
         return _AimlAudioImpl(self)
 
+    @cached_property
+    def batches(self) -> "_AimlBatches":  # type: ignore[override]
+        from .resources.batches import Batches as _AimlBatchesImpl
+
+        return _AimlBatchesImpl(self)
+
+    @cached_property
+    def embeddings(self) -> "_AimlEmbeddings":  # type: ignore[override]
+        from .resources.embeddings import Embeddings as _AimlEmbeddingsImpl
+
+        return _AimlEmbeddingsImpl(self)
+
+    @cached_property
+    def models(self) -> "_AimlModels":  # type: ignore[override]
+        from .resources.models import Models as _AimlModelsImpl
+
+        return _AimlModelsImpl(self)
+
     @cached_property
     def images(self) -> "_AimlImages":  # type: ignore[override]
         from .resources.images import Images as _AimlImagesImpl
 
         return _AimlImagesImpl(self)
 
+    @cached_property
+    def realtime(self) -> "_AimlRealtime":  # type: ignore[override]
+        from .resources.realtime import Realtime as _AimlRealtimeImpl
+
+        return _AimlRealtimeImpl(self)
+
     @cached_property
     def uploads(self) -> "_AimlUploads":
         from .resources.uploads import Uploads as _AimlUploadsImpl
@@ -252,8 +558,14 @@ class AzureAIMLAPI(_ToolSchemaCleanupMixin, _AzureOpenAI):
 
         return _AimlVideosImpl(self)
 
+    @cached_property
+    def webhooks(self) -> "_AimlWebhooks":
+        from .resources.webhooks import Webhooks as _AimlWebhooksImpl
+
+        return _AimlWebhooksImpl(self)
+
 
-class AsyncAzureAIMLAPI(_ToolSchemaCleanupMixin, _AsyncAzureOpenAI):
+class AsyncAzureAIMLAPI(_ToolSchemaCleanupMixin, _AsyncWarmupMixin, _AsyncAzureOpenAI):
     """Asynchronous Azure client with AIMLAPI overrides."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -282,12 +594,36 @@ class AsyncAzureAIMLAPI(_ToolSchemaCleanupMixin, _AsyncAzureOpenAI):
 
         return _AimlAsyncAudioImpl(self)
 
+    @cached_property
+    def batches(self) -> "_AimlAsyncBatches":  # type: ignore[override]
+        from .resources.batches import AsyncBatches as _AimlAsyncBatchesImpl
+
+        return _AimlAsyncBatchesImpl(self)
+
+    @cached_property
+    def embeddings(self) -> "_AimlAsyncEmbeddings":  # type: ignore[override]
+        from .resources.embeddings import AsyncEmbeddings as _AimlAsyncEmbeddingsImpl
+
+        return _AimlAsyncEmbeddingsImpl(self)
+
+    @cached_property
+    def models(self) -> "_AimlAsyncModels":  # type: ignore[override]
+        from .resources.models import AsyncModels as _AimlAsyncModelsImpl
+
+        return _AimlAsyncModelsImpl(self)
+
     @cached_property
     def images(self) -> "_AimlAsyncImages":  # type: ignore[override]
         from .resources.images import AsyncImages as _AimlAsyncImagesImpl
 
         return _AimlAsyncImagesImpl(self)
 
+    @cached_property
+    def realtime(self) -> "_AimlAsyncRealtime":  # type: ignore[override]
+        from .resources.realtime import AsyncRealtime as _AimlAsyncRealtimeImpl
+
+        return _AimlAsyncRealtimeImpl(self)
+
     @cached_property
     def uploads(self) -> "_AimlAsyncUploads":
         from .resources.uploads import AsyncUploads as _AimlAsyncUploadsImpl
@@ -300,6 +636,12 @@ class AsyncAzureAIMLAPI(_ToolSchemaCleanupMixin, _AsyncAzureOpenAI):
 
         return _AimlAsyncVideosImpl(self)
 
+    @cached_property
+    def webhooks(self) -> "_AimlAsyncWebhooks":
+        from .resources.webhooks import AsyncWebhooks as _AimlAsyncWebhooksImpl
+
+        return _AimlAsyncWebhooksImpl(self)
+
 
 class AIMLAPIWithRawResponse(_OpenAIWithRawResponse):
     _client: AIMLAPI
@@ -0,0 +1,121 @@
+"""Connection pool state that every client keeps.
+
+This is apart from `_connections` so that `import aimlapi` doesn't load the custom
+transports and the balancer, which are only needed for `http2`, `targets` and
+`max_streams_per_host`.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Callable, Optional, Awaitable
+from weakref import WeakKeyDictionary
+from dataclasses import dataclass
+
+import httpx
+
+if TYPE_CHECKING:
+    from ._balancer import TargetPool
+
+__all__ = ["ConnectionStats", "ConnectionCounter", "counter_for", "target_pool_for", "register_target_pool"]
+
+_CONNECT_EVENTS = frozenset({"connection.connect_tcp.complete", "connection.connect_unix_socket.complete"})
+_HTTP11_REQUEST_EVENT = "http11.send_request_headers.started"
+_HTTP2_REQUEST_EVENT = "http2.send_request_headers.started"
+
+
+@dataclass(frozen=True)
+class ConnectionStats:
+    requests: int
+    http2_requests: int
+    connections_opened: int
+
+    @property
+    def reused_requests(self) -> int:
+        """Requests that were sent over an already open connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.reused_requests / self.requests if self.requests else 0.0
+
+
+class ConnectionCounter:
+    """Counts requests and new connections through httpcore's `trace` request extension."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._http2_requests = 0
+        self._connections_opened = 0
+
+    def trace(self, event_name: str, _info: Dict[str, Any]) -> None:
+        if event_name == _HTTP11_REQUEST_EVENT:
+            with self._lock:
+                self._requests += 1
+        elif event_name == _HTTP2_REQUEST_EVENT:
+            with self._lock:
+                self._requests += 1
+                self._http2_requests += 1
+        elif event_name in _CONNECT_EVENTS:
+            with self._lock:
+                self._connections_opened += 1
+
+    async def atrace(self, event_name: str, info: Dict[str, Any]) -> None:
+        self.trace(event_name, info)
+
+    def chain(self, trace: Optional[Callable[[str, Dict[str, Any]], None]]) -> Callable[[str, Dict[str, Any]], None]:
+        """A `trace` extension that counts events and then passes them on to the one the request already had."""
+        if trace is None:
+            return self.trace
+
+        def chained(event_name: str, info: Dict[str, Any]) -> None:
+            self.trace(event_name, info)
+            trace(event_name, info)
+
+        return chained
+
+    def achain(
+        self, trace: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]]
+    ) -> Callable[[str, Dict[str, Any]], Awaitable[None]]:
+        if trace is None:
+            return self.atrace
+
+        async def chained(event_name: str, info: Dict[str, Any]) -> None:
+            self.trace(event_name, info)
+            await trace(event_name, info)
+
+        return chained
+
+    def stats(self) -> ConnectionStats:
+        with self._lock:
+            return ConnectionStats(
+                requests=self._requests,
+                http2_requests=self._http2_requests,
+                connections_opened=self._connections_opened,
+            )
+
+
+# one counter per connection pool, shared by clients derived through `with_options()` / `copy()`
+_counters: WeakKeyDictionary[Any, ConnectionCounter] = WeakKeyDictionary()
+_counters_lock = threading.Lock()
+
+
+def counter_for(http_client: httpx.Client | httpx.AsyncClient) -> ConnectionCounter:
+    with _counters_lock:
+        counter = _counters.get(http_client)
+        if counter is None:
+            counter = _counters[http_client] = ConnectionCounter()
+        return counter
+
+
+# the target pool balancing each connection pool built for `targets`, shared the same way
+_target_pools: WeakKeyDictionary[Any, TargetPool] = WeakKeyDictionary()
+
+
+def target_pool_for(http_client: httpx.Client | httpx.AsyncClient) -> Optional[TargetPool]:
+    return _target_pools.get(http_client)
+
+
+def register_target_pool(http_client: httpx.Client | httpx.AsyncClient, pool: TargetPool) -> None:
+    _target_pools[http_client] = pool
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+from typing_extensions import override
+
+import anyio
+import httpx
+
+from openai._constants import DEFAULT_TIMEOUT, DEFAULT_CONNECTION_LIMITS
+from openai._base_client import SyncHttpxClientWrapper, AsyncHttpxClientWrapper
+
+from ._balancer import (
+    TargetPool,
+    BalancingTransport,
+    AsyncBalancingTransport,
+    _ReleasingStream,
+    _AsyncReleasingStream,
+)
+from ._connection_stats import register_target_pool
+
+__all__ = ["HTTP2_CONNECTION_LIMITS", "HostLimitTransport", "AsyncHostLimitTransport"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# An HTTP/2 connection multiplexes every request to a host, so keep it around between bursts.
+# The connection caps still apply when a server only negotiates HTTP/1.1.
+HTTP2_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=DEFAULT_CONNECTION_LIMITS.max_connections,
+    max_keepalive_connections=DEFAULT_CONNECTION_LIMITS.max_keepalive_connections,
+    keepalive_expiry=60.0,
+)
+
+
+def _pool_timeout(request: httpx.Request) -> Optional[float]:
+    timeout: Dict[str, Optional[float]] = request.extensions.get("timeout", {})
+    return timeout.get("pool")
+
+
+class HostLimitTransport(httpx.BaseTransport):
+    """Caps the requests in flight to each origin, streams included until they are closed.
+
+    With HTTP/2 these are the streams multiplexed over the host's connection. A request
+    waiting for a free slot counts against the pool timeout and raises `httpx.PoolTimeout`.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, *, max_streams_per_host: int) -> None:
+        self._transport = transport
+        self._limit = max_streams_per_host
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, request: httpx.Request) -> threading.BoundedSemaphore:
+        origin = f"{request.url.scheme}://{request.url.netloc.decode('ascii')}"
+        with self._lock:
+            semaphore = self._semaphores.get(origin)
+            if semaphore is None:
+                semaphore = self._semaphores[origin] = threading.BoundedSemaphore(self._limit)
+            return semaphore
+
+    @override
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(request)
+        if not semaphore.acquire(timeout=_pool_timeout(request)):
+            raise httpx.PoolTimeout(f"Timed out waiting for one of {self._limit} streams to {request.url.host}")
+
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        response.stream = _ReleasingStream(response.stream, semaphore.release)  # type: ignore[arg-type]
+        return response
+
+    @override
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncHostLimitTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, *, max_streams_per_host: int) -> None:
+        self._transport = transport
+        self._limit = max_streams_per_host
+        self._semaphores: Dict[str, anyio.Semaphore] = {}
+
+    def _semaphore(self, request: httpx.Request) -> anyio.Semaphore:
+        origin = f"{request.url.scheme}://{request.url.netloc.decode('ascii')}"
+        semaphore = self._semaphores.get(origin)
+        if semaphore is None:
+            semaphore = self._semaphores[origin] = anyio.Semaphore(self._limit)
+        return semaphore
+
+    @override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(request)
+        with anyio.move_on_after(_pool_timeout(request)) as scope:
+            await semaphore.acquire()
+        if scope.cancelled_caught:
+            raise httpx.PoolTimeout(f"Timed out waiting for one of {self._limit} streams to {request.url.host}")
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        response.stream = _AsyncReleasingStream(response.stream, semaphore.release)  # type: ignore[arg-type]
+        return response
+
+    @override
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _validate_max_streams(max_streams_per_host: Optional[int]) -> None:
+    if max_streams_per_host is not None and max_streams_per_host < 1:
+        raise ValueError("max_streams_per_host must be at least 1")
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401  # pyright: ignore[reportMissingImports, reportUnusedImport]
+    except ImportError:
+        log.warning("HTTP/2 requires the `h2` package, install `aimlapi[http2]`; falling back to HTTP/1.1")
+        return False
+    return True
+
+
+def _transport_kwargs(
+    kwargs: Dict[str, Any], *, http2: bool, pool: Optional[TargetPool], max_streams_per_host: Optional[int]
+) -> Optional[Dict[str, Any]]:
+    _validate_max_streams(max_streams_per_host)
+    if not http2 and pool is None and max_streams_per_host is None:
+        return None
+
+    if kwargs.get("http_client") is not None:
+        if pool is not None:
+            argument = "targets"
+        elif max_streams_per_host is not None:
+            argument = "max_streams_per_host"
+        else:
+            argument = "http2"
+        raise ValueError(f"The `{argument}` argument cannot be combined with a custom `http_client`")
+
+    if http2 and _http2_available():
+        return {"http2": True, "limits": HTTP2_CONNECTION_LIMITS}
+    if pool is None and max_streams_per_host is None:
+        return None
+    return {"limits": DEFAULT_CONNECTION_LIMITS}
+
+
+def apply_transport_options(
+    kwargs: Dict[str, Any],
+    *,
+    http2: bool = False,
+    pool: Optional[TargetPool] = None,
+    max_streams_per_host: Optional[int] = None,
+) -> None:
+    """Build the default httpx client for the `http2`, `targets` and `max_streams_per_host` client arguments."""
+    transport_kwargs = _transport_kwargs(kwargs, http2=http2, pool=pool, max_streams_per_host=max_streams_per_host)
+    if transport_kwargs is None:
+        return
+
+    if pool is None and max_streams_per_host is None:
+        kwargs["http_client"] = SyncHttpxClientWrapper(
+            base_url=kwargs["base_url"], timeout=DEFAULT_TIMEOUT, **transport_kwargs
+        )
+        return
+
+    transport: httpx.BaseTransport = httpx.HTTPTransport(**transport_kwargs)
+    if max_streams_per_host is not None:
+        # the balancer has already pointed the request at its target, so the limit is per target host
+        transport = HostLimitTransport(transport, max_streams_per_host=max_streams_per_host)
+    if pool is not None:
+        transport = BalancingTransport(pool, transport)
+
+    kwargs["http_client"] = SyncHttpxClientWrapper(
+        base_url=kwargs["base_url"], timeout=DEFAULT_TIMEOUT, transport=transport
+    )
+    if pool is not None:
+        register_target_pool(kwargs["http_client"], pool)
+
+
+def apply_async_transport_options(
+    kwargs: Dict[str, Any],
+    *,
+    http2: bool = False,
+    pool: Optional[TargetPool] = None,
+    max_streams_per_host: Optional[int] = None,
+) -> None:
+    transport_kwargs = _transport_kwargs(kwargs, http2=http2, pool=pool, max_streams_per_host=max_streams_per_host)
+    if transport_kwargs is None:
+        return
+
+    if pool is None and max_streams_per_host is None:
+        kwargs["http_client"] = AsyncHttpxClientWrapper(
+            base_url=kwargs["base_url"], timeout=DEFAULT_TIMEOUT, **transport_kwargs
+        )
+        return
+
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(**transport_kwargs)
+    if max_streams_per_host is not None:
+        transport = AsyncHostLimitTransport(transport, max_streams_per_host=max_streams_per_host)
+    if pool is not None:
+        transport = AsyncBalancingTransport(pool, transport)
+
+    kwargs["http_client"] = AsyncHttpxClientWrapper(
+        base_url=kwargs["base_url"], timeout=DEFAULT_TIMEOUT, transport=transport
+    )
+    if pool is not None:
+        register_target_pool(kwargs["http_client"], pool)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Any, Dict, List, Tuple, Union, Mapping, TypeVar, Callable, Optional, Sequence, Awaitable, cast
+from collections import deque
+from dataclasses import dataclass
+
+from openai._exceptions import APIStatusError, APIConnectionError
+from openai._base_client import BaseClient
+
+__all__ = ["ModelRouter", "ModelStats"]
+
+_T = TypeVar("_T")
+
+# how much a fully failing model is penalised relative to its latency
+_ERROR_PENALTY = 4.0
+
+
+@dataclass(frozen=True)
+class ModelStats:
+    model: str
+    weight: float
+    requests: int
+    errors: int
+    error_rate: float
+    """Share of failed requests within the rolling window."""
+    latency: Optional[float]
+    """Mean latency in seconds of the successful requests within the rolling window."""
+    score: float
+    """Lower is better, this is what the router sorts candidates by."""
+
+
+class _ModelState:
+    def __init__(self, model: str, weight: float, window: int) -> None:
+        self.model = model
+        self.weight = weight
+        self.requests = 0
+        self.errors = 0
+        # (recorded_at, latency, ok) for the most recent requests
+        self.samples: deque[Tuple[float, float, bool]] = deque(maxlen=window)
+
+    def expire(self, before: float) -> None:
+        while self.samples and self.samples[0][0] < before:
+            self.samples.popleft()
+
+    @property
+    def error_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, _, ok in self.samples if not ok) / len(self.samples)
+
+    @property
+    def latency(self) -> Optional[float]:
+        latencies = [latency for _, latency, ok in self.samples if ok]
+        return sum(latencies) / len(latencies) if latencies else None
+
+
+def _resource_client(create: Callable[..., Any]) -> BaseClient[Any, Any]:
+    client: object = getattr(getattr(create, "__self__", None), "_client", None)
+    if not isinstance(client, BaseClient):
+        raise TypeError(f"Expected a bound SDK method such as `client.chat.completions.create`, got {create!r}")
+    return cast("BaseClient[Any, Any]", client)
+
+
+def _without_retries(create: Callable[..., _T], client: BaseClient[Any, Any]) -> Callable[..., _T]:
+    """Rebind `create` to a copy of its client with `max_retries=0`.
+
+    An attempt that still has models to fall back to should fail fast instead of
+    backing off and retrying the same unhealthy model.
+    """
+    if client.max_retries == 0:
+        return create
+    method: Any = create
+    resource, function = method.__self__, method.__func__
+    no_retries = type(resource)(cast(Any, client).with_options(max_retries=0))
+    return cast("Callable[..., _T]", function.__get__(no_retries))
+
+
+class ModelRouter:
+    """Sends each request to the healthiest of several acceptable models.
+
+    Keeps a rolling window of latency and errors per model and tries models best first,
+    falling back to the next one when a request fails in a way the client would retry
+    (connection errors, timeouts, 408, 409, 429 and 5xx responses, or `x-should-retry`).
+    Other errors such as a 400 are raised straight away. Every attempt except the last
+    one is sent without the client's automatic retries.
+
+    Samples older than `max_age` seconds are dropped, so a model that was demoted after
+    a few failures gets tried again once they have aged out.
+
+    ```py
+    router = ModelRouter(["gpt-4o", "claude-3-5-sonnet-latest", "gemini-1.5-pro"])
+    completion = router.create(client.chat.completions.create, messages=[...])
+    ```
+
+    `models` is either a list in order of preference or a mapping of model to weight; a
+    model with twice the weight may be twice as slow and still be picked first.
+    """
+
+    def __init__(
+        self,
+        models: Union[Sequence[str], Mapping[str, float]],
+        *,
+        window: int = 50,
+        max_age: float = 60.0,
+    ) -> None:
+        if not models:
+            raise ValueError("At least one model is required")
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if max_age <= 0:
+            raise ValueError("max_age must be greater than 0")
+
+        if isinstance(models, Mapping):
+            weights = dict(models)
+        else:
+            weights = {model: 1.0 / (index + 1) for index, model in enumerate(models)}
+
+        if any(weight <= 0 for weight in weights.values()):
+            raise ValueError("Model weights must be greater than 0")
+
+        self._states: Dict[str, _ModelState] = {
+            model: _ModelState(model, weight, window) for model, weight in weights.items()
+        }
+        self._max_age = max_age
+        self._lock = threading.Lock()
+
+    def _scores(self) -> Dict[str, float]:
+        cutoff = time.monotonic() - self._max_age
+        for state in self._states.values():
+            state.expire(cutoff)
+
+        latencies = [latency for latency in (state.latency for state in self._states.values()) if latency is not None]
+        # models without data yet are assumed to be as fast as the typical model
+        baseline = sorted(latencies)[len(latencies) // 2] if latencies else 1.0
+
+        scores: Dict[str, float] = {}
+        for model, state in self._states.items():
+            latency = state.latency if state.latency is not None else baseline
+            scores[model] = latency * (1 + _ERROR_PENALTY * state.error_rate) / state.weight
+        return scores
+
+    def candidates(self) -> List[str]:
+        """The models in the order the next request would try them."""
+        with self._lock:
+            scores = self._scores()
+        # `sorted` is stable, so ties keep the configured order
+        return sorted(self._states, key=lambda model: scores[model])
+
+    def _record(self, model: str, latency: float, *, ok: bool, now: Optional[float] = None) -> None:
+        with self._lock:
+            state = self._states[model]
+            state.requests += 1
+            if not ok:
+                state.errors += 1
+            state.samples.append((time.monotonic() if now is None else now, latency, ok))
+
+    def _should_fall_back(self, client: BaseClient[Any, Any], err: Exception) -> bool:
+        if isinstance(err, APIConnectionError):
+            return True
+        if isinstance(err, APIStatusError):
+            return client._should_retry(err.response)  # pyright: ignore[reportPrivateUsage]
+        return False
+
+    def create(self, create: Callable[..., _T], /, **params: Any) -> _T:
+        """Call `create(model=..., **params)` with the best model, falling back on retryable errors."""
+        client = _resource_client(create)
+        candidates = self.candidates()
+        create_once = _without_retries(create, client) if len(candidates) > 1 else create
+        error: Optional[Exception] = None
+        for index, model in enumerate(candidates):
+            attempt = create if index == len(candidates) - 1 else create_once
+            start = time.monotonic()
+            try:
+                result = attempt(model=model, **params)
+            except Exception as err:
+                if not self._should_fall_back(client, err):
+                    raise
+                self._record(model, time.monotonic() - start, ok=False)
+                error = err
+                continue
+
+            self._record(model, time.monotonic() - start, ok=True)
+            return result
+
+        assert error is not None
+        raise error
+
+    async def acreate(self, create: Callable[..., Awaitable[_T]], /, **params: Any) -> _T:
+        """Async version of `create()`."""
+        client = _resource_client(create)
+        candidates = self.candidates()
+        create_once = _without_retries(create, client) if len(candidates) > 1 else create
+        error: Optional[Exception] = None
+        for index, model in enumerate(candidates):
+            attempt = create if index == len(candidates) - 1 else create_once
+            start = time.monotonic()
+            try:
+                result = await attempt(model=model, **params)
+            except Exception as err:
+                if not self._should_fall_back(client, err):
+                    raise
+                self._record(model, time.monotonic() - start, ok=False)
+                error = err
+                continue
+
+            self._record(model, time.monotonic() - start, ok=True)
+            return result
+
+        assert error is not None
+        raise error
+
+    def stats(self) -> List[ModelStats]:
+        """Per model stats, best candidate first."""
+        with self._lock:
+            scores = self._scores()
+            stats = [
+                ModelStats(
+                    model=model,
+                    weight=state.weight,
+                    requests=state.requests,
+                    errors=state.errors,
+                    error_rate=state.error_rate,
+                    latency=state.latency,
+                    score=scores[model],
+                )
+                for model, state in self._states.items()
+            ]
+        return sorted(stats, key=lambda item: item.score)
@@ -0,0 +1,424 @@
+"""Offline token counting for chat messages and Responses API input.
+
+Counts come from the model's BPE vocabulary when one is available, either as a
+`<encoding>.tiktoken` file in `vocab_dir` / `$AIMLAPI_TOKENIZER_DIR` or, when enabled,
+through the optional `tiktoken` package. Vocabulary files reproduce tiktoken's counts when the optional
+`regex` package is installed to run the real pre-tokenizer, and are a close
+approximation otherwise. Models without a known vocabulary use a fast heuristic, which is
+typically within about 10% for English text.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import json
+import mmap
+import base64
+import hashlib
+import threading
+from array import array
+from typing import Any, Dict, List, Tuple, Union, Mapping, Iterable, Optional, Sequence, cast
+from pathlib import Path
+from collections import OrderedDict
+
+__all__ = ["TokenEstimator", "BPETokenizer", "encoding_for_model"]
+
+# https://github.com/openai/openai-cookbook/blob/main/examples/How_to_count_tokens_with_tiktoken.ipynb
+_TOKENS_PER_MESSAGE = 3
+_TOKENS_PER_NAME = 1
+_REPLY_PRIMING_TOKENS = 3
+
+# flat estimates for non-text content parts
+_IMAGE_TOKENS = {"low": 85, "high": 765, "auto": 765}
+_FILE_TOKENS = 256
+
+_O200K_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-4.5", "gpt-5", "o1", "o3", "o4", "chatgpt-4o", "codex")
+_CL100K_PREFIXES = ("gpt-4", "gpt-3.5", "text-embedding-3", "text-embedding-ada-002")
+
+# An approximation of the tiktoken pre-tokenizer that only needs the `re` module:
+# contractions, words with an optional leading space, 1-3 digit groups, punctuation runs
+# and whitespace.
+_PRETOKENIZE = re.compile(
+    r"""'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+[\r\n]*|\s+(?!\S)|\s+""",
+    re.IGNORECASE,
+)
+
+# tiktoken's own pre-tokenizers, they need the `regex` module for the `\p{...}` classes
+_SPLIT_PATTERNS = {
+    "cl100k_base": (
+        r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+"""
+        r"""|\s++$|\s*[\r\n]|\s+(?!\S)|\s"""
+    ),
+    "o200k_base": "|".join(
+        [
+            r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]*[\p{Ll}\p{Lm}\p{Lo}\p{M}]+(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+            r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]+[\p{Ll}\p{Lm}\p{Lo}\p{M}]*(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+            r"""\p{N}{1,3}""",
+            r""" ?[^\s\p{L}\p{N}]+[\r\n/]*""",
+            r"""\s*[\r\n]+""",
+            r"""\s+(?!\S)""",
+            r"""\s+""",
+        ]
+    ),
+}
+
+# one `<base64 token> <rank>` entry of a tiktoken vocabulary file
+_VOCAB_LINE = re.compile(rb"^(\S+) (\d+)", re.MULTILINE)
+_RANK = re.compile(rb"\d+")
+# ranks of the most recently merged tokens kept decoded by each vocabulary
+_RANK_CACHE_SIZE = 65536
+_BUCKETS = 1 << 16
+
+Messages = Iterable[Mapping[str, Any]]
+
+
+def encoding_for_model(model: str | None) -> Optional[str]:
+    """The BPE encoding used by an OpenAI model, `None` for models with unknown tokenizers."""
+    if not model:
+        return None
+
+    name = model.rsplit("/", 1)[-1].lower()
+    if name.startswith(_O200K_PREFIXES):
+        return "o200k_base"
+    if name.startswith(_CL100K_PREFIXES):
+        return "cl100k_base"
+    return None
+
+
+def _split_pattern(encoding: str) -> Any:
+    """The compiled tiktoken pre-tokenizer for `encoding`, `None` without the `regex` package."""
+    pattern = _SPLIT_PATTERNS.get(encoding)
+    if pattern is None:
+        return None
+
+    try:
+        import regex  # type: ignore[import-untyped, import-not-found, unused-ignore]  # pyright: ignore[reportMissingImports, reportMissingModuleSource]
+    except ImportError:
+        return None
+    return regex.compile(pattern)
+
+
+def _heuristic_count(text: str) -> int:
+    tokens = 0
+    for piece in _PRETOKENIZE.findall(text):
+        size = len(piece.encode("utf-8"))
+        if piece.isascii():
+            # common English words are a single token, longer ones split roughly every 4-5 bytes
+            tokens += 1 if size <= 6 else 1 + (size - 3) // 4
+        else:
+            # CJK and other multi-byte scripts are close to one token per character
+            tokens += max(1, len(piece.strip()))
+    return tokens
+
+
+def _bucket(encoded: bytes) -> int:
+    return encoded[0] << 8 | encoded[1] if len(encoded) > 1 else encoded[0] << 8 if encoded else 0
+
+
+class _MappedRanks:
+    """Token ranks backed by a memory-mapped tiktoken vocabulary file.
+
+    Only arrays of line offsets, sorted by base64 token, are kept in memory. Lookups binary
+    search them against the mapped file, and the ranks that were found are kept in a
+    bounded LRU cache.
+    """
+
+    def __init__(self, path: Path, *, cache_size: int = _RANK_CACHE_SIZE) -> None:
+        self._data: Any = b""
+        with open(path, "rb") as f:
+            # an empty file can't be mapped
+            if os.fstat(f.fileno()).st_size:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        lines = [(match.start(), match.end(1)) for match in _VOCAB_LINE.finditer(self._data)]
+        lines.sort(key=lambda line: self._data[line[0] : line[1]])
+        self._offsets = array("Q", (start for start, _ in lines))
+        self._lengths = array("H", (end - start for start, end in lines))
+
+        # the search starts among the tokens that share their first two base64 characters
+        self._buckets = array("I", bytes(4 * (_BUCKETS + 1)))
+        for offset in self._offsets:
+            self._buckets[_bucket(self._data[offset : offset + 2]) + 1] += 1
+        for i in range(_BUCKETS):
+            self._buckets[i + 1] += self._buckets[i]
+
+        self._cache_size = cache_size
+        self._cache: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, token: bytes) -> bool:
+        return self.get(token) is not None
+
+    def _token_at(self, index: int) -> bytes:
+        offset = self._offsets[index]
+        return cast(bytes, self._data[offset : offset + self._lengths[index]])
+
+    def _find(self, token: bytes) -> Optional[int]:
+        encoded = base64.b64encode(token)
+        bucket = _bucket(encoded)
+        low, high = self._buckets[bucket], self._buckets[bucket + 1]
+        while low < high:
+            middle = (low + high) // 2
+            if self._token_at(middle) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == self._buckets[bucket + 1] or self._token_at(low) != encoded:
+            return None
+        match = _RANK.match(self._data, self._offsets[low] + len(encoded) + 1)
+        assert match is not None
+        return int(match[0])
+
+    def get(self, token: bytes) -> Optional[int]:
+        rank = self._cache.get(token)
+        if rank is not None:
+            try:
+                self._cache.move_to_end(token)
+            except KeyError:
+                # evicted by another thread since
+                pass
+            return rank
+
+        rank = self._find(token)
+        # most merge candidates aren't in the vocabulary, only found ranks are worth keeping
+        if rank is not None:
+            with self._lock:
+                self._cache[token] = rank
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return rank
+
+
+class BPETokenizer:
+    """Byte pair encoder over a tiktoken-format vocabulary (`<base64 token> <rank>` per line).
+
+    The vocabulary file is memory-mapped on first use and ranks are decoded as they are
+    looked up. `encoding` selects tiktoken's pre-tokenizer
+    and defaults to the file name without its suffix; when the pattern is unknown or the
+    `regex` package is missing, text is split with an approximation and `exact` is false.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], *, encoding: str | None = None) -> None:
+        self.path = Path(path)
+        self._ranks: Optional[_MappedRanks] = None
+        self._lock = threading.Lock()
+        self._split = _split_pattern(encoding or self.path.stem)
+
+    @property
+    def exact(self) -> bool:
+        """Whether text is split like tiktoken does, so counts match it."""
+        return self._split is not None
+
+    @property
+    def ranks(self) -> _MappedRanks:
+        if self._ranks is None:
+            with self._lock:
+                if self._ranks is None:
+                    self._ranks = _MappedRanks(self.path)
+        return self._ranks
+
+    def _merge(self, piece: bytes) -> int:
+        ranks = self.ranks
+        if piece in ranks:
+            return 1
+
+        parts = [piece[i : i + 1] for i in range(len(piece))]
+        while len(parts) > 1:
+            best_rank: Optional[int] = None
+            best_index = -1
+            for i in range(len(parts) - 1):
+                rank = ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank, best_index = rank, i
+            if best_rank is None:
+                break
+            parts[best_index : best_index + 2] = [parts[best_index] + parts[best_index + 1]]
+        return len(parts)
+
+    def count(self, text: str) -> int:
+        split = self._split or _PRETOKENIZE
+        return sum(self._merge(piece.encode("utf-8")) for piece in split.findall(text))
+
+
+def _load_tiktoken(encoding: str) -> Any:
+    try:
+        import tiktoken  # type: ignore[import-not-found, unused-ignore]  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.get_encoding(encoding)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    except Exception:
+        # e.g. no network access to download the vocabulary
+        return None
+
+
+def _text_parts(content: Any) -> Tuple[List[str], int]:
+    """Split message content into its text and a flat token estimate for everything else."""
+    if content is None:
+        return [], 0
+    if isinstance(content, str):
+        return [content], 0
+
+    texts: List[str] = []
+    extra = 0
+    for part in content:
+        if isinstance(part, str):
+            texts.append(part)
+            continue
+        if not isinstance(part, Mapping):
+            continue
+
+        fields = cast("Mapping[str, object]", part)
+        kind = fields.get("type")
+        if kind in ("text", "input_text", "output_text", "refusal"):
+            texts.append(str(fields.get("text") or fields.get("refusal") or ""))
+        elif kind in ("image_url", "input_image"):
+            image = fields.get("image_url")
+            detail = (
+                cast("Mapping[str, object]", image).get("detail")
+                if isinstance(image, Mapping)
+                else fields.get("detail")
+            )
+            extra += _IMAGE_TOKENS.get(str(detail or "auto"), _IMAGE_TOKENS["auto"])
+        elif kind in ("file", "input_file", "input_audio"):
+            extra += _FILE_TOKENS
+    return texts, extra
+
+
+def _message_key(encoding: str, message: Mapping[str, Any]) -> str:
+    payload = json.dumps(message, sort_keys=True, default=str, separators=(",", ":"))
+    return f"{encoding}:{hashlib.sha1(payload.encode('utf-8')).hexdigest()}"
+
+
+class TokenEstimator:
+    """Counts tokens locally for `chat.completions.create` and `responses.create` payloads.
+
+    Per-message counts are kept in an LRU cache, so re-counting a growing conversation
+    only tokenizes the messages that were added since the last call.
+
+    Nothing is fetched over the network unless `use_tiktoken` is set. With it, `tiktoken`
+    downloads the vocabulary of an encoding the first time it is used, unless the
+    vocabulary is already in its cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        vocab_dir: Union[str, "os.PathLike[str]", None] = None,
+        use_tiktoken: bool = False,
+        cache_size: int = 4096,
+    ) -> None:
+        directory = vocab_dir if vocab_dir is not None else os.environ.get("AIMLAPI_TOKENIZER_DIR")
+        self._vocab_dir = Path(directory).expanduser() if directory else None
+        self._use_tiktoken = use_tiktoken
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._encoders: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _encoder(self, encoding: Optional[str]) -> Any:
+        if encoding is None:
+            return None
+
+        with self._lock:
+            if encoding in self._encoders:
+                return self._encoders[encoding]
+
+        # loaded without the lock, `tiktoken` may download its vocabulary and other threads
+        # shouldn't wait on that, at worst the encoder is loaded twice
+        encoder: Any = None
+        if self._vocab_dir is not None and (self._vocab_dir / f"{encoding}.tiktoken").exists():
+            encoder = BPETokenizer(self._vocab_dir / f"{encoding}.tiktoken")
+        elif self._use_tiktoken:
+            encoder = _load_tiktoken(encoding)
+
+        with self._lock:
+            return self._encoders.setdefault(encoding, encoder)
+
+    def is_exact(self, model: str | None) -> bool:
+        """Whether counts for `model` match its real tokenizer.
+
+        False for models that use the heuristic, and for vocabulary files when the `regex`
+        package isn't installed to run tiktoken's pre-tokenizer.
+        """
+        encoder = self._encoder(encoding_for_model(model))
+        if isinstance(encoder, BPETokenizer):
+            return encoder.exact
+        return encoder is not None
+
+    def count_text(self, text: str, *, model: str | None = None) -> int:
+        encoder = self._encoder(encoding_for_model(model))
+        if encoder is None:
+            return _heuristic_count(text)
+        if isinstance(encoder, BPETokenizer):
+            return encoder.count(text)
+        return len(encoder.encode(text, disallowed_special=()))
+
+    def _count_content(self, content: Any, model: str | None) -> int:
+        texts, extra = _text_parts(content)
+        return extra + sum(self.count_text(text, model=model) for text in texts)
+
+    def _count_message(self, message: Mapping[str, Any], model: str | None) -> int:
+        key = _message_key(encoding_for_model(model) or "heuristic", message)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        tokens = _TOKENS_PER_MESSAGE
+        for field, value in message.items():
+            if field in ("content", "output"):
+                tokens += self._count_content(value, model)
+            elif field == "name":
+                tokens += _TOKENS_PER_NAME + self.count_text(str(value), model=model)
+            elif field in ("role", "type", "arguments", "call_id") and isinstance(value, str):
+                tokens += self.count_text(value, model=model)
+            elif field in ("tool_calls", "function_call"):
+                tokens += self.count_text(json.dumps(value, default=str), model=model)
+
+        with self._lock:
+            self._cache[key] = tokens
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def count_messages(
+        self,
+        messages: Messages,
+        *,
+        model: str | None = None,
+        tools: Optional[Sequence[Mapping[str, Any]]] = None,
+    ) -> int:
+        """Estimate the prompt tokens of a `chat.completions.create(messages=..., tools=...)` call."""
+        tokens = _REPLY_PRIMING_TOKENS
+        for message in messages:
+            tokens += self._count_message(message, model)
+        if tools:
+            tokens += self.count_text(json.dumps(list(tools), default=str), model=model)
+        return tokens
+
+    def count_input(
+        self,
+        input: Union[str, Messages],
+        *,
+        model: str | None = None,
+        instructions: str | None = None,
+        tools: Optional[Sequence[Mapping[str, Any]]] = None,
+    ) -> int:
+        """Estimate the input tokens of a `responses.create(input=..., instructions=...)` call."""
+        if isinstance(input, str):
+            input = [{"role": "user", "content": input}]
+        if instructions:
+            input = [{"role": "developer", "content": instructions}, *input]
+        return self.count_messages(input, model=model, tools=tools)
+
+    def count_many(self, conversations: Iterable[Messages], *, model: str | None = None) -> List[int]:
+        """`count_messages()` for many conversations at once, sharing the per-message cache."""
+        return [self.count_messages(messages, model=model) for messages in conversations]
@@ -1,3 +1,5 @@
 from __future__ import annotations
 
 from openai.cli import *  # noqa: F401, F403
+
+from ._cli import main as main
@@ -1,3 +1,129 @@
 from __future__ import annotations
 
+import os
+import sys
+import json
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Iterator, Optional, cast
+from argparse import ArgumentParser
+
+import openai
+from openai.cli._errors import CLIError
+from openai.cli._models import BaseModel
 from openai.cli._api.chat.completions import *  # noqa: F401, F403
+
+from ...._client import AsyncAIMLAPI
+
+if TYPE_CHECKING:
+    from argparse import _SubParsersAction
+
+    from ...._batch_executor import BatchExecution
+
+
+def register_bulk(subparser: _SubParsersAction[ArgumentParser]) -> None:
+    sub = subparser.add_parser("chat.completions.bulk")
+
+    sub._action_groups.pop()
+    req = sub.add_argument_group("required arguments")
+    opt = sub.add_argument_group("optional arguments")
+
+    req.add_argument(
+        "-i",
+        "--input",
+        help="A JSONL file of requests. Each line is either the parameters of a chat completion, with an optional "
+        "`custom_id`, or a request in the Batch API input format.",
+        required=True,
+    )
+    req.add_argument(
+        "-o",
+        "--output",
+        help="The JSONL file the results are appended to in the Batch API output format, as each request finishes. "
+        "Re-running with the same output file skips the requests that already have a result.",
+        required=True,
+    )
+
+    opt.add_argument(
+        "-c", "--concurrency", help="The maximum number of requests in flight at once, 16 by default.", type=int
+    )
+    opt.add_argument("--rate", help="The maximum number of requests started per second.", type=float)
+    sub.set_defaults(func=CLIChatCompletionBulk.run, args_model=CLIChatCompletionBulkArgs)
+
+
+class CLIChatCompletionBulkArgs(BaseModel):
+    input: str
+    output: str
+    concurrency: int = 16
+    rate: Optional[float] = None
+    # the global `--proxy`, which the client of `bulk` can't use
+    proxy: Optional[List[str]] = None
+
+
+def _bulk_requests(fname: str) -> Iterator[Dict[str, Any]]:
+    """The lines of a bulk input file as Batch API requests, the ones without a `custom_id` are numbered"""
+    with open(fname, encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as err:
+                raise CLIError(f"Line {number} of {fname} is not valid JSON: {err}") from None
+            if not isinstance(request, dict):
+                raise CLIError(f"Line {number} of {fname} is not a JSON object")
+
+            request = cast(Dict[str, Any], request)
+            if "body" not in request:
+                custom_id = request.pop("custom_id", None)
+                request = {"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": request}
+            if request.get("custom_id") is None:
+                request["custom_id"] = f"line-{number}"
+            yield request
+
+
+class CLIChatCompletionBulk:
+    @staticmethod
+    def run(args: CLIChatCompletionBulkArgs) -> None:
+        if args.concurrency < 1:
+            raise CLIError("--concurrency must be at least 1")
+        if args.rate is not None and args.rate <= 0:
+            raise CLIError("--rate must be greater than 0")
+        if not os.path.isfile(args.input):
+            raise CLIError(f"{args.input} is not a file")
+        if args.proxy is not None:
+            raise CLIError("bulk doesn't support --proxy yet")
+        if openai.api_type == "azure" or (
+            openai.api_type is None and (openai.azure_endpoint is not None or openai.azure_ad_token is not None)
+        ):
+            raise CLIError("bulk doesn't support Azure yet")
+
+        execution = asyncio.run(CLIChatCompletionBulk._run(args))
+        sys.stdout.write(
+            f"{execution.succeeded} succeeded, {execution.failed} failed, "
+            f"{execution.skipped} skipped as already in {args.output}\n"
+        )
+
+    @staticmethod
+    async def _run(args: CLIChatCompletionBulkArgs) -> BatchExecution:
+        import tqdm
+
+        # a first pass checks every line before any request is sent
+        total = sum(1 for _ in _bulk_requests(args.input))
+        meter = tqdm.tqdm(total=total, unit="req", desc="Requests")
+
+        def progress(execution: BatchExecution) -> None:
+            meter.set_postfix_str(f"failed={execution.failed}", refresh=False)
+            meter.update(1)
+
+        try:
+            async with AsyncAIMLAPI(
+                api_key=openai.api_key, base_url=openai.base_url, organization=openai.organization
+            ) as client:
+                return await client.batch_execute(
+                    _bulk_requests(args.input),
+                    output=args.output,
+                    concurrency=args.concurrency,
+                    rate=args.rate,
+                    progress_callback=progress,
+                )
+        finally:
+            meter.close()
@@ -1,3 +1,11 @@
 from __future__ import annotations
 
 from openai.cli._cli import *  # noqa: F401, F403
+from openai.cli._cli import main as _main
+
+from .._client import AsyncAIMLAPI
+from ._api.chat.completions import register_bulk
+
+
+def main() -> int:
+    return _main(async_client_factory=AsyncAIMLAPI, register_api_commands=register_bulk)
@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+from openai.cli._tools._mock_server import *  # noqa: F401, F403
@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+from openai.cli._tools.bench import *  # noqa: F401, F403
@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+from openai.lib._chunked_validators import *  # noqa: F401, F403
@@ -0,0 +1,3 @@
+from __future__ import annotations
+
+from openai.lib._prepare_data import *  # noqa: F401, F403
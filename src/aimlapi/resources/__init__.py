@@ -1,3 +1,19 @@
 from __future__ import annotations
 
-from openai.resources import *  # noqa: F401, F403
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from openai.resources import *  # noqa: F401, F403
+
+
+# `openai.resources` imports every resource module, so only load it once a name is used
+def __getattr__(name: str) -> Any:
+    import openai.resources
+
+    if name == "__all__":
+        return list(openai.resources.__all__)
+
+    try:
+        return getattr(openai.resources, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import os
+import json
+import mmap
+import array
+import hashlib
+import threading
+from typing import Any, Dict, List, Tuple, Union, Optional, Sequence
+from pathlib import Path
+from collections import OrderedDict
+from dataclasses import dataclass
+
+__all__ = ["EmbeddingCache", "EmbeddingCacheStats"]
+
+_INDEX_FILE = "index.json"
+# changes since the last snapshot of the index, one JSON record per line
+_JOURNAL_FILE = "index.log"
+# the journal is folded into a new snapshot once it has more records than this, or than there are entries
+_JOURNAL_SNAPSHOT_RECORDS = 1024
+_VECTORS_FILE = "vectors.f32"
+# compaction writes `vectors.<generation>.f32`, the index names the file its offsets refer to
+_VECTORS_GLOB = "vectors*.f32"
+_INDEX_VERSION = 1
+_ITEM_SIZE = array.array("f").itemsize
+
+# (model, dimensions, sha256(text))
+CacheKey = Tuple[str, Optional[int], str]
+
+
+@dataclass(frozen=True)
+class EmbeddingCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _encode_key(key: CacheKey) -> str:
+    model, dimensions, digest = key
+    return f"{model}\t{'' if dimensions is None else dimensions}\t{digest}"
+
+
+def _decode_key(value: str) -> CacheKey:
+    model, dimensions, digest = value.rsplit("\t", 2)
+    return model, int(dimensions) if dimensions else None, digest
+
+
+class EmbeddingCache:
+    """Persistent, content-addressed store of embedding vectors.
+
+    Vectors live in a flat float32 file that is memory-mapped for reads, while a small
+    JSON index maps ``(model, dimensions, sha256(text))`` to an offset into that file.
+    Writes only append to the vectors file and to a journal of index changes; the journal
+    is folded into a new snapshot of the index periodically, on compaction and on ``close()``.
+    Entries are evicted least-recently-used first once ``max_entries`` or ``max_bytes``
+    is exceeded; the vectors file is compacted when most of it is dead space. Compaction
+    writes a new vectors file and only then switches the index over to it, so a crash at
+    any point leaves an index that matches the file it refers to.
+
+    Pass an instance as ``cache=`` to ``client.embeddings.create(...)`` so that only the
+    inputs missing from the cache are sent to the API.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0")
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._index_path = self._directory / _INDEX_FILE
+        self._journal_path = self._directory / _JOURNAL_FILE
+        self._journal_records = 0
+        self._vectors_path = self._directory / _VECTORS_FILE
+        self._generation: int = 0
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._lock = threading.RLock()
+        # key -> (offset, dims) in float32 units, ordered from least to most recently used
+        self._entries: OrderedDict[CacheKey, Tuple[int, int]] = OrderedDict()
+        self._live_items = 0
+        self._mmap: mmap.mmap | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self._load_index()
+        self._vectors_path.touch(exist_ok=True)
+        self._remove_stale_files()
+
+    def __enter__(self) -> EmbeddingCache:
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(*, model: str, dimensions: int | None, text: str) -> CacheKey:
+        return model, dimensions, _text_digest(text)
+
+    def get_many(self, keys: Sequence[CacheKey]) -> List[Optional[List[float]]]:
+        """Look up a batch of keys, returning ``None`` for every miss."""
+        with self._lock:
+            found = [self._entries.get(key) for key in keys]
+            view = self._mapped() if any(location is not None for location in found) else None
+
+            results: List[Optional[List[float]]] = []
+            for key, location in zip(keys, found):
+                if location is None:
+                    self._misses += 1
+                    results.append(None)
+                    continue
+
+                assert view is not None
+                offset, dims = location
+                vector = array.array("f")
+                vector.frombytes(view[offset * _ITEM_SIZE : (offset + dims) * _ITEM_SIZE])
+                results.append(vector.tolist())
+                self._entries.move_to_end(key)
+                self._hits += 1
+
+            return results
+
+    def put_many(self, items: Sequence[Tuple[CacheKey, Sequence[float]]]) -> None:
+        """Store a batch of vectors with a single append to the vectors file."""
+        if not items:
+            return
+
+        with self._lock:
+            offset = self._vectors_path.stat().st_size // _ITEM_SIZE
+            buffer = array.array("f")
+            for key, vector in items:
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._live_items -= previous[1]
+
+                buffer.extend(vector)
+                self._entries[key] = (offset, len(vector))
+                self._live_items += len(vector)
+                offset += len(vector)
+
+            self._close_mmap()
+            with open(self._vectors_path, "ab") as f:
+                buffer.tofile(f)
+
+            evicted = self._evict()
+            if self._maybe_compact():
+                return
+
+            # appended after the vectors, so a record never points past the end of the file
+            records: List[List[Any]] = [
+                [self._generation, _encode_key(key), *self._entries[key]] for key, _ in items if key in self._entries
+            ]
+            records.extend([self._generation, _encode_key(key)] for key in evicted)
+            self._append_journal(records)
+
+    def stats(self) -> EmbeddingCacheStats:
+        with self._lock:
+            return EmbeddingCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._live_items * _ITEM_SIZE,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._close_mmap()
+            self._entries.clear()
+            self._live_items = 0
+            with open(self._vectors_path, "wb"):
+                pass
+            # journal records written before now refer to the truncated file
+            self._generation += 1
+            self._save_index()
+
+    def close(self) -> None:
+        with self._lock:
+            self._save_index()
+            self._close_mmap()
+
+    def _mapped(self) -> mmap.mmap:
+        if self._mmap is None:
+            with open(self._vectors_path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _close_mmap(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _evict(self) -> List[CacheKey]:
+        evicted: List[CacheKey] = []
+        while self._entries and self._over_capacity():
+            key, (_, dims) = self._entries.popitem(last=False)
+            self._live_items -= dims
+            self._evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def _over_capacity(self) -> bool:
+        if self._max_entries is not None and len(self._entries) > self._max_entries:
+            return True
+        return self._max_bytes is not None and self._live_items * _ITEM_SIZE > self._max_bytes
+
+    def _maybe_compact(self) -> bool:
+        total_items = self._vectors_path.stat().st_size // _ITEM_SIZE
+        if total_items - self._live_items <= max(self._live_items, 1 << 16):
+            return False
+
+        view = self._mapped()
+        generation = self._generation + 1
+        new_path = self._directory / f"vectors.{generation}.f32"
+        offset = 0
+        compacted: OrderedDict[CacheKey, Tuple[int, int]] = OrderedDict()
+        with open(new_path, "wb") as f:
+            for key, (old_offset, dims) in self._entries.items():
+                f.write(view[old_offset * _ITEM_SIZE : (old_offset + dims) * _ITEM_SIZE])
+                compacted[key] = (offset, dims)
+                offset += dims
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._close_mmap()
+        old_path = self._vectors_path
+        self._entries = compacted
+        self._vectors_path = new_path
+        self._generation = generation
+        # the index swap is the commit point, until then the old index and file still agree; the
+        # journal's records carry the old generation from here on and are ignored when loading
+        self._save_index()
+        old_path.unlink()
+        return True
+
+    def _load_index(self) -> None:
+        entries: List[List[Any]] = []
+        if self._index_path.exists():
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+            if data.get("version") != _INDEX_VERSION:
+                raise ValueError(f"Unsupported embedding cache index version: {data.get('version')!r}")
+
+            self._generation = int(data.get("generation", 0))
+            self._vectors_path = self._directory / data.get("vectors", _VECTORS_FILE)
+            entries = data.get("entries", [])
+
+        records, torn = self._read_journal()
+        if not self._vectors_path.exists():
+            # offsets without the file they point into are meaningless
+            return
+
+        size = self._vectors_path.stat().st_size // _ITEM_SIZE
+        locations: OrderedDict[str, Tuple[int, int]] = OrderedDict()
+        for encoded, offset, dims in entries:
+            locations[encoded] = (offset, dims)
+        for record in records:
+            if record[0] != self._generation:
+                continue
+            self._journal_records += 1
+            locations.pop(record[1], None)
+            if len(record) == 4:
+                locations[record[1]] = (record[2], record[3])
+
+        for encoded, (offset, dims) in locations.items():
+            # skip entries whose vectors never made it to disk
+            if offset + dims > size:
+                continue
+            self._entries[_decode_key(encoded)] = (offset, dims)
+            self._live_items += dims
+
+        self._evict()
+        if torn:
+            # records appended after a partly written one could not be read back
+            self._save_index()
+
+    def _read_journal(self) -> Tuple[List[List[Any]], bool]:
+        if not self._journal_path.exists():
+            return [], False
+
+        records: List[List[Any]] = []
+        with open(self._journal_path, "rb") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # a write that was cut off by a crash, and the last line of the journal
+                    return records, True
+        return records, False
+
+    def _append_journal(self, records: List[List[Any]]) -> None:
+        with open(self._journal_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+
+        self._journal_records += len(records)
+        if self._journal_records > max(len(self._entries), _JOURNAL_SNAPSHOT_RECORDS):
+            self._save_index()
+
+    def _save_index(self) -> None:
+        payload: Dict[str, Any] = {
+            "version": _INDEX_VERSION,
+            "generation": self._generation,
+            "vectors": self._vectors_path.name,
+            "entries": [[_encode_key(key), offset, dims] for key, (offset, dims) in self._entries.items()],
+        }
+        tmp_path = self._index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(payload, separators=(",", ":")))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._index_path)
+
+        # replaying the journal onto the snapshot that already contains it changes nothing, so a
+        # crash before it is emptied is harmless
+        with open(self._journal_path, "wb"):
+            pass
+        self._journal_records = 0
+
+    def _remove_stale_files(self) -> None:
+        # vectors files left behind by a compaction that crashed before or after the index swap
+        for path in self._directory.glob(_VECTORS_GLOB):
+            if path != self._vectors_path:
+                path.unlink()
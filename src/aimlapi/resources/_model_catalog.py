@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import difflib
+from typing import Any, Dict, List, Tuple, Union, Iterable, Iterator, Optional, FrozenSet, cast
+from pathlib import Path
+
+from openai._utils import is_dict, is_list
+from openai.types.model import Model
+
+__all__ = ["ModelCatalog", "UnknownModelError"]
+
+_SNAPSHOT_VERSION = 1
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+class UnknownModelError(ValueError):
+    def __init__(self, model: str, suggestions: List[str]) -> None:
+        message = f"Unknown model {model!r}"
+        if suggestions:
+            message += f", did you mean {', '.join(repr(s) for s in suggestions)}?"
+        super().__init__(message)
+        self.model = model
+        self.suggestions = suggestions
+
+
+def _extra(model: Model, name: str) -> Any:
+    # AIMLAPI specific fields are kept as extra attributes on the OpenAI `Model` type
+    return getattr(model, name, None)
+
+
+def _provider(model: Model) -> Optional[str]:
+    info = _extra(model, "info")
+    developer = info.get("developer") if is_dict(info) else None
+    if isinstance(developer, str):
+        return developer
+    if getattr(model, "owned_by", None):
+        return model.owned_by
+    # e.g. `google/gemini-2.0-flash`
+    if "/" in model.id:
+        return model.id.split("/", 1)[0]
+    return None
+
+
+def _modality(model: Model) -> Optional[str]:
+    modality = _extra(model, "type")
+    return modality if isinstance(modality, str) else None
+
+
+def _features(model: Model) -> Iterable[str]:
+    features = _extra(model, "features")
+    if not is_list(features):
+        return ()
+    return [feature for feature in features if isinstance(feature, str)]
+
+
+def _key(value: str) -> str:
+    return value.strip().lower()
+
+
+class ModelCatalog:
+    """An indexed view of the models available to a client.
+
+    Lookups by id, provider, modality (the AIMLAPI model `type`, e.g. `chat-completion`)
+    and feature (e.g. `openai/chat-completion.vision`) are dictionary lookups. Provider,
+    modality and feature lookups are case-insensitive.
+    """
+
+    def __init__(
+        self, models: Iterable[Model], *, etag: Optional[str] = None, fetched_at: Optional[float] = None
+    ) -> None:
+        self.etag = etag
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+        self._models: Dict[str, Model] = {}
+        self._by_provider: Dict[str, List[str]] = {}
+        self._by_modality: Dict[str, List[str]] = {}
+        self._by_feature: Dict[str, List[str]] = {}
+        self._features: Dict[str, FrozenSet[str]] = {}
+
+        for model in models:
+            self._models[model.id] = model
+
+            provider = _provider(model)
+            if provider:
+                self._by_provider.setdefault(_key(provider), []).append(model.id)
+
+            modality = _modality(model)
+            if modality:
+                self._by_modality.setdefault(_key(modality), []).append(model.id)
+
+            features = frozenset(_key(feature) for feature in _features(model))
+            self._features[model.id] = features
+            for feature in features:
+                self._by_feature.setdefault(feature, []).append(model.id)
+
+    def __contains__(self, model: object) -> bool:
+        return model in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __iter__(self) -> Iterator[Model]:
+        return iter(self._models.values())
+
+    @property
+    def age(self) -> float:
+        """Seconds since the catalog was fetched or last revalidated."""
+        return max(time.time() - self.fetched_at, 0.0)
+
+    @property
+    def providers(self) -> List[str]:
+        return sorted(self._by_provider)
+
+    @property
+    def modalities(self) -> List[str]:
+        return sorted(self._by_modality)
+
+    def get(self, model: str) -> Optional[Model]:
+        return self._models.get(model)
+
+    def by_provider(self, provider: str) -> List[Model]:
+        return [self._models[model] for model in self._by_provider.get(_key(provider), [])]
+
+    def by_modality(self, modality: str) -> List[Model]:
+        return [self._models[model] for model in self._by_modality.get(_key(modality), [])]
+
+    def with_feature(self, feature: str) -> List[Model]:
+        return [self._models[model] for model in self._by_feature.get(_key(feature), [])]
+
+    def supports(self, model: str, feature: str) -> bool:
+        return _key(feature) in self._features.get(model, _EMPTY)
+
+    def validate(self, model: str) -> Model:
+        """Return the model or raise `UnknownModelError` with close matches."""
+        found = self._models.get(model)
+        if found is None:
+            raise UnknownModelError(model, difflib.get_close_matches(model, self._models, n=3))
+        return found
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        return {
+            "version": _SNAPSHOT_VERSION,
+            "etag": self.etag,
+            "fetched_at": self.fetched_at,
+            "models": [model.to_dict() for model in self._models.values()],
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: Dict[str, Any]) -> ModelCatalog:
+        if data.get("version") != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported model catalog snapshot version: {data.get('version')!r}")
+
+        return cls(
+            (Model.construct(**model) for model in data["models"]),
+            etag=data.get("etag"),
+            fetched_at=data["fetched_at"],
+        )
+
+    def save(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.to_snapshot(), separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike[str]"]) -> Optional[ModelCatalog]:
+        """Load a snapshot written by `save()`, `None` if it is missing or unreadable."""
+        try:
+            data = json.loads(Path(path).expanduser().read_text(encoding="utf-8"))
+            return cls.from_snapshot(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def parse_models_response(body: Dict[str, Any]) -> Tuple[Model, ...]:
+    return tuple(Model.construct(**cast("Dict[str, Any]", model)) for model in body.get("data", []) if is_dict(model))
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hmac
+import json
+import time
+import base64
+import hashlib
+import threading
+from typing import List, Tuple, Union, Iterable, Optional, cast
+from collections import OrderedDict
+
+from openai._types import HeadersLike
+from openai._utils import get_required_header
+from openai._models import construct_type
+from openai._exceptions import InvalidWebhookSignatureError
+from openai.types.webhooks.unwrap_webhook_event import UnwrapWebhookEvent
+
+__all__ = ["WebhookVerifier", "WebhookRequest"]
+
+# the raw body and the headers of one webhook delivery
+WebhookRequest = Tuple[Union[str, bytes], HeadersLike]
+
+
+def _decode_secret(secret: str) -> bytes:
+    if secret.startswith("whsec_"):
+        return base64.b64decode(secret[6:])
+    return secret.encode()
+
+
+class WebhookVerifier:
+    """Verifies and parses webhook deliveries for one secret.
+
+    Does the same checks as `webhooks.verify_signature()`, but the secret is decoded and
+    the HMAC key schedule computed once, and the signature is computed over the raw
+    body without decoding it. Use `client.webhooks.verifier()` to create one.
+
+    Each verified `webhook-id` is remembered, up to `replay_cache_size` of them, and a
+    delivery with an id that was already verified is rejected. A delivery that you want
+    to be retried must therefore fail before it is verified, or the verifier must be
+    created with `replay_cache_size=0`. Instances are safe to share between threads.
+    """
+
+    def __init__(self, secret: str, *, tolerance: int = 300, replay_cache_size: int = 10_000) -> None:
+        if replay_cache_size < 0:
+            raise ValueError("replay_cache_size must not be negative")
+
+        self.tolerance = tolerance
+        self.replay_cache_size = replay_cache_size
+        self._mac = hmac.new(_decode_secret(secret), digestmod=hashlib.sha256)
+        # webhook-id -> timestamp, oldest first
+        self._seen: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def verify(self, payload: str | bytes, headers: HeadersLike) -> None:
+        """Raise `InvalidWebhookSignatureError` unless the delivery is valid and new."""
+        self._verify(payload, headers, int(time.time()))
+
+    def unwrap(self, payload: str | bytes, headers: HeadersLike) -> UnwrapWebhookEvent:
+        """Verify the delivery and parse it into an event."""
+        self._verify(payload, headers, int(time.time()))
+        return self._parse(payload)
+
+    def verify_many(self, requests: Iterable[WebhookRequest]) -> List[Optional[InvalidWebhookSignatureError]]:
+        """Verify a batch of deliveries.
+
+        Returns one entry per delivery, in order: `None` if it is valid, or the error it
+        would have raised.
+        """
+        now = int(time.time())
+        results: List[Optional[InvalidWebhookSignatureError]] = []
+        for payload, headers in requests:
+            try:
+                self._verify(payload, headers, now)
+            except InvalidWebhookSignatureError as err:
+                results.append(err)
+            else:
+                results.append(None)
+        return results
+
+    def unwrap_many(
+        self, requests: Iterable[WebhookRequest]
+    ) -> List[Union[UnwrapWebhookEvent, InvalidWebhookSignatureError]]:
+        """Verify and parse a batch of deliveries, with the error in place of each invalid one."""
+        now = int(time.time())
+        results: List[Union[UnwrapWebhookEvent, InvalidWebhookSignatureError]] = []
+        for payload, headers in requests:
+            try:
+                self._verify(payload, headers, now)
+            except InvalidWebhookSignatureError as err:
+                results.append(err)
+            else:
+                results.append(self._parse(payload))
+        return results
+
+    def _parse(self, payload: str | bytes) -> UnwrapWebhookEvent:
+        return cast(UnwrapWebhookEvent, construct_type(type_=UnwrapWebhookEvent, value=json.loads(payload)))
+
+    def _verify(self, payload: str | bytes, headers: HeadersLike, now: int) -> None:
+        signature_header = get_required_header(headers, "webhook-signature")
+        timestamp = get_required_header(headers, "webhook-timestamp")
+        webhook_id = get_required_header(headers, "webhook-id")
+
+        try:
+            timestamp_seconds = int(timestamp)
+        except ValueError:
+            raise InvalidWebhookSignatureError("Invalid webhook timestamp format") from None
+
+        if now - timestamp_seconds > self.tolerance:
+            raise InvalidWebhookSignatureError("Webhook timestamp is too old")
+
+        if timestamp_seconds > now + self.tolerance:
+            raise InvalidWebhookSignatureError("Webhook timestamp is too new")
+
+        # the signed content is `{webhook_id}.{timestamp}.{body}`, fed in pieces
+        mac = self._mac.copy()
+        mac.update(f"{webhook_id}.{timestamp}.".encode())
+        mac.update(payload if isinstance(payload, bytes) else payload.encode())
+        expected_signature = base64.b64encode(mac.digest())
+
+        # the header holds space separated `v1,<base64>` values, any of them can match
+        if not any(
+            hmac.compare_digest(expected_signature, (part[3:] if part.startswith("v1,") else part).encode())
+            for part in signature_header.split()
+        ):
+            raise InvalidWebhookSignatureError("The given webhook signature does not match the expected signature")
+
+        self._remember(webhook_id, timestamp_seconds, now)
+
+    def _remember(self, webhook_id: str, timestamp: int, now: int) -> None:
+        if not self.replay_cache_size:
+            return
+
+        with self._lock:
+            if webhook_id in self._seen:
+                raise InvalidWebhookSignatureError(f"Webhook {webhook_id} has already been received")
+
+            seen = self._seen
+            seen[webhook_id] = timestamp
+            # ids older than the tolerance are rejected by their timestamp already
+            while seen and (len(seen) > self.replay_cache_size or now - next(iter(seen.values())) > self.tolerance):
+                seen.popitem(last=False)
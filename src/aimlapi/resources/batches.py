@@ -1,3 +1,201 @@
 from __future__ import annotations
 
+import os
+import json
+import time
+import tempfile
+from typing import IO, Any, Dict, Tuple, Union, Mapping, Iterable, Iterator, Optional, AsyncIterator
+from pathlib import Path
+from typing_extensions import Literal
+
+from openai.types import Batch
+from openai._types import Omit, omit
+from openai._utils._sync import to_thread
 from openai.resources.batches import *  # noqa: F401, F403
+from openai.resources.batches import Batches as _OpenAIBatches, AsyncBatches as _OpenAIAsyncBatches
+from openai.types.shared_params.metadata import Metadata
+
+__all__ = ["Batches", "AsyncBatches", "BatchRequest", "BatchResult", "write_batch_input"]
+
+BatchEndpoint = Literal["/v1/responses", "/v1/chat/completions", "/v1/embeddings", "/v1/completions", "/v1/moderations"]
+
+# either a request body, or a `(custom_id, body)` pair
+BatchRequest = Union[Mapping[str, Any], Tuple[str, Mapping[str, Any]]]
+
+# `(custom_id, line)` where `line` is the parsed JSONL record from the output or error file
+BatchResult = Tuple[str, Dict[str, Any]]
+
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+_DEFAULT_POLL_INTERVAL = 10.0
+
+
+def write_batch_input(
+    requests: Iterable[BatchRequest],
+    file: Union[str, "os.PathLike[str]", IO[str]],
+    *,
+    endpoint: BatchEndpoint,
+) -> int:
+    """Write `requests` to `file` as Batch API JSONL, one line at a time.
+
+    Bodies without an explicit `custom_id` are numbered `request-<index>`. Returns the
+    number of lines written.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w", encoding="utf-8") as f:
+            return write_batch_input(requests, f, endpoint=endpoint)
+
+    count = 0
+    for index, request in enumerate(requests):
+        if isinstance(request, tuple):
+            custom_id, body = request
+        else:
+            custom_id, body = f"request-{index}", request
+
+        line = {"custom_id": custom_id, "method": "POST", "url": endpoint, "body": body}
+        file.write(json.dumps(line, separators=(",", ":")))
+        file.write("\n")
+        count += 1
+
+    return count
+
+
+def _new_input_path() -> Path:
+    fd, name = tempfile.mkstemp(prefix="aimlapi-batch-", suffix=".jsonl")
+    os.close(fd)
+    return Path(name)
+
+
+def _parse_result_line(line: str) -> Optional[BatchResult]:
+    if not line.strip():
+        return None
+
+    record = json.loads(line)
+    return str(record.get("custom_id")), record
+
+
+def _result_file_ids(batch: Batch, *, include_errors: bool) -> list[str]:
+    file_ids = [batch.output_file_id] if batch.output_file_id else []
+    if include_errors and batch.error_file_id:
+        file_ids.append(batch.error_file_id)
+    return file_ids
+
+
+class Batches(_OpenAIBatches):
+    """AIMLAPI batch helpers that keep memory use flat regardless of batch size."""
+
+    def create_from_requests(
+        self,
+        requests: Iterable[BatchRequest],
+        *,
+        endpoint: BatchEndpoint,
+        completion_window: Literal["24h"] = "24h",
+        metadata: Optional[Metadata] | Omit = omit,
+    ) -> Batch:
+        """Stream `requests` into a temporary JSONL file, upload it and create a batch from it."""
+        path = _new_input_path()
+        try:
+            write_batch_input(requests, path, endpoint=endpoint)
+            input_file = self._client.files.create(file=path, purpose="batch")
+        finally:
+            path.unlink()
+
+        return self.create(
+            input_file_id=input_file.id,
+            endpoint=endpoint,
+            completion_window=completion_window,
+            metadata=metadata,
+        )
+
+    def poll(
+        self,
+        batch_id: str,
+        *,
+        poll_interval: float = _DEFAULT_POLL_INTERVAL,
+        poll_timeout: float | None = None,
+    ) -> Batch:
+        """Retrieve the batch until it reaches a terminal status."""
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be greater than 0")
+
+        deadline = None if poll_timeout is None else time.monotonic() + poll_timeout
+        while True:
+            batch = self.retrieve(batch_id)
+            if batch.status in _TERMINAL_STATUSES:
+                return batch
+
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out while waiting for batch {batch_id!r} to finish")
+
+            self._sleep(poll_interval)
+
+    def iter_results(self, batch: Union[Batch, str], *, include_errors: bool = True) -> Iterator[BatchResult]:
+        """Stream `(custom_id, record)` pairs from the batch output file, then the error file."""
+        if isinstance(batch, str):
+            batch = self.retrieve(batch)
+
+        for file_id in _result_file_ids(batch, include_errors=include_errors):
+            with self._client.files.with_streaming_response.content(file_id) as response:
+                for line in response.iter_lines():
+                    result = _parse_result_line(line)
+                    if result is not None:
+                        yield result
+
+
+class AsyncBatches(_OpenAIAsyncBatches):
+    """Async AIMLAPI batch helpers that keep memory use flat regardless of batch size."""
+
+    async def create_from_requests(
+        self,
+        requests: Iterable[BatchRequest],
+        *,
+        endpoint: BatchEndpoint,
+        completion_window: Literal["24h"] = "24h",
+        metadata: Optional[Metadata] | Omit = omit,
+    ) -> Batch:
+        path = _new_input_path()
+        try:
+            await to_thread(write_batch_input, requests, path, endpoint=endpoint)
+            input_file = await self._client.files.create(file=path, purpose="batch")
+        finally:
+            path.unlink()
+
+        return await self.create(
+            input_file_id=input_file.id,
+            endpoint=endpoint,
+            completion_window=completion_window,
+            metadata=metadata,
+        )
+
+    async def poll(
+        self,
+        batch_id: str,
+        *,
+        poll_interval: float = _DEFAULT_POLL_INTERVAL,
+        poll_timeout: float | None = None,
+    ) -> Batch:
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be greater than 0")
+
+        deadline = None if poll_timeout is None else time.monotonic() + poll_timeout
+        while True:
+            batch = await self.retrieve(batch_id)
+            if batch.status in _TERMINAL_STATUSES:
+                return batch
+
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out while waiting for batch {batch_id!r} to finish")
+
+            await self._sleep(poll_interval)
+
+    async def iter_results(
+        self, batch: Union[Batch, str], *, include_errors: bool = True
+    ) -> AsyncIterator[BatchResult]:
+        if isinstance(batch, str):
+            batch = await self.retrieve(batch)
+
+        for file_id in _result_file_ids(batch, include_errors=include_errors):
+            async with self._client.files.with_streaming_response.content(file_id) as response:
+                async for line in response.iter_lines():
+                    result = _parse_result_line(line)
+                    if result is not None:
+                        yield result
@@ -1,3 +1,213 @@
 from __future__ import annotations
 
+from typing import List, Union, Iterable, Optional, Sequence, cast
+from typing_extensions import Literal, override
+
+import httpx
+
+from openai._types import Body, Omit, Query, Headers, NotGiven, SequenceNotStr, omit, not_given
+from openai._utils import is_given
+from openai._constants import RAW_RESPONSE_HEADER
+from openai._utils._sync import to_thread
+from openai.types.embedding import Embedding
 from openai.resources.embeddings import *  # noqa: F401, F403
+from openai.resources.embeddings import Embeddings as _OpenAIEmbeddings, AsyncEmbeddings as _OpenAIAsyncEmbeddings
+from openai.types.embedding_model import EmbeddingModel
+from openai.types.create_embedding_response import Usage, CreateEmbeddingResponse
+
+from ._embedding_cache import CacheKey, EmbeddingCache, EmbeddingCacheStats
+
+__all__ = ["Embeddings", "AsyncEmbeddings", "EmbeddingCache", "EmbeddingCacheStats"]
+
+
+class _CachePlan:
+    """Splits an embeddings request into cache hits and the inputs that still need to be sent."""
+
+    def __init__(
+        self,
+        cache: EmbeddingCache,
+        texts: List[str],
+        *,
+        model: str,
+        dimensions: int | Omit,
+    ) -> None:
+        self.cache = cache
+        self.keys: List[CacheKey] = [
+            cache.key(model=model, dimensions=dimensions if is_given(dimensions) else None, text=text) for text in texts
+        ]
+        self.vectors = cache.get_many(self.keys)
+        self.missing = [i for i, vector in enumerate(self.vectors) if vector is None]
+        self.missing_texts = [texts[i] for i in self.missing]
+        self.model = model
+
+    def merge(self, response: CreateEmbeddingResponse | None) -> CreateEmbeddingResponse:
+        if response is not None:
+            fetched = sorted(response.data, key=lambda embedding: embedding.index)
+            if len(fetched) != len(self.missing):
+                raise ValueError(f"Expected {len(self.missing)} embeddings but received {len(fetched)}")
+
+            self.cache.put_many([(self.keys[i], embedding.embedding) for i, embedding in zip(self.missing, fetched)])
+            for i, embedding in zip(self.missing, fetched):
+                self.vectors[i] = embedding.embedding
+
+        return CreateEmbeddingResponse.construct(
+            data=[
+                Embedding.construct(embedding=vector, index=index, object="embedding")
+                for index, vector in enumerate(self.vectors)
+            ],
+            model=response.model if response is not None else self.model,
+            object="list",
+            usage=response.usage if response is not None else Usage.construct(prompt_tokens=0, total_tokens=0),
+        )
+
+
+def _plan_cached_request(
+    cache: EmbeddingCache | None,
+    *,
+    input: object,
+    model: str,
+    dimensions: int | Omit,
+    encoding_format: Literal["float", "base64"] | Omit,
+    extra_headers: Headers | None,
+) -> Optional[_CachePlan]:
+    if cache is None:
+        return None
+    if extra_headers and extra_headers.get(RAW_RESPONSE_HEADER):
+        # the merged response is built locally, there is no single HTTP response to return
+        raise ValueError("`cache` cannot be used with `.with_raw_response` or `.with_streaming_response`")
+
+    # raw base64 payloads and token inputs are passed through untouched
+    if encoding_format == "base64":
+        return None
+
+    if isinstance(input, str):
+        texts = [input]
+    elif isinstance(input, (list, tuple)):
+        # token inputs are lists of ints, or of lists of ints
+        items = cast(Sequence[object], input)
+        texts = [item for item in items if isinstance(item, str)]
+        if not texts or len(texts) != len(items):
+            return None
+    else:
+        return None
+
+    return _CachePlan(cache, texts, model=model, dimensions=dimensions)
+
+
+class Embeddings(_OpenAIEmbeddings):
+    @override
+    def create(
+        self,
+        *,
+        input: Union[str, SequenceNotStr[str], Iterable[int], Iterable[Iterable[int]]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | Omit = omit,
+        encoding_format: Literal["float", "base64"] | Omit = omit,
+        user: str | Omit = omit,
+        cache: EmbeddingCache | None = None,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> CreateEmbeddingResponse:
+        """Creates an embedding vector representing the input text.
+
+        Args:
+            cache: When given, text inputs already present in the cache are served locally
+                and only the misses are sent to the API. The merged response keeps the
+                original input order; ``usage`` reflects the request that was actually made.
+        """
+        plan = _plan_cached_request(
+            cache,
+            input=input,
+            model=model,
+            dimensions=dimensions,
+            encoding_format=encoding_format,
+            extra_headers=extra_headers,
+        )
+        if plan is None:
+            return super().create(
+                input=input,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        response = None
+        if plan.missing:
+            response = super().create(
+                input=plan.missing_texts,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        return plan.merge(response)
+
+
+class AsyncEmbeddings(_OpenAIAsyncEmbeddings):
+    @override
+    async def create(
+        self,
+        *,
+        input: Union[str, SequenceNotStr[str], Iterable[int], Iterable[Iterable[int]]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | Omit = omit,
+        encoding_format: Literal["float", "base64"] | Omit = omit,
+        user: str | Omit = omit,
+        cache: EmbeddingCache | None = None,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> CreateEmbeddingResponse:
+        plan = None
+        if cache is not None:
+            # the cache reads and writes files, which would block the event loop
+            plan = await to_thread(
+                _plan_cached_request,
+                cache,
+                input=input,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                extra_headers=extra_headers,
+            )
+        if plan is None:
+            return await super().create(
+                input=input,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        response = None
+        if plan.missing:
+            response = await super().create(
+                input=plan.missing_texts,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        return await to_thread(plan.merge, response)
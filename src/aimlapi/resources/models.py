@@ -1,3 +1,131 @@
 from __future__ import annotations
 
+import os
+import time
+from typing import Any, Dict, Union, Optional
+
+import httpx
+
+from openai._exceptions import APIStatusError
+from openai._base_client import make_request_options
+from openai._utils._sync import to_thread
 from openai.resources.models import *  # noqa: F401, F403
+from openai.resources.models import Models as _OpenAIModels, AsyncModels as _OpenAIAsyncModels
+
+from ._model_catalog import ModelCatalog, UnknownModelError, parse_models_response
+
+__all__ = ["Models", "AsyncModels", "ModelCatalog", "UnknownModelError"]
+
+DEFAULT_CATALOG_TTL = 300.0
+
+SnapshotPath = Union[str, "os.PathLike[str]"]
+
+
+def _is_fresh(catalog: Optional[ModelCatalog], ttl: float) -> bool:
+    return catalog is not None and catalog.age < ttl
+
+
+def _revalidation_headers(catalog: Optional[ModelCatalog]) -> Dict[str, str]:
+    if catalog is None or not catalog.etag:
+        return {}
+    return {"If-None-Match": catalog.etag}
+
+
+def _catalog_from_response(response: httpx.Response) -> ModelCatalog:
+    body: Any = response.json()
+    return ModelCatalog(parse_models_response(body), etag=response.headers.get("etag"))
+
+
+def _touch(catalog: ModelCatalog) -> ModelCatalog:
+    catalog.fetched_at = time.time()
+    return catalog
+
+
+class Models(_OpenAIModels):
+    _catalog: Optional[ModelCatalog] = None
+
+    def catalog(
+        self,
+        *,
+        ttl: float = DEFAULT_CATALOG_TTL,
+        snapshot_path: SnapshotPath | None = None,
+        refresh: bool = False,
+    ) -> ModelCatalog:
+        """Return the indexed model catalog, fetching `/models` only when the cached copy is stale.
+
+        The catalog is kept in memory for `ttl` seconds. After that it is revalidated with
+        `If-None-Match`, so an unchanged list costs a `304` instead of the full body. When
+        `snapshot_path` is given the catalog is also written there, and a fresh enough
+        snapshot is used on start up without any request at all.
+        """
+        catalog = self._catalog
+        if catalog is None and snapshot_path is not None:
+            catalog = ModelCatalog.load(snapshot_path)
+
+        if not refresh and _is_fresh(catalog, ttl):
+            assert catalog is not None
+            self._catalog = catalog
+            return catalog
+
+        try:
+            response = self._get(
+                "/models",
+                options=make_request_options(extra_headers=_revalidation_headers(catalog)),
+                cast_to=httpx.Response,
+            )
+        except APIStatusError as err:
+            if err.status_code != 304 or catalog is None:
+                raise
+            catalog = _touch(catalog)
+        else:
+            catalog = _catalog_from_response(response)
+
+        self._catalog = catalog
+        if snapshot_path is not None:
+            catalog.save(snapshot_path)
+        return catalog
+
+
+class AsyncModels(_OpenAIAsyncModels):
+    _catalog: Optional[ModelCatalog] = None
+
+    async def catalog(
+        self,
+        *,
+        ttl: float = DEFAULT_CATALOG_TTL,
+        snapshot_path: SnapshotPath | None = None,
+        refresh: bool = False,
+    ) -> ModelCatalog:
+        """Return the indexed model catalog, fetching `/models` only when the cached copy is stale.
+
+        The catalog is kept in memory for `ttl` seconds. After that it is revalidated with
+        `If-None-Match`, so an unchanged list costs a `304` instead of the full body. When
+        `snapshot_path` is given the catalog is also written there, and a fresh enough
+        snapshot is used on start up without any request at all.
+        """
+        catalog = self._catalog
+        if catalog is None and snapshot_path is not None:
+            catalog = await to_thread(ModelCatalog.load, snapshot_path)
+
+        if not refresh and _is_fresh(catalog, ttl):
+            assert catalog is not None
+            self._catalog = catalog
+            return catalog
+
+        try:
+            response = await self._get(
+                "/models",
+                options=make_request_options(extra_headers=_revalidation_headers(catalog)),
+                cast_to=httpx.Response,
+            )
+        except APIStatusError as err:
+            if err.status_code != 304 or catalog is None:
+                raise
+            catalog = _touch(catalog)
+        else:
+            catalog = _catalog_from_response(response)
+
+        self._catalog = catalog
+        if snapshot_path is not None:
+            await to_thread(catalog.save, snapshot_path)
+        return catalog
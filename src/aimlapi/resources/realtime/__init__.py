@@ -1,3 +1,11 @@
 from __future__ import annotations
 
 from openai.resources.realtime import *  # noqa: F401, F403
+
+from ._pool import (
+    RealtimeSession as RealtimeSession,
+    RealtimeSessionPool as RealtimeSessionPool,
+    RealtimeSessionStats as RealtimeSessionStats,
+)
+from ._events import AudioDeltaEvent as AudioDeltaEvent, event_type as event_type
+from .realtime import *  # noqa: F401, F403
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import re
+import json
+import base64
+from typing import Any, Dict, Type, Union, Callable, Optional, cast
+from typing_extensions import get_args, get_origin
+
+import pydantic
+
+from openai._utils import is_dict, is_union, lru_cache, is_literal_type
+from openai._compat import PYDANTIC_V1, get_model_fields
+from openai._models import BaseModel, construct_type_unchecked, _build_discriminated_union_meta
+from openai.types.realtime.realtime_server_event import RealtimeServerEvent
+from openai.types.realtime.response_audio_delta_event import ResponseAudioDeltaEvent
+
+__all__ = ["AudioDeltaEvent", "event_type", "parse_server_event"]
+
+# `{"type":"x"` or the same after other string valued keys such as `"event_id":"..."`,
+# anything else (nested objects, escapes) goes through the generic parser
+_TYPE_PREFIX = re.compile(rb'\s*\{(?:\s*"[^"\\]*"\s*:\s*"[^"\\]*"\s*,)*?\s*"type"\s*:\s*"([^"\\]+)"')
+
+_AUDIO_DELTA = "response.output_audio.delta"
+_DELTA_KEY = b'"delta":"'
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+class AudioDeltaEvent(ResponseAudioDeltaEvent):
+    """A `response.output_audio.delta` event that decodes its audio on first use."""
+
+    _audio_bytes: Optional[bytes] = pydantic.PrivateAttr(default=None)
+
+    @property
+    def audio_bytes(self) -> bytes:
+        """The raw audio of `delta`, decoded from base64 the first time it is read."""
+        audio = getattr(self, "_audio_bytes", None)
+        if audio is None:
+            if (not PYDANTIC_V1) and getattr(self, "__pydantic_private__", None) is None:
+                self.__pydantic_private__ = {}
+            audio = self._audio_bytes = base64.b64decode(self.delta)
+        return audio
+
+
+def event_type(data: Union[str, bytes]) -> Optional[str]:
+    """Read the `type` of a server event without parsing the rest of it.
+
+    Returns `None` when the type can't be found cheaply, e.g. when it comes after a nested object.
+    """
+    raw = data.encode("utf-8") if isinstance(data, str) else data
+    match = _TYPE_PREFIX.match(raw)
+    return match.group(1).decode("ascii", "replace") if match else None
+
+
+def _parse_audio_delta(raw: bytes) -> Optional[AudioDeltaEvent]:
+    # the base64 payload is almost all of the frame, so it is cut out before `json.loads()`
+    # and put back as a plain ASCII decode instead of going through the JSON string scanner
+    start = raw.find(_DELTA_KEY)
+    if start == -1:
+        return None
+    start += len(_DELTA_KEY)
+    end = raw.find(b'"', start)
+    if end == -1:
+        return None
+
+    audio = raw[start:end]
+    if not audio.isascii() or b"\\" in audio:
+        return None
+
+    value = json.loads(raw[:start] + raw[end:])
+    if not is_dict(value) or value.get("type") != _AUDIO_DELTA or value.get("delta") != "":
+        return None
+
+    value["delta"] = audio.decode("ascii")
+    return cast(AudioDeltaEvent, _constructors()[_AUDIO_DELTA](cast(Dict[str, Any], value)))
+
+
+def _is_primitive(annotation: Any) -> bool:
+    if annotation in _PRIMITIVES or is_literal_type(annotation):
+        return True
+    if is_union(get_origin(annotation)):
+        return all(_is_primitive(arg) for arg in get_args(annotation))
+    return False
+
+
+def _constructor(model: Type[BaseModel]) -> Callable[[Dict[str, Any]], Any]:
+    # events made only of strings, numbers and literals don't need the recursive
+    # `construct()`, pydantic's own `model_construct()` gives the same result
+    flat = all(_is_primitive(field.annotation) for field in get_model_fields(model).values())
+    if flat and not PYDANTIC_V1:
+        construct = pydantic.BaseModel.model_construct.__func__  # type: ignore[attr-defined]
+        return lambda value: construct(model, **value)
+    return lambda value: construct_type_unchecked(value=value, type_=model)
+
+
+@lru_cache(maxsize=None)
+def _constructors() -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+    union, *meta = get_args(RealtimeServerEvent)
+    details = _build_discriminated_union_meta(union=union, meta_annotations=tuple(meta))
+    assert details is not None
+
+    mapping = {**details.mapping, _AUDIO_DELTA: AudioDeltaEvent}
+    return {name: _constructor(cast(Type[BaseModel], model)) for name, model in mapping.items()}
+
+
+def parse_server_event(data: Union[str, bytes]) -> RealtimeServerEvent:
+    """Parse a server event straight into its model, without resolving the event union."""
+    raw = data.encode("utf-8") if isinstance(data, str) else data
+    if event_type(raw) == _AUDIO_DELTA:
+        event = _parse_audio_delta(raw)
+        if event is not None:
+            return cast(RealtimeServerEvent, event)
+
+    value = json.loads(raw)
+    name = value.get("type") if is_dict(value) else None
+    constructor = _constructors().get(name) if isinstance(name, str) else None
+    if constructor is None:
+        return cast(RealtimeServerEvent, construct_type_unchecked(value=value, type_=cast(Any, RealtimeServerEvent)))
+    return cast(RealtimeServerEvent, constructor(cast(Dict[str, Any], value)))
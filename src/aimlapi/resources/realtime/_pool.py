@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+import logging
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, List, Type, Tuple, Union, Optional, cast
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing_extensions import override
+
+import anyio
+from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectSendStream, MemoryObjectReceiveStream
+
+from openai import AsyncOpenAI
+from openai._types import Omit, Query, Headers
+from openai._utils import is_dict
+from openai.types.websocket_connection_options import WebsocketConnectionOptions
+
+from ._events import event_type
+from .realtime import AsyncRealtimeConnection, AsyncRealtimeConnectionManager
+
+if TYPE_CHECKING:
+    from websockets.asyncio.client import ClientConnection
+
+__all__ = ["RealtimeSession", "RealtimeSessionPool", "RealtimeSessionStats"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+Message = Union[str, bytes, bytearray]
+
+
+@dataclass(frozen=True)
+class RealtimeSessionStats:
+    session_id: Optional[str]
+    """The server's id from `session.created`, `None` until it has arrived."""
+    events_received: int
+    queued: int
+    """Events read from the socket that the session hasn't consumed yet."""
+    reconnects: int
+    responses: int
+    """Responses whose first delta has arrived."""
+    mean_time_to_first_delta: Optional[float]
+    """Average seconds between sending `response.create` and its first `response.*.delta`."""
+    max_time_to_first_delta: Optional[float]
+
+
+def _message_type(message: Message) -> Optional[str]:
+    kind = event_type(message)  # type: ignore[arg-type]
+    if kind is None and not isinstance(message, bytearray):
+        # `type` comes after a nested object, so the event has to be parsed to find it
+        try:
+            value = json.loads(message)
+        except ValueError:
+            return None
+        found = value.get("type") if is_dict(value) else None
+        kind = found if isinstance(found, str) else None
+    return kind
+
+
+def _connect_errors() -> Tuple[Type[BaseException], ...]:
+    from websockets.exceptions import WebSocketException
+
+    return (OSError, asyncio.TimeoutError, WebSocketException)
+
+
+class _SessionSocket:
+    """The websocket behind a `RealtimeSession`, replaced when the connection drops.
+
+    A reader task in the pool's task group moves frames into a bounded queue, so a session
+    that isn't consumed stops reading from its socket instead of buffering without limit.
+    The reader never raises into the task group: a dropped connection is reopened, and
+    any other failure ends this session alone and is raised by its `receive()`.
+    """
+
+    def __init__(self, pool: RealtimeSessionPool, websocket: ClientConnection) -> None:
+        self._pool = pool
+        self._websocket = websocket
+        self._closing = False
+        self._error: Optional[BaseException] = None
+        # set and replaced every time a new websocket is in place, senders wait on it
+        self._reconnected = anyio.Event()
+
+        self._send_stream: MemoryObjectSendStream[bytes]
+        self._receive_stream: MemoryObjectReceiveStream[bytes]
+        self._send_stream, self._receive_stream = anyio.create_memory_object_stream(pool.max_queue)
+
+        # replayed on a new websocket to resume the conversation
+        self._session_updates: List[Message] = []
+        self._items: OrderedDict[str, Any] = OrderedDict()
+
+        self._session_id: Optional[str] = None
+        self._events_received = 0
+        self._reconnects = 0
+        self._response_started: Optional[float] = None
+        self._responses = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    async def run(self) -> None:
+        from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
+
+        try:
+            while True:
+                try:
+                    frame = await self._websocket.recv(decode=False)
+                except ConnectionClosed as err:
+                    if self._closing or isinstance(err, ConnectionClosedOK) or not await self._reconnect():
+                        self._error = err
+                        return
+                    continue
+                except _connect_errors() as err:
+                    if self._closing or not await self._reconnect():
+                        self._error = err
+                        return
+                    continue
+
+                self._observe_received(frame)
+                try:
+                    # only yield to the scheduler when the queue is full
+                    try:
+                        self._send_stream.send_nowait(frame)
+                    except anyio.WouldBlock:
+                        await self._send_stream.send(frame)
+                except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                    return
+        except Exception as err:
+            # raising would cancel the task group and with it every other session of the pool
+            log.warning("Realtime session %s failed: %r", self._session_id, err)
+            self._error = err
+        finally:
+            self._send_stream.close()
+            # wake senders waiting for a reconnect that is not going to happen
+            self._reconnected.set()
+
+    async def receive(self) -> bytes:
+        try:
+            try:
+                return self._receive_stream.receive_nowait()
+            except anyio.WouldBlock:
+                return await self._receive_stream.receive()
+        except (anyio.EndOfStream, anyio.ClosedResourceError):
+            raise self._closed_error() from None
+
+    async def send(self, message: Message, text: Optional[bool] = None) -> None:
+        from websockets.exceptions import ConnectionClosedError
+
+        self._observe_sent(message)
+        while True:
+            websocket, reconnected = self._websocket, self._reconnected
+            try:
+                # websockets sends any bytes-like message, though its `Data` type only names `bytes`
+                await websocket.send(cast(Union[str, bytes], message), text=text)
+                return
+            except ConnectionClosedError:
+                if self._closing or not self._pool.reconnect_attempts:
+                    raise
+
+            await reconnected.wait()
+            if self._error is not None:
+                raise self._error
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self._closing = True
+        self._receive_stream.close()
+        self._pool._discard(self)
+        await self._websocket.close(code=code, reason=reason)
+
+    def stats(self) -> RealtimeSessionStats:
+        responses = self._responses
+        return RealtimeSessionStats(
+            session_id=self._session_id,
+            events_received=self._events_received,
+            queued=self._receive_stream.statistics().current_buffer_used,
+            reconnects=self._reconnects,
+            responses=responses,
+            mean_time_to_first_delta=self._latency_total / responses if responses else None,
+            max_time_to_first_delta=self._latency_max if responses else None,
+        )
+
+    def _closed_error(self) -> BaseException:
+        if self._error is not None:
+            return self._error
+
+        from websockets.exceptions import ConnectionClosedOK
+
+        return ConnectionClosedOK(None, None)
+
+    def _observe_sent(self, message: Message) -> None:
+        kind = _message_type(message)
+        if kind == "response.create":
+            self._response_started = time.monotonic()
+        elif kind == "session.update":
+            self._session_updates.append(bytes(message) if isinstance(message, bytearray) else message)
+
+    def _observe_received(self, frame: bytes) -> None:
+        self._events_received += 1
+        kind = _message_type(frame)
+        if kind is None:
+            return
+
+        if kind.startswith("response.") and kind.endswith(".delta"):
+            if self._response_started is not None:
+                latency = time.monotonic() - self._response_started
+                self._response_started = None
+                self._responses += 1
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+        elif kind == "response.done":
+            self._response_started = None
+        elif kind == "conversation.item.done":
+            item: Dict[str, Any] = json.loads(frame).get("item") or {}
+            if item.get("id"):
+                self._items[item["id"]] = item
+        elif kind == "conversation.item.deleted":
+            self._items.pop(json.loads(frame).get("item_id"), None)
+        elif kind == "session.created":
+            session: Dict[str, Any] = json.loads(frame).get("session") or {}
+            self._session_id = session.get("id")
+
+    def _resume_messages(self) -> List[Message]:
+        items = [
+            json.dumps({"type": "conversation.item.create", "item": item}, separators=(",", ":"))
+            for item in self._items.values()
+        ]
+        return [*self._session_updates, *items]
+
+    async def _reconnect(self) -> bool:
+        pool = self._pool
+        for attempt in range(pool.reconnect_attempts):
+            await anyio.sleep(pool.reconnect_backoff * 2**attempt)
+            try:
+                websocket = await pool._connect()
+            except _connect_errors() as err:
+                log.debug("Realtime session reconnect attempt %s failed: %s", attempt + 1, err)
+                continue
+
+            if self._closing:
+                # closed while this attempt was in flight
+                await websocket.close()
+                return False
+
+            try:
+                for message in self._resume_messages():
+                    await websocket.send(cast(Union[str, bytes], message))
+            except _connect_errors() as err:
+                log.debug("Realtime session resume attempt %s failed: %s", attempt + 1, err)
+                await websocket.close()
+                continue
+
+            self._websocket = websocket
+            self._reconnects += 1
+            # the response in flight was lost with the old connection
+            self._response_started = None
+            reconnected, self._reconnected = self._reconnected, anyio.Event()
+            reconnected.set()
+            return True
+        return False
+
+
+class RealtimeSession(AsyncRealtimeConnection):
+    """A realtime connection owned by a `RealtimeSessionPool`.
+
+    It is used like the connection returned by `realtime.connect()`. Events are read from
+    the websocket by the pool into a queue of at most `max_queue` events, so a session
+    that falls behind holds back its own socket instead of growing memory. When the
+    connection drops it is opened again, and the session configuration and the finished
+    conversation items are replayed before events continue.
+    """
+
+    def __init__(self, socket: _SessionSocket) -> None:
+        super().__init__(socket)
+        self._socket = socket
+
+    @override
+    async def recv_bytes(self) -> bytes:
+        """Receive the next message from the session's queue as raw bytes.
+
+        Canceling this method is safe. There's no risk of losing data.
+        """
+        return await self._socket.receive()
+
+    def stats(self) -> RealtimeSessionStats:
+        return self._socket.stats()
+
+
+class RealtimeSessionPool:
+    """Runs many realtime sessions from a single task group.
+
+    Each session's events are read by a lightweight task in the pool's task group, which
+    schedules the reads of all sessions on the one event loop. A failure in one of them
+    only ends that session.
+
+    ```py
+    async with client.realtime.session_pool(model="gpt-realtime") as pool:
+        session = await pool.open()
+        await session.response.create()
+        async for event in session:
+            ...
+    ```
+
+    Sessions stay in the pool until they are closed, also after their connection has
+    failed for good, and every session still open is closed when the pool exits.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncOpenAI,
+        model: str | Omit,
+        max_queue: int,
+        reconnect_attempts: int,
+        reconnect_backoff: float,
+        extra_query: Query,
+        extra_headers: Headers,
+        websocket_connection_options: WebsocketConnectionOptions,
+    ) -> None:
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        if reconnect_attempts < 0:
+            raise ValueError("reconnect_attempts must not be negative")
+
+        self.max_queue = max_queue
+        self.reconnect_attempts = reconnect_attempts
+        self.reconnect_backoff = reconnect_backoff
+        self._client = client
+        self._model = model
+        self._extra_query = extra_query
+        self._extra_headers = extra_headers
+        self._websocket_connection_options = websocket_connection_options
+        self._sessions: Dict[_SessionSocket, RealtimeSession] = {}
+        self._task_group: Optional[TaskGroup] = None
+
+    async def __aenter__(self) -> RealtimeSessionPool:
+        task_group = anyio.create_task_group()
+        await task_group.__aenter__()
+        self._task_group = task_group
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, exc_tb: TracebackType | None
+    ) -> Optional[bool]:
+        task_group = self._task_group
+        assert task_group is not None
+        self._task_group = None
+
+        async with anyio.create_task_group() as closer:
+            for session in list(self._sessions.values()):
+                closer.start_soon(session.close)
+        return await task_group.__aexit__(exc_type, exc, exc_tb)
+
+    @property
+    def sessions(self) -> List[RealtimeSession]:
+        return list(self._sessions.values())
+
+    async def open(self) -> RealtimeSession:
+        """Open a new realtime session in this pool."""
+        if self._task_group is None:
+            raise RuntimeError("Sessions can only be opened inside `async with client.realtime.session_pool(...)`")
+
+        socket = _SessionSocket(self, await self._connect())
+        session = RealtimeSession(socket)
+        self._sessions[socket] = session
+        self._task_group.start_soon(socket.run)
+        return session
+
+    def stats(self) -> List[RealtimeSessionStats]:
+        """Queue depth and latency of every session that hasn't been closed."""
+        return [session.stats() for session in self._sessions.values()]
+
+    async def _connect(self) -> ClientConnection:
+        manager = AsyncRealtimeConnectionManager(
+            client=self._client,
+            model=self._model,
+            extra_query=self._extra_query,
+            extra_headers=self._extra_headers,
+            websocket_connection_options=self._websocket_connection_options,
+        )
+        connection = await manager.enter()
+        return connection._connection
+
+    def _discard(self, socket: _SessionSocket) -> None:
+        self._sessions.pop(socket, None)
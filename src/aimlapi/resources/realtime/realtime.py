@@ -1,3 +1,255 @@
 from __future__ import annotations
 
+import json
+import binascii
+from typing import TYPE_CHECKING, Any, Union, cast
+from typing_extensions import override
+
+from openai._types import Omit, Query, Headers, omit
+from openai._utils import is_given
 from openai.resources.realtime.realtime import *  # noqa: F401, F403
+from openai.resources.realtime.realtime import (
+    Realtime as _OpenAIRealtime,
+    AsyncRealtime as _OpenAIAsyncRealtime,
+    RealtimeConnection as _OpenAIRealtimeConnection,
+    AsyncRealtimeConnection as _OpenAIAsyncRealtimeConnection,
+    RealtimeConnectionManager as _OpenAIRealtimeConnectionManager,
+    AsyncRealtimeConnectionManager as _OpenAIAsyncRealtimeConnectionManager,
+)
+from openai.types.websocket_connection_options import WebsocketConnectionOptions
+from openai.types.realtime.realtime_server_event import RealtimeServerEvent
+
+from ._events import parse_server_event
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from ._pool import RealtimeSessionPool
+
+__all__ = [
+    "Realtime",
+    "AsyncRealtime",
+    "RealtimeConnection",
+    "AsyncRealtimeConnection",
+    "RealtimeConnectionManager",
+    "AsyncRealtimeConnectionManager",
+]
+
+PCMData = Union[bytes, bytearray, memoryview, "np.ndarray[Any, Any]"]
+
+_APPEND_PREFIX = b'{"type":"input_audio_buffer.append","audio":"'
+_APPEND_SUFFIX = b'"}'
+_FLOAT_FORMATS = frozenset({"e", "f", "d"})
+
+
+def _pcm_view(pcm: PCMData) -> memoryview:
+    view = memoryview(pcm)  # type: ignore[arg-type]  # ndarray implements the buffer protocol
+    if view.format in _FLOAT_FORMATS:
+        raise TypeError("`append_audio()` sends raw PCM, convert float samples to 16-bit integers first")
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return view.cast("B") if view.format != "B" or view.ndim != 1 else view
+
+
+class _AppendFrame:
+    """A reusable `input_audio_buffer.append` frame.
+
+    The JSON around the audio never changes, so the prefix is written once and each
+    append only copies the base64 payload and the closing `"}` into the buffer.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray(_APPEND_PREFIX)
+        self.busy = False
+
+    def build(self, view: memoryview) -> bytearray:
+        encoded = binascii.b2a_base64(view, newline=False)
+        start = len(_APPEND_PREFIX)
+        end = start + len(encoded) + len(_APPEND_SUFFIX)
+
+        buffer = self._buffer
+        if len(buffer) < end:
+            buffer.extend(bytes(end - len(buffer)))
+        buffer[start : end - len(_APPEND_SUFFIX)] = encoded
+        buffer[end - len(_APPEND_SUFFIX) : end] = _APPEND_SUFFIX
+        # trimming keeps the allocation, CPython only shrinks a bytearray when it halves
+        del buffer[end:]
+        return buffer
+
+
+def _append_event(view: memoryview, event_id: str) -> bytes:
+    encoded = binascii.b2a_base64(view, newline=False)
+    prefix = b'{"type":"input_audio_buffer.append","event_id":%s,"audio":"' % json.dumps(event_id).encode()
+    return b"".join((prefix, encoded, _APPEND_SUFFIX))
+
+
+class AsyncRealtimeConnection(_OpenAIAsyncRealtimeConnection):
+    def __init__(self, connection: Any) -> None:
+        super().__init__(connection)
+        self._append_frame = _AppendFrame()
+
+    @override
+    def parse_event(self, data: str | bytes) -> RealtimeServerEvent:
+        """
+        Converts a raw `str` or `bytes` message into a `RealtimeServerEvent` object.
+
+        The event `type` is read before the rest of the message so that it is built as its
+        model directly. `response.output_audio.delta` events are `AudioDeltaEvent`s, which
+        decode the audio into `.audio_bytes` only when it is read.
+        """
+        return parse_server_event(data)
+
+    async def append_audio(self, pcm: PCMData, *, event_id: str | Omit = omit) -> None:
+        """Send an `input_audio_buffer.append` event for raw PCM audio.
+
+        Equivalent to `input_audio_buffer.append(audio=base64.b64encode(pcm).decode())`,
+        but the frame is built directly as JSON bytes without the generic event transform.
+        `pcm` can be `bytes`, a `memoryview` or a numpy array of 16-bit samples.
+        """
+        view = _pcm_view(pcm)
+        if is_given(event_id):
+            await self._connection.send(_append_event(view, event_id), text=True)
+            return
+
+        frame = self._append_frame
+        if frame.busy:
+            # another task is mid-send with the shared buffer
+            frame = _AppendFrame()
+
+        frame.busy = True
+        try:
+            # websockets sends any bytes-like message, though its `Data` type only names `bytes`
+            await self._connection.send(cast(bytes, frame.build(view)), text=True)
+        finally:
+            frame.busy = False
+
+
+class RealtimeConnection(_OpenAIRealtimeConnection):
+    def __init__(self, connection: Any) -> None:
+        super().__init__(connection)
+        self._append_frame = _AppendFrame()
+
+    @override
+    def parse_event(self, data: str | bytes) -> RealtimeServerEvent:
+        """
+        Converts a raw `str` or `bytes` message into a `RealtimeServerEvent` object.
+
+        The event `type` is read before the rest of the message so that it is built as its
+        model directly. `response.output_audio.delta` events are `AudioDeltaEvent`s, which
+        decode the audio into `.audio_bytes` only when it is read.
+        """
+        return parse_server_event(data)
+
+    def append_audio(self, pcm: PCMData, *, event_id: str | Omit = omit) -> None:
+        """Send an `input_audio_buffer.append` event for raw PCM audio.
+
+        Equivalent to `input_audio_buffer.append(audio=base64.b64encode(pcm).decode())`,
+        but the frame is built directly as JSON bytes without the generic event transform.
+        `pcm` can be `bytes`, a `memoryview` or a numpy array of 16-bit samples.
+        """
+        view = _pcm_view(pcm)
+        if is_given(event_id):
+            self._connection.send(_append_event(view, event_id), text=True)
+            return
+
+        frame = self._append_frame
+        if frame.busy:
+            frame = _AppendFrame()
+
+        frame.busy = True
+        try:
+            self._connection.send(cast(bytes, frame.build(view)), text=True)
+        finally:
+            frame.busy = False
+
+
+class AsyncRealtimeConnectionManager(_OpenAIAsyncRealtimeConnectionManager):
+    @override
+    async def __aenter__(self) -> AsyncRealtimeConnection:  # type: ignore[override]
+        connection = await super().__aenter__()
+        # wraps the same websocket, so closing either closes both
+        return AsyncRealtimeConnection(connection._connection)
+
+    enter = __aenter__
+
+
+class RealtimeConnectionManager(_OpenAIRealtimeConnectionManager):
+    @override
+    def __enter__(self) -> RealtimeConnection:  # type: ignore[override]
+        connection = super().__enter__()
+        return RealtimeConnection(connection._connection)
+
+    enter = __enter__
+
+
+class Realtime(_OpenAIRealtime):
+    @override
+    def connect(  # type: ignore[override]
+        self,
+        *,
+        call_id: str | Omit = omit,
+        model: str | Omit = omit,
+        extra_query: Query = {},
+        extra_headers: Headers = {},
+        websocket_connection_options: WebsocketConnectionOptions = {},
+    ) -> RealtimeConnectionManager:
+        return RealtimeConnectionManager(
+            client=self._client,
+            extra_query=extra_query,
+            extra_headers=extra_headers,
+            websocket_connection_options=websocket_connection_options,
+            call_id=call_id,
+            model=model,
+        )
+
+
+class AsyncRealtime(_OpenAIAsyncRealtime):
+    @override
+    def connect(  # type: ignore[override]
+        self,
+        *,
+        call_id: str | Omit = omit,
+        model: str | Omit = omit,
+        extra_query: Query = {},
+        extra_headers: Headers = {},
+        websocket_connection_options: WebsocketConnectionOptions = {},
+    ) -> AsyncRealtimeConnectionManager:
+        return AsyncRealtimeConnectionManager(
+            client=self._client,
+            extra_query=extra_query,
+            extra_headers=extra_headers,
+            websocket_connection_options=websocket_connection_options,
+            call_id=call_id,
+            model=model,
+        )
+
+    def session_pool(
+        self,
+        *,
+        model: str | Omit = omit,
+        max_queue: int = 256,
+        reconnect_attempts: int = 3,
+        reconnect_backoff: float = 0.5,
+        extra_query: Query = {},
+        extra_headers: Headers = {},
+        websocket_connection_options: WebsocketConnectionOptions = {},
+    ) -> RealtimeSessionPool:
+        """Manage many realtime sessions from one task group.
+
+        Each session buffers at most `max_queue` unread events and stops reading from its
+        websocket while the queue is full. A session whose connection drops is reconnected
+        up to `reconnect_attempts` times, waiting `reconnect_backoff` seconds before the
+        first attempt and twice as long before each one after.
+        """
+        from ._pool import RealtimeSessionPool
+
+        return RealtimeSessionPool(
+            client=self._client,
+            model=model,
+            max_queue=max_queue,
+            reconnect_attempts=reconnect_attempts,
+            reconnect_backoff=reconnect_backoff,
+            extra_query=extra_query,
+            extra_headers=extra_headers,
+            websocket_connection_options=websocket_connection_options,
+        )
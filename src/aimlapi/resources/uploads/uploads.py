@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-from typing import Any
-
+import io
+import os
+import builtins
+from typing import Any, Tuple, Union, Mapping, cast
+
+from openai.types import FileObject, FilePurpose
+from openai._files import LazyFileReader
+from openai._types import Omit, FileTypes, omit
+from openai._utils import extract_files, deepcopy_minimal
 from openai._compat import cached_property
-from openai._base_client import BaseClient
+from openai._base_client import BaseClient, make_request_options
+from openai.types.upload import Upload
 from openai.resources.uploads.uploads import (
     Uploads as OpenAIUploads,
     AsyncUploads as OpenAIAsyncUploads,
@@ -65,6 +73,48 @@ def _files_url(client: BaseClient, path: str) -> str:
     return f"{base_url}/{path}"
 
 
+def _upload_file_content(
+    file: Union["os.PathLike[str]", bytes],
+    *,
+    filename: str | None,
+) -> Tuple[str, io.IOBase]:
+    if isinstance(file, builtins.bytes):
+        if filename is None:
+            raise TypeError("The `filename` argument must be given for in-memory files")
+
+        return filename, io.BytesIO(file)
+
+    reader = LazyFileReader(file)
+    return filename or reader.name, reader
+
+
+def _files_upload_request(
+    content: io.IOBase,
+    *,
+    filename: str,
+    mime_type: str,
+    purpose: FilePurpose,
+) -> Tuple[object, list[Tuple[str, FileTypes]], Any]:
+    body = deepcopy_minimal({"file": (filename, content, mime_type), "purpose": purpose})
+    files = extract_files(cast(Mapping[str, object], body), paths=[["file"]])
+    options = make_request_options(extra_headers={"Content-Type": "multipart/form-data"})
+    return body, files, options
+
+
+def _upload_from_file_object(file: FileObject) -> Upload:
+    return Upload.construct(
+        id=file.id,
+        bytes=file.bytes,
+        created_at=file.created_at,
+        expires_at=file.expires_at or 0,
+        filename=file.filename,
+        object="upload",
+        purpose=file.purpose,
+        status="completed",
+        file=file,
+    )
+
+
 class Uploads(OpenAIUploads):
     @cached_property
     def parts(self):  # type: ignore[override]
@@ -72,6 +122,36 @@ class Uploads(OpenAIUploads):
             "AIMLAPI does not support /v1/uploads for now."
         )
 
+    def upload_file_chunked(  # type: ignore[override]
+        self,
+        *,
+        file: Union["os.PathLike[str]", bytes],
+        mime_type: str,
+        purpose: FilePurpose,
+        filename: str | None = None,
+        bytes: int | None = None,
+        part_size: int | None = None,
+        md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        compute_md5: bool = False,
+    ) -> Upload:
+        """Uploads the given file to `/files` as a single streamed multipart request.
+
+        AIMLAPI does not support upload parts yet, so `bytes`, `part_size`, `md5`,
+        `max_concurrency` and `compute_md5` are accepted for compatibility and ignored.
+        Files on disk are read in small chunks while the request body is sent, so memory
+        usage does not grow with the file size.
+        """
+        del bytes, part_size, md5, max_concurrency, compute_md5
+        filename, content = _upload_file_content(file, filename=filename)
+        body, files, options = _files_upload_request(content, filename=filename, mime_type=mime_type, purpose=purpose)
+        try:
+            file_object = self._post("/files", body=body, files=files, options=options, cast_to=FileObject)
+        finally:
+            content.close()
+
+        return _upload_from_file_object(file_object)
+
     def __init__(self, client: Any) -> None:
         super().__init__(client)
         self._post = self._files_post  # type: ignore[assignment]
@@ -95,6 +175,36 @@ class AsyncUploads(OpenAIAsyncUploads):
             "AIMLAPI does not support /v1/uploads for now."
         )
 
+    async def upload_file_chunked(  # type: ignore[override]
+        self,
+        *,
+        file: Union["os.PathLike[str]", bytes],
+        mime_type: str,
+        purpose: FilePurpose,
+        filename: str | None = None,
+        bytes: int | None = None,
+        part_size: int | None = None,
+        md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        compute_md5: bool = False,
+    ) -> Upload:
+        """Uploads the given file to `/files` as a single streamed multipart request.
+
+        AIMLAPI does not support upload parts yet, so `bytes`, `part_size`, `md5`,
+        `max_concurrency` and `compute_md5` are accepted for compatibility and ignored.
+        Files on disk are read in small chunks while the request body is sent, so memory
+        usage does not grow with the file size.
+        """
+        del bytes, part_size, md5, max_concurrency, compute_md5
+        filename, content = _upload_file_content(file, filename=filename)
+        body, files, options = _files_upload_request(content, filename=filename, mime_type=mime_type, purpose=purpose)
+        try:
+            file_object = await self._post("/files", body=body, files=files, options=options, cast_to=FileObject)
+        finally:
+            content.close()
+
+        return _upload_from_file_object(file_object)
+
     def __init__(self, client: Any) -> None:
         super().__init__(client)
         self._post = self._files_post  # type: ignore[assignment]
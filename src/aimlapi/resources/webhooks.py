@@ -1,3 +1,61 @@
 from __future__ import annotations
 
 from openai.resources.webhooks import *  # noqa: F401, F403
+from openai.resources.webhooks import Webhooks as _OpenAIWebhooks, AsyncWebhooks as _OpenAIAsyncWebhooks
+
+from ._webhook_verifier import WebhookRequest, WebhookVerifier
+
+__all__ = ["Webhooks", "AsyncWebhooks", "WebhookVerifier", "WebhookRequest"]
+
+
+def _require_secret(secret: str | None) -> str:
+    if secret is None:
+        raise ValueError(
+            "The webhook secret must either be set using the env var, OPENAI_WEBHOOK_SECRET, "
+            "on the client class, AIMLAPI(webhook_secret='123'), or passed to this function"
+        )
+    return secret
+
+
+class Webhooks(_OpenAIWebhooks):
+    def verifier(
+        self,
+        *,
+        secret: str | None = None,
+        tolerance: int = 300,
+        replay_cache_size: int = 10_000,
+    ) -> WebhookVerifier:
+        """Create a reusable verifier for high volumes of webhooks.
+
+        Args:
+            secret: The webhook secret (optional, will use client secret if not provided)
+            tolerance: Maximum age of the webhook in seconds (default: 300 = 5 minutes)
+            replay_cache_size: How many verified webhook ids to remember to reject replays, 0 to disable
+        """
+        return WebhookVerifier(
+            _require_secret(secret if secret is not None else self._client.webhook_secret),
+            tolerance=tolerance,
+            replay_cache_size=replay_cache_size,
+        )
+
+
+class AsyncWebhooks(_OpenAIAsyncWebhooks):
+    def verifier(
+        self,
+        *,
+        secret: str | None = None,
+        tolerance: int = 300,
+        replay_cache_size: int = 10_000,
+    ) -> WebhookVerifier:
+        """Create a reusable verifier for high volumes of webhooks.
+
+        Args:
+            secret: The webhook secret (optional, will use client secret if not provided)
+            tolerance: Maximum age of the webhook in seconds (default: 300 = 5 minutes)
+            replay_cache_size: How many verified webhook ids to remember to reject replays, 0 to disable
+        """
+        return WebhookVerifier(
+            _require_secret(secret if secret is not None else self._client.webhook_secret),
+            tolerance=tolerance,
+            replay_cache_size=replay_cache_size,
+        )
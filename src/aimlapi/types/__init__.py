@@ -1,3 +1,23 @@
 from __future__ import annotations
 
-from openai.types import *  # noqa: F401, F403
+from typing import TYPE_CHECKING, Any
+
+from .._aliases import install_alias
+
+if TYPE_CHECKING:
+    from openai.types import *  # noqa: F401, F403
+
+# `aimlapi.types.<x>` is the `openai.types.<x>` module object itself
+install_alias(__name__, "openai.types")
+
+
+def __getattr__(name: str) -> Any:
+    import openai.types
+
+    if name == "__all__":
+        return [name for name in dir(openai.types) if not name.startswith("_")]
+
+    try:
+        return getattr(openai.types, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
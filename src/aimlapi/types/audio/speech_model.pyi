@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.audio.speech_model import *  # noqa: F401, F403
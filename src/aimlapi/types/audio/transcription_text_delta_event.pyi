@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.audio.transcription_text_delta_event import *  # noqa: F401, F403
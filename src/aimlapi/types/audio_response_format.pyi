@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.audio_response_format import *  # noqa: F401, F403
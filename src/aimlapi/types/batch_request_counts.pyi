@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.batch_request_counts import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.assistant_response_format_option_param import *  # noqa: F401, F403
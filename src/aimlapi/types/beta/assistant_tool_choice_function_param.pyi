@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.assistant_tool_choice_function_param import *  # noqa: F401, F403
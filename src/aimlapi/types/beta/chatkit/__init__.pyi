@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.chatkit import *  # noqa: F401, F403
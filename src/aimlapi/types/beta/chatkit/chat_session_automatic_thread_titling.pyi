@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.chatkit.chat_session_automatic_thread_titling import *  # noqa: F401, F403
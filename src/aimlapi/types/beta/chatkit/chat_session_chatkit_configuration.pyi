@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.chatkit.chat_session_chatkit_configuration import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.chatkit.chatkit_thread_assistant_message_item import *  # noqa: F401, F403
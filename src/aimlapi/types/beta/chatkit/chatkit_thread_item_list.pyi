@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.chatkit.chatkit_thread_item_list import *  # noqa: F401, F403
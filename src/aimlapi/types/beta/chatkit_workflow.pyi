@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.chatkit_workflow import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.realtime.conversation_item_content_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.realtime.input_audio_buffer_append_event_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.realtime.response_output_item_added_event import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.realtime.response_text_done_event import *  # noqa: F401, F403
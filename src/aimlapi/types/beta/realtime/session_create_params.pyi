@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.realtime.session_create_params import *  # noqa: F401, F403
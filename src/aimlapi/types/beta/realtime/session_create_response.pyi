@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.realtime.session_create_response import *  # noqa: F401, F403
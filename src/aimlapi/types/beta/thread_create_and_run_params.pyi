@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.thread_create_and_run_params import *  # noqa: F401, F403
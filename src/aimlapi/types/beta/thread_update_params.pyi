@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.thread_update_params import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.file_citation_delta_annotation import *  # noqa: F401, F403
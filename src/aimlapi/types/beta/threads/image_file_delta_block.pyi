@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.image_file_delta_block import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.image_url_delta import *  # noqa: F401, F403
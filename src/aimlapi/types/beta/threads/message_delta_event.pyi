@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.message_delta_event import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.refusal_delta_block import *  # noqa: F401, F403
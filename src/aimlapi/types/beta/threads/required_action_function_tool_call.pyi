@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.required_action_function_tool_call import *  # noqa: F401, F403
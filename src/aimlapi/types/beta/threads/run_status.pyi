@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.run_status import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.runs.code_interpreter_logs import *  # noqa: F401, F403
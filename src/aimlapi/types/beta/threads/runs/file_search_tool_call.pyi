@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.runs.file_search_tool_call import *  # noqa: F401, F403
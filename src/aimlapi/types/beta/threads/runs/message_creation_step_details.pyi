@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.runs.message_creation_step_details import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.runs.run_step import *  # noqa: F401, F403
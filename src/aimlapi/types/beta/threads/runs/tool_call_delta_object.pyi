@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.beta.threads.runs.tool_call_delta_object import *  # noqa: F401, F403
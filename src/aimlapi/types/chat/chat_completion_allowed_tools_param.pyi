@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.chat.chat_completion_allowed_tools_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.chat.chat_completion_message_function_tool_call_param import *  # noqa: F401, F403
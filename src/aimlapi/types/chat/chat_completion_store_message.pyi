@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.chat.chat_completion_store_message import *  # noqa: F401, F403
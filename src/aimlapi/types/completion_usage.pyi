@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.completion_usage import *  # noqa: F401, F403
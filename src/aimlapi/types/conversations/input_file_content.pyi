@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.conversations.input_file_content import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.conversations.input_image_content_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.conversations.message import *  # noqa: F401, F403
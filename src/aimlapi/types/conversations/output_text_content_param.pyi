@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.conversations.output_text_content_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.conversations.refusal_content import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.eval_custom_data_source_config import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.evals.create_eval_jsonl_run_data_source import *  # noqa: F401, F403
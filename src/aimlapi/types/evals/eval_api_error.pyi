@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.evals.eval_api_error import *  # noqa: F401, F403
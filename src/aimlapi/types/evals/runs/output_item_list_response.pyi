@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.evals.runs.output_item_list_response import *  # noqa: F401, F403
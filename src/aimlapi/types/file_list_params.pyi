@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.file_list_params import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.fine_tuning.alpha.grader_run_params import *  # noqa: F401, F403
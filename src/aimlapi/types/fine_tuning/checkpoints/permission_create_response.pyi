@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.fine_tuning.checkpoints.permission_create_response import *  # noqa: F401, F403
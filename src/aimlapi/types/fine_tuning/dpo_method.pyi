@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.fine_tuning.dpo_method import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.fine_tuning.fine_tuning_job_integration import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.fine_tuning.job_list_params import *  # noqa: F401, F403
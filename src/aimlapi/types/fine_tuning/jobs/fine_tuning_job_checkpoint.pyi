@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.fine_tuning.jobs.fine_tuning_job_checkpoint import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.fine_tuning.reinforcement_method_param import *  # noqa: F401, F403
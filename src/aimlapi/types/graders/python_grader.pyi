@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.graders.python_grader import *  # noqa: F401, F403
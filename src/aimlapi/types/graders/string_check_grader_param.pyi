@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.graders.string_check_grader_param import *  # noqa: F401, F403
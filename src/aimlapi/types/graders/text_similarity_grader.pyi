@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.graders.text_similarity_grader import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.image_edit_completed_event import *  # noqa: F401, F403
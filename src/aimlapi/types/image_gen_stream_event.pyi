@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.image_gen_stream_event import *  # noqa: F401, F403
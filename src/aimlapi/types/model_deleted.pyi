@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.model_deleted import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.moderation_multi_modal_input_param import *  # noqa: F401, F403
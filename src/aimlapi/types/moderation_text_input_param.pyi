@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.moderation_text_input_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.audio_transcription_param import *  # noqa: F401, F403
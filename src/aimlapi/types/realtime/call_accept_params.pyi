@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.call_accept_params import *  # noqa: F401, F403
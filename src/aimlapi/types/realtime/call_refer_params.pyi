@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.call_refer_params import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.conversation_item import *  # noqa: F401, F403
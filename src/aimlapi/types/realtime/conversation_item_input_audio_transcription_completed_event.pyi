@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.conversation_item_input_audio_transcription_completed_event import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.log_prob_properties import *  # noqa: F401, F403
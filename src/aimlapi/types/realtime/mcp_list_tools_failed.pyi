@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.mcp_list_tools_failed import *  # noqa: F401, F403
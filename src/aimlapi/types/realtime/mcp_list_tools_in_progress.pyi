@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.mcp_list_tools_in_progress import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.noise_reduction_type import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.output_audio_buffer_clear_event_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.rate_limits_updated_event import *  # noqa: F401, F403
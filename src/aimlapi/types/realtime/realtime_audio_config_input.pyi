@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_audio_config_input import *  # noqa: F401, F403
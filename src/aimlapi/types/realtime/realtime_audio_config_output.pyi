@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_audio_config_output import *  # noqa: F401, F403
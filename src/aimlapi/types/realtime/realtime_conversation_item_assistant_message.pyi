@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_conversation_item_assistant_message import *  # noqa: F401, F403
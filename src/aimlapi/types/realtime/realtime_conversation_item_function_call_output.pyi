@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_conversation_item_function_call_output import *  # noqa: F401, F403
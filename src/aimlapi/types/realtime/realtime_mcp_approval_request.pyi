@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_mcp_approval_request import *  # noqa: F401, F403
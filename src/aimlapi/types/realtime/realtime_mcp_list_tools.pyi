@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_mcp_list_tools import *  # noqa: F401, F403
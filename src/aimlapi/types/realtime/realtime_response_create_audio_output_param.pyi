@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_response_create_audio_output_param import *  # noqa: F401, F403
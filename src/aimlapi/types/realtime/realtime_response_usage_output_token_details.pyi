@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_response_usage_output_token_details import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_session_client_secret import *  # noqa: F401, F403
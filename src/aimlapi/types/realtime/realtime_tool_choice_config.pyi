@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_tool_choice_config import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.realtime_transcription_session_audio_input import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.response_audio_delta_event import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.response_content_part_done_event import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.response_create_event_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.response_mcp_call_arguments_done import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.response_mcp_call_failed import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.response_text_done_event import *  # noqa: F401, F403
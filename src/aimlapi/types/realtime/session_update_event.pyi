@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.realtime.session_update_event import *  # noqa: F401, F403
@@ -0,0 +1 @@
+from openai.types.responses.apply_patch_tool import *  # noqa: F401, F403
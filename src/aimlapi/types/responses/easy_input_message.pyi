@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.easy_input_message import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.easy_input_message_param import *  # noqa: F401, F403
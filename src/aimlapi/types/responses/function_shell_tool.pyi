@@ -0,0 +1 @@
+from openai.types.responses.function_shell_tool import *  # noqa: F401, F403
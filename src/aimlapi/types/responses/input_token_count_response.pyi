@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.input_token_count_response import *  # noqa: F401, F403
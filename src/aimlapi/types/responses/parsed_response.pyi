@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.parsed_response import *  # noqa: F401, F403
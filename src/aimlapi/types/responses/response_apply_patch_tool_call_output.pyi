@@ -0,0 +1 @@
+from openai.types.responses.response_apply_patch_tool_call_output import *  # noqa: F401, F403
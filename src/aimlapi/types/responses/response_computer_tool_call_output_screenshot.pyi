@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_computer_tool_call_output_screenshot import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_custom_tool_call_input_done_event import *  # noqa: F401, F403
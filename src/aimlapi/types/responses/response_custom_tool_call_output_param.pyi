@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_custom_tool_call_output_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_file_search_call_completed_event import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_format_text_config import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_format_text_json_schema_config_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_function_call_arguments_done_event import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_function_call_output_item_param import *  # noqa: F401, F403
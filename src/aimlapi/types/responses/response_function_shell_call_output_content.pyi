@@ -0,0 +1 @@
+from openai.types.responses.response_function_shell_call_output_content import *  # noqa: F401, F403
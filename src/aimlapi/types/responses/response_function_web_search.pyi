@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_function_web_search import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_image_gen_call_partial_image_event import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_input_item_param import *  # noqa: F401, F403
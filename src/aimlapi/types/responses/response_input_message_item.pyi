@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.response_input_message_item import *  # noqa: F401, F403
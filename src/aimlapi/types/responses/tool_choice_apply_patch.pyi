@@ -0,0 +1 @@
+from openai.types.responses.tool_choice_apply_patch import *  # noqa: F401, F403
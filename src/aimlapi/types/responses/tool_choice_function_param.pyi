@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.tool_choice_function_param import *  # noqa: F401, F403
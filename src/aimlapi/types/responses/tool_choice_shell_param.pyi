@@ -0,0 +1 @@
+from openai.types.responses.tool_choice_shell_param import *  # noqa: F401, F403
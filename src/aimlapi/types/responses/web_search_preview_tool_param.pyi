@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.responses.web_search_preview_tool_param import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.shared.all_models import *  # noqa: F401, F403
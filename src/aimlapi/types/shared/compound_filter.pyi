@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.shared.compound_filter import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.shared.custom_tool_input_format import *  # noqa: F401, F403
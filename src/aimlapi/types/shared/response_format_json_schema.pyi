@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.shared.response_format_json_schema import *  # noqa: F401, F403
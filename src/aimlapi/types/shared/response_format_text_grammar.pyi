@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.shared.response_format_text_grammar import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.shared_params.custom_tool_input_format import *  # noqa: F401, F403
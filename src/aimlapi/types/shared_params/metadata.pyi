@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.shared_params.metadata import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.shared_params.response_format_json_object import *  # noqa: F401, F403
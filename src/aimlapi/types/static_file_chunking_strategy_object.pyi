@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.static_file_chunking_strategy_object import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.uploads.upload_part import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.vector_store import *  # noqa: F401, F403
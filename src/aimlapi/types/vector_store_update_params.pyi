@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.vector_store_update_params import *  # noqa: F401, F403
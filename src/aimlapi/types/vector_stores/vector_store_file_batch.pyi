@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.vector_stores.vector_store_file_batch import *  # noqa: F401, F403
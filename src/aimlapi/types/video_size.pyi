@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.video_size import *  # noqa: F401, F403
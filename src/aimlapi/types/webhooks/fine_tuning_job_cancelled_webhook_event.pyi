@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.webhooks.fine_tuning_job_cancelled_webhook_event import *  # noqa: F401, F403
@@ -1,3 +1 @@
-from __future__ import annotations
-
 from openai.types.webhooks.realtime_call_incoming_webhook_event import *  # noqa: F401, F403
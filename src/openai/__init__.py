@@ -7,6 +7,7 @@ import typing as _t
 from typing_extensions import override
 
 from . import types
+from ._files import set_upload_buffer_limit
 from ._types import NOT_GIVEN, Omit, NoneType, NotGiven, Transport, ProxiesTypes, omit, not_given
 from ._utils import file_from_path
 from ._client import Client, OpenAI, Stream, Timeout, Transport, AsyncClient, AsyncOpenAI, AsyncStream, RequestOptions
@@ -75,6 +76,7 @@ __all__ = [
     "OpenAI",
     "AsyncOpenAI",
     "file_from_path",
+    "set_upload_buffer_limit",
     "BaseModel",
     "DEFAULT_TIMEOUT",
     "DEFAULT_MAX_RETRIES",
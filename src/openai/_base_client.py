@@ -9,6 +9,7 @@ import asyncio
 import inspect
 import logging
 import platform
+import threading
 import email.utils
 from types import TracebackType
 from random import random
@@ -21,15 +22,17 @@ from typing import (
     Generic,
     Mapping,
     TypeVar,
+    Callable,
     Iterable,
     Iterator,
     Optional,
+    Awaitable,
     Generator,
     AsyncIterator,
     cast,
     overload,
 )
-from typing_extensions import Literal, override, get_origin
+from typing_extensions import Self, Literal, override, get_origin
 
 import anyio
 import httpx
@@ -37,10 +40,12 @@ import distro
 import pydantic
 from httpx import URL
 from pydantic import PrivateAttr
+from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectSendStream, MemoryObjectReceiveStream
 
 from . import _exceptions
 from ._qs import Querystring
-from ._files import to_httpx_files, async_to_httpx_files
+from ._files import AsyncFileStream, to_httpx_files, async_to_httpx_files
 from ._types import (
     Body,
     Omit,
@@ -250,11 +255,29 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
     # to cast a model to a dictionary, model.dict(), which is used internally
     # by pydantic.
     def __iter__(self) -> Iterator[_T]:  # type: ignore
-        for page in self.iter_pages():
-            for item in page._get_page_items():
-                yield item
+        return self.iter_items()
+
+    def iter_items(self, *, prefetch: int = 0) -> Iterator[_T]:
+        """Iterate over the items of this page and every page after it, see `iter_pages()`."""
+        pages = self.iter_pages(prefetch=prefetch)
+        return (item for page in pages for item in page._get_page_items())
+
+    def iter_pages(self: SyncPageT, *, prefetch: int = 0) -> Iterator[SyncPageT]:
+        """Iterate over this page and every page after it.
+
+        With `prefetch=N`, up to `N` upcoming pages are fetched in a background thread
+        while the caller is still processing the current one. If the caller stops early,
+        the thread exits once the request it is making has finished, as soon as the
+        iterator is closed or garbage collected.
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+
+        if prefetch == 0:
+            return self._iter_pages()
+        return _prefetch_sync_pages(self, prefetch)
 
-    def iter_pages(self: SyncPageT) -> Iterator[SyncPageT]:
+    def _iter_pages(self: SyncPageT) -> Iterator[SyncPageT]:
         page = self
         while True:
             yield page
@@ -312,6 +335,14 @@ class AsyncPaginator(Generic[_T, AsyncPageT]):
         async for item in page:
             yield item
 
+    def iter_pages(self, *, prefetch: int = 0) -> AsyncPageIterator[AsyncPageT]:
+        """Request the first page and iterate over it and every page after it, see `BaseAsyncPage.iter_pages()`."""
+        return AsyncPageIterator(self._get_page, prefetch=prefetch, items=False)
+
+    def iter_items(self, *, prefetch: int = 0) -> AsyncPageIterator[_T]:
+        """Request the first page and iterate over the items of every page, see `BaseAsyncPage.iter_pages()`."""
+        return AsyncPageIterator(self._get_page, prefetch=prefetch, items=True)
+
 
 class BaseAsyncPage(BasePage[_T], Generic[_T]):
     _client: AsyncAPIClient = pydantic.PrivateAttr()
@@ -334,14 +365,30 @@ class BaseAsyncPage(BasePage[_T], Generic[_T]):
             for item in page._get_page_items():
                 yield item
 
-    async def iter_pages(self: AsyncPageT) -> AsyncIterator[AsyncPageT]:
-        page = self
-        while True:
-            yield page
-            if page.has_next_page():
-                page = await page.get_next_page()
-            else:
-                return
+    def iter_pages(self: AsyncPageT, *, prefetch: int = 0) -> AsyncPageIterator[AsyncPageT]:
+        """Iterate over this page and every page after it.
+
+        With `prefetch=N`, up to `N` upcoming pages are fetched by a background task while
+        the caller is still processing the current one. The task runs in a task group that
+        is opened by `async with`, which prefetching requires:
+
+        ```py
+        async with first_page.iter_pages(prefetch=2) as pages:
+            async for page in pages:
+                ...
+        ```
+
+        Leaving the block cancels the request that is in flight, also when the loop was
+        left early.
+        """
+        return AsyncPageIterator(self._get_self, prefetch=prefetch, items=False)
+
+    def iter_items(self, *, prefetch: int = 0) -> AsyncPageIterator[_T]:
+        """Iterate over the items of this page and every page after it, see `iter_pages()`."""
+        return AsyncPageIterator(self._get_self, prefetch=prefetch, items=True)
+
+    async def _get_self(self) -> Self:
+        return self
 
     async def get_next_page(self: AsyncPageT) -> AsyncPageT:
         info = self.next_page_info()
@@ -354,6 +401,161 @@ class BaseAsyncPage(BasePage[_T], Generic[_T]):
         return await self._client._request_api_list(self._model, page=self.__class__, options=options)
 
 
+_PAGES_DONE = object()
+
+
+class _PageFetchError:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _prefetch_sync_pages(page: SyncPageT, prefetch: int) -> Iterator[SyncPageT]:
+    """Yields `page` and the pages after it, fetching them ahead of the consumer in a worker thread.
+
+    The worker is started before `page` is handed out so the next request overlaps the
+    caller's processing of the first page.
+    """
+    # imported here, only page iteration with `prefetch` needs it
+    import queue
+
+    pages: "queue.Queue[object]" = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        current = page
+        try:
+            while current.has_next_page():
+                current = current.get_next_page()
+                if not put(current):
+                    return
+        except BaseException as err:
+            put(_PageFetchError(err))
+            return
+        put(_PAGES_DONE)
+
+    worker = threading.Thread(target=produce, name="openai-page-prefetch", daemon=True)
+    worker.start()
+    try:
+        yield page
+        while True:
+            item = pages.get()
+            if item is _PAGES_DONE:
+                return
+            if isinstance(item, _PageFetchError):
+                raise item.error
+            yield cast(SyncPageT, item)
+    finally:
+        stopped.set()
+
+
+class AsyncPageIterator(Generic[_T]):
+    """Iterates over the pages of an async list endpoint, or over the items on them.
+
+    Without prefetching this is a plain async iterator. With prefetching, upcoming pages
+    are fetched by a task in a task group that is opened and closed by `async with`, so
+    that no request outlives the block.
+    """
+
+    def __init__(
+        self,
+        first_page: Callable[[], Awaitable[BaseAsyncPage[Any]]],
+        *,
+        prefetch: int,
+        items: bool,
+    ) -> None:
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+
+        self._first_page = first_page
+        self._prefetch = prefetch
+        self._items = items
+        self._page: BaseAsyncPage[Any] | None = None
+        self._page_items: Iterator[Any] = iter(())
+        self._task_group: TaskGroup | None = None
+        self._pages: MemoryObjectReceiveStream[object] | None = None
+
+    async def __aenter__(self) -> Self:
+        if self._prefetch and self._task_group is None:
+            send, self._pages = anyio.create_memory_object_stream[object](self._prefetch)
+            self._task_group = anyio.create_task_group()
+            await self._task_group.__aenter__()
+            self._task_group.start_soon(self._produce, send)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        if self._task_group is None:
+            return None
+
+        task_group, self._task_group = self._task_group, None
+        task_group.cancel_scope.cancel()
+        try:
+            return await task_group.__aexit__(exc_type, exc, exc_tb)
+        finally:
+            if self._pages is not None:
+                self._pages.close()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> _T:
+        if not self._items:
+            return cast(_T, await self._next_page())
+
+        while True:
+            for item in self._page_items:
+                return cast(_T, item)
+            self._page_items = iter((await self._next_page())._get_page_items())
+
+    async def _next_page(self) -> BaseAsyncPage[Any]:
+        if self._pages is not None:
+            try:
+                item = await self._pages.receive()
+            except anyio.EndOfStream:
+                raise StopAsyncIteration() from None
+
+            if isinstance(item, _PageFetchError):
+                raise item.error
+            return cast("BaseAsyncPage[Any]", item)
+
+        if self._prefetch:
+            raise RuntimeError(
+                "Prefetching pages requires `async with`, e.g. `async with page.iter_pages(prefetch=2) as pages:`"
+            )
+
+        if self._page is None:
+            self._page = await self._first_page()
+        elif self._page.has_next_page():
+            self._page = await self._page.get_next_page()
+        else:
+            raise StopAsyncIteration()
+        return self._page
+
+    async def _produce(self, pages: MemoryObjectSendStream[object]) -> None:
+        async with pages:
+            try:
+                page = await self._first_page()
+                await pages.send(page)
+                while page.has_next_page():
+                    page = await page.get_next_page()
+                    await pages.send(page)
+            except Exception as err:
+                await pages.send(_PageFetchError(err))
+
+
 _HttpxClientT = TypeVar("_HttpxClientT", bound=Union[httpx.Client, httpx.AsyncClient])
 _DefaultStreamT = TypeVar("_DefaultStreamT", bound=Union[Stream[Any], AsyncStream[Any]])
 
@@ -1513,6 +1715,9 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
             remaining_retries = max_retries - retries_taken
             request = self._build_request(options, retries_taken=retries_taken)
+            if options.files:
+                # read file contents in a worker thread instead of blocking the event loop
+                request.stream = AsyncFileStream(cast(Iterable[bytes], request.stream))
             await self._prepare_request(request)
 
             kwargs: HttpxSendArgs = {}
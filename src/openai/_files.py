@@ -3,10 +3,12 @@ from __future__ import annotations
 import io
 import os
 import pathlib
-from typing import overload
-from typing_extensions import TypeGuard
+from typing import Iterable, AsyncIterator, overload
+from typing_extensions import TypeGuard, override
 
 import anyio
+import httpx
+from anyio.lowlevel import RunVar
 
 from ._types import (
     FileTypes,
@@ -18,6 +20,180 @@ from ._types import (
     HttpxRequestFiles,
 )
 from ._utils import is_tuple_t, is_mapping_t, is_sequence_t
+from ._utils._sync import to_thread
+
+# the size of the chunks httpx reads from file objects when encoding multipart bodies
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_UPLOAD_BUFFER_LIMIT = 64 * 1024 * 1024
+
+
+class LazyFileReader(io.RawIOBase):
+    """Read-only, seekable view of a file on disk for multipart uploads.
+
+    httpx streams file objects in fixed-size chunks, so passing this instead of the
+    file's bytes keeps memory usage flat regardless of the file size. The underlying
+    handle is only opened while the body is being read and is closed again at EOF,
+    which means no file descriptor is leaked if the request is never sent and that
+    retries can re-read the file from the start.
+
+    Requests get it wrapped in a `BufferedReader` by `open_lazy_file()`, which is the
+    binary file object type that httpx expects.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        super().__init__()
+        self.path = pathlib.Path(path)
+        self._file: io.BufferedReader | None = None
+        self._position = 0
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def seekable(self) -> bool:
+        return True
+
+    @override
+    def tell(self) -> int:
+        return self._position
+
+    @override
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.path.stat().st_size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence!r})")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        if self._file is not None:
+            self._file.seek(position)
+        self._position = position
+        return position
+
+    @override
+    def read(self, size: int = -1) -> bytes:
+        if self._file is None:
+            self._file = open(self.path, "rb")  # noqa: SIM115
+            self._file.seek(self._position)
+
+        data = self._file.read(size)
+        self._position += len(data)
+        if not data or size < 0:
+            self._release()
+        return data
+
+    @override
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    @override
+    def close(self) -> None:
+        self._release()
+        super().close()
+
+    def _release(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def open_lazy_file(path: str | os.PathLike[str]) -> io.BufferedReader:
+    """Returns a binary file object for `path` that only opens the file while it is being read."""
+    return io.BufferedReader(LazyFileReader(path))
+
+
+class UploadBufferBudget:
+    """Caps the memory held by async upload chunks that were read from disk.
+
+    Every chunk holds one slot of `UPLOAD_CHUNK_SIZE` bytes from before it is read until
+    the transport asks for the next one, so the chunks in flight across all concurrent
+    uploads stay under `max_bytes`. The limit
+    applies per event loop: each loop, whether asyncio or trio and whichever thread it
+    runs on, gets its own slots.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes < UPLOAD_CHUNK_SIZE:
+            raise ValueError(f"max_bytes must be at least {UPLOAD_CHUNK_SIZE}")
+
+        self.max_bytes = max_bytes
+        # anyio primitives are bound to the event loop that created them
+        self._semaphore: RunVar[anyio.Semaphore] = RunVar(f"upload_buffer_budget_{id(self)}")
+
+    @property
+    def slots(self) -> int:
+        return self.max_bytes // UPLOAD_CHUNK_SIZE
+
+    def _get_semaphore(self) -> anyio.Semaphore:
+        try:
+            return self._semaphore.get()
+        except LookupError:
+            semaphore = anyio.Semaphore(self.slots)
+            self._semaphore.set(semaphore)
+            return semaphore
+
+    async def acquire(self) -> None:
+        await self._get_semaphore().acquire()
+
+    def release(self) -> None:
+        self._get_semaphore().release()
+
+
+_upload_buffer_budget = UploadBufferBudget(DEFAULT_UPLOAD_BUFFER_LIMIT)
+
+
+def set_upload_buffer_limit(max_bytes: int) -> None:
+    """Set the limit on memory held by async upload chunks, per event loop.
+
+    Async requests that upload files wait for a free slot before reading each chunk of
+    the body, so lowering the limit trades upload throughput for memory.
+    """
+    global _upload_buffer_budget
+    _upload_buffer_budget = UploadBufferBudget(max_bytes)
+
+
+class AsyncFileStream(httpx.AsyncByteStream):
+    """Async request body that reads an encoded multipart body off the event loop.
+
+    httpx only knows how to read file objects synchronously, which would block the event
+    loop on disk I/O. This wraps the sync multipart stream and pulls each chunk in a
+    worker thread. Each chunk holds a slot of the `UploadBufferBudget` until the transport
+    has sent it and asks for the next chunk. A body that is abandoned mid-way keeps its
+    slot until the iterator is closed, which the event loop does when it is garbage
+    collected.
+    """
+
+    def __init__(self, stream: Iterable[bytes], *, budget: UploadBufferBudget | None = None) -> None:
+        self._stream = stream
+        self._budget = budget
+
+    @override
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        budget = self._budget or _upload_buffer_budget
+        iterator = iter(self._stream)
+        while True:
+            await budget.acquire()
+            try:
+                chunk = await to_thread(next, iterator, None)
+                if chunk is None:
+                    break
+                yield chunk
+            finally:
+                budget.release()
 
 
 def is_base64_file_input(obj: object) -> TypeGuard[Base64FileInput]:
@@ -63,8 +239,7 @@ def to_httpx_files(files: RequestFiles | None) -> HttpxRequestFiles | None:
 def _transform_file(file: FileTypes) -> HttpxFileTypes:
     if is_file_content(file):
         if isinstance(file, os.PathLike):
-            path = pathlib.Path(file)
-            return (path.name, path.read_bytes())
+            return (pathlib.Path(file).name, open_lazy_file(file))
 
         return file
 
@@ -76,7 +251,7 @@ def _transform_file(file: FileTypes) -> HttpxFileTypes:
 
 def read_file_content(file: FileContent) -> HttpxFileContent:
     if isinstance(file, os.PathLike):
-        return pathlib.Path(file).read_bytes()
+        return open_lazy_file(file)
     return file
 
 
@@ -105,8 +280,7 @@ async def async_to_httpx_files(files: RequestFiles | None) -> HttpxRequestFiles
 async def _async_transform_file(file: FileTypes) -> HttpxFileTypes:
     if is_file_content(file):
         if isinstance(file, os.PathLike):
-            path = anyio.Path(file)
-            return (path.name, await path.read_bytes())
+            return (pathlib.Path(file).name, open_lazy_file(file))
 
         return file
 
@@ -118,6 +292,6 @@ async def _async_transform_file(file: FileTypes) -> HttpxFileTypes:
 
 async def async_read_file_content(file: FileContent) -> HttpxFileContent:
     if isinstance(file, os.PathLike):
-        return await anyio.Path(file).read_bytes()
+        return open_lazy_file(file)
 
     return file
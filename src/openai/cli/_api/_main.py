@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from argparse import ArgumentParser
 
 from . import chat, audio, files, image, models, completions, fine_tuning
 
+if TYPE_CHECKING:
+    from argparse import _SubParsersAction
 
-def register_commands(parser: ArgumentParser) -> None:
+
+def register_commands(parser: ArgumentParser) -> _SubParsersAction[ArgumentParser]:
     subparsers = parser.add_subparsers(help="All API subcommands")
 
     chat.register(subparsers)
@@ -15,3 +19,4 @@ def register_commands(parser: ArgumentParser) -> None:
     models.register(subparsers)
     completions.register(subparsers)
     fine_tuning.register(subparsers)
+    return subparsers
@@ -3,7 +3,7 @@ from __future__ import annotations
 import sys
 import logging
 import argparse
-from typing import Any, List, Type, Optional
+from typing import TYPE_CHECKING, Any, List, Type, Callable, Optional
 from typing_extensions import ClassVar
 
 import httpx
@@ -14,12 +14,17 @@ import openai
 from . import _tools
 from .. import _ApiType, __version__
 from ._api import register_commands
-from ._utils import can_use_http2
+from ._utils import AsyncClientFactory, can_use_http2, set_async_client_factory
 from ._errors import CLIError, display_error
 from .._compat import PYDANTIC_V1, ConfigDict, model_parse
 from .._models import BaseModel
 from .._exceptions import APIError
 
+if TYPE_CHECKING:
+    from argparse import _SubParsersAction
+
+RegisterCommands = Callable[["_SubParsersAction[argparse.ArgumentParser]"], None]
+
 logger = logging.getLogger()
 formatter = logging.Formatter("[%(asctime)s] %(message)s")
 handler = logging.StreamHandler(sys.stderr)
@@ -59,7 +64,7 @@ class Arguments(BaseModel):
     allow_unknown_args: bool = False
 
 
-def _build_parser() -> argparse.ArgumentParser:
+def _build_parser(register_api_commands: Optional[RegisterCommands] = None) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=None, prog="openai")
     parser.add_argument(
         "-v",
@@ -115,7 +120,9 @@ def _build_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers()
     sub_api = subparsers.add_parser("api", help="Direct API calls")
 
-    register_commands(sub_api)
+    api_subparsers = register_commands(sub_api)
+    if register_api_commands is not None:
+        register_api_commands(api_subparsers)
 
     sub_tools = subparsers.add_parser("tools", help="Client side tools for convenience")
     _tools.register_commands(sub_tools, subparsers)
@@ -123,9 +130,21 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
+def main(
+    *,
+    async_client_factory: Optional[AsyncClientFactory] = None,
+    register_api_commands: Optional[RegisterCommands] = None,
+) -> int:
+    """Run the CLI.
+
+    CLIs built on this one can pass `async_client_factory` to build the async clients of
+    commands such as `tools bench`, and `register_api_commands` to add `api` subcommands.
+    """
+    if async_client_factory is not None:
+        set_async_client_factory(async_client_factory)
+
     try:
-        _main()
+        _main(register_api_commands)
     except (APIError, CLIError, pydantic.ValidationError) as err:
         display_error(err)
         return 1
@@ -159,8 +178,8 @@ def _parse_args(parser: argparse.ArgumentParser) -> tuple[argparse.Namespace, Ar
     return parsed, args, remaining_unknown
 
 
-def _main() -> None:
-    parser = _build_parser()
+def _main(register_api_commands: Optional[RegisterCommands] = None) -> None:
+    parser = _build_parser(register_api_commands)
     parsed, args, unknown = _parse_args(parser)
 
     if args.verbosity != 0:
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import time
+import random
+import threading
+import multiprocessing
+from typing import Any, Dict, Iterator, Optional, cast
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing_extensions import override
+from multiprocessing.connection import Connection
+
+_WORDS = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit", "sed", "do"]
+
+
+@dataclass
+class MockServerOptions:
+    latency: float = 0.1
+    """Seconds before the response starts, or before the first token of a stream."""
+
+    token_interval: float = 0.01
+    """Seconds between the tokens of a response."""
+
+    error_rate: float = 0.0
+    """The share of requests answered with a retryable `429` error."""
+
+    default_tokens: int = 16
+    """The number of tokens generated when a request sets no `max_tokens`."""
+
+    seed: Optional[int] = None
+    """Seeds which requests fail."""
+
+
+class _MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # the client opens up to one connection per request in flight at once
+    request_queue_size = 1024
+
+    def __init__(self, options: MockServerOptions) -> None:
+        super().__init__(("127.0.0.1", 0), _MockHandler)
+        self.options = options
+        self.random = random.Random(options.seed)
+        self.lock = threading.Lock()
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """Answers `/chat/completions` requests the way the API does, streamed as SSE or not"""
+
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def mock_server(self) -> _MockServer:
+        return cast(_MockServer, self.server)
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+
+        options = self.mock_server.options
+        with self.mock_server.lock:
+            failed = self.mock_server.random.random() < options.error_rate
+            completion_id = f"chatcmpl-mock{self.mock_server.random.getrandbits(32):08x}"
+        if failed:
+            self._send_json(
+                429,
+                {"error": {"message": "Rate limit reached", "type": "rate_limit_error"}},
+                headers={"retry-after-ms": "10"},
+            )
+            return
+
+        completion_tokens = body.get("max_completion_tokens") or body.get("max_tokens") or options.default_tokens
+        prompt_tokens = sum(len(str(message.get("content", "")).split()) for message in body.get("messages", []))
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        completion: Dict[str, Any] = {
+            "id": completion_id,
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "system_fingerprint": "fp_mock",
+        }
+        tokens = [" " + _WORDS[i % len(_WORDS)] for i in range(completion_tokens)]
+
+        time.sleep(options.latency)
+        if not body.get("stream"):
+            time.sleep(options.token_interval * max(completion_tokens - 1, 0))
+            message = {"role": "assistant", "content": "".join(tokens).lstrip(), "refusal": None}
+            choice = {"index": 0, "message": message, "finish_reason": "length", "logprobs": None}
+            self._send_json(200, {**completion, "object": "chat.completion", "choices": [choice], "usage": usage})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        chunk = {**completion, "object": "chat.completion.chunk"}
+
+        def send_chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> None:
+            choice = {"index": 0, "delta": delta, "finish_reason": finish_reason, "logprobs": None}
+            self._send_event(json.dumps({**chunk, "choices": [choice]}))
+
+        send_chunk({"role": "assistant", "content": "", "refusal": None})
+        for i, token in enumerate(tokens):
+            if i:
+                time.sleep(options.token_interval)
+            send_chunk({"content": token.lstrip() if i == 0 else token})
+        send_chunk({}, "length")
+        stream_options: Dict[str, Any] = body.get("stream_options") or {}
+        if stream_options.get("include_usage"):
+            self._send_event(json.dumps({**chunk, "choices": [], "usage": usage}))
+        self._send_event("[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_event(self, data: str) -> None:
+        event = f"data: {data}\n\n".encode()
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(event), event))
+
+    def _send_json(self, status: int, body: object, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    @override
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _serve(options: MockServerOptions, connection: Connection) -> None:
+    server = _MockServer(options)
+    connection.send(server.server_address[1])
+    connection.close()
+    server.serve_forever()
+
+
+@contextmanager
+def serve_mock(options: MockServerOptions) -> Iterator[str]:
+    """
+    Runs a local stand-in of the chat completions API in a process of its own, so that it doesn't
+    take CPU time from the client, and yields its base URL
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_serve, args=(options, sender), daemon=True)
+    process.start()
+    try:
+        sender.close()
+        port = receiver.recv()
+        yield f"http://127.0.0.1:{port}/v1"
+    finally:
+        receiver.close()
+        process.terminate()
+        process.join()
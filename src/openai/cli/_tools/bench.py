@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import sys
+import json
+import time
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from argparse import ArgumentParser
+from dataclasses import dataclass
+
+import httpx
+
+from .._utils import get_async_client
+from .._errors import CLIError
+from .._models import BaseModel
+from ...types.chat import ChatCompletionMessageParam
+from ._mock_server import MockServerOptions, serve_mock
+from ..._exceptions import APIError
+
+if TYPE_CHECKING:
+    from argparse import _SubParsersAction
+
+    from ..._client import AsyncOpenAI
+
+_PERCENTILES = (50, 90, 99)
+_WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+
+
+def register(subparser: _SubParsersAction[ArgumentParser]) -> None:
+    sub = subparser.add_parser(
+        "bench",
+        help="Load test chat completions through the client, against the API or a local stand-in of it",
+    )
+    sub.add_argument("-m", "--model", help="The model to request, gpt-4o-mini by default.")
+    sub.add_argument("-n", "--requests", help="How many requests to send, 100 by default.", type=int)
+    sub.add_argument(
+        "-c",
+        "--concurrency",
+        help="The maximum number of requests in flight at once. 8 by default, unbounded with --qps.",
+        type=int,
+    )
+    sub.add_argument(
+        "--qps", help="Start this many requests per second, whether earlier ones finished or not.", type=float
+    )
+    sub.add_argument("--stream", help="Stream the responses.", action="store_true")
+    sub.add_argument("--prompt-tokens", help="About how many tokens each prompt has, 32 by default.", type=int)
+    sub.add_argument("--max-tokens", help="The max_tokens of each request, 64 by default.", type=int)
+    sub.add_argument("--max-retries", help="The client's max_retries, 2 by default.", type=int)
+    sub.add_argument(
+        "--mock",
+        help="Send the requests to a local stand-in of the API, to measure the overhead of the client alone.",
+        action="store_true",
+    )
+    sub.add_argument(
+        "--mock-latency", help="Milliseconds the stand-in takes to the first token, 100 by default.", type=float
+    )
+    sub.add_argument(
+        "--mock-token-interval", help="Milliseconds between the stand-in's tokens, 10 by default.", type=float
+    )
+    sub.add_argument("--mock-error-rate", help="The share of requests the stand-in rejects with a 429.", type=float)
+    sub.add_argument("--json", dest="print_json", help="Print the report as JSON.", action="store_true")
+    sub.set_defaults(func=bench, args_model=BenchArgs)
+
+
+class BenchArgs(BaseModel):
+    model: str = "gpt-4o-mini"
+    requests: int = 100
+    concurrency: Optional[int] = None
+    qps: Optional[float] = None
+    stream: bool = False
+    prompt_tokens: int = 32
+    max_tokens: int = 64
+    max_retries: int = 2
+    mock: bool = False
+    mock_latency: float = 100
+    mock_token_interval: float = 10
+    mock_error_rate: float = 0
+    print_json: bool = False
+
+
+@dataclass
+class _Sample:
+    latency: float
+    """Seconds from sending the request until the whole response was read."""
+
+    ttft: Optional[float]
+    """Seconds until the first content of a stream."""
+
+    output_tokens: int
+    retries: int
+    error: Optional[str] = None
+
+
+def bench(args: BenchArgs) -> None:
+    if args.requests < 1:
+        raise CLIError("--requests must be at least 1")
+    if args.concurrency is not None and args.concurrency < 1:
+        raise CLIError("--concurrency must be at least 1")
+    if args.qps is not None and args.qps <= 0:
+        raise CLIError("--qps must be greater than 0")
+
+    if args.mock:
+        options = MockServerOptions(
+            latency=args.mock_latency / 1000,
+            token_interval=args.mock_token_interval / 1000,
+            error_rate=args.mock_error_rate,
+        )
+        with serve_mock(options) as base_url:
+            report = asyncio.run(_run(args, api_key="mock", base_url=base_url))
+    else:
+        report = asyncio.run(_run(args))
+
+    if args.print_json:
+        sys.stdout.write(json.dumps(report, indent=2) + "\n")
+    else:
+        sys.stdout.write(_format_report(report))
+
+
+async def _run(args: BenchArgs, **client_options: Any) -> Dict[str, Any]:
+    prompt = " ".join(_WORDS[i % len(_WORDS)] for i in range(args.prompt_tokens))
+    concurrency = args.concurrency or (None if args.qps else 8)
+    slots = asyncio.Semaphore(concurrency) if concurrency else None
+    samples: List[_Sample] = []
+
+    async with get_async_client(max_retries=args.max_retries, **client_options) as client:
+
+        async def run(i: int) -> None:
+            try:
+                # a different prompt for each request, so that none is served from a cache
+                samples.append(await _request(client, args, f"{i} {prompt}"))
+            finally:
+                if slots is not None:
+                    slots.release()
+
+        # imports the resources and response types, and opens a connection, before anything is measured
+        await _request(client, args, prompt)
+
+        loop = asyncio.get_running_loop()
+        tasks: List[asyncio.Future[None]] = []
+        cpu_start = time.process_time()
+        start = loop.time()
+        for i in range(args.requests):
+            if args.qps:
+                await asyncio.sleep(max(start + i / args.qps - loop.time(), 0))
+            if slots is not None:
+                await slots.acquire()
+            tasks.append(asyncio.ensure_future(run(i)))
+        await asyncio.gather(*tasks)
+        wall_time = loop.time() - start
+        cpu_time = time.process_time() - cpu_start
+
+    return _report(args, samples, wall_time=wall_time, cpu_time=cpu_time)
+
+
+async def _request(client: AsyncOpenAI, args: BenchArgs, prompt: str) -> _Sample:
+    messages: List[ChatCompletionMessageParam] = [{"role": "user", "content": prompt}]
+    start = time.perf_counter()
+    retries = 0
+    ttft = None
+    try:
+        if not args.stream:
+            raw = await client.chat.completions.with_raw_response.create(
+                model=args.model, messages=messages, max_tokens=args.max_tokens
+            )
+            retries = raw.retries_taken
+            completion = raw.parse()
+            usage_tokens = completion.usage.completion_tokens if completion.usage else None
+            content = completion.choices[0].message.content if completion.choices else None
+            output_tokens = usage_tokens if usage_tokens is not None else len((content or "").split())
+            return _Sample(time.perf_counter() - start, None, output_tokens, retries)
+
+        raw_stream = await client.chat.completions.with_raw_response.create(
+            model=args.model,
+            messages=messages,
+            max_tokens=args.max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        retries = raw_stream.retries_taken
+        content_chunks = 0
+        usage_tokens = None
+        async for chunk in raw_stream.parse():
+            if any(choice.delta.content for choice in chunk.choices):
+                if ttft is None:
+                    ttft = time.perf_counter() - start
+                content_chunks += 1
+            if chunk.usage is not None:
+                usage_tokens = chunk.usage.completion_tokens
+        output_tokens = usage_tokens if usage_tokens is not None else content_chunks
+        return _Sample(time.perf_counter() - start, ttft, output_tokens, retries)
+    except APIError as err:
+        retries = int(err.request.headers.get("x-stainless-retry-count", retries))
+        return _Sample(time.perf_counter() - start, ttft, 0, retries, error=type(err).__name__)
+    except httpx.HTTPError as err:
+        # a stream that broke off
+        return _Sample(time.perf_counter() - start, ttft, 0, retries, error=type(err).__name__)
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Interpolates between the closest ranks, like `numpy.percentile()`"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * percent / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _distribution(values: List[float]) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    distribution = {f"p{percent}": _percentile(values, percent) for percent in _PERCENTILES}
+    distribution["max"] = max(values)
+    return distribution
+
+
+def _report(args: BenchArgs, samples: List[_Sample], *, wall_time: float, cpu_time: float) -> Dict[str, Any]:
+    succeeded = [sample for sample in samples if sample.error is None]
+    errors: Dict[str, int] = {}
+    for sample in samples:
+        if sample.error is not None:
+            errors[sample.error] = errors.get(sample.error, 0) + 1
+
+    def tokens_per_second(sample: _Sample) -> Optional[float]:
+        # the rate at which a stream produces tokens once it started
+        duration = sample.latency - (sample.ttft or 0)
+        return sample.output_tokens / duration if duration > 0 and sample.output_tokens else None
+
+    token_rates = [rate for rate in map(tokens_per_second, succeeded) if rate is not None]
+    output_tokens = sum(sample.output_tokens for sample in succeeded)
+    return {
+        "target": "mock" if args.mock else "api",
+        "model": args.model,
+        "stream": args.stream,
+        "requests": len(samples),
+        "succeeded": len(succeeded),
+        "errors": errors,
+        "retries": sum(sample.retries for sample in samples),
+        "wall_time_s": wall_time,
+        "requests_per_s": len(samples) / wall_time if wall_time else None,
+        "output_tokens_per_s": output_tokens / wall_time if wall_time else None,
+        "client_cpu_ms_per_request": cpu_time * 1000 / len(samples),
+        "latency_ms": _distribution([sample.latency * 1000 for sample in succeeded]),
+        "ttft_ms": _distribution([sample.ttft * 1000 for sample in succeeded if sample.ttft is not None]),
+        "tokens_per_s": _distribution(token_rates),
+    }
+
+
+def _format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"{report['requests']} requests to {report['target']} ({report['model']}, "
+        f"{'streamed' if report['stream'] else 'not streamed'}) in {report['wall_time_s']:.2f}s: "
+        f"{report['requests_per_s']:.1f} requests/s, {report['output_tokens_per_s']:.1f} output tokens/s",
+        f"{report['succeeded']} succeeded, {report['requests'] - report['succeeded']} failed, "
+        f"{report['retries']} retries",
+    ]
+    if report["errors"]:
+        lines.append("errors: " + ", ".join(f"{name} x{count}" for name, count in report["errors"].items()))
+    lines.append(f"client CPU: {report['client_cpu_ms_per_request']:.2f} ms per request")
+    lines.append("")
+
+    columns = [*(f"p{percent}" for percent in _PERCENTILES), "max"]
+    lines.append(f"{'':<14}" + "".join(f"{column:>10}" for column in columns))
+    for name, key in (("latency (ms)", "latency_ms"), ("TTFT (ms)", "ttft_ms"), ("tokens/s", "tokens_per_s")):
+        distribution = report[key]
+        if distribution is not None:
+            lines.append(f"{name:<14}" + "".join(f"{distribution[column]:>10.1f}" for column in columns))
+    return "\n".join(lines) + "\n"
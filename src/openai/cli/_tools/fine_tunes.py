@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from argparse import ArgumentParser
 
+from .._errors import CLIError
 from .._models import BaseModel
 from ...lib._validators import (
     get_validators,
@@ -12,6 +13,8 @@ from ...lib._validators import (
     apply_validators,
     apply_necessary_remediation,
 )
+from ...lib._prepare_data import prepare_data_in_parts
+from ...lib._chunked_validators import DEFAULT_CHUNK_SIZE
 
 if TYPE_CHECKING:
     from argparse import _SubParsersAction
@@ -33,6 +36,19 @@ def register(subparser: _SubParsersAction[ArgumentParser]) -> None:
         action="store_true",
         help="Auto accepts all suggestions, without asking for user input. To be used within scripts.",
     )
+    sub.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="How many processes validate and prepare the examples of a JSONL file, each one a part of the file.",
+    )
+    sub.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Read the file this many rows at a time, which caps the rows each worker holds in memory at once. "
+        "The cap is a count of rows, not of bytes, so long rows take more memory. "
+        "By default the whole file is read at once, unless there is more than one worker.",
+    )
     sub.set_defaults(func=prepare_data, args_model=PrepareDataArgs)
 
 
@@ -41,11 +57,29 @@ class PrepareDataArgs(BaseModel):
 
     quiet: bool
 
+    workers: int = 1
+
+    chunk_size: Optional[int] = None
+
 
 def prepare_data(args: PrepareDataArgs) -> None:
+    if args.workers < 1:
+        raise CLIError("--workers must be at least 1")
+    if args.chunk_size is not None and args.chunk_size < 1:
+        raise CLIError("--chunk-size must be at least 1")
+
     sys.stdout.write("Analyzing...\n")
     fname = args.file
     auto_accept = args.quiet
+    if args.workers > 1 or args.chunk_size is not None:
+        prepare_data_in_parts(
+            fname,
+            auto_accept=auto_accept,
+            workers=args.workers,
+            chunksize=args.chunk_size if args.chunk_size is not None else DEFAULT_CHUNK_SIZE,
+        )
+        return
+
     df, remediation = read_any_format(fname)
     apply_necessary_remediation(None, remediation)
 
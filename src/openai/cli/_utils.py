@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import sys
+from typing import Any, Callable
 
 import openai
 
-from .. import OpenAI, _load_client
+from .. import OpenAI, AsyncOpenAI, _load_client
 from .._compat import model_json
 from .._models import BaseModel
 
@@ -20,10 +21,27 @@ class Colors:
     UNDERLINE = "\033[4m"
 
 
+AsyncClientFactory = Callable[..., AsyncOpenAI]
+
+_async_client_factory: AsyncClientFactory = AsyncOpenAI
+
+
 def get_client() -> OpenAI:
     return _load_client()
 
 
+def set_async_client_factory(factory: AsyncClientFactory) -> None:
+    global _async_client_factory
+    _async_client_factory = factory
+
+
+def get_async_client(**options: Any) -> AsyncOpenAI:
+    """A new async client for the global `--api-key`, `--api-base` and `--organization`, `options` take precedence"""
+    return _async_client_factory(
+        **{"api_key": openai.api_key, "base_url": openai.base_url, "organization": openai.organization, **options}
+    )
+
+
 def organization_info() -> str:
     organization = openai.organization
     if organization is not None:
@@ -1,4 +1,21 @@
+from ._audio import (
+    AudioSink,
+    AudioSource,
+    NullAudioSink,
+    SoundDeviceSink,
+    SoundDeviceSource,
+    SyntheticAudioSource,
+)
 from .microphone import Microphone
 from .local_audio_player import LocalAudioPlayer
 
-__all__ = ["Microphone", "LocalAudioPlayer"]
+__all__ = [
+    "Microphone",
+    "LocalAudioPlayer",
+    "AudioSink",
+    "NullAudioSink",
+    "SoundDeviceSink",
+    "AudioSource",
+    "SoundDeviceSource",
+    "SyntheticAudioSource",
+]
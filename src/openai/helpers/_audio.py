@@ -0,0 +1,264 @@
+# mypy: ignore-errors
+from __future__ import annotations
+
+import time
+import threading
+from typing import Any, Type, Callable, Iterator, ContextManager, cast
+from contextlib import contextmanager
+from typing_extensions import TYPE_CHECKING, Protocol
+
+from .._extras import numpy as np, sounddevice as sd
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+__all__ = [
+    "AudioSink",
+    "SoundDeviceSink",
+    "NullAudioSink",
+    "AudioSource",
+    "SoundDeviceSource",
+    "SyntheticAudioSource",
+    "PCMDecoder",
+    "RingBuffer",
+]
+
+FillCallback = Callable[["npt.NDArray[np.float32]"], bool]
+ConsumeCallback = Callable[["npt.NDArray[Any]"], bool]
+
+
+class _SoundDevice(Protocol):
+    """The part of `sounddevice`, which ships without type hints, that the devices use."""
+
+    CallbackStop: Type[Exception]
+
+    def OutputStream(
+        self, *, samplerate: int, channels: int, dtype: Any, callback: Callable[..., None]
+    ) -> ContextManager[Any]: ...
+
+    def InputStream(
+        self, *, samplerate: int, channels: int, dtype: Any, callback: Callable[..., None]
+    ) -> ContextManager[Any]: ...
+
+
+# the proxy only imports `sounddevice` once a device is opened
+_sounddevice = cast(_SoundDevice, sd)
+
+
+class PCMDecoder:
+    """Converts 16-bit PCM chunks to float32 frames as they arrive.
+
+    Chunks don't have to end on a frame boundary, the bytes of an incomplete frame are
+    kept until the next chunk completes it.
+    """
+
+    def __init__(self, channels: int = 1) -> None:
+        self.channels = channels
+        self._frame_size = 2 * channels
+        self._pending = b""
+
+    def decode(self, chunk: bytes) -> npt.NDArray[np.float32]:
+        data = self._pending + chunk if self._pending else chunk
+        usable = len(data) - len(data) % self._frame_size
+        self._pending = bytes(data[usable:])
+
+        samples = np.frombuffer(data, dtype=np.int16, count=usable // 2)
+        return np.divide(samples, 32767.0, dtype=np.float32).reshape(-1, self.channels)
+
+
+class RingBuffer:
+    """A preallocated audio buffer between one writer and one reader thread.
+
+    Each side only advances its own position, and a position is only advanced after
+    the frames it covers have been copied, so no lock is needed.
+    """
+
+    def __init__(self, frames: int, channels: int = 1, dtype: Any = np.float32) -> None:
+        if frames < 1:
+            raise ValueError("frames must be at least 1")
+
+        self.capacity = frames
+        self.closed = False
+        self._data = np.zeros((frames, channels), dtype=dtype)
+        # frames written and read since the start, the difference is the fill level
+        self._written = 0
+        self._read = 0
+
+    def __len__(self) -> int:
+        return self._written - self._read
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    def write(self, block: npt.NDArray[Any]) -> int:
+        """Copy as much of `block` as fits and return the number of frames written."""
+        count = min(self.capacity - len(self), len(block))
+        start = self._written % self.capacity
+        head = min(count, self.capacity - start)
+        self._data[start : start + head] = block[:head]
+        self._data[: count - head] = block[head:count]
+        self._written += count
+        return count
+
+    def read_into(self, out: npt.NDArray[Any]) -> int:
+        """Fill `out` with buffered frames, pad it with silence and return the frames read."""
+        count = min(len(self), len(out))
+        start = self._read % self.capacity
+        head = min(count, self.capacity - start)
+        out[:head] = self._data[start : start + head]
+        out[head:count] = self._data[: count - head]
+        out[count:] = 0
+        self._read += count
+        return count
+
+    def close(self) -> None:
+        """Mark the end of the audio, the reader still gets the frames that are buffered."""
+        self.closed = True
+
+
+class AudioSink(Protocol):
+    """The output device behind `LocalAudioPlayer`.
+
+    `open()` starts pulling audio: `fill` is called from the sink's own thread with a
+    block to write the next frames into and returns `False` once playback is over, after
+    which it is not called again. Leaving the context stops the device.
+    """
+
+    def open(self, *, samplerate: int, channels: int, fill: FillCallback) -> ContextManager[Any]: ...
+
+
+class SoundDeviceSink:
+    """Plays audio on the default output device through `sounddevice`."""
+
+    def open(self, *, samplerate: int, channels: int, fill: FillCallback) -> ContextManager[Any]:
+        def callback(outdata: npt.NDArray[np.float32], _frame_count: int, _time_info: Any, _status: Any) -> None:
+            if not fill(outdata):
+                raise _sounddevice.CallbackStop
+
+        return _sounddevice.OutputStream(samplerate=samplerate, channels=channels, dtype=np.float32, callback=callback)
+
+
+class NullAudioSink:
+    """A sink without audio hardware, for tests and benchmarks.
+
+    It pulls blocks of `blocksize` frames from a background thread, as fast as it can
+    or, with `realtime=True`, at the pace of the sample rate. Pass `keep=True` to keep
+    what was played in `output`.
+    """
+
+    def __init__(self, *, blocksize: int = 512, realtime: bool = False, keep: bool = False) -> None:
+        self.blocksize = blocksize
+        self.realtime = realtime
+        self.keep = keep
+        self.blocks_played = 0
+        self.first_block_at: float | None = None
+        self._kept: list[npt.NDArray[np.float32]] = []
+        self._channels = 1
+
+    @property
+    def output(self) -> npt.NDArray[np.float32]:
+        """Every block played so far, including the silence padding them."""
+        if not self._kept:
+            return np.zeros((0, self._channels), dtype=np.float32)
+        return np.concatenate(self._kept)
+
+    @contextmanager
+    def open(self, *, samplerate: int, channels: int, fill: FillCallback) -> Iterator[None]:
+        self._channels = channels
+        stopped = threading.Event()
+
+        def run() -> None:
+            block = np.zeros((self.blocksize, channels), dtype=np.float32)
+            pace = _Pace(self.blocksize / samplerate if self.realtime else None, stopped)
+            while not stopped.is_set() and fill(block):
+                if self.first_block_at is None:
+                    self.first_block_at = time.monotonic()
+                self.blocks_played += 1
+                if self.keep:
+                    self._kept.append(block.copy())
+                pace.wait()
+
+        with _running(run, stopped, name="null-audio-sink"):
+            yield
+
+
+class AudioSource(Protocol):
+    """The input device behind `Microphone`.
+
+    `open()` starts capturing: `consume` is called from the source's own thread with
+    every captured block and returns `False` to stop, after which it is not called
+    again. An empty block means the input has ended. Leaving the context stops the device.
+    """
+
+    def open(self, *, samplerate: int, channels: int, dtype: Any, consume: ConsumeCallback) -> ContextManager[Any]: ...
+
+
+class SoundDeviceSource:
+    """Captures audio from the default input device through `sounddevice`."""
+
+    def open(self, *, samplerate: int, channels: int, dtype: Any, consume: ConsumeCallback) -> ContextManager[Any]:
+        def callback(indata: npt.NDArray[Any], _frame_count: int, _time_info: Any, _status: Any) -> None:
+            if not consume(indata):
+                raise _sounddevice.CallbackStop
+
+        return _sounddevice.InputStream(samplerate=samplerate, channels=channels, dtype=dtype, callback=callback)
+
+
+class SyntheticAudioSource:
+    """A source that captures `audio` instead of a device, for tests and benchmarks.
+
+    The samples are delivered in blocks of `blocksize` frames, as fast as they are
+    consumed or, with `realtime=True`, at the pace of the sample rate. The input ends
+    after the last block.
+    """
+
+    def __init__(self, audio: npt.NDArray[Any], *, blocksize: int = 480, realtime: bool = False) -> None:
+        self.audio = audio
+        self.blocksize = blocksize
+        self.realtime = realtime
+
+    @contextmanager
+    def open(self, *, samplerate: int, channels: int, dtype: Any, consume: ConsumeCallback) -> Iterator[None]:
+        audio = np.asarray(self.audio).astype(dtype, copy=False).reshape(-1, channels)
+        stopped = threading.Event()
+
+        def run() -> None:
+            pace = _Pace(self.blocksize / samplerate if self.realtime else None, stopped)
+            for start in range(0, len(audio), self.blocksize):
+                if stopped.is_set() or not consume(audio[start : start + self.blocksize]):
+                    return
+                pace.wait()
+            if not stopped.is_set():
+                consume(audio[:0])
+
+        with _running(run, stopped, name="synthetic-audio-source"):
+            yield
+
+
+class _Pace:
+    """Spaces out the blocks of a device thread, `period` seconds apart if it is set."""
+
+    def __init__(self, period: float | None, stopped: threading.Event) -> None:
+        self._period = period
+        self._stopped = stopped
+        self._deadline = time.monotonic()
+
+    def wait(self) -> None:
+        if self._period is None:
+            # let the other side in between blocks
+            time.sleep(0)
+            return
+        self._deadline += self._period
+        self._stopped.wait(max(self._deadline - time.monotonic(), 0))
+
+
+@contextmanager
+def _running(target: Callable[[], None], stopped: threading.Event, *, name: str) -> Iterator[None]:
+    thread = threading.Thread(target=target, name=name, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        thread.join()
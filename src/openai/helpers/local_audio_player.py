@@ -1,13 +1,13 @@
 # mypy: ignore-errors
 from __future__ import annotations
 
-import queue
 import asyncio
-from typing import Any, Union, Callable, AsyncGenerator, cast
+from typing import Union, Callable, AsyncIterator, AsyncGenerator, cast
 from typing_extensions import TYPE_CHECKING
 
 from .. import _legacy_response
-from .._extras import numpy as np, sounddevice as sd
+from ._audio import AudioSink, PCMDecoder, RingBuffer, SoundDeviceSink
+from .._extras import numpy as np
 from .._response import StreamedBinaryAPIResponse, AsyncStreamedBinaryAPIResponse
 
 if TYPE_CHECKING:
@@ -17,38 +17,55 @@ SAMPLE_RATE = 24000
 
 
 class LocalAudioPlayer:
+    """Plays PCM audio, starting as soon as the first chunk of a stream has arrived.
+
+    Audio is decoded into a ring buffer of `buffer_seconds` that the `sink` drains, by
+    default the system's output device. A `NullAudioSink` plays without audio hardware.
+    """
+
     def __init__(
         self,
         should_stop: Union[Callable[[], bool], None] = None,
+        *,
+        sink: Union[AudioSink, None] = None,
+        buffer_seconds: float = 2.0,
     ):
         self.channels = 1
         self.dtype = np.float32
         self.should_stop = should_stop
+        self.sink = sink if sink is not None else SoundDeviceSink()
+        self.buffer_frames = max(int(SAMPLE_RATE * buffer_seconds), 1)
 
-    async def _tts_response_to_buffer(
+    async def _tts_response_to_blocks(
         self,
         response: Union[
             _legacy_response.HttpxBinaryResponseContent,
             AsyncStreamedBinaryAPIResponse,
             StreamedBinaryAPIResponse,
         ],
-    ) -> npt.NDArray[np.float32]:
-        chunks: list[bytes] = []
+    ) -> AsyncIterator[npt.NDArray[np.float32]]:
+        decoder = PCMDecoder(self.channels)
         if isinstance(response, _legacy_response.HttpxBinaryResponseContent) or isinstance(
             response, StreamedBinaryAPIResponse
         ):
             for chunk in response.iter_bytes(chunk_size=1024):
-                if chunk:
-                    chunks.append(chunk)
+                block = decoder.decode(chunk)
+                if len(block):
+                    yield block
         else:
             async for chunk in response.iter_bytes(chunk_size=1024):
-                if chunk:
-                    chunks.append(chunk)
-
-        audio_bytes = b"".join(chunks)
-        audio_np = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32767.0
-        audio_np = audio_np.reshape(-1, 1)
-        return audio_np
+                block = decoder.decode(chunk)
+                if len(block):
+                    yield block
+
+    def _to_float32(self, buffer: Union[npt.NDArray[np.int16], npt.NDArray[np.float32]]) -> npt.NDArray[np.float32]:
+        if buffer.dtype == np.int16 and self.dtype == np.float32:
+            return (buffer.astype(np.float32) / 32767.0).reshape(-1, self.channels)
+        elif buffer.dtype == np.float32:
+            audio = cast("npt.NDArray[np.float32]", buffer)
+            return audio if audio.ndim == 2 else audio.reshape(-1, self.channels)
+        else:
+            raise ValueError(f"Unsupported dtype: {buffer.dtype}")
 
     async def play(
         self,
@@ -60,106 +77,76 @@ class LocalAudioPlayer:
             StreamedBinaryAPIResponse,
         ],
     ) -> None:
-        audio_content: npt.NDArray[np.float32]
         if isinstance(input, np.ndarray):
-            if input.dtype == np.int16 and self.dtype == np.float32:
-                audio_content = (input.astype(np.float32) / 32767.0).reshape(-1, self.channels)
-            elif input.dtype == np.float32:
-                audio_content = cast("npt.NDArray[np.float32]", input)
-            else:
-                raise ValueError(f"Unsupported dtype: {input.dtype}")
-        else:
-            audio_content = await self._tts_response_to_buffer(input)
+            audio_content = self._to_float32(input)
 
-        loop = asyncio.get_event_loop()
-        event = asyncio.Event()
-        idx = 0
+            async def single_block() -> AsyncIterator[npt.NDArray[np.float32]]:
+                yield audio_content
 
-        def callback(
-            outdata: npt.NDArray[np.float32],
-            frame_count: int,
-            _time_info: Any,
-            _status: Any,
-        ):
-            nonlocal idx
-
-            remainder = len(audio_content) - idx
-            if remainder == 0 or (callable(self.should_stop) and self.should_stop()):
-                loop.call_soon_threadsafe(event.set)
-                raise sd.CallbackStop
-            valid_frames = frame_count if remainder >= frame_count else remainder
-            outdata[:valid_frames] = audio_content[idx : idx + valid_frames]
-            outdata[valid_frames:] = 0
-            idx += valid_frames
-
-        stream = sd.OutputStream(
-            samplerate=SAMPLE_RATE,
-            callback=callback,
-            dtype=audio_content.dtype,
-            channels=audio_content.shape[1],
-        )
-        with stream:
-            await event.wait()
+            await self._play_blocks(single_block(), channels=audio_content.shape[1])
+        else:
+            await self._play_blocks(self._tts_response_to_blocks(input), channels=self.channels)
 
     async def play_stream(
         self,
-        buffer_stream: AsyncGenerator[Union[npt.NDArray[np.float32], npt.NDArray[np.int16], None], None],
+        buffer_stream: AsyncGenerator[Union[npt.NDArray[np.float32], npt.NDArray[np.int16], bytes, None], None],
     ) -> None:
-        loop = asyncio.get_event_loop()
-        event = asyncio.Event()
-        buffer_queue: queue.Queue[Union[npt.NDArray[np.float32], npt.NDArray[np.int16], None]] = queue.Queue(maxsize=50)
+        """Play buffers as they are produced, until the stream ends or yields `None`.
+
+        Buffers are numpy arrays or raw 16-bit PCM `bytes`, which can be split anywhere.
+        """
+        decoder = PCMDecoder(self.channels)
 
-        async def buffer_producer():
+        async def blocks() -> AsyncIterator[npt.NDArray[np.float32]]:
             async for buffer in buffer_stream:
                 if buffer is None:
                     break
-                await loop.run_in_executor(None, buffer_queue.put, buffer)
-            await loop.run_in_executor(None, buffer_queue.put, None)  # Signal completion
-
-        def callback(
-            outdata: npt.NDArray[np.float32],
-            frame_count: int,
-            _time_info: Any,
-            _status: Any,
-        ):
-            nonlocal current_buffer, buffer_pos
-
-            frames_written = 0
-            while frames_written < frame_count:
-                if current_buffer is None or buffer_pos >= len(current_buffer):
-                    try:
-                        current_buffer = buffer_queue.get(timeout=0.1)
-                        if current_buffer is None:
-                            loop.call_soon_threadsafe(event.set)
-                            raise sd.CallbackStop
-                        buffer_pos = 0
-
-                        if current_buffer.dtype == np.int16 and self.dtype == np.float32:
-                            current_buffer = (current_buffer.astype(np.float32) / 32767.0).reshape(-1, self.channels)
-
-                    except queue.Empty:
-                        outdata[frames_written:] = 0
-                        return
-
-                remaining_frames = len(current_buffer) - buffer_pos
-                frames_to_write = min(frame_count - frames_written, remaining_frames)
-                outdata[frames_written : frames_written + frames_to_write] = current_buffer[
-                    buffer_pos : buffer_pos + frames_to_write
-                ]
-                buffer_pos += frames_to_write
-                frames_written += frames_to_write
-
-        current_buffer = None
-        buffer_pos = 0
-
-        producer_task = asyncio.create_task(buffer_producer())
-
-        with sd.OutputStream(
-            samplerate=SAMPLE_RATE,
-            channels=self.channels,
-            dtype=self.dtype,
-            callback=callback,
-        ):
-            await event.wait()
-
-        await producer_task
+                block = decoder.decode(buffer) if isinstance(buffer, (bytes, bytearray)) else self._to_float32(buffer)
+                if len(block):
+                    yield block
+
+        await self._play_blocks(blocks(), channels=self.channels)
+
+    async def _play_blocks(self, blocks: AsyncIterator[npt.NDArray[np.float32]], *, channels: int) -> None:
+        loop = asyncio.get_running_loop()
+        ring = RingBuffer(self.buffer_frames, channels)
+        first_block = asyncio.Event()
+        has_space = asyncio.Event()
+        finished = asyncio.Event()
+
+        async def produce() -> None:
+            try:
+                async for block in blocks:
+                    while len(block):
+                        # cleared before writing so a read in between isn't missed
+                        has_space.clear()
+                        block = block[ring.write(block) :]
+                        first_block.set()
+                        if len(block):
+                            await has_space.wait()
+            finally:
+                ring.close()
+                first_block.set()
+
+        def fill(outdata: npt.NDArray[np.float32]) -> bool:
+            # checked before reading, frames written right before closing are still played
+            closed = ring.closed
+            stop = callable(self.should_stop) and self.should_stop()
+            if stop or (ring.read_into(outdata) == 0 and closed):
+                loop.call_soon_threadsafe(finished.set)
+                return False
+            loop.call_soon_threadsafe(has_space.set)
+            return True
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            await first_block.wait()
+            if ring.written:
+                with self.sink.open(samplerate=SAMPLE_RATE, channels=channels, fill=fill):
+                    await finished.wait()
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
@@ -5,34 +5,55 @@ import io
 import time
 import wave
 import asyncio
-from typing import Any, Type, Union, Generic, TypeVar, Callable, overload
+from typing import Any, Type, Union, Generic, TypeVar, Callable, AsyncIterator, overload
 from typing_extensions import TYPE_CHECKING, Literal
 
+from ._audio import RingBuffer, AudioSource, SoundDeviceSource
 from .._types import FileTypes, FileContent
-from .._extras import numpy as np, sounddevice as sd
+from .._extras import numpy as np
 
 if TYPE_CHECKING:
     import numpy.typing as npt
 
 SAMPLE_RATE = 24000
 
+# a recording without a `timeout` stops after 5 minutes unless `max_duration=None` is passed
+DEFAULT_MAX_DURATION = 300.0
+
+# recordings capped at up to this many seconds get their whole buffer allocated up front
+_PREALLOCATE_SECONDS = 10
+
 DType = TypeVar("DType", bound=np.generic)
 
 
 class Microphone(Generic[DType]):
+    """Records from the `source`, by default the system's input device.
+
+    A recording stops after `timeout` seconds or once it reaches `max_duration` seconds,
+    whichever comes first, so memory is bounded by default. Short recordings are captured
+    into a buffer that is allocated up front, longer ones into chunks that are added as the
+    recording grows, up to the cap. Pass `max_duration=None` to record for as long as
+    `should_record` allows.
+    """
+
     def __init__(
         self,
         channels: int = 1,
         dtype: Type[DType] = np.int16,
         should_record: Union[Callable[[], bool], None] = None,
         timeout: Union[float, None] = None,
+        *,
+        max_duration: Union[float, None] = DEFAULT_MAX_DURATION,
+        source: Union[AudioSource, None] = None,
     ):
         self.channels = channels
         self.dtype = dtype
         self.should_record = should_record
-        self.buffer_chunks = []
         self.timeout = timeout
+        self.max_duration = max_duration
+        self.source = source if source is not None else SoundDeviceSource()
         self.has_record_function = callable(should_record)
+        self.dropped_frames = 0
 
     def _ndarray_to_wav(self, audio_data: npt.NDArray[DType]) -> FileTypes:
         buffer: FileContent = io.BytesIO()
@@ -44,6 +65,39 @@ class Microphone(Generic[DType]):
         buffer.seek(0)
         return ("audio.wav", buffer, "audio/wav")
 
+    def _capture(
+        self,
+        ring: Union[RingBuffer, _GrowingBuffer],
+        ready: asyncio.Event,
+        *,
+        drop_when_full: bool,
+    ) -> Callable[[npt.NDArray[DType]], bool]:
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+
+        def consume(indata: npt.NDArray[DType]) -> bool:
+            execution_time = time.perf_counter() - start_time
+            reached_recording_timeout = execution_time > self.timeout if self.timeout is not None else False
+            should_be_recording = self.should_record() if callable(self.should_record) else True
+
+            stop = len(indata) == 0 or reached_recording_timeout or not should_be_recording
+            if not stop:
+                written = ring.write(indata)
+                if written < len(indata):
+                    # the buffer is full, a recording stops while a stream of frames drops new audio
+                    stop = not drop_when_full
+                    self.dropped_frames += len(indata) - written
+
+            if stop:
+                ring.close()
+            loop.call_soon_threadsafe(ready.set)
+            return not stop
+
+        return consume
+
+    def _ring_buffer(self, seconds: float) -> RingBuffer:
+        return RingBuffer(max(int(SAMPLE_RATE * seconds), 1), self.channels, self.dtype)
+
     @overload
     async def record(self, return_ndarray: Literal[True]) -> npt.NDArray[DType]: ...
 
@@ -54,47 +108,100 @@ class Microphone(Generic[DType]):
     async def record(self, return_ndarray: None = ...) -> FileTypes: ...
 
     async def record(self, return_ndarray: Union[bool, None] = False) -> Union[npt.NDArray[DType], FileTypes]:
-        loop = asyncio.get_event_loop()
-        event = asyncio.Event()
-        self.buffer_chunks: list[npt.NDArray[DType]] = []
-        start_time = time.perf_counter()
+        self.dropped_frames = 0
+        caps = [cap for cap in (self.timeout, self.max_duration) if cap is not None]
+        ring: Union[RingBuffer, _GrowingBuffer]
+        if caps and min(caps) <= _PREALLOCATE_SECONDS:
+            ring = self._ring_buffer(min(caps))
+        else:
+            max_frames = max(int(SAMPLE_RATE * min(caps)), 1) if caps else None
+            ring = _GrowingBuffer(SAMPLE_RATE * _PREALLOCATE_SECONDS, self.channels, self.dtype, max_frames=max_frames)
+        ready = asyncio.Event()
+        consume = self._capture(ring, ready, drop_when_full=False)
 
-        def callback(
-            indata: npt.NDArray[DType],
-            _frame_count: int,
-            _time_info: Any,
-            _status: Any,
-        ):
-            execution_time = time.perf_counter() - start_time
-            reached_recording_timeout = execution_time > self.timeout if self.timeout is not None else False
-            if reached_recording_timeout:
-                loop.call_soon_threadsafe(event.set)
-                raise sd.CallbackStop
+        with self.source.open(samplerate=SAMPLE_RATE, channels=self.channels, dtype=self.dtype, consume=consume):
+            while not ring.closed:
+                await ready.wait()
+                ready.clear()
 
-            should_be_recording = self.should_record() if callable(self.should_record) else True
-            if not should_be_recording:
-                loop.call_soon_threadsafe(event.set)
-                raise sd.CallbackStop
-
-            self.buffer_chunks.append(indata.copy())
-
-        stream = sd.InputStream(
-            callback=callback,
-            dtype=self.dtype,
-            samplerate=SAMPLE_RATE,
-            channels=self.channels,
-        )
-        with stream:
-            await event.wait()
-
-        # Concatenate all chunks into a single buffer, handle empty case
-        concatenated_chunks: npt.NDArray[DType] = (
-            np.concatenate(self.buffer_chunks, axis=0)
-            if len(self.buffer_chunks) > 0
-            else np.array([], dtype=self.dtype)
-        )
+        recording: npt.NDArray[DType] = np.empty((len(ring), self.channels), dtype=self.dtype)
+        ring.read_into(recording)
 
         if return_ndarray:
-            return concatenated_chunks
+            return recording
         else:
-            return self._ndarray_to_wav(concatenated_chunks)
+            return self._ndarray_to_wav(recording)
+
+    async def frames(self, frame_size: int = 480, *, max_backlog: float = 5.0) -> AsyncIterator[npt.NDArray[DType]]:
+        """Record and yield the audio in frames of `frame_size` samples as it is captured.
+
+        The default of 480 samples is 20ms, ready for `input_audio_buffer.append` or
+        chunked transcription. Recording stops like `record()` does, the last frame can
+        be shorter. When the frames aren't consumed, up to `max_backlog` seconds are
+        kept and newer audio is dropped and counted in `dropped_frames`.
+        """
+        if frame_size < 1:
+            raise ValueError("frame_size must be at least 1")
+
+        self.dropped_frames = 0
+        ring = self._ring_buffer(max(max_backlog, frame_size / SAMPLE_RATE))
+        ready = asyncio.Event()
+        consume = self._capture(ring, ready, drop_when_full=True)
+
+        with self.source.open(samplerate=SAMPLE_RATE, channels=self.channels, dtype=self.dtype, consume=consume):
+            while True:
+                ready.clear()
+                # checked before the fill level, frames written right before closing are still read
+                closed = ring.closed
+                if len(ring) >= frame_size or (closed and len(ring)):
+                    frame: npt.NDArray[DType] = np.empty((min(len(ring), frame_size), self.channels), dtype=self.dtype)
+                    ring.read_into(frame)
+                    yield frame
+                elif closed:
+                    return
+                else:
+                    await ready.wait()
+
+
+class _GrowingBuffer:
+    """The buffer of a long or uncapped recording.
+
+    It is written like a `RingBuffer` and read once the recording is over. When a chunk is
+    full a new one of twice the size is allocated, the frames captured so far are never
+    copied again. Once `max_frames` are buffered further frames are not written.
+    """
+
+    def __init__(self, frames: int, channels: int, dtype: Any, *, max_frames: Union[int, None] = None) -> None:
+        self.closed = False
+        self._max_frames = max_frames
+        self._chunks = [RingBuffer(frames if max_frames is None else min(frames, max_frames), channels, dtype)]
+        self._channels = channels
+        self._dtype = dtype
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def write(self, block: npt.NDArray[Any]) -> int:
+        written = self._chunks[-1].write(block)
+        if written < len(block):
+            rest = block[written:]
+            size = max(self._chunks[-1].capacity * 2, len(rest))
+            if self._max_frames is not None:
+                size = min(size, self._max_frames - sum(chunk.capacity for chunk in self._chunks))
+                if size <= 0:
+                    return written
+            chunk = RingBuffer(size, self._channels, self._dtype)
+            self._chunks.append(chunk)
+            written += chunk.write(rest)
+        return written
+
+    def read_into(self, out: npt.NDArray[Any]) -> int:
+        count = 0
+        for chunk in self._chunks:
+            if count < len(out):
+                count += chunk.read_into(out[count:])
+        out[count:] = 0
+        return count
+
+    def close(self) -> None:
+        self.closed = True
@@ -0,0 +1,628 @@
+# pyright: basic
+from __future__ import annotations
+
+import io
+import os
+import functools
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Callable, Iterable, Iterator, Optional, NamedTuple, cast
+
+from .._extras import numpy as np, pandas as pd
+from ._validators import (
+    _COUNT_BATCH_ROWS,
+    PROMPT_SUFFIX_OPTIONS,
+    COMPLETION_SUFFIX_OPTIONS,
+    Remediation,
+    _common_prefix,
+    _long_examples,
+    read_any_format,
+    _infer_task_type,
+    _invalid_format_msg,
+    _letter_case_counts,
+    _lower_case_remediation,
+    _separated_values_format,
+    _num_examples_remediation,
+    _long_examples_remediation,
+    necessary_column_validator,
+    additional_column_validator,
+    _duplicated_rows_remediation,
+    _format_inferrer_remediation,
+    _non_empty_field_remediation,
+    _common_prompt_prefix_remediation,
+    _common_prompt_suffix_remediation,
+    _completions_space_start_remediation,
+    _common_completion_prefix_remediation,
+    _common_completion_suffix_remediation,
+)
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+DEFAULT_CHUNK_SIZE = 100_000
+# how long a common suffix can be to find repeats of it while scanning, longer ones take another pass
+_MAX_TRACKED_SUFFIX = 32
+
+# the columns a chunk's `prompt` and `completion` are taken from
+Sources = Tuple[Any, Any]
+
+# builds a remediation, or `None` when there is nothing to remediate. Unlike the functions of a remediation,
+# it can be pickled, to apply the remediation in another process
+RemediationSpec = Callable[[], Optional[Remediation]]
+
+# `read_json` converts every column to a `dtype` that isn't a mapping, like `read_any_format` reads files,
+# pandas-stubs only declare the mapping
+_AS_STR: Any = str
+
+
+class DatasetReadError(Exception):
+    """Raised while iterating over the chunks of a file that turns out to be malformed."""
+
+    def __init__(self, remediation: Remediation) -> None:
+        # the remediation is the only argument, so that the error can be pickled
+        super().__init__(remediation)
+        self.remediation = remediation
+
+    def __str__(self) -> str:
+        return str(self.remediation.error_msg)
+
+
+class DatasetChunks:
+    """
+    The rows of a dataset as DataFrame chunks, which can be iterated over more than once.
+
+    `columns` holds the columns of the whole dataset, in the order reading the whole file
+    gives them, once the chunks have been iterated over to the end. From then on, missing
+    columns are added to every chunk and filled with `missing_value`, like a whole-file read does.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[], Iterator[pd.DataFrame]],
+        *,
+        missing_value: str = "",
+        split: Optional[Callable[[int], List[DatasetChunks]]] = None,
+    ) -> None:
+        self._read = read
+        self._split = split
+        self.missing_value = missing_value
+        self.columns: Optional[List[Any]] = None
+
+    def split(self, count: int) -> List[DatasetChunks]:
+        """
+        Splits the dataset in up to `count` parts that can be read independently, from another process too,
+        and that hold the rows of the dataset in order. Only .jsonl files are split, other datasets are one part.
+         - the index of every part starts at 0
+        """
+        if self._split is None or count < 2:
+            return [self]
+        return self._split(count)
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        columns = self.columns
+        if columns is not None:
+            for chunk in self._read():
+                if list(chunk.columns) != columns:
+                    chunk = chunk.reindex(columns=columns, fill_value=self.missing_value)
+                yield chunk
+            return
+
+        seen: Dict[Any, None] = {}
+        for chunk in self._read():
+            seen.update(dict.fromkeys(chunk.columns))
+            yield chunk
+        self.columns = list(seen)
+
+
+def read_chunks(
+    fname: str, fields: list[str] = ["prompt", "completion"], chunksize: int = DEFAULT_CHUNK_SIZE
+) -> tuple[DatasetChunks | None, Remediation]:
+    """
+    Like `read_any_format`, but .csv, .tsv and .jsonl files are read `chunksize` rows at a time while
+    the chunks are iterated over. Other formats are read whole, as a single chunk.
+     - the values of a .jsonl file that aren't strings can be converted differently than in a whole-file read,
+       where they depend on the other values of their column
+    """
+    lower_fname = fname.lower()
+    if not os.path.isfile(fname) or not lower_fname.endswith((".csv", ".tsv", ".jsonl")):
+        return _single_chunk(*read_any_format(fname, fields))
+
+    if lower_fname.endswith(".jsonl"):
+        try:
+            probe = pd.read_json(fname, lines=True, dtype=_AS_STR, nrows=2)
+        except (ValueError, TypeError):
+            probe = None
+        if probe is None or len(probe) == 1:
+            # a malformed file, or a single JSON object to read the way `read_any_format` does
+            return _single_chunk(*read_any_format(fname, fields))
+
+        # keys missing from a row become "nan" when the whole file is read with `dtype=str`
+        chunks = DatasetChunks(
+            functools.partial(_read_jsonl, fname, chunksize),
+            missing_value="nan",
+            split=functools.partial(_split_jsonl, fname, chunksize),
+        )
+        return chunks, Remediation(name="read_any_format")
+
+    separator, immediate_msg, necessary_msg = _separated_values_format(fname)
+    try:
+        pd.read_csv(fname, sep=separator, dtype=str, nrows=1)
+    except (ValueError, TypeError):
+        return None, Remediation(name="read_any_format", error_msg=_invalid_format_msg(fname))
+
+    remediation = Remediation(name="read_any_format", immediate_msg=immediate_msg, necessary_msg=necessary_msg)
+    return DatasetChunks(functools.partial(_read_csv, fname, separator, chunksize)), remediation
+
+
+def _single_chunk(df: pd.DataFrame | None, remediation: Remediation) -> tuple[DatasetChunks | None, Remediation]:
+    if df is None or remediation.error_msg is not None:
+        return None, remediation
+    return DatasetChunks(lambda: iter([df])), remediation
+
+
+def _read_csv(fname: str, separator: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(fname, sep=separator, dtype=str, chunksize=chunksize) as reader:
+        iterator = iter(reader)
+        while True:
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            except (ValueError, TypeError) as err:
+                raise _read_error(fname) from err
+            yield chunk.fillna("")
+
+
+def _read_jsonl(fname: str, chunksize: int, start: int = 0, end: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Parses the lines of a .jsonl file from the byte offset `start` up to `end`, `chunksize` lines at a time,
+    the way `read_json(lines=True, chunksize=chunksize)` does
+    """
+    label = 0
+    with open(fname, "rb") as f:
+        f.seek(start)
+        position = start
+        while end is None or position < end:
+            lines: List[bytes] = []
+            while len(lines) < chunksize and (end is None or position < end):
+                line = f.readline()
+                if not line:
+                    break
+                position += len(line)
+                lines.append(line)
+            if not lines:
+                return
+
+            records = [record for record in (line.strip() for line in lines) if record]
+            if not records:
+                continue
+            try:
+                chunk = pd.read_json(io.BytesIO(b"[" + b",".join(records) + b"]"), dtype=_AS_STR)
+            except (ValueError, TypeError) as err:
+                raise _read_error(fname) from err
+            chunk.index = pd.RangeIndex(label, label + len(chunk))
+            label += len(chunk)
+            yield chunk.fillna("")
+
+
+def _split_jsonl(fname: str, chunksize: int, count: int) -> List[DatasetChunks]:
+    """Splits a .jsonl file in `count` parts of about the same size, at the start of a line"""
+    size = os.path.getsize(fname)
+    offsets = [0]
+    with open(fname, "rb") as f:
+        for i in range(1, count):
+            f.seek(max(size * i // count, offsets[-1] + 1) - 1)
+            # to the start of the line after the one the offset is in
+            f.readline()
+            offsets.append(min(f.tell(), size))
+    offsets.append(size)
+
+    return [
+        DatasetChunks(functools.partial(_read_jsonl, fname, chunksize, start, end), missing_value="nan")
+        for start, end in zip(offsets, offsets[1:])
+        if end > start
+    ]
+
+
+def _read_error(fname: str) -> DatasetReadError:
+    return DatasetReadError(Remediation(name="read_any_format", error_msg=_invalid_format_msg(fname)))
+
+
+class _ColumnStats:
+    """
+    What the validators need to know about every value of the `prompt` or the `completion` column
+    """
+
+    def __init__(self, options: list[str]) -> None:
+        self.options = options
+        self.found: set[str] = set()
+        self.min: Optional[str] = None
+        self.max: Optional[str] = None
+        self.reversed_min: Optional[str] = None
+        self.reversed_max: Optional[str] = None
+        self._counts = np.zeros(128, dtype=np.int64)
+        # lengths of the suffixes of the common suffix so far that some value contains more than once
+        self._repeated: set[int] = set()
+
+    def update(self, values: Any) -> None:
+        if len(values) == 0:
+            return
+
+        reversed_values = values.str[::-1]
+        self.min = _min(self.min, values.min())
+        self.max = _max(self.max, values.max())
+        self.reversed_min = _min(self.reversed_min, reversed_values.min())
+        self.reversed_max = _max(self.reversed_max, reversed_values.max())
+        common_suffix = self.common_suffix()[-_MAX_TRACKED_SUFFIX:]
+
+        for start in range(0, len(values), _COUNT_BATCH_ROWS):
+            batch = values.values[start : start + _COUNT_BATCH_ROWS]
+            # the options don't contain the separator, so they can only match within a value
+            text = "\x00".join(batch)
+            for option in self.options:
+                if option not in self.found and option in text:
+                    self.found.add(option)
+
+            # every value ends with `suffix`, it is repeated in one of them if there are more
+            # occurrences than values; the final common suffix is one of the suffixes checked
+            for length in range(1, len(common_suffix) + 1):
+                suffix = common_suffix[-length:]
+                if length not in self._repeated and "\x00" not in suffix and text.count(suffix) > len(batch):
+                    self._repeated.add(length)
+
+            frequencies = np.bincount(
+                np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32), minlength=1
+            )
+            frequencies[0] -= len(batch) - 1
+            if len(frequencies) > len(self._counts):
+                self._counts = np.concatenate([self._counts, np.zeros(len(frequencies) - len(self._counts), np.int64)])
+            self._counts[: len(frequencies)] += frequencies
+
+    def extend(self, other: _ColumnStats) -> None:
+        """Adds the statistics of the values after the ones seen so far"""
+        self.found.update(other.found)
+        for name in ("min", "reversed_min"):
+            if getattr(other, name) is not None:
+                setattr(self, name, _min(getattr(self, name), getattr(other, name)))
+        for name in ("max", "reversed_max"):
+            if getattr(other, name) is not None:
+                setattr(self, name, _max(getattr(self, name), getattr(other, name)))
+        if len(other._counts) > len(self._counts):
+            self._counts, other_counts = other._counts.copy(), self._counts
+        else:
+            other_counts = other._counts
+        self._counts[: len(other_counts)] += other_counts
+        # both were tracked for every suffix of the common suffix of all the values
+        self._repeated.update(other._repeated)
+
+    @property
+    def all_identical(self) -> bool:
+        return self.min == self.max
+
+    def common_prefix(self) -> str:
+        if self.min is None or self.max is None:
+            return ""
+        return _common_prefix(self.min, self.max)
+
+    def common_suffix(self) -> str:
+        if self.reversed_min is None or self.reversed_max is None:
+            return ""
+        return _common_prefix(self.reversed_min, self.reversed_max)[::-1]
+
+    def contains(self, text: str) -> bool:
+        return text in self.found
+
+    def repeats_common_suffix(self) -> Optional[bool]:
+        """Whether a value contains the common suffix also before its end, `None` if it wasn't tracked"""
+        common_suffix = self.common_suffix()
+        if len(common_suffix) > _MAX_TRACKED_SUFFIX or "\x00" in common_suffix:
+            return None
+        return len(common_suffix) in self._repeated
+
+    def letter_case_counts(self) -> tuple[int, int]:
+        return _letter_case_counts({int(c): int(self._counts[c]) for c in np.flatnonzero(self._counts)})
+
+
+def _min(current: Optional[str], value: str) -> str:
+    return value if current is None or value < current else current
+
+
+def _max(current: Optional[str], value: str) -> str:
+    return value if current is None or value > current else current
+
+
+class _Scan:
+    """The statistics of one pass over the chunks"""
+
+    def __init__(self) -> None:
+        self.num_examples = 0
+        self.kept_examples = 0
+        self.columns: Dict[Any, None] = {}
+        self.sources: list[Optional[Sources]] = []
+        self.empty_indexes: list[npt.NDArray[np.intp]] = []
+        self.long_indexes: list[npt.NDArray[np.intp]] = []
+        self.labels: list[npt.NDArray[Any]] = []
+        self.row_hashes: list[npt.NDArray[np.uint64]] = []
+        self.completion_hashes: list[npt.NDArray[np.uint64]] = []
+        self.prompt_length = 0
+        self.all_start_with_space = True
+        self.prompt = _ColumnStats(["\n", *PROMPT_SUFFIX_OPTIONS])
+        self.completion = _ColumnStats(COMPLETION_SUFFIX_OPTIONS)
+
+    def update(self, chunk: pd.DataFrame, sources: Optional[Sources], missing_value: str) -> None:
+        self.sources.append(sources)
+        start = self.num_examples
+        self.num_examples += len(chunk)
+        if sources is None:
+            # the columns can't be resolved yet, the chunk will be scanned again
+            return
+
+        df = _examples(chunk, sources, missing_value)
+        empty_rows = np.asarray((df.completion == "") | df.completion.isnull(), dtype=bool)
+        self.empty_indexes.append(np.flatnonzero(empty_rows) + start)
+        df = cast("pd.DataFrame", df[~empty_rows])
+
+        start = self.kept_examples
+        self.kept_examples += len(df)
+        self.labels.append(np.asarray(df.index))
+        self.row_hashes.append(np.asarray(pd.util.hash_pandas_object(df, index=False), dtype=np.uint64))
+        completion_hashes = np.asarray(pd.util.hash_pandas_object(df.completion, index=False), dtype=np.uint64)
+        self.completion_hashes.append(pd.unique(completion_hashes))
+        self.prompt_length += int(df.prompt.str.len().sum())
+        self.long_indexes.append(np.flatnonzero(np.asarray(_long_examples(df), dtype=bool)) + start)
+        self.all_start_with_space = self.all_start_with_space and bool(df.completion.str.startswith(" ").all())
+        self.prompt.update(df.prompt)
+        self.completion.update(df.completion)
+
+    def extend(self, other: _Scan) -> None:
+        """Adds the statistics of a pass over the chunks after the ones scanned so far"""
+        self.columns.update(other.columns)
+        self.sources.extend(other.sources)
+        self.empty_indexes.extend(indexes + self.num_examples for indexes in other.empty_indexes)
+        self.long_indexes.extend(indexes + self.kept_examples for indexes in other.long_indexes)
+        self.labels.extend(labels + self.num_examples for labels in other.labels)
+        self.row_hashes.extend(other.row_hashes)
+        self.completion_hashes.extend(other.completion_hashes)
+        self.num_examples += other.num_examples
+        self.kept_examples += other.kept_examples
+        self.prompt_length += other.prompt_length
+        self.all_start_with_space = self.all_start_with_space and other.all_start_with_space
+        self.prompt.extend(other.prompt)
+        self.completion.extend(other.completion)
+
+
+def _examples(chunk: pd.DataFrame, sources: Sources, missing_value: str) -> pd.DataFrame:
+    """The `prompt` and `completion` of the chunk's rows"""
+    return pd.DataFrame(
+        {
+            field: chunk[source] if source in chunk.columns else missing_value
+            for field, source in zip(("prompt", "completion"), sources)
+        },
+        index=chunk.index,
+    )
+
+
+def _column_remediations(columns: list[Any]) -> tuple[list[RemediationSpec], Optional[Sources]]:
+    """
+    Runs the column validators on a row holding the name of each column, so that after their
+    remediations the row tells which columns become `prompt` and `completion`
+    """
+    df = pd.DataFrame([columns], columns=columns, dtype=object)
+    validators: List[Callable[[pd.DataFrame], Remediation]] = [
+        functools.partial(necessary_column_validator, necessary_column="prompt"),
+        functools.partial(necessary_column_validator, necessary_column="completion"),
+        additional_column_validator,
+    ]
+    specs: list[RemediationSpec] = []
+    for validator in validators:
+        # a copy, the remediations rename the columns in place
+        specs.append(functools.partial(validator, df.copy()))
+        remediation = validator(df)
+        if remediation.error_msg is not None:
+            return specs, None
+        if remediation.necessary_fn is not None:
+            df = remediation.necessary_fn(df)
+    return specs, (df["prompt"].iloc[0], df["completion"].iloc[0])
+
+
+def _scan(sources: Optional[Sources], chunks: DatasetChunks) -> _Scan:
+    """
+    Scans the chunks for the statistics of their `prompt` and `completion`, taken from `sources`,
+    or from the columns that the columns of the chunks so far resolve to
+    """
+    scan = _Scan()
+    for chunk in chunks:
+        chunk_sources = sources
+        scan.columns.update(dict.fromkeys(chunk.columns))
+        if chunk_sources is None:
+            chunk_sources = _column_remediations(list(scan.columns))[1]
+        scan.update(chunk, chunk_sources, chunks.missing_value)
+    return scan
+
+
+def _repeated_suffixes(sources: Sources, suffixes: Dict[str, str], chunks: DatasetChunks) -> set[str]:
+    """Which of the columns contain their common suffix also before the end of a value"""
+    repeated: set[str] = set()
+    for chunk in chunks:
+        df = _examples(chunk, sources, chunks.missing_value)
+        df = df[(df.completion != "") & df.completion.notnull()]
+        for column, suffix in suffixes.items():
+            if column not in repeated and df[column].str[: -len(suffix)].str.contains(suffix, regex=False).any():
+                repeated.add(column)
+        if len(repeated) == len(suffixes):
+            break
+    return repeated
+
+
+def validate_chunks(chunks: DatasetChunks) -> list[Remediation]:
+    """
+    Runs the checks of `get_validators()` over a dataset one chunk at a time, and returns the remediations
+    that applying them to the whole dataset gives, up to the first one with an error.
+     - duplicated rows are found by their hash
+     - the `necessary_fn` and `optional_fn` of the remediations can be applied to one chunk at a time
+     - it takes one pass over the chunks, one more if the columns of the first chunks don't resolve the way the
+       whole dataset's do, and one more if a common suffix is too long to find its repeats while scanning
+    """
+    return _validate([chunks]).remediations
+
+
+class _Validation(NamedTuple):
+    remediations: List[Remediation]
+    specs: List[RemediationSpec]
+    """What each of the remediations is built from."""
+    columns: List[Any]
+    """The columns of the whole dataset."""
+    part_examples: List[int]
+    """How many examples were read from each part, the index of a part's rows starts after the ones before."""
+    duplicated_indexes: List[int]
+    long_indexes: List[int]
+
+
+def _validate(parts: List[DatasetChunks], map_parts: Callable[..., Iterable[Any]] = map) -> _Validation:
+    """
+    Validates the dataset that the parts of `DatasetChunks.split()` hold, and scans them with `map_parts`,
+    which can be the `map` of a process pool
+    """
+
+    def scan(sources: Optional[Sources]) -> _Scan:
+        total = _Scan()
+        part_examples.clear()
+        for part_scan in map_parts(functools.partial(_scan, sources), parts):
+            part_examples.append(part_scan.num_examples)
+            total.extend(part_scan)
+        return total
+
+    part_examples: List[int] = []
+    try:
+        result = scan(None)
+        columns = list(result.columns)
+        column_specs, sources = _column_remediations(columns)
+        if sources is not None and any(chunk_sources != sources for chunk_sources in result.sources):
+            # the columns of a chunk read early were resolved differently than the whole dataset's
+            result = scan(sources)
+    except DatasetReadError as err:
+        return _validation([functools.partial(Remediation, *err.remediation)], [], part_examples, [], [])
+
+    specs: List[RemediationSpec] = [functools.partial(_num_examples_remediation, result.num_examples), *column_specs]
+    if sources is None:
+        return _validation(specs, columns, part_examples, [], [])
+
+    empty_indexes = np.concatenate(result.empty_indexes).tolist() if result.empty_indexes else []
+    specs.append(functools.partial(_non_empty_field_remediation, "completion", empty_indexes))
+
+    completion_hashes = np.concatenate(result.completion_hashes) if result.completion_hashes else np.zeros(0, np.uint64)
+    ft_type = _infer_task_type(result.prompt_length, len(pd.unique(completion_hashes)), result.kept_examples)
+    specs.append(functools.partial(_format_inferrer_remediation, ft_type))
+
+    if result.row_hashes:
+        duplicated_rows = np.asarray(pd.Series(np.concatenate(result.row_hashes)).duplicated(), dtype=bool)
+        duplicated_labels = np.concatenate(result.labels)[duplicated_rows]
+    else:
+        duplicated_rows = np.zeros(0, bool)
+        duplicated_labels = np.zeros(0, np.int64)
+
+    fields = ["prompt", "completion"]
+    duplicated_indexes = np.flatnonzero(duplicated_rows).tolist()
+    drop_duplicates = functools.partial(_drop_labels, duplicated_labels)
+    specs.append(functools.partial(_duplicated_rows_remediation, duplicated_indexes, fields, drop_duplicates))
+
+    long_indexes = []
+    if ft_type != "open-ended generation" and result.long_indexes:
+        long_indexes = np.concatenate(result.long_indexes).tolist()
+    specs.append(functools.partial(_long_examples_remediation, ft_type, long_indexes, _drop_long_examples))
+
+    for column, stats in (("prompt", result.prompt), ("completion", result.completion)):
+        specs.append(functools.partial(_lower_case_remediation, column, *stats.letter_case_counts()))
+
+    # common suffixes too long to be tracked while scanning are looked for with one more pass
+    repeated = {
+        column
+        for column, stats in (("prompt", result.prompt), ("completion", result.completion))
+        if stats.repeats_common_suffix()
+    }
+    suffixes = {}
+    if (
+        ft_type != "open-ended generation"
+        and not result.prompt.all_identical
+        and result.prompt.repeats_common_suffix() is None
+    ):
+        suffixes["prompt"] = result.prompt.common_suffix()
+    if (
+        ft_type == "conditional generation"
+        and not result.completion.all_identical
+        and result.completion.repeats_common_suffix() is None
+    ):
+        suffixes["completion"] = result.completion.common_suffix()
+    if suffixes:
+        try:
+            for part_repeated in map_parts(functools.partial(_repeated_suffixes, sources, suffixes), parts):
+                repeated.update(part_repeated)
+        except DatasetReadError as err:
+            specs.append(functools.partial(Remediation, *err.remediation))
+            return _validation(specs, columns, part_examples, duplicated_indexes, long_indexes)
+
+    specs.extend(
+        [
+            functools.partial(
+                _common_prompt_suffix_remediation,
+                ft_type,
+                result.prompt.common_suffix(),
+                all_identical=result.prompt.all_identical,
+                contains=result.prompt.contains,
+                repeats_suffix=functools.partial(_is_repeated, repeated, "prompt"),
+            ),
+            functools.partial(
+                _common_prompt_prefix_remediation,
+                result.prompt.common_prefix(),
+                all_identical=result.prompt.all_identical,
+            ),
+            functools.partial(
+                _common_completion_prefix_remediation,
+                result.completion.common_prefix(),
+                all_identical=result.completion.all_identical,
+            ),
+            functools.partial(
+                _common_completion_suffix_remediation,
+                ft_type,
+                result.completion.common_suffix(),
+                all_identical=result.completion.all_identical,
+                contains=result.completion.contains,
+                repeats_suffix=functools.partial(_is_repeated, repeated, "completion"),
+            ),
+            functools.partial(
+                _completions_space_start_remediation, result.kept_examples > 0 and result.all_start_with_space
+            ),
+        ]
+    )
+    return _validation(specs, columns, part_examples, duplicated_indexes, long_indexes)
+
+
+def _validation(
+    specs: List[RemediationSpec],
+    columns: List[Any],
+    part_examples: List[int],
+    duplicated_indexes: List[int],
+    long_indexes: List[int],
+) -> _Validation:
+    """Builds the remediations of `specs`, up to the first one with an error"""
+    remediations: List[Remediation] = []
+    remediation_specs: List[RemediationSpec] = []
+    for spec in specs:
+        remediation = spec()
+        if remediation is None:
+            continue
+        remediations.append(remediation)
+        remediation_specs.append(spec)
+        if remediation.error_msg is not None:
+            break
+    return _Validation(remediations, remediation_specs, columns, part_examples, duplicated_indexes, long_indexes)
+
+
+def _drop_labels(labels: Any, x: Any) -> Any:
+    return x.drop(x.index[x.index.isin(labels)])
+
+
+def _drop_long_examples(x: Any) -> Any:
+    return x.drop(x.index[_long_examples(x)])
+
+
+def _is_repeated(repeated: set[str], column: str, _suffix: Any) -> bool:
+    return column in repeated
@@ -0,0 +1,332 @@
+# pyright: basic
+from __future__ import annotations
+
+import os
+import sys
+import mmap
+import tempfile
+import functools
+import contextlib
+import multiprocessing
+from typing import Any, Dict, List, Tuple, Callable, Iterable, Iterator, Optional, cast
+
+from .._extras import numpy as np, pandas as pd
+from ._validators import (
+    Remediation,
+    _write_out,
+    _common_prefix,
+    _infer_task_type,
+    _num_train_examples,
+    _estimate_fine_tuning_time,
+    accept_optional_remediation,
+    apply_necessary_remediation,
+    write_necessary_remediation,
+)
+from ._chunked_validators import DEFAULT_CHUNK_SIZE, DatasetChunks, RemediationSpec, _validate, read_chunks
+
+
+class _Preparation:
+    """What the worker processes prepare, everything is pickled to them"""
+
+    def __init__(
+        self,
+        directory: str,
+        parts: List[DatasetChunks],
+        first_labels: List[int],
+        remediations: List[Tuple[RemediationSpec, str]],
+        max_classes: int,
+    ) -> None:
+        self.directory = directory
+        self.parts = parts
+        self.first_labels = first_labels
+        # the spec of each remediation to apply, and whether it is its `necessary_fn` or its `optional_fn`
+        self.remediations = remediations
+        self.max_classes = max_classes
+
+    def part_fname(self, i: int) -> str:
+        return os.path.join(self.directory, f"part-{i}.jsonl")
+
+    def remediation_fns(self) -> List[Callable[[Any], Any]]:
+        fns = []
+        for spec, fn_name in self.remediations:
+            remediation = spec()
+            assert remediation is not None
+            fns.append(getattr(remediation, fn_name))
+        return fns
+
+
+class _PartSummary:
+    """What writing out the rest of the dialog needs to know about the prepared rows of a part"""
+
+    def __init__(self, max_classes: int) -> None:
+        self.max_classes = max_classes
+        self.num_examples = 0
+        self.prompt_length = 0
+        # the count of each completion in the order they first appear, `None` once there are too many to be classes
+        self.completion_counts: Optional[Dict[str, int]] = {}
+        self.reversed_prompt: Optional[Tuple[str, str]] = None
+        self.reversed_completion: Optional[Tuple[str, str]] = None
+        self.line_lengths: List[Any] = []
+
+    def update(self, df: pd.DataFrame, data: bytes) -> None:
+        self.num_examples += len(df)
+        self.prompt_length += int(df.prompt.str.len().sum())
+        self.reversed_prompt = _reversed_range(self.reversed_prompt, df.prompt)
+        self.reversed_completion = _reversed_range(self.reversed_completion, df.completion)
+        # values are JSON strings, a newline can only end a line
+        line_ends = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n"))
+        self.line_lengths.append(np.diff(line_ends, prepend=-1))
+
+        if self.completion_counts is not None:
+            completions = pd.unique(df.completion.values)
+            if len(completions) > self.max_classes:
+                self.completion_counts = None
+                return
+            counts = df.completion.value_counts(sort=False)
+            for completion in completions:
+                self.completion_counts[completion] = self.completion_counts.get(completion, 0) + int(counts[completion])
+            if len(self.completion_counts) > self.max_classes:
+                self.completion_counts = None
+
+    def extend(self, other: _PartSummary) -> None:
+        """Adds the summary of the rows after the ones summarized so far"""
+        self.num_examples += other.num_examples
+        self.prompt_length += other.prompt_length
+        for name in ("reversed_prompt", "reversed_completion"):
+            values = [value for value in (getattr(self, name), getattr(other, name)) if value is not None]
+            setattr(self, name, (min(v[0] for v in values), max(v[1] for v in values)) if values else None)
+        self.line_lengths.extend(other.line_lengths)
+
+        if self.completion_counts is not None and other.completion_counts is not None:
+            for completion, count in other.completion_counts.items():
+                self.completion_counts[completion] = self.completion_counts.get(completion, 0) + count
+            if len(self.completion_counts) > self.max_classes:
+                self.completion_counts = None
+        else:
+            self.completion_counts = None
+
+    def common_suffix(self, name: str) -> str:
+        values = getattr(self, name)
+        if values is None:
+            return ""
+        return _common_prefix(*values)[::-1]
+
+
+def _reversed_range(current: Optional[Tuple[str, str]], values: Any) -> Tuple[str, str]:
+    reversed_values = values.str[::-1]
+    low, high = reversed_values.min(), reversed_values.max()
+    if current is None:
+        return low, high
+    return min(current[0], low), max(current[1], high)
+
+
+def prepare_data_in_parts(
+    fname: str, *, auto_accept: bool, workers: int = 1, chunksize: int = DEFAULT_CHUNK_SIZE
+) -> None:
+    """
+    Does what `fine_tunes.prepare_data` does, and writes the same files, but never holds more than
+    `chunksize` rows of a worker in memory at once. A .jsonl file is split in up to `workers` parts
+    which are validated and remediated in as many processes.
+     - the estimated fine-tuning time can differ slightly, it depends on the type of the DataFrame index
+     - the values of a .jsonl file that aren't strings can be converted differently, see `read_chunks()`
+    """
+    chunks, read_remediation = read_chunks(fname, chunksize=chunksize)
+    apply_necessary_remediation(None, read_remediation)
+    assert chunks is not None
+
+    parts = chunks.split(workers)
+    with _pool(len(parts)) as map_parts:
+        validation = _validate(parts, map_parts)
+
+    for remediation in validation.remediations:
+        apply_necessary_remediation(None, remediation._replace(necessary_fn=None))
+    necessary = [
+        (spec, "necessary_fn")
+        for remediation, spec in zip(validation.remediations, validation.specs)
+        if remediation.necessary_fn is not None
+    ]
+
+    remediations = [(read_remediation, None), *zip(validation.remediations, validation.specs)]
+    any_optional_or_necessary_remediations = any(
+        remediation.optional_msg is not None or remediation.necessary_msg is not None for remediation, _ in remediations
+    )
+    any_necessary_applied = any(remediation.necessary_msg is not None for remediation, _ in remediations)
+    accepted: List[Remediation] = []
+    optional: List[Tuple[RemediationSpec, str]] = []
+
+    if any_optional_or_necessary_remediations:
+        sys.stdout.write("\n\nBased on the analysis we will perform the following actions:\n")
+        # the dialog of `apply_optional_remediation`, the remediations are applied to the parts afterwards
+        for remediation, spec in remediations:
+            if accept_optional_remediation(remediation, auto_accept):
+                if remediation.name == "long_examples":
+                    dropped_duplicates = any(r.name == "duplicated_rows" for r in accepted)
+                    _report_long_indexes(
+                        validation.long_indexes, validation.duplicated_indexes if dropped_duplicates else []
+                    )
+                accepted.append(remediation)
+                if spec is not None and remediation.optional_fn is not None:
+                    optional.append((spec, "optional_fn"))
+            write_necessary_remediation(remediation)
+    else:
+        sys.stdout.write("\n\nNo remediations found.\n")
+
+    for part in parts:
+        part.columns = validation.columns
+    first_labels = np.cumsum([0, *validation.part_examples[:-1]]).tolist()
+
+    with tempfile.TemporaryDirectory(prefix=".prepare_data-", dir=os.path.dirname(os.path.abspath(fname))) as directory:
+        preparation = _Preparation(
+            directory,
+            parts,
+            first_labels,
+            [*necessary, *optional],
+            max_classes=sum(validation.part_examples) // 3 + 1,
+        )
+        summary = _PartSummary(preparation.max_classes)
+        with _pool(len(parts)) as map_parts:
+            for part_summary in map_parts(functools.partial(_prepare_part, preparation), range(len(parts))):
+                summary.extend(part_summary)
+        part_fnames = [preparation.part_fname(i) for i in range(len(parts))]
+
+        _write_summary(
+            fname,
+            summary,
+            part_fnames,
+            any_optional_or_necessary_applied=bool(accepted) or any_necessary_applied,
+            auto_accept=auto_accept,
+            rows_removed=summary.num_examples < sum(validation.part_examples),
+        )
+
+
+@contextlib.contextmanager
+def _pool(processes: int) -> Iterator[Callable[..., Iterable[Any]]]:
+    """The `map` of a pool of processes, started the platform's default way, or the builtin one if there is no use for it"""
+    if processes < 2:
+        yield map
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        yield pool.imap
+
+
+def _report_long_indexes(long_indexes: List[int], dropped_indexes: List[int]) -> None:
+    """Tells where the long examples are after the rows at `dropped_indexes` were dropped, like `long_examples_validator`"""
+    dropped = np.asarray(dropped_indexes, dtype=np.int64)
+    positions = np.asarray(long_indexes, dtype=np.int64)
+    positions = positions[~np.isin(positions, dropped)]
+    long_indexes_to_drop = (positions - np.searchsorted(dropped, positions)).tolist()
+    if long_indexes != long_indexes_to_drop:
+        sys.stdout.write(
+            f"The indices of the long examples has changed as a result of a previously applied recommendation.\nThe {len(long_indexes_to_drop)} long examples to be dropped are now at the following indices: {long_indexes_to_drop}\n"
+        )
+
+
+def _prepare_part(preparation: _Preparation, i: int) -> _PartSummary:
+    """Applies the remediations to the chunks of a part, and writes their rows to a file of its own"""
+    remediation_fns = preparation.remediation_fns()
+    summary = _PartSummary(preparation.max_classes)
+    with open(preparation.part_fname(i), "wb") as f:
+        for chunk in preparation.parts[i]:
+            # the labels the rows have when the whole dataset is read
+            chunk.index = chunk.index + preparation.first_labels[i]
+            for remediation_fn in remediation_fns:
+                chunk = remediation_fn(chunk)
+            if len(chunk) == 0:
+                continue
+
+            df = cast("pd.DataFrame", chunk[["prompt", "completion"]])
+            data = df.to_json(lines=True, orient="records", force_ascii=False, indent=None).encode("utf-8")
+            if not data.endswith(b"\n"):
+                # pandas before 1.5.0 doesn't end the last line
+                data += b"\n"
+            f.write(data)
+            summary.update(df, data)
+    return summary
+
+
+def _write_summary(
+    fname: str,
+    summary: _PartSummary,
+    part_fnames: List[str],
+    *,
+    any_optional_or_necessary_applied: bool,
+    auto_accept: bool,
+    rows_removed: bool,
+) -> None:
+    num_examples = summary.num_examples
+    num_classes = len(summary.completion_counts) if summary.completion_counts is not None else num_examples
+    ft_format = _infer_task_type(summary.prompt_length, num_classes, num_examples)
+
+    def write_files(fnames: List[str]) -> None:
+        if len(fnames) == 1:
+            _concatenate(part_fnames, fnames[0])
+            return
+
+        line_ends = np.cumsum(np.concatenate([np.zeros(1, np.int64), *summary.line_lengths]))
+        # the rows `df.sample(n=n_train, random_state=42)` takes
+        train = np.random.RandomState(42).choice(num_examples, size=_num_train_examples(num_examples), replace=False)
+        valid = np.ones(num_examples, dtype=bool)
+        valid[train] = False
+
+        all_fname = os.path.join(os.path.dirname(part_fnames[0]), "all.jsonl")
+        _concatenate(part_fnames, all_fname)
+        with open(all_fname, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as lines:
+            for out_fname, rows in ((fnames[0], train), (fnames[1], np.flatnonzero(valid))):
+                _write_lines(out_fname, (lines[line_ends[row] : line_ends[row + 1]] for row in rows.tolist()))
+
+    def classification_hyperparams() -> Tuple[int, object]:
+        assert summary.completion_counts is not None
+        n_classes = len(summary.completion_counts)
+        pos_class = None
+        if n_classes == 2:
+            counts = summary.completion_counts
+            pos_class = pd.Series(list(counts.values()), index=list(counts)).sort_values(ascending=False).index[0]
+        return n_classes, pos_class
+
+    # the memory of a prompt and a completion column, and of the index, which stops being a range once rows are removed
+    index_size = num_examples * 8 if rows_removed else pd.RangeIndex(num_examples).memory_usage()
+    size = num_examples * 16 + index_size
+
+    _write_out(
+        fname,
+        any_optional_or_necessary_applied,
+        auto_accept,
+        ft_format=ft_format,
+        common_prompt_suffix=summary.common_suffix("reversed_prompt"),
+        common_completion_suffix=summary.common_suffix("reversed_completion"),
+        write_files=write_files,
+        classification_hyperparams=classification_hyperparams,
+        estimate_fine_tuning_time=lambda: _estimate_fine_tuning_time(ft_format, num_examples, size),
+    )
+
+
+def _concatenate(part_fnames: List[str], out_fname: str) -> None:
+    def blocks() -> Iterator[bytes]:
+        for part_fname in part_fnames:
+            with open(part_fname, "rb") as f:
+                while True:
+                    data = f.read(1 << 20)
+                    if not data:
+                        break
+                    yield data
+
+    _write_lines(out_fname, blocks())
+
+
+def _write_lines(fname: str, lines: Iterable[bytes]) -> None:
+    """Writes out blocks of whole lines, with the end of the last line the way `DataFrame.to_json(lines=True)` has it"""
+    with open(fname, "wb") as f:
+        last = b""
+        for data in lines:
+            if last:
+                f.write(last)
+            last = data
+
+        if not last:
+            empty = pd.DataFrame({"prompt": [], "completion": []})
+            f.write(empty.to_json(lines=True, orient="records", force_ascii=False, indent=None).encode("utf-8"))
+        elif pd.DataFrame({"prompt": [""]}).to_json(lines=True, orient="records").endswith("\n"):
+            f.write(last)
+        else:
+            f.write(last[:-1])
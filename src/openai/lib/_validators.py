@@ -6,7 +6,7 @@ import sys
 from typing import Any, TypeVar, Callable, Optional, NamedTuple
 from typing_extensions import TypeAlias
 
-from .._extras import pandas as pd
+from .._extras import numpy as np, pandas as pd
 
 
 class Remediation(NamedTuple):
@@ -21,18 +21,45 @@ class Remediation(NamedTuple):
 
 OptionalDataFrameT = TypeVar("OptionalDataFrameT", bound="Optional[pd.DataFrame]")
 
+MAX_EXAMPLE_LENGTH = 10000
+PROMPT_SUFFIX_OPTIONS = [
+    " ->",
+    "\n\n###\n\n",
+    "\n\n===\n\n",
+    "\n\n---\n\n",
+    "\n\n===>\n\n",
+    "\n\n--->\n\n",
+]
+COMPLETION_SUFFIX_OPTIONS = [
+    "\n",
+    ".",
+    " END",
+    "***",
+    "+++",
+    "&&&",
+    "$$$",
+    "@@@",
+    "%%%",
+]
+# rows joined at a time when counting characters, bounds the size of the UTF-32 copy
+_COUNT_BATCH_ROWS = 10_000
+
 
 def num_examples_validator(df: pd.DataFrame) -> Remediation:
     """
     This validator will only print out the number of examples and recommend to the user to increase the number of examples if less than 100.
     """
+    return _num_examples_remediation(len(df))
+
+
+def _num_examples_remediation(num_examples: int) -> Remediation:
     MIN_EXAMPLES = 100
     optional_suggestion = (
         ""
-        if len(df) >= MIN_EXAMPLES
+        if num_examples >= MIN_EXAMPLES
         else ". In general, we recommend having at least a few hundred examples. We've found that performance tends to linearly increase for every doubling of the number of examples"
     )
-    immediate_msg = f"\n- Your file contains {len(df)} prompt-completion pairs{optional_suggestion}"
+    immediate_msg = f"\n- Your file contains {num_examples} prompt-completion pairs{optional_suggestion}"
     return Remediation(name="num_examples", immediate_msg=immediate_msg)
 
 
@@ -92,7 +119,8 @@ def additional_column_validator(df: pd.DataFrame, fields: list[str] = ["prompt",
         necessary_msg = f"Remove additional columns/keys: {additional_columns}"
 
         def necessary_fn(x: Any) -> Any:
-            return x[fields]
+            # a frame of its own, the remediations after this one assign to its columns
+            return x[fields].copy()
 
     return Remediation(
         name="additional_column",
@@ -106,13 +134,16 @@ def non_empty_field_validator(df: pd.DataFrame, field: str = "completion") -> Re
     """
     This validator will ensure that no completion is empty.
     """
+    empty_rows = (df[field] == "") | (df[field].isnull())
+    return _non_empty_field_remediation(field, df.reset_index().index[empty_rows].tolist())
+
+
+def _non_empty_field_remediation(field: str, empty_indexes: list[int]) -> Remediation:
     necessary_msg = None
     necessary_fn = None  # type: ignore
     immediate_msg = None
 
-    if df[field].apply(lambda x: x == "").any() or df[field].isnull().any():
-        empty_rows = (df[field] == "") | (df[field].isnull())
-        empty_indexes = df.reset_index().index[empty_rows].tolist()
+    if len(empty_indexes) > 0:
         immediate_msg = f"\n- `{field}` column/key should not contain empty strings. These are rows: {empty_indexes}"
 
         def necessary_fn(x: Any) -> Any:
@@ -134,16 +165,24 @@ def duplicated_rows_validator(df: pd.DataFrame, fields: list[str] = ["prompt", "
     """
     duplicated_rows = df.duplicated(subset=fields)
     duplicated_indexes = df.reset_index().index[duplicated_rows].tolist()
+
+    def drop_duplicates(x: Any) -> Any:
+        return x.drop_duplicates(subset=fields)
+
+    return _duplicated_rows_remediation(duplicated_indexes, fields, drop_duplicates)
+
+
+def _duplicated_rows_remediation(
+    duplicated_indexes: list[int], fields: list[str], drop_duplicates: Callable[[Any], Any]
+) -> Remediation:
     immediate_msg = None
     optional_msg = None
-    optional_fn = None  # type: ignore
+    optional_fn = None
 
     if len(duplicated_indexes) > 0:
         immediate_msg = f"\n- There are {len(duplicated_indexes)} duplicated {'-'.join(fields)} sets. These are rows: {duplicated_indexes}"
         optional_msg = f"Remove {len(duplicated_indexes)} duplicate rows"
-
-        def optional_fn(x: Any) -> Any:
-            return x.drop_duplicates(subset=fields)
+        optional_fn = drop_duplicates
 
     return Remediation(
         name="duplicated_rows",
@@ -157,30 +196,42 @@ def long_examples_validator(df: pd.DataFrame) -> Remediation:
     """
     This validator will suggest to the user to remove examples that are too long.
     """
-    immediate_msg = None
-    optional_msg = None
-    optional_fn = None  # type: ignore
-
     ft_type = infer_task_type(df)
-    if ft_type != "open-ended generation":
+    if ft_type == "open-ended generation":
+        return _long_examples_remediation(ft_type, [], lambda x: x)
 
-        def get_long_indexes(d: pd.DataFrame) -> Any:
-            long_examples = d.apply(lambda x: len(x.prompt) + len(x.completion) > 10000, axis=1)
-            return d.reset_index().index[long_examples].tolist()
+    def get_long_indexes(d: pd.DataFrame) -> Any:
+        return d.reset_index().index[_long_examples(d)].tolist()
 
-        long_indexes = get_long_indexes(df)
+    long_indexes = get_long_indexes(df)
 
-        if len(long_indexes) > 0:
-            immediate_msg = f"\n- There are {len(long_indexes)} examples that are very long. These are rows: {long_indexes}\nFor conditional generation, and for classification the examples shouldn't be longer than 2048 tokens."
-            optional_msg = f"Remove {len(long_indexes)} long examples"
+    def drop_long_examples(x: Any) -> Any:
+        long_indexes_to_drop = get_long_indexes(x)
+        if long_indexes != long_indexes_to_drop:
+            sys.stdout.write(
+                f"The indices of the long examples has changed as a result of a previously applied recommendation.\nThe {len(long_indexes_to_drop)} long examples to be dropped are now at the following indices: {long_indexes_to_drop}\n"
+            )
+        return x.drop(x.index[_long_examples(x)])
 
-            def optional_fn(x: Any) -> Any:
-                long_indexes_to_drop = get_long_indexes(x)
-                if long_indexes != long_indexes_to_drop:
-                    sys.stdout.write(
-                        f"The indices of the long examples has changed as a result of a previously applied recommendation.\nThe {len(long_indexes_to_drop)} long examples to be dropped are now at the following indices: {long_indexes_to_drop}\n"
-                    )
-                return x.drop(long_indexes_to_drop)
+    return _long_examples_remediation(ft_type, long_indexes, drop_long_examples)
+
+
+def _long_examples(df: pd.DataFrame) -> Any:
+    """Which rows are longer than 10000 characters in total."""
+    return df.prompt.str.len() + df.completion.str.len() > MAX_EXAMPLE_LENGTH
+
+
+def _long_examples_remediation(
+    ft_type: str, long_indexes: list[int], drop_long_examples: Callable[[Any], Any]
+) -> Remediation:
+    immediate_msg = None
+    optional_msg = None
+    optional_fn = None
+
+    if ft_type != "open-ended generation" and len(long_indexes) > 0:
+        immediate_msg = f"\n- There are {len(long_indexes)} examples that are very long. These are rows: {long_indexes}\nFor conditional generation, and for classification the examples shouldn't be longer than 2048 tokens."
+        optional_msg = f"Remove {len(long_indexes)} long examples"
+        optional_fn = drop_long_examples
 
     return Remediation(
         name="long_examples",
@@ -194,6 +245,23 @@ def common_prompt_suffix_validator(df: pd.DataFrame) -> Remediation:
     """
     This validator will suggest to add a common suffix to the prompt if one doesn't already exist in case of classification or conditional generation.
     """
+    return _common_prompt_suffix_remediation(
+        infer_task_type(df),
+        get_common_xfix(df.prompt, xfix="suffix"),
+        all_identical=_all_identical(df.prompt),
+        contains=lambda text: _contains(df.prompt, text),
+        repeats_suffix=lambda suffix: _repeats_suffix(df.prompt, suffix),
+    )
+
+
+def _common_prompt_suffix_remediation(
+    ft_type: str,
+    common_suffix: str,
+    *,
+    all_identical: bool,
+    contains: Callable[[str], bool],
+    repeats_suffix: Callable[[str], bool],
+) -> Remediation:
     error_msg = None
     immediate_msg = None
     optional_msg = None
@@ -201,25 +269,16 @@ def common_prompt_suffix_validator(df: pd.DataFrame) -> Remediation:
 
     # Find a suffix which is not contained within the prompt otherwise
     suggested_suffix = "\n\n### =>\n\n"
-    suffix_options = [
-        " ->",
-        "\n\n###\n\n",
-        "\n\n===\n\n",
-        "\n\n---\n\n",
-        "\n\n===>\n\n",
-        "\n\n--->\n\n",
-    ]
-    for suffix_option in suffix_options:
+    for suffix_option in PROMPT_SUFFIX_OPTIONS:
         if suffix_option == " ->":
-            if df.prompt.str.contains("\n").any():
+            if contains("\n"):
                 continue
-        if df.prompt.str.contains(suffix_option, regex=False).any():
+        if contains(suffix_option):
             continue
         suggested_suffix = suffix_option
         break
     display_suggested_suffix = suggested_suffix.replace("\n", "\\n")
 
-    ft_type = infer_task_type(df)
     if ft_type == "open-ended generation":
         return Remediation(name="common_suffix")
 
@@ -227,8 +286,7 @@ def common_prompt_suffix_validator(df: pd.DataFrame) -> Remediation:
         x["prompt"] += suffix
         return x
 
-    common_suffix = get_common_xfix(df.prompt, xfix="suffix")
-    if (df.prompt == common_suffix).all():
+    if all_identical:
         error_msg = f"All prompts are identical: `{common_suffix}`\nConsider leaving the prompts blank if you want to do open-ended generation, otherwise ensure prompts are different"
         return Remediation(name="common_suffix", error_msg=error_msg)
 
@@ -237,7 +295,7 @@ def common_prompt_suffix_validator(df: pd.DataFrame) -> Remediation:
         immediate_msg = f"\n- All prompts end with suffix `{common_suffix_new_line_handled}`"
         if len(common_suffix) > 10:
             immediate_msg += f". This suffix seems very long. Consider replacing with a shorter suffix, such as `{display_suggested_suffix}`"
-        if df.prompt.str[: -len(common_suffix)].str.contains(common_suffix, regex=False).any():
+        if repeats_suffix(common_suffix):
             immediate_msg += f"\n  WARNING: Some of your prompts contain the suffix `{common_suffix}` more than once. We strongly suggest that you review your prompts and add a unique suffix"
 
     else:
@@ -262,13 +320,18 @@ def common_prompt_prefix_validator(df: pd.DataFrame) -> Remediation:
     """
     This validator will suggest to remove a common prefix from the prompt if a long one exist.
     """
+    return _common_prompt_prefix_remediation(
+        get_common_xfix(df.prompt, xfix="prefix"), all_identical=_all_identical(df.prompt)
+    )
+
+
+def _common_prompt_prefix_remediation(common_prefix: str, *, all_identical: bool) -> Remediation:
     MAX_PREFIX_LEN = 12
 
     immediate_msg = None
     optional_msg = None
     optional_fn = None  # type: ignore
 
-    common_prefix = get_common_xfix(df.prompt, xfix="prefix")
     if common_prefix == "":
         return Remediation(name="common_prefix")
 
@@ -276,7 +339,7 @@ def common_prompt_prefix_validator(df: pd.DataFrame) -> Remediation:
         x["prompt"] = x["prompt"].str[len(prefix) :]
         return x
 
-    if (df.prompt == common_prefix).all():
+    if all_identical:
         # already handled by common_suffix_validator
         return Remediation(name="common_prefix")
 
@@ -301,9 +364,14 @@ def common_completion_prefix_validator(df: pd.DataFrame) -> Remediation:
     """
     This validator will suggest to remove a common prefix from the completion if a long one exist.
     """
+    return _common_completion_prefix_remediation(
+        get_common_xfix(df.completion, xfix="prefix"), all_identical=_all_identical(df.completion)
+    )
+
+
+def _common_completion_prefix_remediation(common_prefix: str, *, all_identical: bool) -> Remediation:
     MAX_PREFIX_LEN = 5
 
-    common_prefix = get_common_xfix(df.completion, xfix="prefix")
     ws_prefix = len(common_prefix) > 0 and common_prefix[0] == " "
     if len(common_prefix) < MAX_PREFIX_LEN:
         return Remediation(name="common_prefix")
@@ -312,10 +380,10 @@ def common_completion_prefix_validator(df: pd.DataFrame) -> Remediation:
         x["completion"] = x["completion"].str[len(prefix) :]
         if ws_prefix:
             # keep the single whitespace as prefix
-            x["completion"] = f" {x['completion']}"
+            x["completion"] = " " + x["completion"]
         return x
 
-    if (df.completion == common_prefix).all():
+    if all_identical:
         # already handled by common_suffix_validator
         return Remediation(name="common_prefix")
 
@@ -337,35 +405,43 @@ def common_completion_suffix_validator(df: pd.DataFrame) -> Remediation:
     """
     This validator will suggest to add a common suffix to the completion if one doesn't already exist in case of classification or conditional generation.
     """
+    ft_type = infer_task_type(df)
+    if ft_type == "open-ended generation" or ft_type == "classification":
+        return Remediation(name="common_suffix")
+
+    return _common_completion_suffix_remediation(
+        ft_type,
+        get_common_xfix(df.completion, xfix="suffix"),
+        all_identical=_all_identical(df.completion),
+        contains=lambda text: _contains(df.completion, text),
+        repeats_suffix=lambda suffix: _repeats_suffix(df.completion, suffix),
+    )
+
+
+def _common_completion_suffix_remediation(
+    ft_type: str,
+    common_suffix: str,
+    *,
+    all_identical: bool,
+    contains: Callable[[str], bool],
+    repeats_suffix: Callable[[str], bool],
+) -> Remediation:
     error_msg = None
     immediate_msg = None
     optional_msg = None
     optional_fn = None  # type: ignore
 
-    ft_type = infer_task_type(df)
     if ft_type == "open-ended generation" or ft_type == "classification":
         return Remediation(name="common_suffix")
 
-    common_suffix = get_common_xfix(df.completion, xfix="suffix")
-    if (df.completion == common_suffix).all():
+    if all_identical:
         error_msg = f"All completions are identical: `{common_suffix}`\nEnsure completions are different, otherwise the model will just repeat `{common_suffix}`"
         return Remediation(name="common_suffix", error_msg=error_msg)
 
     # Find a suffix which is not contained within the completion otherwise
     suggested_suffix = " [END]"
-    suffix_options = [
-        "\n",
-        ".",
-        " END",
-        "***",
-        "+++",
-        "&&&",
-        "$$$",
-        "@@@",
-        "%%%",
-    ]
-    for suffix_option in suffix_options:
-        if df.completion.str.contains(suffix_option, regex=False).any():
+    for suffix_option in COMPLETION_SUFFIX_OPTIONS:
+        if contains(suffix_option):
             continue
         suggested_suffix = suffix_option
         break
@@ -380,7 +456,7 @@ def common_completion_suffix_validator(df: pd.DataFrame) -> Remediation:
         immediate_msg = f"\n- All completions end with suffix `{common_suffix_new_line_handled}`"
         if len(common_suffix) > 10:
             immediate_msg += f". This suffix seems very long. Consider replacing with a shorter suffix, such as `{display_suggested_suffix}`"
-        if df.completion.str[: -len(common_suffix)].str.contains(common_suffix, regex=False).any():
+        if repeats_suffix(common_suffix):
             immediate_msg += f"\n  WARNING: Some of your completions contain the suffix `{common_suffix}` more than once. We suggest that you review your completions and add a unique ending"
 
     else:
@@ -405,16 +481,20 @@ def completions_space_start_validator(df: pd.DataFrame) -> Remediation:
     """
     This validator will suggest to add a space at the start of the completion if it doesn't already exist. This helps with tokenization.
     """
+    return _completions_space_start_remediation(len(df) > 0 and bool(df.completion.str.startswith(" ").all()))
 
+
+def _completions_space_start_remediation(all_start_with_space: bool) -> Remediation:
     def add_space_start(x: Any) -> Any:
-        x["completion"] = x["completion"].apply(lambda s: ("" if s.startswith(" ") else " ") + s)
+        completion = x["completion"]
+        x["completion"] = completion.where(completion.str.startswith(" "), " " + completion)
         return x
 
     optional_msg = None
     optional_fn = None
     immediate_msg = None
 
-    if df.completion.str[:1].nunique() != 1 or df.completion.values[0][0] != " ":
+    if not all_start_with_space:
         immediate_msg = "\n- The completion should start with a whitespace character (` `). This tends to produce better results due to the tokenization we use. See https://platform.openai.com/docs/guides/fine-tuning/preparing-your-dataset for more details"
         optional_msg = "Add a whitespace character to the beginning of the completion"
         optional_fn = add_space_start
@@ -430,14 +510,14 @@ def lower_case_validator(df: pd.DataFrame, column: Any) -> Remediation | None:
     """
     This validator will suggest to lowercase the column values, if more than a third of letters are uppercase.
     """
+    return _lower_case_remediation(column, *_letter_case_counts(_character_counts(df[column])))
+
 
+def _lower_case_remediation(column: Any, count_upper: int, count_lower: int) -> Remediation | None:
     def lower_case(x: Any) -> Any:
         x[column] = x[column].str.lower()
         return x
 
-    count_upper = df[column].apply(lambda x: sum(1 for c in x if c.isalpha() and c.isupper())).sum()
-    count_lower = df[column].apply(lambda x: sum(1 for c in x if c.isalpha() and c.islower())).sum()
-
     if count_upper * 2 > count_lower:
         return Remediation(
             name="lower_case",
@@ -448,6 +528,48 @@ def lower_case_validator(df: pd.DataFrame, column: Any) -> Remediation | None:
     return None
 
 
+def _character_counts(series: Any) -> dict[int, int]:
+    """
+    Counts how often every code point occurs in a column of strings, without a Python loop over the characters
+    """
+    counts: dict[int, int] = {}
+    for start in range(0, len(series), _COUNT_BATCH_ROWS):
+        text = "".join(series.values[start : start + _COUNT_BATCH_ROWS])
+        code_points = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        if len(code_points) == 0:
+            continue
+        frequencies = np.bincount(code_points)
+        for code_point in np.flatnonzero(frequencies).tolist():
+            counts[code_point] = counts.get(code_point, 0) + int(frequencies[code_point])
+    return counts
+
+
+def _letter_case_counts(counts: dict[int, int]) -> tuple[int, int]:
+    count_upper = 0
+    count_lower = 0
+    for code_point, count in counts.items():
+        c = chr(code_point)
+        if c.isalpha():
+            if c.isupper():
+                count_upper += count
+            elif c.islower():
+                count_lower += count
+    return count_upper, count_lower
+
+
+def _all_identical(series: Any) -> bool:
+    return bool(series.nunique(dropna=False) <= 1)
+
+
+def _contains(series: Any, text: str) -> bool:
+    return bool(series.str.contains(text, regex=False).any())
+
+
+def _repeats_suffix(series: Any, suffix: str) -> bool:
+    """Whether any value contains `suffix` also before the end"""
+    return bool(series.str[: -len(suffix)].str.contains(suffix, regex=False).any())
+
+
 def read_any_format(
     fname: str, fields: list[str] = ["prompt", "completion"]
 ) -> tuple[pd.DataFrame | None, Remediation]:
@@ -465,11 +587,7 @@ def read_any_format(
     if os.path.isfile(fname):
         try:
             if fname.lower().endswith(".csv") or fname.lower().endswith(".tsv"):
-                file_extension_str, separator = ("CSV", ",") if fname.lower().endswith(".csv") else ("TSV", "\t")
-                immediate_msg = (
-                    f"\n- Based on your file extension, your file is formatted as a {file_extension_str} file"
-                )
-                necessary_msg = f"Your format `{file_extension_str}` will be converted to `JSONL`"
+                separator, immediate_msg, necessary_msg = _separated_values_format(fname)
                 df = pd.read_csv(fname, sep=separator, dtype=str).fillna("")
             elif fname.lower().endswith(".xlsx"):
                 immediate_msg = "\n- Based on your file extension, your file is formatted as an Excel file"
@@ -522,8 +640,7 @@ def read_any_format(
                     error_msg += f" Your file `{fname}` is missing a file extension."
 
         except (ValueError, TypeError):
-            file_extension_str = fname.split(".")[-1].upper()
-            error_msg = f"Your file `{fname}` does not appear to be in valid {file_extension_str} format. Please ensure your file is formatted as a valid {file_extension_str} file."
+            error_msg = _invalid_format_msg(fname)
 
     else:
         error_msg = f"File {fname} does not exist."
@@ -537,12 +654,30 @@ def read_any_format(
     return df, remediation
 
 
+def _separated_values_format(fname: str) -> tuple[str, str, str]:
+    """
+    The separator of a .csv or .tsv file, and the messages telling that it will be converted
+    """
+    file_extension_str, separator = ("CSV", ",") if fname.lower().endswith(".csv") else ("TSV", "\t")
+    immediate_msg = f"\n- Based on your file extension, your file is formatted as a {file_extension_str} file"
+    necessary_msg = f"Your format `{file_extension_str}` will be converted to `JSONL`"
+    return separator, immediate_msg, necessary_msg
+
+
+def _invalid_format_msg(fname: str) -> str:
+    file_extension_str = fname.split(".")[-1].upper()
+    return f"Your file `{fname}` does not appear to be in valid {file_extension_str} format. Please ensure your file is formatted as a valid {file_extension_str} file."
+
+
 def format_inferrer_validator(df: pd.DataFrame) -> Remediation:
     """
     This validator will infer the likely fine-tuning format of the data, and display it to the user if it is classification.
     It will also suggest to use ada and explain train/validation split benefits.
     """
-    ft_type = infer_task_type(df)
+    return _format_inferrer_remediation(infer_task_type(df))
+
+
+def _format_inferrer_remediation(ft_type: str) -> Remediation:
     immediate_msg = None
     if ft_type == "classification":
         immediate_msg = f"\n- Based on your data it seems like you're trying to fine-tune a model for {ft_type}\n- For classification, we recommend you try one of the faster and cheaper models, such as `ada`\n- For classification, you can estimate the expected model performance by keeping a held out dataset, which is not used for training"
@@ -577,29 +712,42 @@ def apply_optional_remediation(
     """
     This function will apply an optional remediation to a dataframe, based on the user input.
     """
-    optional_applied = False
+    optional_applied = accept_optional_remediation(remediation, auto_accept)
+    if optional_applied:
+        assert remediation.optional_fn is not None
+        df = remediation.optional_fn(df)
+    write_necessary_remediation(remediation)
+    return df, optional_applied
+
+
+def accept_optional_remediation(remediation: Remediation, auto_accept: bool) -> bool:
+    """
+    This function will ask whether to apply an optional remediation, without applying it.
+    """
     input_text = f"- [Recommended] {remediation.optional_msg} [Y/n]: "
-    if remediation.optional_msg is not None:
-        if accept_suggestion(input_text, auto_accept):
-            assert remediation.optional_fn is not None
-            df = remediation.optional_fn(df)
-            optional_applied = True
+    return remediation.optional_msg is not None and accept_suggestion(input_text, auto_accept)
+
+
+def write_necessary_remediation(remediation: Remediation) -> None:
+    """
+    This function will tell which necessary remediation is applied, if there is one.
+    """
     if remediation.necessary_msg is not None:
         sys.stdout.write(f"- [Necessary] {remediation.necessary_msg}\n")
-    return df, optional_applied
 
 
 def estimate_fine_tuning_time(df: pd.DataFrame) -> None:
     """
     Estimate the time it'll take to fine-tune the dataset
     """
-    ft_format = infer_task_type(df)
+    _estimate_fine_tuning_time(infer_task_type(df), len(df), int(df.memory_usage(index=True).sum()))
+
+
+def _estimate_fine_tuning_time(ft_format: str, num_examples: int, size: int) -> None:
     expected_time = 1.0
     if ft_format == "classification":
-        num_examples = len(df)
         expected_time = num_examples * 1.44
     else:
-        size = df.memory_usage(index=True).sum()
         expected_time = size * 0.0515
 
     def format_time(time: float) -> str:
@@ -642,10 +790,56 @@ def write_out_file(df: pd.DataFrame, fname: str, any_remediations: bool, auto_ac
     This function will write out a dataframe to a file, if the user would like to proceed, and also offer a fine-tuning command with the newly created file.
     For classification it will optionally ask the user if they would like to split the data into train/valid files, and modify the suggested command to include the valid set.
     """
-    ft_format = infer_task_type(df)
-    common_prompt_suffix = get_common_xfix(df.prompt, xfix="suffix")
-    common_completion_suffix = get_common_xfix(df.completion, xfix="suffix")
 
+    def write_files(fnames: list[str]) -> None:
+        if len(fnames) == 2:
+            df_train = df.sample(n=_num_train_examples(len(df)), random_state=42)
+            df_valid = df.drop(df_train.index)
+            df_train[["prompt", "completion"]].to_json(  # type: ignore
+                fnames[0], lines=True, orient="records", force_ascii=False, indent=None
+            )
+            df_valid[["prompt", "completion"]].to_json(
+                fnames[1], lines=True, orient="records", force_ascii=False, indent=None
+            )
+        else:
+            df[["prompt", "completion"]].to_json(
+                fnames[0], lines=True, orient="records", force_ascii=False, indent=None
+            )
+
+    _write_out(
+        fname,
+        any_remediations,
+        auto_accept,
+        ft_format=infer_task_type(df),
+        common_prompt_suffix=get_common_xfix(df.prompt, xfix="suffix"),
+        common_completion_suffix=get_common_xfix(df.completion, xfix="suffix"),
+        write_files=write_files,
+        classification_hyperparams=lambda: get_classification_hyperparams(df),
+        estimate_fine_tuning_time=lambda: estimate_fine_tuning_time(df),
+    )
+
+
+def _num_train_examples(num_examples: int) -> int:
+    MAX_VALID_EXAMPLES = 1000
+    return max(num_examples - MAX_VALID_EXAMPLES, int(num_examples * 0.8))
+
+
+def _write_out(
+    fname: str,
+    any_remediations: bool,
+    auto_accept: bool,
+    *,
+    ft_format: str,
+    common_prompt_suffix: str,
+    common_completion_suffix: str,
+    write_files: Callable[[list[str]], None],
+    classification_hyperparams: Callable[[], tuple[int, object]],
+    estimate_fine_tuning_time: Callable[[], None],
+) -> None:
+    """
+    The dialog of `write_out_file`, with the data behind it described by the arguments
+     - `write_files` gets a train and a valid file name if the data should be split, or a single file name
+    """
     split = False
     input_text = "- [Recommended] Would you like to split into training and validation set? [Y/n]: "
     if ft_format == "classification":
@@ -667,24 +861,15 @@ def write_out_file(df: pd.DataFrame, fname: str, any_remediations: bool, auto_ac
         sys.stdout.write(
             f'\nYou can use your file for fine-tuning:\n> openai api fine_tunes.create -t "{fname}"{additional_params}\n\nAfter you’ve fine-tuned a model, remember that your prompt has to end with the indicator string `{common_prompt_suffix_new_line_handled}` for the model to start generating completions, rather than continuing with the prompt.{optional_ending_string}\n'
         )
-        estimate_fine_tuning_time(df)
+        estimate_fine_tuning_time()
 
     elif accept_suggestion(input_text, auto_accept):
         fnames = get_outfnames(fname, split)
         if split:
             assert len(fnames) == 2 and "train" in fnames[0] and "valid" in fnames[1]
-            MAX_VALID_EXAMPLES = 1000
-            n_train = max(len(df) - MAX_VALID_EXAMPLES, int(len(df) * 0.8))
-            df_train = df.sample(n=n_train, random_state=42)
-            df_valid = df.drop(df_train.index)
-            df_train[["prompt", "completion"]].to_json(  # type: ignore
-                fnames[0], lines=True, orient="records", force_ascii=False, indent=None
-            )
-            df_valid[["prompt", "completion"]].to_json(
-                fnames[1], lines=True, orient="records", force_ascii=False, indent=None
-            )
+            write_files(fnames)
 
-            n_classes, pos_class = get_classification_hyperparams(df)
+            n_classes, pos_class = classification_hyperparams()
             additional_params += " --compute_classification_metrics"
             if n_classes == 2:
                 additional_params += f' --classification_positive_class "{pos_class}"'
@@ -692,9 +877,7 @@ def write_out_file(df: pd.DataFrame, fname: str, any_remediations: bool, auto_ac
                 additional_params += f" --classification_n_classes {n_classes}"
         else:
             assert len(fnames) == 1
-            df[["prompt", "completion"]].to_json(
-                fnames[0], lines=True, orient="records", force_ascii=False, indent=None
-            )
+            write_files(fnames)
 
         # Add -v VALID_FILE if we split the file into train / valid
         files_string = ("s" if split else "") + " to `" + ("` and `".join(fnames))
@@ -707,7 +890,7 @@ def write_out_file(df: pd.DataFrame, fname: str, any_remediations: bool, auto_ac
         sys.stdout.write(
             f'\nWrote modified file{files_string}`\nFeel free to take a look!\n\nNow use that file when fine-tuning:\n> openai api fine_tunes.create -t "{fnames[0]}"{valid_string}{additional_params}\n\n{separator_reminder}{optional_ending_string}\n'
         )
-        estimate_fine_tuning_time(df)
+        estimate_fine_tuning_time()
     else:
         sys.stdout.write("Aborting... did not write the file\n")
 
@@ -716,11 +899,15 @@ def infer_task_type(df: pd.DataFrame) -> str:
     """
     Infer the likely fine-tuning task type from the data
     """
+    return _infer_task_type(int(df.prompt.str.len().sum()), df.completion.nunique(), len(df))
+
+
+def _infer_task_type(prompt_length: int, unique_completions: int, num_examples: int) -> str:
     CLASSIFICATION_THRESHOLD = 3  # min_average instances of each class
-    if sum(df.prompt.str.len()) == 0:
+    if prompt_length == 0:
         return "open-ended generation"
 
-    if len(df.completion.unique()) < len(df) / CLASSIFICATION_THRESHOLD:
+    if unique_completions < num_examples / CLASSIFICATION_THRESHOLD:
         return "classification"
 
     return "conditional generation"
@@ -730,18 +917,19 @@ def get_common_xfix(series: Any, xfix: str = "suffix") -> str:
     """
     Finds the longest common suffix or prefix of all the values in a series
     """
-    common_xfix = ""
-    while True:
-        common_xfixes = (
-            series.str[-(len(common_xfix) + 1) :] if xfix == "suffix" else series.str[: len(common_xfix) + 1]
-        )  # first few or last few characters
-        if common_xfixes.nunique() != 1:  # we found the character at which we don't have a unique xfix anymore
-            break
-        elif common_xfix == common_xfixes.values[0]:  # the entire first row is a prefix of every other row
-            break
-        else:  # the first or last few characters are still common across all rows - let's try to add one more
-            common_xfix = common_xfixes.values[0]
-    return common_xfix
+    if len(series) == 0:
+        return ""
+    if xfix == "suffix":
+        # the common prefix of the reversed values
+        return _common_prefix(series.str[::-1].min(), series.str[::-1].max())[::-1]
+    return _common_prefix(series.min(), series.max())
+
+
+def _common_prefix(first: str, last: str) -> str:
+    """
+    The common prefix of the smallest and the largest of some strings is the common prefix of all of them
+    """
+    return os.path.commonprefix([first, last])
 
 
 Validator: TypeAlias = "Callable[[pd.DataFrame], Remediation | None]"
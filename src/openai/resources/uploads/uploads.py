@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import io
 import os
+import hashlib
 import logging
 import builtins
-from typing import overload
+from typing import TYPE_CHECKING, Dict, Optional, Generator, overload
 from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 import anyio
 import httpx
@@ -23,14 +24,18 @@ from .parts import (
 )
 from ...types import FilePurpose, upload_create_params, upload_complete_params
 from ..._types import Body, Omit, Query, Headers, NotGiven, SequenceNotStr, omit, not_given
-from ..._utils import maybe_transform, async_maybe_transform
+from ..._utils import is_given, maybe_transform, async_maybe_transform
 from ..._compat import cached_property
 from ..._resource import SyncAPIResource, AsyncAPIResource
 from ..._response import to_streamed_response_wrapper, async_to_streamed_response_wrapper
 from ..._base_client import make_request_options
+from ..._utils._sync import to_thread
 from ...types.upload import Upload
 from ...types.file_purpose import FilePurpose
 
+if TYPE_CHECKING:
+    from ...types.uploads.upload_part import UploadPart
+
 __all__ = ["Uploads", "AsyncUploads"]
 
 
@@ -40,6 +45,43 @@ DEFAULT_PART_SIZE = 64 * 1024 * 1024
 log: logging.Logger = logging.getLogger(__name__)
 
 
+def _read_part(fd: int, offset: int, size: int) -> builtins.bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+
+    # no positional reads on this platform (e.g. Windows), parts are always read in order anyway
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, size)
+
+
+def _iter_parts(file: Path | builtins.bytes, part_size: int) -> Generator[builtins.bytes, None, None]:
+    if isinstance(file, builtins.bytes):
+        view = memoryview(file)
+        for offset in range(0, len(file), part_size):
+            yield view[offset : offset + part_size].tobytes()
+        return
+
+    fd = os.open(file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        offset = 0
+        while True:
+            data = _read_part(fd, offset, part_size)
+            if not data:
+                # EOF
+                break
+
+            offset += len(data)
+            yield data
+    finally:
+        os.close(fd)
+
+
+def _new_checksum(md5: str | Omit, compute_md5: bool) -> Optional["hashlib._Hash"]:
+    if not compute_md5 or is_given(md5):
+        return None
+    return hashlib.md5(usedforsecurity=False)
+
+
 class Uploads(SyncAPIResource):
     @cached_property
     def parts(self) -> Parts:
@@ -74,8 +116,10 @@ class Uploads(SyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        compute_md5: bool = False,
     ) -> Upload:
-        """Splits a file into multiple 64MB parts and uploads them sequentially."""
+        """Splits a file into multiple 64MB parts and uploads them, optionally in parallel."""
 
     @overload
     def upload_file_chunked(
@@ -88,8 +132,10 @@ class Uploads(SyncAPIResource):
         purpose: FilePurpose,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        compute_md5: bool = False,
     ) -> Upload:
-        """Splits an in-memory file into multiple 64MB parts and uploads them sequentially."""
+        """Splits an in-memory file into multiple 64MB parts and uploads them, optionally in parallel."""
 
     def upload_file_chunked(
         self,
@@ -101,8 +147,15 @@ class Uploads(SyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        compute_md5: bool = False,
     ) -> Upload:
-        """Splits the given file into multiple parts and uploads them sequentially.
+        """Splits the given file into multiple parts and uploads them.
+
+        Up to `max_concurrency` parts are read and uploaded at the same time; each part
+        request is retried on its own according to the client's `max_retries`. The part
+        ids are always passed to `complete()` in file order. When `compute_md5` is set
+        and no `md5` is given, the checksum is computed while the parts are read.
 
         ```py
         from pathlib import Path
@@ -114,6 +167,9 @@ class Uploads(SyncAPIResource):
         )
         ```
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         if isinstance(file, builtins.bytes):
             if filename is None:
                 raise TypeError("The `filename` argument must be given for in-memory files")
@@ -137,28 +193,51 @@ class Uploads(SyncAPIResource):
             purpose=purpose,
         )
 
-        part_ids: list[str] = []
-
         if part_size is None:
             part_size = DEFAULT_PART_SIZE
 
-        if isinstance(file, builtins.bytes):
-            buf: io.FileIO | io.BytesIO = io.BytesIO(file)
-        else:
-            buf = io.FileIO(file)
+        checksum = _new_checksum(md5, compute_md5)
+        part_ids: list[str] = []
+        parts = _iter_parts(file, part_size)
 
-        try:
-            while True:
-                data = buf.read(part_size)
-                if not data:
-                    # EOF
-                    break
+        if max_concurrency == 1:
+            for data in parts:
+                if checksum is not None:
+                    checksum.update(data)
 
                 part = self.parts.create(upload_id=upload.id, data=data)
                 log.info("Uploaded part %s for upload %s", part.id, upload.id)
                 part_ids.append(part.id)
-        finally:
-            buf.close()
+        else:
+            pending: Dict["Future[UploadPart]", int] = {}
+
+            def collect(return_when: str) -> None:
+                done, _ = wait(pending, return_when=return_when)
+                for future in done:
+                    part = future.result()
+                    log.info("Uploaded part %s for upload %s", part.id, upload.id)
+                    part_ids[pending.pop(future)] = part.id
+
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                try:
+                    for index, data in enumerate(parts):
+                        if checksum is not None:
+                            checksum.update(data)
+
+                        part_ids.append("")
+                        pending[executor.submit(self.parts.create, upload_id=upload.id, data=data)] = index
+                        if len(pending) >= max_concurrency:
+                            collect(FIRST_COMPLETED)
+
+                    while pending:
+                        collect(FIRST_COMPLETED)
+                finally:
+                    for future in pending:
+                        future.cancel()
+                    parts.close()
+
+        if checksum is not None:
+            md5 = checksum.hexdigest()
 
         return self.complete(upload_id=upload.id, part_ids=part_ids, md5=md5)
 
@@ -370,8 +449,10 @@ class AsyncUploads(AsyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        compute_md5: bool = False,
     ) -> Upload:
-        """Splits a file into multiple 64MB parts and uploads them sequentially."""
+        """Splits a file into multiple 64MB parts and uploads them, optionally in parallel."""
 
     @overload
     async def upload_file_chunked(
@@ -384,8 +465,10 @@ class AsyncUploads(AsyncAPIResource):
         purpose: FilePurpose,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        compute_md5: bool = False,
     ) -> Upload:
-        """Splits an in-memory file into multiple 64MB parts and uploads them sequentially."""
+        """Splits an in-memory file into multiple 64MB parts and uploads them, optionally in parallel."""
 
     async def upload_file_chunked(
         self,
@@ -397,8 +480,15 @@ class AsyncUploads(AsyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | Omit = omit,
+        max_concurrency: int = 1,
+        compute_md5: bool = False,
     ) -> Upload:
-        """Splits the given file into multiple parts and uploads them sequentially.
+        """Splits the given file into multiple parts and uploads them.
+
+        Up to `max_concurrency` parts are read and uploaded at the same time; each part
+        request is retried on its own according to the client's `max_retries`. The part
+        ids are always passed to `complete()` in file order. When `compute_md5` is set
+        and no `md5` is given, the checksum is computed while the parts are read.
 
         ```py
         from pathlib import Path
@@ -410,6 +500,9 @@ class AsyncUploads(AsyncAPIResource):
         )
         ```
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         if isinstance(file, builtins.bytes):
             if filename is None:
                 raise TypeError("The `filename` argument must be given for in-memory files")
@@ -434,38 +527,71 @@ class AsyncUploads(AsyncAPIResource):
             purpose=purpose,
         )
 
-        part_ids: list[str] = []
-
         if part_size is None:
             part_size = DEFAULT_PART_SIZE
 
-        if isinstance(file, anyio.Path):
-            fd = await file.open("rb")
-            async with fd:
+        checksum = _new_checksum(md5, compute_md5)
+        part_ids: list[str] = []
+        parts = _iter_parts(file if isinstance(file, builtins.bytes) else Path(file), part_size)
+
+        if max_concurrency == 1:
+            try:
                 while True:
-                    data = await fd.read(part_size)
-                    if not data:
-                        # EOF
+                    data = await to_thread(next, parts, None)
+                    if data is None:
                         break
 
+                    if checksum is not None:
+                        checksum.update(data)
+
                     part = await self.parts.create(upload_id=upload.id, data=data)
                     log.info("Uploaded part %s for upload %s", part.id, upload.id)
                     part_ids.append(part.id)
+            finally:
+                parts.close()
         else:
-            buf = io.BytesIO(file)
-
-            try:
-                while True:
-                    data = buf.read(part_size)
-                    if not data:
-                        # EOF
-                        break
+            limiter = anyio.Semaphore(max_concurrency)
+            errors: list[Exception] = []
 
+            async def upload_part(index: int, data: builtins.bytes) -> None:
+                try:
                     part = await self.parts.create(upload_id=upload.id, data=data)
-                    log.info("Uploaded part %s for upload %s", part.id, upload.id)
-                    part_ids.append(part.id)
+                except Exception as exc:
+                    # stop the other parts and raise this error itself rather than an exception group
+                    errors.append(exc)
+                    tg.cancel_scope.cancel()
+                    return
+                finally:
+                    limiter.release()
+
+                log.info("Uploaded part %s for upload %s", part.id, upload.id)
+                part_ids[index] = part.id
+
+            try:
+                async with anyio.create_task_group() as tg:
+                    index = 0
+                    while True:
+                        # acquire before reading so that at most `max_concurrency` parts are held in memory
+                        await limiter.acquire()
+                        data = await to_thread(next, parts, None)
+                        if data is None:
+                            limiter.release()
+                            break
+
+                        if checksum is not None:
+                            checksum.update(data)
+
+                        part_ids.append("")
+                        tg.start_soon(upload_part, index, data)
+                        index += 1
             finally:
-                buf.close()
+                parts.close()
+
+            if errors:
+                raise errors[0]
+
+        if checksum is not None:
+            md5 = checksum.hexdigest()
 
         return await self.complete(upload_id=upload.id, part_ids=part_ids, md5=md5)
 
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from typing import Iterator
+
 import pytest
 
 from aimlapi import AIMLAPI
 
+from .helpers import LocalServer, serve_local
+
 AIML_BASE_URL = "https://example.aimlapi"
 
 
@@ -14,3 +18,9 @@ def aiml_client() -> AIMLAPI:
         yield client
     finally:
         client.close()
+
+
+@pytest.fixture
+def local_server() -> Iterator[LocalServer]:
+    with serve_local() as server:
+        yield server
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import copy
 import json
-from typing import Tuple, Iterable
+import threading
+from typing import Tuple, Iterable, Iterator
+from contextlib import contextmanager
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
 
 ResponseEvent = Tuple[str, dict]
 
@@ -74,3 +78,63 @@ def sse_bytes(events: Iterable[ResponseEvent]) -> bytes:
         chunks.append(f"event: {name}\n")
         chunks.append(f"data: {json.dumps(data)}\n\n")
     return "".join(chunks).encode()
+
+
+class LocalServer(ThreadingMixIn, HTTPServer):
+    """Keep-alive HTTP/1.1 server on localhost that counts accepted connections."""
+
+    daemon_threads = True
+    connections = 0
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+class _LocalHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1  # type: ignore[attr-defined]
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._send(404)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._send(200, b'{"object": "list", "data": []}')
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        chunk = {
+            "id": "chatcmpl_1",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {"content": "hi"}, "finish_reason": None}],
+        }
+        body = f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n".encode()
+        self._send(200, body, content_type="text/event-stream")
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+@contextmanager
+def serve_local() -> Iterator[LocalServer]:
+    server = LocalServer(("127.0.0.1", 0), _LocalHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import Any, List
+from unittest import mock
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from aimlapi import AIMLAPI, AsyncAIMLAPI
+
+US = "https://us.example.aimlapi/v1"
+EU = "https://eu.example.aimlapi/v1"
+TARGETS = [("key-us", US), ("key-eu", EU)]
+
+MODELS = {"object": "list", "data": []}
+
+
+def _no_retry_delay(*_args: Any, **_kwargs: Any) -> float:
+    return 0
+
+
+def _mock_models(respx_mock: MockRouter, base_url: str, *responses: httpx.Response) -> List[httpx.Request]:
+    seen: List[httpx.Request] = []
+    remaining = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+
+    respx_mock.get(f"{base_url}/models").mock(side_effect=handler)
+    return seen
+
+
+def test_requests_are_spread_over_targets(respx_mock: MockRouter) -> None:
+    us = _mock_models(respx_mock, US, httpx.Response(200, json=MODELS))
+    eu = _mock_models(respx_mock, EU, httpx.Response(200, json=MODELS))
+
+    with AIMLAPI(targets=TARGETS) as client:
+        for _ in range(4):
+            client.models.list()
+
+        assert [stats.requests for stats in client.target_stats()] == [2, 2]
+        assert [stats.outstanding for stats in client.target_stats()] == [0, 0]
+
+    assert {request.headers["Authorization"] for request in us} == {"Bearer key-us"}
+    assert {request.headers["Authorization"] for request in eu} == {"Bearer key-eu"}
+    assert {request.headers["Host"] for request in eu} == {"eu.example.aimlapi"}
+
+
+@mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _no_retry_delay)
+def test_throttled_target_is_evicted(respx_mock: MockRouter) -> None:
+    us = _mock_models(respx_mock, US, httpx.Response(429, headers={"retry-after": "30"}))
+    eu = _mock_models(respx_mock, EU, httpx.Response(200, json=MODELS))
+
+    with AIMLAPI(targets=TARGETS, max_retries=1) as client:
+        for _ in range(3):
+            client.models.list()
+
+        us_stats, eu_stats = client.target_stats()
+
+    assert len(us) == 1
+    assert len(eu) == 3
+    assert us_stats.failures == 1
+    assert 0 < us_stats.evicted_for <= 30
+    assert eu_stats.evicted_for == 0
+
+
+def test_rate_limit_strategy_prefers_remaining_budget(respx_mock: MockRouter) -> None:
+    us = _mock_models(respx_mock, US, httpx.Response(200, json=MODELS, headers={"x-ratelimit-remaining-requests": "3"}))
+    eu = _mock_models(
+        respx_mock, EU, httpx.Response(200, json=MODELS, headers={"x-ratelimit-remaining-requests": "90"})
+    )
+
+    with AIMLAPI(targets=TARGETS, balance="rate_limit") as client:
+        for _ in range(5):
+            client.models.list()
+
+        assert [stats.remaining_requests for stats in client.target_stats()] == [3, 90]
+
+    # each target is tried once to learn its budget, then the larger one wins
+    assert (len(us), len(eu)) == (1, 4)
+
+
+@mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _no_retry_delay)
+def test_connection_errors_fall_over(respx_mock: MockRouter) -> None:
+    respx_mock.get(f"{US}/models").mock(side_effect=httpx.ConnectError("refused"))
+    eu = _mock_models(respx_mock, EU, httpx.Response(200, json=MODELS))
+
+    with AIMLAPI(targets=TARGETS, max_retries=1) as client:
+        client.models.list()
+        client.models.list()
+
+        assert client.target_stats()[0].failures == 1
+
+    assert len(eu) == 2
+
+
+def test_requests_outside_the_base_url_stay_on_the_primary(respx_mock: MockRouter) -> None:
+    _mock_models(respx_mock, US, httpx.Response(200, json=MODELS))
+    _mock_models(respx_mock, EU, httpx.Response(200, json=MODELS))
+    # uploads go to `/files` next to, not under, the `/v1` base URL
+    files = respx_mock.get("https://us.example.aimlapi/files").mock(
+        return_value=httpx.Response(200, json={"object": "list", "data": []})
+    )
+
+    with AIMLAPI(targets=TARGETS) as client:
+        for _ in range(3):
+            client.get("https://us.example.aimlapi/files", cast_to=httpx.Response)
+        client.models.list()
+        client.models.list()
+
+        assert [stats.requests for stats in client.target_stats()] == [4, 1]
+
+    assert files.call_count == 3
+    assert {call.request.headers["Authorization"] for call in files.calls} == {"Bearer key-us"}
+
+
+def test_target_stats_are_shared_with_copies(respx_mock: MockRouter) -> None:
+    _mock_models(respx_mock, US, httpx.Response(200, json=MODELS))
+    _mock_models(respx_mock, EU, httpx.Response(200, json=MODELS))
+
+    with AIMLAPI(targets=TARGETS) as client:
+        client.with_options(timeout=5).models.list()
+
+        assert sum(stats.requests for stats in client.target_stats()) == 1
+        assert client.with_options(timeout=5).target_stats() == client.target_stats()
+
+    assert AIMLAPI(api_key="key").target_stats() == []
+
+
+def test_targets_replace_api_key_and_base_url() -> None:
+    with pytest.raises(ValueError, match="targets"):
+        AIMLAPI(targets=TARGETS, api_key="other")
+
+    with pytest.raises(ValueError, match="target"):
+        AIMLAPI(targets=[])
+
+
+async def test_async_streams_stay_outstanding_until_closed(respx_mock: MockRouter) -> None:
+    body = b'data: {"id": "c", "object": "chat.completion.chunk", "created": 0, "model": "m", "choices": []}\n\ndata: [DONE]\n\n'
+    for base_url in (US, EU):
+        respx_mock.post(f"{base_url}/chat/completions").mock(
+            return_value=httpx.Response(200, content=body, headers={"content-type": "text/event-stream"})
+        )
+
+    async with AsyncAIMLAPI(targets=TARGETS) as client:
+        stream = await client.chat.completions.create(model="m", messages=[], stream=True)
+        assert sum(stats.outstanding for stats in client.target_stats()) == 1
+
+        async for _ in stream:
+            pass
+
+        assert sum(stats.outstanding for stats in client.target_stats()) == 0
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import json
+import threading
+from typing import IO, Set, List, Tuple
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import pytest
+from respx import MockRouter
+
+import openai
+from aimlapi import AsyncAIMLAPI
+from openai.cli._cli import _build_parser
+from openai.cli._errors import CLIError
+from aimlapi._batch_executor import _append
+from aimlapi.cli._api.chat.completions import CLIChatCompletionBulk, CLIChatCompletionBulkArgs, register_bulk
+
+from .conftest import AIML_BASE_URL
+
+
+def _request(custom_id: str, content: str) -> dict:
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {"model": "gpt-4o", "messages": [{"role": "user", "content": content}]},
+    }
+
+
+def _read_output(path: Path) -> dict:
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    return {record["custom_id"]: record for record in records}
+
+
+def _read_output_lines(path: Path) -> list:
+    return [json.loads(line)["custom_id"] for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+async def async_client() -> AsyncAIMLAPI:
+    client = AsyncAIMLAPI(api_key="test", base_url=AIML_BASE_URL, max_retries=0)
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+async def test_batch_execute_writes_batch_output(
+    async_client: AsyncAIMLAPI, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        content = json.loads(request.content)["messages"][0]["content"]
+        if content == "bad":
+            return httpx.Response(400, json={"error": {"message": "invalid"}})
+        return httpx.Response(200, json={"echo": content}, headers={"x-request-id": f"req_{content}"})
+
+    route = respx_mock.post("/chat/completions").mock(side_effect=handler)
+
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text("\n".join(json.dumps(_request(f"r{i}", c)) for i, c in enumerate(["a", "bad", "c"])))
+    output_path = tmp_path / "output.jsonl"
+
+    result = await async_client.batch_execute(input_path, output=output_path, concurrency=2)
+
+    assert route.call_count == 3
+    assert (result.succeeded, result.failed, result.skipped) == (2, 1, 0)
+
+    records = _read_output(output_path)
+    assert records["r0"]["response"] == {"status_code": 200, "request_id": "req_a", "body": {"echo": "a"}}
+    assert records["r0"]["id"].startswith("batch_req_")
+    assert records["r0"]["error"] is None
+    assert records["r1"]["response"]["status_code"] == 400
+    assert records["r1"]["response"]["body"] == {"error": {"message": "invalid"}}
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+async def test_batch_execute_resumes_from_output(
+    async_client: AsyncAIMLAPI, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    route = respx_mock.post("/chat/completions").mock(return_value=httpx.Response(200, json={"ok": True}))
+
+    output_path = tmp_path / "output.jsonl"
+    # a finished request followed by a line that was cut off mid-write
+    output_path.write_text(
+        json.dumps({"id": "batch_req_0", "custom_id": "r0", "response": {"status_code": 200}, "error": None})
+        + '\n{"id": "batch_req_1", "cust'
+    )
+
+    result = await async_client.batch_execute([_request("r0", "a"), _request("r1", "b")], output=output_path, rate=1000)
+
+    assert route.call_count == 1
+    assert (result.succeeded, result.failed, result.skipped) == (1, 0, 1)
+    # the cut off record is replaced rather than left in front of the new one
+    assert _read_output_lines(output_path) == ["r0", "r1"]
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+async def test_batch_execute_retries_connection_errors(
+    async_client: AsyncAIMLAPI, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    route = respx_mock.post("/chat/completions").mock(
+        side_effect=[httpx.ConnectError("boom"), httpx.Response(200, json={"ok": True})]
+    )
+    output_path = tmp_path / "output.jsonl"
+
+    first = await async_client.batch_execute([_request("r0", "a")], output=output_path)
+    assert (first.succeeded, first.failed) == (0, 1)
+    assert _read_output(output_path)["r0"]["error"]["code"] == "connection_error"
+
+    second = await async_client.batch_execute([_request("r0", "a")], output=output_path)
+
+    assert route.call_count == 2
+    assert (second.succeeded, second.failed, second.skipped) == (1, 0, 0)
+    assert _read_output_lines(output_path) == ["r0"]
+    assert _read_output(output_path)["r0"]["response"]["body"] == {"ok": True}
+
+
+async def test_batch_execute_rejects_invalid_concurrency(async_client: AsyncAIMLAPI, tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        await async_client.batch_execute([], output=tmp_path / "output.jsonl", concurrency=0)
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+async def test_batch_execute_reports_progress(
+    async_client: AsyncAIMLAPI, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    respx_mock.post("/chat/completions").mock(return_value=httpx.Response(200, json={"ok": True}))
+    output_path = tmp_path / "output.jsonl"
+    output_path.write_text(json.dumps({"id": "batch_req_0", "custom_id": "r0", "response": {}, "error": None}) + "\n")
+
+    counts = []
+    await async_client.batch_execute(
+        [_request("r0", "a"), _request("r1", "b"), _request("r2", "c")],
+        output=output_path,
+        progress_callback=lambda execution: counts.append((execution.succeeded, execution.failed, execution.skipped)),
+    )
+
+    assert counts == [(0, 0, 1), (1, 0, 1), (2, 0, 1)]
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+async def test_batch_execute_writes_off_the_event_loop(
+    async_client: AsyncAIMLAPI, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    respx_mock.post("/chat/completions").mock(return_value=httpx.Response(200, json={"ok": True}))
+    output_path = tmp_path / "output.jsonl"
+    loop_thread = threading.get_ident()
+    write_threads: Set[int] = set()
+
+    def record_append(out: IO[str], lines: List[str]) -> None:
+        write_threads.add(threading.get_ident())
+        _append(out, lines)
+
+    written: List[Tuple[int, int]] = []
+    with mock.patch("aimlapi._batch_executor._append", record_append):
+        await async_client.batch_execute(
+            [_request(f"r{i}", "a") for i in range(8)],
+            output=output_path,
+            concurrency=4,
+            # every result counted so far is already on disk
+            progress_callback=lambda execution: written.append(
+                (execution.succeeded, len(output_path.read_text().splitlines()))
+            ),
+        )
+
+    assert write_threads and loop_thread not in write_threads
+    assert all(succeeded <= lines for succeeded, lines in written)
+    assert sorted(_read_output_lines(output_path)) == [f"r{i}" for i in range(8)]
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_bulk_cli_runs_chat_completions(
+    respx_mock: MockRouter, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"echo": json.loads(request.content)["messages"][0]["content"]})
+
+    route = respx_mock.post("/chat/completions").mock(side_effect=handler)
+    monkeypatch.setattr(openai, "api_key", "test")
+    monkeypatch.setattr(openai, "base_url", AIML_BASE_URL)
+
+    input_path = tmp_path / "requests.jsonl"
+    lines = [
+        json.dumps({"custom_id": "first", "model": "gpt-4o", "messages": [{"role": "user", "content": "a"}]}),
+        "",
+        json.dumps({"model": "gpt-4o", "messages": [{"role": "user", "content": "b"}]}),
+        json.dumps(_request("batch", "c")),
+    ]
+    input_path.write_text("\n".join(lines) + "\n")
+    output_path = tmp_path / "results.jsonl"
+    args = CLIChatCompletionBulkArgs(input=str(input_path), output=str(output_path), concurrency=2)
+
+    CLIChatCompletionBulk.run(args)
+
+    records = _read_output(output_path)
+    assert {custom_id: record["response"]["body"] for custom_id, record in records.items()} == {
+        "first": {"echo": "a"},
+        "line-3": {"echo": "b"},
+        "batch": {"echo": "c"},
+    }
+    assert capsys.readouterr().out == f"3 succeeded, 0 failed, 0 skipped as already in {output_path}\n"
+
+    # a second run resumes from the output and sends nothing
+    CLIChatCompletionBulk.run(args)
+    assert route.call_count == 3
+    assert capsys.readouterr().out == f"0 succeeded, 0 failed, 3 skipped as already in {output_path}\n"
+
+
+def test_bulk_cli_rejects_invalid_lines(tmp_path: Path) -> None:
+    input_path = tmp_path / "requests.jsonl"
+    input_path.write_text('{"model": "gpt-4o"}\n{"model": \n')
+    args = CLIChatCompletionBulkArgs(input=str(input_path), output=str(tmp_path / "results.jsonl"))
+
+    with pytest.raises(CLIError, match="Line 2 of"):
+        CLIChatCompletionBulk.run(args)
+    assert not (tmp_path / "results.jsonl").exists()
+
+
+def test_bulk_cli_rejects_a_proxy(tmp_path: Path) -> None:
+    input_path = tmp_path / "requests.jsonl"
+    input_path.write_text('{"model": "gpt-4o"}\n')
+    args = CLIChatCompletionBulkArgs(
+        input=str(input_path), output=str(tmp_path / "results.jsonl"), proxy=["http://localhost:8080"]
+    )
+
+    with pytest.raises(CLIError, match="--proxy"):
+        CLIChatCompletionBulk.run(args)
+
+
+@pytest.mark.parametrize("setting, value", [("api_type", "azure"), ("azure_endpoint", "https://example.azure.com")])
+def test_bulk_cli_rejects_azure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, setting: str, value: str) -> None:
+    input_path = tmp_path / "requests.jsonl"
+    input_path.write_text('{"model": "gpt-4o"}\n')
+    args = CLIChatCompletionBulkArgs(input=str(input_path), output=str(tmp_path / "results.jsonl"))
+    for name in ("api_type", "azure_endpoint", "azure_ad_token"):
+        monkeypatch.setattr(openai, name, None)
+    monkeypatch.setattr(openai, setting, value)
+
+    with pytest.raises(CLIError, match="Azure"):
+        CLIChatCompletionBulk.run(args)
+
+
+def test_bulk_cli_is_only_registered_by_the_aimlapi_cli(capsys: pytest.CaptureFixture[str]) -> None:
+    argv = ["api", "chat.completions.bulk", "--input", "requests.jsonl", "--output", "results.jsonl"]
+
+    parsed = _build_parser(register_bulk).parse_args(argv)
+    assert parsed.func == CLIChatCompletionBulk.run
+
+    with pytest.raises(SystemExit):
+        _build_parser().parse_args(argv)
+    assert "invalid choice: 'chat.completions.bulk'" in capsys.readouterr().err
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import io
+import json
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from aimlapi.resources.batches import write_batch_input
+
+from .conftest import AIML_BASE_URL
+
+
+def _batch(status: str, **extra: object) -> dict:
+    return {
+        "id": "batch_1",
+        "object": "batch",
+        "endpoint": "/v1/chat/completions",
+        "input_file_id": "file_in",
+        "completion_window": "24h",
+        "status": status,
+        "created_at": 0,
+        **extra,
+    }
+
+
+def test_write_batch_input_numbers_bodies() -> None:
+    buf = io.StringIO()
+    count = write_batch_input(
+        iter([{"model": "gpt-4o"}, ("custom", {"model": "gpt-4o-mini"})]),
+        buf,
+        endpoint="/v1/chat/completions",
+    )
+
+    lines = [json.loads(line) for line in buf.getvalue().splitlines()]
+    assert count == 2
+    assert lines == [
+        {"custom_id": "request-0", "method": "POST", "url": "/v1/chat/completions", "body": {"model": "gpt-4o"}},
+        {"custom_id": "custom", "method": "POST", "url": "/v1/chat/completions", "body": {"model": "gpt-4o-mini"}},
+    ]
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_create_from_requests_uploads_jsonl(aiml_client, respx_mock: MockRouter) -> None:
+    upload = respx_mock.post("/files").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "id": "file_in",
+                "object": "file",
+                "bytes": 1,
+                "created_at": 0,
+                "filename": "input.jsonl",
+                "purpose": "batch",
+                "status": "uploaded",
+            },
+        )
+    )
+    create = respx_mock.post("/batches").mock(return_value=httpx.Response(200, json=_batch("validating")))
+
+    batch = aiml_client.batches.create_from_requests(
+        ({"model": "gpt-4o", "messages": [{"role": "user", "content": str(i)}]} for i in range(3)),
+        endpoint="/v1/chat/completions",
+    )
+
+    assert batch.id == "batch_1"
+    assert upload.calls[0].request.content.count(b'"custom_id"') == 3
+    assert json.loads(create.calls[0].request.content) == {
+        "completion_window": "24h",
+        "endpoint": "/v1/chat/completions",
+        "input_file_id": "file_in",
+    }
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_poll_and_iter_results(aiml_client, respx_mock: MockRouter) -> None:
+    respx_mock.get("/batches/batch_1").mock(
+        side_effect=[
+            httpx.Response(200, json=_batch("in_progress")),
+            httpx.Response(200, json=_batch("completed", output_file_id="file_out", error_file_id="file_err")),
+        ]
+    )
+    respx_mock.get("/files/file_out/content").mock(
+        return_value=httpx.Response(200, content=b'{"custom_id": "a", "response": {}}\n\n{"custom_id": "b"}\n')
+    )
+    respx_mock.get("/files/file_err/content").mock(
+        return_value=httpx.Response(200, content=b'{"custom_id": "c", "error": {"code": "x"}}\n')
+    )
+
+    batch = aiml_client.batches.poll("batch_1", poll_interval=0.001)
+    results = list(aiml_client.batches.iter_results(batch))
+
+    assert batch.status == "completed"
+    assert [custom_id for custom_id, _ in results] == ["a", "b", "c"]
+    assert results[2][1]["error"] == {"code": "x"}
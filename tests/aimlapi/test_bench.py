@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import sys
+import json
+import subprocess
+from typing import Any, Dict, List
+
+import pytest
+
+from aimlapi import AsyncAIMLAPI
+from openai.cli import _utils as cli_utils
+from openai.cli._tools.bench import BenchArgs, bench, _percentile
+
+
+def run_bench(capsys: pytest.CaptureFixture[str], **kwargs: Any) -> Dict[str, Any]:
+    args = BenchArgs(mock=True, mock_latency=0, mock_token_interval=0, print_json=True, **kwargs)
+    bench(args)
+    report: Dict[str, Any] = json.loads(capsys.readouterr().out)
+    return report
+
+
+def test_percentile_interpolates_between_ranks() -> None:
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+
+    assert _percentile(values, 50) == 3.0
+    assert _percentile(values, 90) == pytest.approx(4.6)
+    assert _percentile(values, 100) == 5.0
+    assert _percentile([7.0], 99) == 7.0
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_bench_against_mock(capsys: pytest.CaptureFixture[str], stream: bool) -> None:
+    report = run_bench(capsys, requests=12, concurrency=3, max_tokens=5, stream=stream)
+
+    assert (report["target"], report["stream"]) == ("mock", stream)
+    assert (report["requests"], report["succeeded"], report["errors"], report["retries"]) == (12, 12, {}, 0)
+    assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"] <= report["latency_ms"]["max"]
+    assert report["client_cpu_ms_per_request"] > 0
+    assert report["output_tokens_per_s"] > 0
+    if stream:
+        assert report["ttft_ms"]["max"] <= report["latency_ms"]["max"]
+    else:
+        assert report["ttft_ms"] is None
+
+
+def test_bench_counts_retries_and_errors(capsys: pytest.CaptureFixture[str]) -> None:
+    report = run_bench(capsys, requests=4, qps=100, mock_error_rate=1, max_retries=1)
+
+    assert (report["requests"], report["succeeded"], report["retries"]) == (4, 0, 4)
+    assert report["errors"] == {"RateLimitError": 4}
+    assert report["latency_ms"] is None
+
+
+def test_bench_prints_a_table(capsys: pytest.CaptureFixture[str]) -> None:
+    bench(BenchArgs(mock=True, mock_latency=0, mock_token_interval=0, requests=3, stream=True))
+    out = capsys.readouterr().out
+
+    assert out.startswith("3 requests to mock (gpt-4o-mini, streamed)")
+    assert "3 succeeded, 0 failed, 0 retries" in out
+    assert [line.split()[0] for line in out.splitlines()[-4:]] == ["p50", "latency", "TTFT", "tokens/s"]
+
+
+def test_bench_uses_the_cli_client_factory(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    clients: List[AsyncAIMLAPI] = []
+
+    def factory(**options: Any) -> AsyncAIMLAPI:
+        clients.append(AsyncAIMLAPI(**options))
+        return clients[-1]
+
+    monkeypatch.setattr(cli_utils, "_async_client_factory", factory)
+    report = run_bench(capsys, requests=2)
+
+    assert report["succeeded"] == 2
+    assert len(clients) == 1
+    assert clients[0].api_key == "mock"
+
+
+def test_openai_cli_does_not_import_aimlapi() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, openai.cli._cli, openai.cli._tools.bench; print('aimlapi' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -6,6 +6,8 @@ import httpx
 import pytest
 from respx import MockRouter
 
+from aimlapi import AIMLAPI, AsyncAIMLAPI, EmbeddingCache
+
 from .conftest import AIML_BASE_URL
 
 
@@ -31,3 +33,177 @@ def test_embeddings_call(aiml_client, respx_mock: MockRouter) -> None:
     assert payload["model"] == "text-embedding-3-small"
     assert payload["input"] == "A cat"
     assert payload["encoding_format"] == "base64"
+
+
+def _embeddings_response(vectors: list) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "object": "list",
+            "data": [{"object": "embedding", "embedding": vector, "index": i} for i, vector in enumerate(vectors)],
+            "model": "text-embedding-3-small",
+            "usage": {"prompt_tokens": len(vectors), "total_tokens": len(vectors)},
+        },
+    )
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_embeddings_cache_sends_only_misses(aiml_client, respx_mock: MockRouter, tmp_path) -> None:
+    route = respx_mock.post("/embeddings").mock(
+        side_effect=[
+            _embeddings_response([[0.5, 1.0], [1.5, 2.0]]),
+            _embeddings_response([[2.5, 3.0]]),
+        ]
+    )
+
+    with EmbeddingCache(tmp_path) as cache:
+        first = aiml_client.embeddings.create(
+            model="text-embedding-3-small", input=["a", "b"], encoding_format="float", cache=cache
+        )
+        second = aiml_client.embeddings.create(
+            model="text-embedding-3-small", input=["b", "c", "a"], encoding_format="float", cache=cache
+        )
+
+        assert [e.embedding for e in first.data] == [[0.5, 1.0], [1.5, 2.0]]
+        assert [e.embedding for e in second.data] == [[1.5, 2.0], [2.5, 3.0], [0.5, 1.0]]
+        assert [e.index for e in second.data] == [0, 1, 2]
+        assert json.loads(route.calls[1].request.content.decode())["input"] == ["c"]
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (2, 3, 3)
+        assert stats.hit_rate == pytest.approx(0.4)
+
+    with EmbeddingCache(tmp_path) as reopened:
+        result = aiml_client.embeddings.create(
+            model="text-embedding-3-small", input="c", encoding_format="float", cache=reopened
+        )
+        assert result.data[0].embedding == [2.5, 3.0]
+        assert result.usage.total_tokens == 0
+        assert len(route.calls) == 2
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+async def test_async_embeddings_cache_sends_only_misses(respx_mock: MockRouter, tmp_path) -> None:
+    route = respx_mock.post("/embeddings").mock(return_value=_embeddings_response([[2.5, 3.0]]))
+
+    async with AsyncAIMLAPI(api_key="test", base_url=AIML_BASE_URL) as client:
+        with EmbeddingCache(tmp_path) as cache:
+            cache.put_many([(cache.key(model="text-embedding-3-small", dimensions=None, text="a"), [0.5, 1.0])])
+            result = await client.embeddings.create(
+                model="text-embedding-3-small", input=["a", "c"], encoding_format="float", cache=cache
+            )
+
+            assert [e.embedding for e in result.data] == [[0.5, 1.0], [2.5, 3.0]]
+            assert json.loads(route.calls[0].request.content.decode())["input"] == ["c"]
+            assert cache.get_many([cache.key(model="text-embedding-3-small", dimensions=None, text="c")]) == [
+                [2.5, 3.0]
+            ]
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+async def test_async_embeddings_without_cache_stay_on_the_event_loop(respx_mock: MockRouter, monkeypatch) -> None:
+    respx_mock.post("/embeddings").mock(return_value=_embeddings_response([[2.5, 3.0]]))
+
+    async def no_thread(*_args, **_kwargs):
+        raise AssertionError("a thread was used without a cache")
+
+    monkeypatch.setattr("aimlapi.resources.embeddings.to_thread", no_thread)
+    async with AsyncAIMLAPI(api_key="test", base_url=AIML_BASE_URL) as client:
+        result = await client.embeddings.create(model="text-embedding-3-small", input="c")
+
+    assert [e.embedding for e in result.data] == [[2.5, 3.0]]
+
+
+def test_embeddings_cache_rejects_raw_responses(aiml_client: AIMLAPI, tmp_path) -> None:
+    with EmbeddingCache(tmp_path) as cache:
+        with pytest.raises(ValueError, match="with_raw_response"):
+            aiml_client.embeddings.with_raw_response.create(
+                model="text-embedding-3-small",
+                input="a",
+                cache=cache,  # pyright: ignore[reportCallIssue]
+            )
+        with pytest.raises(ValueError, match="with_streaming_response"):
+            with aiml_client.embeddings.with_streaming_response.create(
+                model="text-embedding-3-small",
+                input="a",
+                cache=cache,  # pyright: ignore[reportCallIssue]
+            ):
+                pass
+
+
+def test_embeddings_cache_keys_include_dimensions(tmp_path) -> None:
+    cache = EmbeddingCache(tmp_path)
+    small = cache.key(model="m", dimensions=2, text="a")
+    default = cache.key(model="m", dimensions=None, text="a")
+    cache.put_many([(small, [1.0, 2.0])])
+
+    assert cache.get_many([small, default]) == [[1.0, 2.0], None]
+
+
+def test_embeddings_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = EmbeddingCache(tmp_path, max_entries=2)
+    a, b, c = (cache.key(model="m", dimensions=None, text=text) for text in "abc")
+
+    cache.put_many([(a, [1.0]), (b, [2.0])])
+    cache.get_many([a])
+    cache.put_many([(c, [3.0])])
+
+    assert cache.get_many([a, b, c]) == [[1.0], None, [3.0]]
+    assert cache.stats().evictions == 1
+    cache.close()
+
+
+def _large_vector(value: float) -> list:
+    # big enough that a couple of replaced entries trigger a compaction
+    return [value] * 70_000
+
+
+def test_embeddings_cache_compaction_switches_vectors_file(tmp_path) -> None:
+    cache = EmbeddingCache(tmp_path, max_entries=1)
+    keys = [cache.key(model="m", dimensions=None, text=text) for text in "abc"]
+    for value, key in enumerate(keys):
+        cache.put_many([(key, _large_vector(float(value)))])
+    cache.close()
+
+    assert sorted(path.name for path in tmp_path.glob("vectors*.f32")) == ["vectors.1.f32"]
+    with EmbeddingCache(tmp_path, max_entries=1) as reopened:
+        assert reopened.get_many(keys) == [None, None, _large_vector(2.0)]
+
+
+def test_embeddings_cache_crash_during_compaction_keeps_old_index(tmp_path, monkeypatch) -> None:
+    cache = EmbeddingCache(tmp_path, max_entries=1)
+    keys = [cache.key(model="m", dimensions=None, text=text) for text in "abc"]
+    cache.put_many([(keys[0], _large_vector(0.0))])
+    cache.put_many([(keys[1], _large_vector(1.0))])
+
+    def crash() -> None:
+        raise OSError("crashed before the index was written")
+
+    monkeypatch.setattr(cache, "_save_index", crash)
+    with pytest.raises(OSError):
+        cache.put_many([(keys[2], _large_vector(2.0))])
+
+    # the last committed index still describes the original vectors file
+    with EmbeddingCache(tmp_path, max_entries=1) as reopened:
+        assert reopened.get_many(keys) == [None, _large_vector(1.0), None]
+    assert [path.name for path in tmp_path.glob("vectors*.f32")] == ["vectors.f32"]
+
+
+def test_embeddings_cache_journals_writes_between_snapshots(tmp_path) -> None:
+    cache = EmbeddingCache(tmp_path, max_entries=2)
+    a, b, c = (cache.key(model="m", dimensions=None, text=text) for text in "abc")
+    for key, value in ((a, 1.0), (b, 2.0), (c, 3.0)):
+        cache.put_many([(key, [value])])
+
+    # no snapshot of the index yet, every change so far is in the journal
+    assert not (tmp_path / "index.json").exists()
+    with (tmp_path / "index.log").open("a") as f:
+        f.write('[0,"cut off')
+
+    reopened = EmbeddingCache(tmp_path, max_entries=2)
+    assert reopened.get_many([a, b, c]) == [None, [2.0], [3.0]]
+    reopened.close()
+    assert (tmp_path / "index.log").read_bytes() == b""
+
+    with EmbeddingCache(tmp_path, max_entries=2) as snapshot:
+        assert snapshot.get_many([a, b, c]) == [None, [2.0], [3.0]]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import sys
+import logging
+from typing import Any, Dict, List, AsyncIterator
+
+import httpx
+import pytest
+
+from aimlapi import AIMLAPI, AsyncAIMLAPI
+from openai._models import FinalRequestOptions
+from openai._base_client import SyncAPIClient
+from aimlapi._connections import HostLimitTransport, AsyncHostLimitTransport
+
+from .helpers import LocalServer
+
+
+def _uses_http2(client: AIMLAPI | AsyncAIMLAPI) -> bool:
+    return bool(client._client._transport._pool._http2)  # type: ignore[union-attr]
+
+
+def test_http2_flag_enables_multiplexing() -> None:
+    pytest.importorskip("h2")
+
+    with AIMLAPI(api_key="test", http2=True) as client:
+        assert _uses_http2(client)
+        assert client.with_options(timeout=5)._client is client._client
+
+
+async def test_async_http2_flag_enables_multiplexing() -> None:
+    pytest.importorskip("h2")
+
+    async with AsyncAIMLAPI(api_key="test", http2=True) as client:
+        assert _uses_http2(client)
+
+
+def test_http2_falls_back_without_h2(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    with caplog.at_level(logging.WARNING, logger="aimlapi._connections"):
+        with AIMLAPI(api_key="test", http2=True) as client:
+            assert not _uses_http2(client)
+
+    assert "falling back to HTTP/1.1" in caplog.text
+
+
+def test_http2_conflicts_with_http_client() -> None:
+    with pytest.raises(ValueError, match="http2"):
+        AIMLAPI(api_key="test", http2=True, http_client=httpx.Client())
+
+
+def test_connection_stats_count_reuse(local_server: LocalServer) -> None:
+    with AIMLAPI(api_key="test", base_url=local_server.base_url) as client:
+        for _ in range(3):
+            client.models.list()
+
+        stream = client.chat.completions.create(
+            model="gpt-4o", messages=[{"role": "user", "content": "hi"}], stream=True
+        )
+        assert [chunk.choices[0].delta.content for chunk in stream] == ["hi"]
+
+        stats = client.connection_stats()
+        assert stats.requests == 4
+        assert stats.http2_requests == 0
+        assert stats.connections_opened == local_server.connections == 1
+        assert stats.reused_requests == 3
+        assert stats.reuse_ratio == 0.75
+
+
+async def test_async_connection_stats_count_reuse(local_server: LocalServer) -> None:
+    async with AsyncAIMLAPI(api_key="test", base_url=local_server.base_url) as client:
+        await client.models.list()
+        await client.with_options(max_retries=0).models.list()
+
+        stats = client.connection_stats()
+        assert (stats.requests, stats.connections_opened) == (2, 1)
+
+
+def test_connection_stats_keep_an_existing_trace(local_server: LocalServer, monkeypatch: pytest.MonkeyPatch) -> None:
+    events: List[str] = []
+    build_request = SyncAPIClient._build_request
+
+    def trace(event_name: str, _info: Dict[str, Any]) -> None:
+        events.append(event_name)
+
+    def with_trace(self: SyncAPIClient, options: FinalRequestOptions, *, retries_taken: int = 0) -> httpx.Request:
+        request = build_request(self, options, retries_taken=retries_taken)
+        request.extensions["trace"] = trace
+        return request
+
+    monkeypatch.setattr(SyncAPIClient, "_build_request", with_trace)
+    with AIMLAPI(api_key="test", base_url=local_server.base_url) as client:
+        client.models.list()
+
+        assert client.connection_stats().requests == 1
+        assert "http11.send_request_headers.started" in events
+
+
+def _streamed_ok(_request: httpx.Request) -> httpx.Response:
+    # an iterator body, unlike `text=`, is only closed once it has been read
+    return httpx.Response(200, content=iter([b"ok"]))
+
+
+async def _async_streamed_ok(_request: httpx.Request) -> httpx.Response:
+    async def body() -> AsyncIterator[bytes]:
+        yield b"ok"
+
+    return httpx.Response(200, content=body())
+
+
+def _limited(limit: int) -> HostLimitTransport:
+    return HostLimitTransport(httpx.MockTransport(_streamed_ok), max_streams_per_host=limit)
+
+
+def test_max_streams_per_host_holds_a_slot_until_the_stream_is_closed() -> None:
+    with httpx.Client(transport=_limited(1), timeout=httpx.Timeout(5, pool=0.05)) as http:
+        with http.stream("GET", "https://api.aimlapi.com/v1/models") as response:
+            # the only slot for this host is taken by the open stream
+            with pytest.raises(httpx.PoolTimeout):
+                http.get("https://api.aimlapi.com/v1/models")
+            # other hosts have slots of their own
+            assert http.get("https://eu.aimlapi.com/v1/models").text == "ok"
+            response.read()
+
+        assert http.get("https://api.aimlapi.com/v1/models").text == "ok"
+
+
+async def test_async_max_streams_per_host_holds_a_slot_until_the_stream_is_closed() -> None:
+    transport = AsyncHostLimitTransport(httpx.MockTransport(_async_streamed_ok), max_streams_per_host=1)
+    async with httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(5, pool=0.05)) as http:
+        async with http.stream("GET", "https://api.aimlapi.com/v1/models"):
+            with pytest.raises(httpx.PoolTimeout):
+                await http.get("https://api.aimlapi.com/v1/models")
+
+        assert (await http.get("https://api.aimlapi.com/v1/models")).text == "ok"
+
+
+def test_max_streams_per_host_option() -> None:
+    with AIMLAPI(api_key="test", max_streams_per_host=8) as client:
+        assert isinstance(client._client._transport, HostLimitTransport)
+
+    with pytest.raises(ValueError, match="at least 1"):
+        AIMLAPI(api_key="test", max_streams_per_host=0)
+
+    with pytest.raises(ValueError, match="max_streams_per_host"):
+        AIMLAPI(api_key="test", max_streams_per_host=8, http_client=httpx.Client())
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import re
+import sys
+import subprocess
+from typing import Dict, List, Tuple
+
+# Modules that are only needed once a resource, type or helper is actually used.
+DEFERRED_MODULES = (
+    "openai.resources",
+    "aimlapi.resources",
+    "aimlapi.resources.responses",
+    "aimlapi.resources._embedding_cache",
+    "aimlapi.types",
+    "aimlapi._batch_executor",
+    "aimlapi._tokens",
+    "aimlapi._balancer",
+    "aimlapi._connections",
+    "concurrent.futures.thread",
+    "queue",
+    "numpy",
+    "pandas",
+)
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<module>.+)$")
+
+
+# Total self time of the `aimlapi` modules imported by `import aimlapi`, in microseconds.
+# The `openai` import underneath is not counted, the clients subclass it. About twice
+# the ~10ms it takes, so that a module that is loaded eagerly by mistake fails it.
+AIMLAPI_SELF_TIME_BUDGET_US = 20_000
+
+
+def _import_times(runs: int = 1) -> List[Dict[str, Tuple[int, int]]]:
+    """Self and cumulative microseconds per module from `python -X importtime -c 'import aimlapi'`, for each run."""
+    measured: List[Dict[str, Tuple[int, int]]] = []
+    # a fresh interpreter, the test session has long imported everything. The first run
+    # may still be writing bytecode caches, so it isn't measured.
+    for run in range(runs + 1):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import aimlapi"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        if run == 0:
+            continue
+
+        times: Dict[str, Tuple[int, int]] = {}
+        for line in result.stderr.splitlines():
+            match = _IMPORTTIME_LINE.match(line)
+            if match:
+                times[match["module"].strip()] = (int(match["self"]), int(match["cumulative"]))
+        measured.append(times)
+    return measured
+
+
+def test_import_defers_heavy_modules() -> None:
+    (times,) = _import_times()
+
+    assert "aimlapi" in times
+    assert [name for name in DEFERRED_MODULES if name in times] == []
+
+
+def test_import_self_time_within_budget() -> None:
+    owns = [
+        {name: self_us for name, (self_us, _) in times.items() if name == "aimlapi" or name.startswith("aimlapi.")}
+        for times in _import_times(runs=5)
+    ]
+    assert all(owns)
+    # the fastest run, the others are slowed down by whatever else runs on the machine
+    own = min(owns, key=lambda times: sum(times.values()))
+    assert sum(own.values()) <= AIMLAPI_SELF_TIME_BUDGET_US, sorted(own.items(), key=lambda item: -item[1])
+
+
+def test_lazy_exports_resolve() -> None:
+    import aimlapi
+    from aimlapi.types import Batch
+    from aimlapi.resources import Chat
+    from aimlapi.resources._embedding_cache import EmbeddingCache
+
+    assert aimlapi.EmbeddingCache is EmbeddingCache
+    assert Batch.__name__ == "Batch"
+    assert Chat.__name__ == "Chat"
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import time_machine
+from respx import MockRouter
+
+from aimlapi import AIMLAPI, AsyncAIMLAPI
+from aimlapi.resources.models import UnknownModelError
+
+from .conftest import AIML_BASE_URL
+
+MODELS = {
+    "object": "list",
+    "data": [
+        {
+            "id": "gpt-4o",
+            "type": "chat-completion",
+            "info": {"developer": "Open AI", "contextLength": 128000},
+            "features": ["openai/chat-completion", "openai/chat-completion.vision"],
+        },
+        {
+            "id": "google/gemini-2.0-flash",
+            "type": "chat-completion",
+            "features": ["openai/chat-completion"],
+        },
+        {"id": "flux/schnell", "type": "image", "info": {"developer": "Flux"}},
+    ],
+}
+
+
+def _mock_models(respx_mock: MockRouter, etag: str = '"v1"') -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(200, json=MODELS, headers={"etag": etag})
+
+    respx_mock.get("/models").mock(side_effect=handler)
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_catalog_indexes(aiml_client: AIMLAPI, respx_mock: MockRouter) -> None:
+    _mock_models(respx_mock)
+
+    catalog = aiml_client.models.catalog()
+
+    assert len(catalog) == 3
+    assert "gpt-4o" in catalog
+    assert [model.id for model in catalog.by_provider("open ai")] == ["gpt-4o"]
+    assert [model.id for model in catalog.by_provider("google")] == ["google/gemini-2.0-flash"]
+    assert [model.id for model in catalog.by_modality("chat-completion")] == ["gpt-4o", "google/gemini-2.0-flash"]
+    assert [model.id for model in catalog.with_feature("openai/chat-completion.vision")] == ["gpt-4o"]
+    assert catalog.supports("gpt-4o", "openai/chat-completion.vision")
+    assert not catalog.supports("google/gemini-2.0-flash", "openai/chat-completion.vision")
+    assert catalog.modalities == ["chat-completion", "image"]
+    assert catalog.get("gpt-4o").info == {"developer": "Open AI", "contextLength": 128000}  # type: ignore[union-attr]
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_catalog_validate_suggests_close_matches(aiml_client: AIMLAPI, respx_mock: MockRouter) -> None:
+    _mock_models(respx_mock)
+    catalog = aiml_client.models.catalog()
+
+    assert catalog.validate("gpt-4o").id == "gpt-4o"
+    with pytest.raises(UnknownModelError, match="did you mean 'gpt-4o'") as exc_info:
+        catalog.validate("gpt4o")
+    assert exc_info.value.suggestions[0] == "gpt-4o"
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_catalog_ttl_and_etag_revalidation(aiml_client: AIMLAPI, respx_mock: MockRouter) -> None:
+    _mock_models(respx_mock)
+
+    with time_machine.travel(1_000_000, tick=False) as traveller:
+        first = aiml_client.models.catalog(ttl=60)
+        assert aiml_client.models.catalog(ttl=60) is first
+        assert respx_mock.calls.call_count == 1
+
+        traveller.shift(61)
+        second = aiml_client.models.catalog(ttl=60)
+
+    # a 304 keeps the same catalog and restarts its ttl
+    assert second is first
+    assert first.fetched_at == 1_000_061
+    assert respx_mock.calls.call_count == 2
+    assert respx_mock.calls.last.request.headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_catalog_snapshot_cold_start(respx_mock: MockRouter, tmp_path: Path) -> None:
+    _mock_models(respx_mock)
+    snapshot = tmp_path / "models.json"
+
+    with AIMLAPI(api_key="test", base_url=AIML_BASE_URL) as client:
+        client.models.catalog(snapshot_path=snapshot)
+    assert json.loads(snapshot.read_text())["etag"] == '"v1"'
+
+    with AIMLAPI(api_key="test", base_url=AIML_BASE_URL) as client:
+        catalog = client.models.catalog(snapshot_path=snapshot)
+
+    # the second client is served from disk
+    assert respx_mock.calls.call_count == 1
+    assert catalog.by_provider("flux")[0].id == "flux/schnell"
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+async def test_async_catalog_refresh(respx_mock: MockRouter, tmp_path: Path) -> None:
+    _mock_models(respx_mock)
+
+    async with AsyncAIMLAPI(api_key="test", base_url=AIML_BASE_URL) as client:
+        catalog = await client.models.catalog(snapshot_path=tmp_path / "models.json")
+        assert await client.models.catalog(refresh=True) is catalog
+
+    assert respx_mock.calls.call_count == 2
+    assert respx_mock.calls.last.request.headers["If-None-Match"] == '"v1"'
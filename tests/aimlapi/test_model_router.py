@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Dict, List
+from unittest import mock
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from aimlapi import AIMLAPI, ModelRouter, AsyncAIMLAPI, BadRequestError
+
+from .conftest import AIML_BASE_URL
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def _no_retry_delay(*_args: Any, **_kwargs: Any) -> float:
+    return 0
+
+
+def _mock_chat(respx_mock: MockRouter, statuses: Dict[str, int]) -> List[str]:
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        seen.append(model)
+        status = statuses.get(model, 200)
+        if status != 200:
+            return httpx.Response(status, json={"error": {"message": "unavailable"}})
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl_1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": model,
+                "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
+            },
+        )
+
+    respx_mock.post("/chat/completions").mock(side_effect=handler)
+    return seen
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_prefers_first_model(aiml_client: AIMLAPI, respx_mock: MockRouter) -> None:
+    seen = _mock_chat(respx_mock, {})
+    router = ModelRouter(["gpt-4o", "gpt-4o-mini"])
+
+    completion = router.create(aiml_client.chat.completions.create, messages=MESSAGES)
+
+    assert completion.model == "gpt-4o"
+    assert seen == ["gpt-4o"]
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_falls_back_on_retryable_errors(respx_mock: MockRouter) -> None:
+    seen = _mock_chat(respx_mock, {"gpt-4o": 503})
+    router = ModelRouter(["gpt-4o", "gpt-4o-mini"])
+
+    with AIMLAPI(api_key="test", base_url=AIML_BASE_URL, max_retries=0) as client:
+        completion = router.create(client.chat.completions.create, messages=MESSAGES)
+        assert completion.model == "gpt-4o-mini"
+
+        # the failing model now ranks below the healthy one
+        assert router.candidates() == ["gpt-4o-mini", "gpt-4o"]
+        router.create(client.chat.completions.create, messages=MESSAGES)
+
+    assert seen == ["gpt-4o", "gpt-4o-mini", "gpt-4o-mini"]
+
+    stats = {item.model: item for item in router.stats()}
+    assert (stats["gpt-4o"].requests, stats["gpt-4o"].errors, stats["gpt-4o"].error_rate) == (1, 1, 1.0)
+    assert stats["gpt-4o"].latency is None
+    assert (stats["gpt-4o-mini"].requests, stats["gpt-4o-mini"].errors) == (2, 0)
+    assert stats["gpt-4o-mini"].latency is not None
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_does_not_fall_back_on_client_errors(aiml_client: AIMLAPI, respx_mock: MockRouter) -> None:
+    seen = _mock_chat(respx_mock, {"gpt-4o": 400})
+    router = ModelRouter(["gpt-4o", "gpt-4o-mini"])
+
+    with pytest.raises(BadRequestError):
+        router.create(aiml_client.chat.completions.create, messages=MESSAGES)
+
+    assert seen == ["gpt-4o"]
+    assert router.stats()[0].errors == 0
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_raises_last_error_when_every_model_fails(respx_mock: MockRouter) -> None:
+    _mock_chat(respx_mock, {"a": 429, "b": 500})
+    router = ModelRouter({"a": 1.0, "b": 1.0})
+
+    with AIMLAPI(api_key="test", base_url=AIML_BASE_URL, max_retries=0) as client:
+        with pytest.raises(Exception) as exc_info:
+            router.create(client.chat.completions.create, messages=MESSAGES)
+
+    assert getattr(exc_info.value, "status_code", None) == 500
+
+
+def test_weights_trade_off_against_latency() -> None:
+    router = ModelRouter({"fast": 1.0, "preferred": 3.0})
+
+    router._record("fast", 1.0, ok=True)
+    router._record("preferred", 2.0, ok=True)
+
+    # twice as slow, but three times the weight
+    assert router.candidates() == ["preferred", "fast"]
+
+
+def test_demoted_model_recovers_once_its_errors_age_out() -> None:
+    router = ModelRouter(["primary", "fallback"], max_age=30)
+
+    router._record("primary", 0.1, ok=False)
+    router._record("fallback", 0.5, ok=True)
+    assert router.candidates() == ["fallback", "primary"]
+
+    # the same samples, recorded long enough ago to have expired
+    router = ModelRouter(["primary", "fallback"], max_age=30)
+    router._record("primary", 0.1, ok=False, now=time.monotonic() - 60)
+    router._record("fallback", 0.5, ok=True)
+    assert router.candidates() == ["primary", "fallback"]
+
+    stats = {item.model: item for item in router.stats()}
+    assert (stats["primary"].requests, stats["primary"].errors, stats["primary"].error_rate) == (1, 1, 0.0)
+
+
+@mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _no_retry_delay)
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_only_the_last_candidate_is_retried(respx_mock: MockRouter) -> None:
+    seen = _mock_chat(respx_mock, {"gpt-4o": 503, "gpt-4o-mini": 503})
+    router = ModelRouter(["gpt-4o", "gpt-4o-mini"])
+
+    with AIMLAPI(api_key="test", base_url=AIML_BASE_URL, max_retries=2) as client:
+        with pytest.raises(Exception) as exc_info:
+            router.create(client.chat.completions.create, messages=MESSAGES)
+
+    assert getattr(exc_info.value, "status_code", None) == 503
+    assert seen == ["gpt-4o", "gpt-4o-mini", "gpt-4o-mini", "gpt-4o-mini"]
+
+
+def test_rejects_plain_callables() -> None:
+    router = ModelRouter(["gpt-4o"])
+
+    with pytest.raises(TypeError, match="bound SDK method"):
+        router.create(lambda **_: None)
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+async def test_async_fallback(respx_mock: MockRouter) -> None:
+    seen = _mock_chat(respx_mock, {"gpt-4o": 429})
+    router = ModelRouter(["gpt-4o", "gpt-4o-mini"])
+
+    async with AsyncAIMLAPI(api_key="test", base_url=AIML_BASE_URL, max_retries=0) as client:
+        completion = await router.acreate(client.chat.completions.create, messages=MESSAGES)
+
+    assert completion.model == "gpt-4o-mini"
+    assert seen == ["gpt-4o", "gpt-4o-mini"]
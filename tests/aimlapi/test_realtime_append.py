@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import base64
+import asyncio
+import threading
+from typing import Any, List, Iterator
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+from aimlapi import AIMLAPI, AsyncAIMLAPI
+from aimlapi.resources.realtime import AsyncRealtimeConnection
+from aimlapi.resources.realtime.realtime import _pcm_view, _AppendFrame
+
+PCM = bytes(range(256)) * 19
+
+
+class FakeWebsocket:
+    def __init__(self) -> None:
+        self.sent: List[Any] = []
+
+    async def send(self, message: Any, text: bool | None = None) -> None:
+        assert text is True
+        # the frame buffer is reused, so keep a copy like the websocket framing does
+        self.sent.append(bytes(message))
+
+
+def _decoded(frame: bytes) -> Any:
+    return json.loads(frame)
+
+
+async def test_append_audio_matches_generic_event() -> None:
+    websocket = FakeWebsocket()
+    connection = AsyncRealtimeConnection(websocket)  # type: ignore[arg-type]
+
+    await connection.append_audio(PCM)
+
+    assert _decoded(websocket.sent[0]) == {
+        "type": "input_audio_buffer.append",
+        "audio": base64.b64encode(PCM).decode(),
+    }
+
+
+async def test_append_audio_reuses_frame_for_different_sizes() -> None:
+    websocket = FakeWebsocket()
+    connection = AsyncRealtimeConnection(websocket)  # type: ignore[arg-type]
+
+    chunks = [PCM, PCM[:10], b"", PCM[:4801]]
+    for chunk in chunks:
+        await connection.append_audio(chunk)
+
+    assert [base64.b64decode(_decoded(frame)["audio"]) for frame in websocket.sent] == chunks
+
+
+async def test_append_audio_with_event_id() -> None:
+    websocket = FakeWebsocket()
+    connection = AsyncRealtimeConnection(websocket)  # type: ignore[arg-type]
+
+    await connection.append_audio(b"\x00\x01", event_id='evt "1"')
+
+    assert _decoded(websocket.sent[0]) == {
+        "type": "input_audio_buffer.append",
+        "event_id": 'evt "1"',
+        "audio": "AAE=",
+    }
+
+
+def test_pcm_view_accepts_buffers_and_arrays() -> None:
+    samples = np.arange(-4, 4, dtype=np.int16)
+
+    assert _pcm_view(samples).tobytes() == samples.tobytes()
+    assert _pcm_view(memoryview(PCM)[3:9]).tobytes() == PCM[3:9]
+    # non contiguous arrays are copied in C order
+    assert _pcm_view(samples[::2]).tobytes() == samples[::2].tobytes()
+    assert _pcm_view(samples.reshape(2, 4)).tobytes() == samples.tobytes()
+
+
+def test_pcm_view_rejects_float_samples() -> None:
+    with pytest.raises(TypeError, match="16-bit"):
+        _pcm_view(np.zeros(4, dtype=np.float32))
+
+
+def test_append_frame_shrinks_to_the_current_payload() -> None:
+    frame = _AppendFrame()
+
+    frame.build(memoryview(PCM))
+    small = bytes(frame.build(memoryview(b"ab")))
+
+    assert json.loads(small)["audio"] == "YWI="
+
+
+@contextmanager
+def _serve_websocket() -> Iterator[tuple[str, List[str]]]:
+    from websockets.sync.server import serve
+
+    received: List[str] = []
+
+    def handler(websocket: Any) -> None:
+        for message in websocket:
+            received.append(message)
+
+    with serve(handler, "127.0.0.1", 0) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        host, port = server.socket.getsockname()[:2]
+        try:
+            yield f"ws://{host}:{port}", received
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def test_sync_append_audio_over_websocket() -> None:
+    with _serve_websocket() as (url, received):
+        client = AIMLAPI(api_key="test", websocket_base_url=url)
+        with client.realtime.connect(model="gpt-realtime") as connection:
+            connection.append_audio(PCM[:960])
+            connection.input_audio_buffer.commit()
+
+    assert [json.loads(message)["type"] for message in received] == [
+        "input_audio_buffer.append",
+        "input_audio_buffer.commit",
+    ]
+    # sent as text frames, like every other event
+    assert isinstance(received[0], str)
+    assert base64.b64decode(json.loads(received[0])["audio"]) == PCM[:960]
+
+
+async def test_async_append_audio_over_websocket() -> None:
+    with _serve_websocket() as (url, received):
+        client = AsyncAIMLAPI(api_key="test", websocket_base_url=url)
+        async with client.realtime.connect(model="gpt-realtime") as connection:
+            await asyncio.gather(*(connection.append_audio(PCM[i : i + 480]) for i in range(0, 960, 480)))
+
+    assert sorted(base64.b64decode(json.loads(message)["audio"]) for message in received) == sorted(
+        [PCM[:480], PCM[480:960]]
+    )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import copy
+import json
+import base64
+import pickle
+from typing import Any, Dict
+
+import pytest
+
+from openai.types.realtime import (
+    RealtimeErrorEvent,
+    SessionCreatedEvent,
+    ResponseTextDeltaEvent,
+    ResponseAudioDeltaEvent,
+)
+from aimlapi.resources.realtime import AudioDeltaEvent, AsyncRealtimeConnection, event_type
+from aimlapi.resources.realtime._events import parse_server_event
+from openai.resources.realtime.realtime import AsyncRealtimeConnection as OpenAIAsyncRealtimeConnection
+
+AUDIO = bytes(range(256)) * 10
+
+AUDIO_DELTA: Dict[str, Any] = {
+    "type": "response.output_audio.delta",
+    "event_id": "event_1",
+    "response_id": "resp_1",
+    "item_id": "item_1",
+    "output_index": 0,
+    "content_index": 0,
+    "delta": base64.b64encode(AUDIO).decode(),
+}
+
+EVENTS = [
+    AUDIO_DELTA,
+    {**AUDIO_DELTA, "type": "response.output_text.delta", "delta": 'Hel"lo'},
+    {
+        "type": "session.created",
+        "event_id": "event_2",
+        "session": {"type": "realtime", "id": "sess_1", "output_modalities": ["audio"]},
+    },
+    {"type": "error", "event_id": "event_3", "error": {"type": "invalid_request_error", "message": "bad"}},
+    {"type": "some.future.event", "event_id": "event_4", "payload": {"a": 1}},
+]
+
+
+def _frame(value: Dict[str, Any]) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+@pytest.mark.parametrize("value", EVENTS, ids=[event["type"] for event in EVENTS])
+def test_parse_event_matches_generic_parser(value: Dict[str, Any]) -> None:
+    generic = OpenAIAsyncRealtimeConnection(None).parse_event(_frame(value))  # type: ignore[arg-type]
+    fast = AsyncRealtimeConnection(None).parse_event(_frame(value))
+
+    assert isinstance(fast, type(generic))
+    assert fast.to_dict() == generic.to_dict()
+
+
+def test_parse_event_builds_concrete_models() -> None:
+    assert isinstance(parse_server_event(_frame(EVENTS[1])), ResponseTextDeltaEvent)
+    assert isinstance(parse_server_event(_frame(EVENTS[2])), SessionCreatedEvent)
+    assert isinstance(parse_server_event(_frame(EVENTS[3])), RealtimeErrorEvent)
+
+
+def test_audio_delta_decodes_lazily() -> None:
+    event = parse_server_event(_frame(AUDIO_DELTA))
+
+    assert isinstance(event, AudioDeltaEvent)
+    assert isinstance(event, ResponseAudioDeltaEvent)
+    assert "audio_bytes" not in event.__dict__
+
+    assert event.audio_bytes == AUDIO
+    assert event.audio_bytes is event.audio_bytes
+    # the cached audio isn't part of the serialised event
+    assert event.to_dict() == AUDIO_DELTA
+
+
+def test_audio_delta_can_be_copied_after_decoding() -> None:
+    event = parse_server_event(_frame(AUDIO_DELTA))
+    assert isinstance(event, AudioDeltaEvent)
+    assert event.audio_bytes == AUDIO
+
+    for clone in (copy.deepcopy(event), pickle.loads(pickle.dumps(event))):
+        assert clone.audio_bytes == AUDIO
+        assert clone.to_dict() == AUDIO_DELTA
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        # `type` after the payload
+        json.dumps({k: AUDIO_DELTA[k] for k in reversed(list(AUDIO_DELTA))}),
+        # spaces around separators
+        json.dumps(AUDIO_DELTA),
+        # escaped slashes in the base64 payload
+        _frame(AUDIO_DELTA).decode().replace("/", "\\/"),
+    ],
+    ids=["type-last", "spaced", "escaped"],
+)
+def test_audio_delta_fallbacks(frame: str) -> None:
+    event = parse_server_event(frame)
+
+    assert isinstance(event, AudioDeltaEvent)
+    assert event.audio_bytes == AUDIO
+
+
+def test_event_type() -> None:
+    assert event_type(_frame(AUDIO_DELTA)) == "response.output_audio.delta"
+    assert event_type('{"event_id": "event_1", "type": "response.done", "response": {}}') == "response.done"
+    # only answered when it can be read without parsing nested values
+    assert event_type('{"response": {"type": "x"}, "type": "response.done"}') is None
+    assert event_type(b"[]") is None
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, AsyncIterator
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+
+from aimlapi import AsyncAIMLAPI
+from aimlapi.resources.realtime import RealtimeSession, RealtimeSessionPool
+
+DELTAS = 5
+
+
+class StandInServer:
+    """A local stand-in for the realtime endpoint.
+
+    Every connection gets a `session.created` event and every `response.create` is
+    answered with a few text deltas and a `response.done`.
+    """
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.received: List[List[Dict[str, Any]]] = []
+        # connection numbers to drop without a close frame once they get `response.create`
+        self.drop: set[int] = set()
+        self.flood = 0
+
+    async def handler(self, websocket: Any) -> None:
+        self.connections += 1
+        number = self.connections
+        received: List[Dict[str, Any]] = []
+        self.received.append(received)
+
+        await websocket.send(
+            json.dumps({"type": "session.created", "event_id": "e", "session": {"id": f"sess_{number}"}})
+        )
+        for i in range(self.flood):
+            await websocket.send(
+                json.dumps({"type": "response.output_text.delta", "event_id": f"f{i}", "delta": str(i)})
+            )
+
+        async for message in websocket:
+            event = json.loads(message)
+            received.append(event)
+            if event["type"] == "conversation.item.create":
+                item = {"id": f"item_{len(received)}", **event["item"]}
+                await websocket.send(json.dumps({"type": "conversation.item.done", "event_id": "e", "item": item}))
+            elif event["type"] == "response.create":
+                if number in self.drop:
+                    websocket.transport.abort()
+                    return
+                for i in range(DELTAS):
+                    await websocket.send(
+                        json.dumps({"type": "response.output_text.delta", "event_id": "e", "delta": str(i)})
+                    )
+                await websocket.send(json.dumps({"type": "response.done", "event_id": "e", "response": {}}))
+
+
+@asynccontextmanager
+async def _serve() -> AsyncIterator[tuple[StandInServer, AsyncAIMLAPI]]:
+    from websockets.asyncio.server import serve
+
+    server = StandInServer()
+    async with serve(server.handler, "127.0.0.1", 0) as websocket_server:
+        host, port = next(iter(websocket_server.sockets)).getsockname()[:2]
+        client = AsyncAIMLAPI(api_key="test", websocket_base_url=f"ws://{host}:{port}")
+        yield server, client
+
+
+async def _read_response(session: RealtimeSession) -> List[str]:
+    deltas: List[str] = []
+    async for event in session:
+        if event.type == "response.output_text.delta":
+            deltas.append(event.delta)
+        elif event.type == "response.done":
+            break
+    return deltas
+
+
+async def test_load_many_concurrent_sessions() -> None:
+    sessions_count = 100
+
+    async with _serve() as (server, client):
+        async with client.realtime.session_pool(model="gpt-realtime") as pool:
+            sessions = [await pool.open() for _ in range(sessions_count)]
+            results: Dict[int, List[str]] = {}
+
+            async def converse(index: int, session: RealtimeSession) -> None:
+                await session.response.create()
+                results[index] = await _read_response(session)
+
+            async with anyio.create_task_group() as tg:
+                for index, session in enumerate(sessions):
+                    tg.start_soon(converse, index, session)
+
+            stats = pool.stats()
+
+    assert server.connections == sessions_count
+    assert all(deltas == [str(i) for i in range(DELTAS)] for deltas in results.values())
+    assert len(results) == sessions_count
+
+    assert sorted(s.session_id for s in stats) == sorted(f"sess_{i + 1}" for i in range(sessions_count))
+    for session_stats in stats:
+        assert session_stats.responses == 1
+        assert session_stats.mean_time_to_first_delta is not None
+        assert 0 < session_stats.mean_time_to_first_delta <= session_stats.max_time_to_first_delta  # type: ignore[operator]
+        # session.created, the deltas and response.done
+        assert session_stats.events_received == DELTAS + 2
+
+
+async def test_queue_is_bounded() -> None:
+    async with _serve() as (server, client):
+        server.flood = 50
+        async with client.realtime.session_pool(model="gpt-realtime", max_queue=4) as pool:
+            session = await pool.open()
+
+            # the reader stops once the queue is full instead of draining the socket
+            with anyio.fail_after(5):
+                while session.stats().queued < 4:
+                    await anyio.sleep(0.01)
+            await anyio.sleep(0.05)
+            assert session.stats().queued == 4
+            assert session.stats().events_received <= 5
+
+            deltas: List[str] = []
+            while len(deltas) < server.flood:
+                event = await session.recv()
+                if event.type == "response.output_text.delta":
+                    deltas.append(event.delta)
+
+    assert deltas == [str(i) for i in range(server.flood)]
+
+
+async def test_reconnect_resumes_the_conversation() -> None:
+    async with _serve() as (server, client):
+        server.drop = {1}
+        async with client.realtime.session_pool(model="gpt-realtime", reconnect_backoff=0.01) as pool:
+            session = await pool.open()
+            await session.session.update(session={"type": "realtime", "instructions": "Be brief."})
+            await session.conversation.item.create(
+                item={"type": "message", "role": "user", "content": [{"type": "input_text", "text": "hi"}]}
+            )
+            with anyio.fail_after(5):
+                async for event in session:
+                    if event.type == "conversation.item.done":
+                        break
+
+            # the first connection is dropped without a close frame when the response starts
+            await session.response.create()
+            with anyio.fail_after(5):
+                while session.stats().reconnects == 0:
+                    await anyio.sleep(0.01)
+
+            await session.response.create()
+            with anyio.fail_after(5):
+                deltas = await _read_response(session)
+            stats = session.stats()
+
+    assert deltas == [str(i) for i in range(DELTAS)]
+    assert server.connections == 2
+    assert stats.reconnects == 1
+    assert stats.session_id == "sess_2"
+
+    # the session configuration and the finished items are replayed on the new connection
+    resumed = server.received[1]
+    assert [event["type"] for event in resumed] == ["session.update", "conversation.item.create", "response.create"]
+    assert resumed[0]["session"]["instructions"] == "Be brief."
+    assert resumed[1]["item"]["id"] == "item_2"
+    assert resumed[1]["item"]["content"] == [{"type": "input_text", "text": "hi"}]
+
+
+async def test_connection_errors_surface_without_reconnects() -> None:
+    from websockets.exceptions import ConnectionClosedError
+
+    async with _serve() as (server, client):
+        server.drop = {1}
+        async with client.realtime.session_pool(model="gpt-realtime", reconnect_attempts=0) as pool:
+            session = await pool.open()
+            await session.response.create()
+
+            with pytest.raises(ConnectionClosedError), anyio.fail_after(5):
+                async for _ in session:
+                    pass
+
+            # sends fail the same way instead of waiting for a reconnect
+            with pytest.raises(ConnectionClosedError):
+                await session.response.create()
+
+            assert pool.sessions == [session]
+            await session.close()
+            assert pool.sessions == []
+
+
+async def test_reader_failure_ends_only_its_session() -> None:
+    async with _serve() as (_, client):
+        async with client.realtime.session_pool(model="gpt-realtime") as pool:
+            broken, healthy = await pool.open(), await pool.open()
+
+            def fail(_frame: bytes) -> None:
+                raise RuntimeError("reader failed")
+
+            broken._socket._observe_received = fail  # type: ignore[method-assign]
+            await broken.response.create()
+            with pytest.raises(RuntimeError, match="reader failed"), anyio.fail_after(5):
+                async for _ in broken:
+                    pass
+
+            await healthy.response.create()
+            with anyio.fail_after(5):
+                assert await _read_response(healthy) == [str(i) for i in range(DELTAS)]
+
+
+async def test_close_ends_iteration() -> None:
+    async with _serve() as (_, client):
+        async with client.realtime.session_pool(model="gpt-realtime") as pool:
+            session = await pool.open()
+            assert pool.sessions == [session]
+
+            await session.close()
+            assert pool.sessions == []
+            with anyio.fail_after(5):
+                assert [event async for event in session] == []
+
+
+async def test_open_requires_the_pool_context() -> None:
+    client = AsyncAIMLAPI(api_key="test")
+    pool = client.realtime.session_pool(model="gpt-realtime")
+
+    assert isinstance(pool, RealtimeSessionPool)
+    with pytest.raises(RuntimeError, match="session_pool"):
+        await pool.open()
+
+    with pytest.raises(ValueError, match="max_queue"):
+        client.realtime.session_pool(max_queue=0)
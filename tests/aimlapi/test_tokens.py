@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import base64
+from typing import Any, Dict, List
+from pathlib import Path
+
+import pytest
+
+from aimlapi import TokenEstimator
+from aimlapi._tokens import BPETokenizer, _MappedRanks, _split_pattern, encoding_for_model
+
+# single bytes followed by a few merges, enough to tokenize "hello world"
+MERGES = [b"he", b"ll", b"hell", b"hello", b" w", b"or", b" wor", b" world"]
+
+
+def _write_vocab(directory: Path, name: str = "o200k_base") -> Path:
+    lines = [base64.b64encode(bytes([i])).decode() + f" {i}" for i in range(256)]
+    lines += [base64.b64encode(token).decode() + f" {256 + i}" for i, token in enumerate(MERGES)]
+    path = directory / f"{name}.tiktoken"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def estimator(tmp_path: Path) -> TokenEstimator:
+    _write_vocab(tmp_path)
+    return TokenEstimator(vocab_dir=tmp_path, use_tiktoken=False)
+
+
+@pytest.mark.parametrize(
+    "model, encoding",
+    [
+        ("gpt-4o-mini", "o200k_base"),
+        ("openai/gpt-5-chat-latest", "o200k_base"),
+        ("o3-mini", "o200k_base"),
+        ("gpt-4-turbo", "cl100k_base"),
+        ("gpt-3.5-turbo", "cl100k_base"),
+        ("claude-3-5-sonnet-latest", None),
+        (None, None),
+    ],
+)
+def test_encoding_for_model(model: str | None, encoding: str | None) -> None:
+    assert encoding_for_model(model) == encoding
+
+
+def test_bpe_merges_by_rank(tmp_path: Path) -> None:
+    tokenizer = BPETokenizer(_write_vocab(tmp_path))
+
+    assert tokenizer.count("hello world") == 2
+    # "help" -> "hell" is not reachable, so "he" + "l" + "p"
+    assert tokenizer.count("help") == 3
+    assert tokenizer.count("") == 0
+
+
+def test_vocab_is_loaded_lazily(tmp_path: Path) -> None:
+    tokenizer = BPETokenizer(_write_vocab(tmp_path))
+    assert tokenizer._ranks is None
+
+    tokenizer.count("hello")
+    assert tokenizer._ranks is not None
+    assert len(tokenizer._ranks) == 256 + len(MERGES)
+    # only the tokens looked up so far have had their ranks decoded
+    assert 0 < len(tokenizer._ranks._cache) < 256
+    assert tokenizer._ranks.get(b" world") == 256 + MERGES.index(b" world")
+    assert b"xyz" not in tokenizer._ranks
+
+
+def test_rank_cache_keeps_only_recent_hits(tmp_path: Path) -> None:
+    ranks = _MappedRanks(_write_vocab(tmp_path), cache_size=4)
+
+    assert [ranks.get(token) for token in MERGES] == [256 + i for i in range(len(MERGES))]
+    assert ranks.get(b"xyz") is None
+    assert ranks.get(b"") is None
+    assert list(ranks._cache) == MERGES[-4:]
+
+
+def test_count_text_uses_vocab_for_known_models(estimator: TokenEstimator) -> None:
+    pytest.importorskip("regex")
+
+    assert estimator.is_exact("gpt-4o")
+    assert estimator.count_text("hello world", model="gpt-4o") == 2
+
+    # no cl100k vocabulary in the directory, so this falls back to the heuristic
+    assert not estimator.is_exact("gpt-4")
+    assert not estimator.is_exact("mistralai/Mistral-7B-Instruct-v0.2")
+
+
+def test_vocab_without_regex_is_not_exact(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("aimlapi._tokens._split_pattern", lambda _encoding: None)
+    _write_vocab(tmp_path)
+    estimator = TokenEstimator(vocab_dir=tmp_path, use_tiktoken=False)
+
+    # the vocabulary is still used, but text is split with the approximate pre-tokenizer
+    assert not estimator.is_exact("gpt-4o")
+    assert estimator.count_text("hello world", model="gpt-4o") == 2
+
+
+@pytest.mark.parametrize(
+    "encoding, text, pieces",
+    [
+        ("cl100k_base", "I don't know 12345", ["I", " don", "'t", " know", " ", "123", "45"]),
+        ("o200k_base", "I don't know 12345", ["I", " don't", " know", " ", "123", "45"]),
+        ("o200k_base", "HTTPServer", ["HTTPServer"]),
+    ],
+)
+def test_split_patterns(encoding: str, text: str, pieces: List[str]) -> None:
+    pytest.importorskip("regex")
+
+    assert _split_pattern(encoding).findall(text) == pieces
+
+
+def test_vocab_dir_from_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("regex")
+    _write_vocab(tmp_path)
+    monkeypatch.setenv("AIMLAPI_TOKENIZER_DIR", str(tmp_path))
+
+    assert TokenEstimator(use_tiktoken=False).is_exact("gpt-4o")
+
+
+def test_tiktoken_is_only_used_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    loaded: List[str] = []
+
+    class Encoder:
+        def encode(self, text: str, **_kwargs: Any) -> List[int]:
+            return [0] * len(text)
+
+    def load_tiktoken(encoding: str) -> Encoder:
+        loaded.append(encoding)
+        return Encoder()
+
+    monkeypatch.setattr("aimlapi._tokens._load_tiktoken", load_tiktoken)
+    monkeypatch.delenv("AIMLAPI_TOKENIZER_DIR", raising=False)
+
+    # offline by default, tiktoken could download the vocabulary
+    assert not TokenEstimator().is_exact("gpt-4o")
+    assert loaded == []
+
+    estimator = TokenEstimator(use_tiktoken=True)
+    assert estimator.count_text("hello", model="gpt-4o") == 5
+    assert estimator.count_text("hi", model="gpt-4o") == 2
+    assert loaded == ["o200k_base"]
+
+
+def test_heuristic_count() -> None:
+    estimator = TokenEstimator(use_tiktoken=False)
+
+    assert estimator.count_text("") == 0
+    assert estimator.count_text("The quick brown fox jumps over the lazy dog.") == 10
+    assert estimator.count_text("internationalization") > 1
+    assert estimator.count_text("你好世界") == 4
+
+
+def test_count_messages(estimator: TokenEstimator) -> None:
+    messages = [
+        {"role": "user", "content": "hello world"},
+        {"role": "assistant", "content": "hello", "name": "bot"},
+    ]
+
+    # priming + per message overhead + role + content (+ name)
+    count = estimator.count_messages(messages, model="gpt-4o")
+    expected = 3 + (3 + estimator.count_text("user", model="gpt-4o") + 2)
+    expected += (
+        3 + estimator.count_text("assistant", model="gpt-4o") + 1 + 1 + estimator.count_text("bot", model="gpt-4o")
+    )
+    assert count == expected
+
+
+def test_count_messages_with_parts_and_tools() -> None:
+    estimator = TokenEstimator(use_tiktoken=False)
+    text_only = estimator.count_messages([{"role": "user", "content": [{"type": "text", "text": "describe"}]}])
+    with_image = estimator.count_messages(
+        [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "describe"},
+                    {"type": "image_url", "image_url": {"url": "https://example.com/a.png", "detail": "low"}},
+                ],
+            }
+        ]
+    )
+    assert with_image - text_only == 85
+
+    tools: List[Dict[str, Any]] = [{"type": "function", "function": {"name": "get_weather", "parameters": {}}}]
+    with_tools = estimator.count_messages(
+        [{"role": "user", "content": [{"type": "text", "text": "describe"}]}], tools=tools
+    )
+    assert with_tools > text_only
+
+
+def test_count_input_matches_messages() -> None:
+    estimator = TokenEstimator(use_tiktoken=False)
+
+    assert estimator.count_input("hi there") == estimator.count_messages([{"role": "user", "content": "hi there"}])
+    assert estimator.count_input(
+        [{"role": "user", "content": [{"type": "input_text", "text": "hi there"}]}],
+        instructions="Be brief.",
+    ) == estimator.count_messages(
+        [{"role": "developer", "content": "Be brief."}, {"role": "user", "content": "hi there"}]
+    )
+
+
+def test_per_message_counts_are_cached(estimator: TokenEstimator, monkeypatch: pytest.MonkeyPatch) -> None:
+    conversation = [{"role": "user", "content": "hello world"}]
+    first = estimator.count_messages(conversation, model="gpt-4o")
+
+    calls: List[str] = []
+    count_text = estimator.count_text
+
+    def counting(text: str, *, model: str | None = None) -> int:
+        calls.append(text)
+        return count_text(text, model=model)
+
+    monkeypatch.setattr(estimator, "count_text", counting)
+    conversation.append({"role": "assistant", "content": "hello"})
+    second = estimator.count_messages(conversation, model="gpt-4o")
+
+    # only the new message is tokenized
+    assert calls == ["assistant", "hello"]
+    assert second > first
+
+
+def test_cache_is_bounded() -> None:
+    estimator = TokenEstimator(use_tiktoken=False, cache_size=2)
+    estimator.count_many([[{"role": "user", "content": str(i)}] for i in range(5)])
+
+    assert len(estimator._cache) == 2
+
+
+def test_count_many(estimator: TokenEstimator) -> None:
+    conversations = [
+        [{"role": "user", "content": "hello"}],
+        [{"role": "user", "content": "hello world"}],
+    ]
+
+    assert estimator.count_many(conversations, model="gpt-4o") == [
+        estimator.count_messages(conversation, model="gpt-4o") for conversation in conversations
+    ]
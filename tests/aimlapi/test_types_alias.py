@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import openai.types.chat
+import openai.types.responses
+
+
+def test_submodules_are_the_openai_modules() -> None:
+    import aimlapi.types.chat
+    import aimlapi.types.responses
+    import aimlapi.types.chat.chat_completion
+
+    assert aimlapi.types.chat is openai.types.chat
+    assert aimlapi.types.responses is openai.types.responses
+    assert sys.modules["aimlapi.types.chat.chat_completion"] is sys.modules["openai.types.chat.chat_completion"]
+
+    # the aliased modules keep their own identity
+    assert openai.types.chat.__name__ == "openai.types.chat"
+    assert openai.types.chat.__spec__ is not None
+    assert openai.types.chat.__spec__.name == "openai.types.chat"
+
+
+def test_classes_are_shared() -> None:
+    from openai.types.chat import ChatCompletionMessage as OpenAIChatCompletionMessage
+    from aimlapi.types.chat import ChatCompletionMessage
+    from aimlapi.types.responses.response import Response
+
+    assert ChatCompletionMessage is OpenAIChatCompletionMessage
+    assert isinstance(OpenAIChatCompletionMessage.construct(role="assistant"), ChatCompletionMessage)
+    assert Response is openai.types.responses.Response
+
+
+def test_missing_submodule() -> None:
+    with pytest.raises(ModuleNotFoundError, match="aimlapi.types.does_not_exist"):
+        import aimlapi.types.does_not_exist  # noqa: F401
+
+
+def test_no_duplicate_modules() -> None:
+    script = (
+        "import sys, aimlapi.types.responses\n"
+        "extra = [n for n, m in sys.modules.items() if n.startswith('aimlapi.types.')"
+        " and m is not sys.modules.get('openai' + n[len('aimlapi'):])]\n"
+        "print(len(extra))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "0"
+
+
+def test_stubs_cover_every_submodule() -> None:
+    # type checkers can't follow the import hook, so each aliased module has a re-export stub
+    openai_types = Path(openai.types.__file__).parent
+    aimlapi_types = Path(__file__).parents[2] / "src" / "aimlapi" / "types"
+
+    for source in openai_types.rglob("*.py"):
+        rel_path = source.relative_to(openai_types)
+        if rel_path == Path("__init__.py"):
+            continue
+
+        parts = rel_path.parent.parts if source.name == "__init__.py" else rel_path.with_suffix("").parts
+        stub = aimlapi_types / rel_path.with_suffix(".pyi")
+        assert stub.read_text() == f"from openai.types.{'.'.join(parts)} import *  # noqa: F401, F403\n"
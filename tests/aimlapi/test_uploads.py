@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from .conftest import AIML_BASE_URL
+
+FILE_OBJECT = {
+    "id": "file_1",
+    "object": "file",
+    "bytes": 11,
+    "created_at": 0,
+    "filename": "batch.jsonl",
+    "purpose": "batch",
+    "status": "uploaded",
+}
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_upload_file_chunked_streams_file_to_files(aiml_client, respx_mock: MockRouter, tmp_path) -> None:
+    path = tmp_path / "batch.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n\n')
+    route = respx_mock.post("/files").mock(return_value=httpx.Response(200, json=FILE_OBJECT))
+
+    upload = aiml_client.uploads.upload_file_chunked(file=path, mime_type="application/jsonl", purpose="batch")
+
+    assert upload.id == "file_1"
+    assert upload.status == "completed"
+    assert upload.file is not None and upload.file.filename == "batch.jsonl"
+
+    request = route.calls[0].request
+    assert request.headers["content-type"].startswith("multipart/form-data; boundary=")
+    body = request.read()
+    assert b'filename="batch.jsonl"' in body
+    assert b"Content-Type: application/jsonl" in body
+    assert b'{"a": 1}\n\n\n' in body
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_upload_file_chunked_requires_filename_for_bytes(aiml_client) -> None:
+    with pytest.raises(TypeError, match="filename"):
+        aiml_client.uploads.upload_file_chunked(file=b"data", mime_type="text/plain", purpose="batch")
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from aimlapi import AIMLAPI, AsyncAIMLAPI
+
+from .helpers import LocalServer
+from .conftest import AIML_BASE_URL
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_warmup_sends_head_requests(aiml_client: AIMLAPI, respx_mock: MockRouter) -> None:
+    route = respx_mock.head("/").mock(return_value=httpx.Response(404))
+
+    assert aiml_client.warmup(connections=3) == 3
+    assert route.call_count == 3
+    assert "Authorization" not in route.calls.last.request.headers
+
+
+@pytest.mark.respx(base_url=AIML_BASE_URL)
+def test_warmup_reports_failed_connections(aiml_client: AIMLAPI, respx_mock: MockRouter) -> None:
+    respx_mock.head("/").mock(side_effect=httpx.ConnectError("boom"))
+
+    assert aiml_client.warmup(connections=2) == 0
+
+
+def test_warmup_rejects_invalid_connections(aiml_client: AIMLAPI) -> None:
+    with pytest.raises(ValueError, match="connections"):
+        aiml_client.warmup(connections=0)
+
+
+def test_warmup_keeps_connections_for_later_requests(local_server: LocalServer) -> None:
+    with AIMLAPI(api_key="test", base_url=local_server.base_url) as client:
+        assert client.warmup(connections=4) == 4
+        warmed = local_server.connections
+        assert 1 <= warmed <= 4
+
+        client.models.list()
+        assert local_server.connections == warmed
+
+
+async def test_async_warmup_keeps_connections_for_later_requests(local_server: LocalServer) -> None:
+    async with AsyncAIMLAPI(api_key="test", base_url=local_server.base_url) as client:
+        assert await client.warmup(connections=4) == 4
+        assert local_server.connections == 4
+
+        await client.models.list()
+        assert local_server.connections == 4
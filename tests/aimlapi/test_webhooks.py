@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hmac
+import json
+import base64
+import hashlib
+from typing import Dict, Union, Iterator
+from unittest import mock
+
+import pytest
+
+from aimlapi import AIMLAPI, AsyncAIMLAPI, InvalidWebhookSignatureError
+from aimlapi.resources.webhooks import WebhookVerifier
+
+TEST_SECRET = "whsec_RdvaYFYUXuIFuEbvZHwMfYFhUf7aMYjYcmM24+Aj40c="
+TEST_PAYLOAD = '{"id": "evt_685c059ae3a481909bdc86819b066fb6", "object": "event", "created_at": 1750861210, "type": "response.completed", "data": {"id": "resp_123"}}'
+TEST_TIMESTAMP = 1750861210
+TEST_WEBHOOK_ID = "wh_685c059ae39c8190af8c71ed1022a24d"
+TEST_SIGNATURE = "v1,gUAg4R2hWouRZqRQG4uJypNS8YK885G838+EHb4nKBY="
+
+
+def _sign(payload: Union[str, bytes], webhook_id: str, timestamp: int = TEST_TIMESTAMP) -> Dict[str, str]:
+    body = payload if isinstance(payload, bytes) else payload.encode()
+    digest = hmac.new(base64.b64decode(TEST_SECRET[6:]), f"{webhook_id}.{timestamp}.".encode() + body, hashlib.sha256)
+    return {
+        "webhook-signature": f"v1,{base64.b64encode(digest.digest()).decode()}",
+        "webhook-timestamp": str(timestamp),
+        "webhook-id": webhook_id,
+    }
+
+
+@pytest.fixture(autouse=True)
+def _frozen_time() -> Iterator[None]:
+    with mock.patch("time.time", mock.MagicMock(return_value=TEST_TIMESTAMP)):
+        yield
+
+
+def test_verifier_matches_verify_signature() -> None:
+    client = AIMLAPI(api_key="test", webhook_secret=TEST_SECRET)
+    headers = {
+        "webhook-signature": TEST_SIGNATURE,
+        "webhook-timestamp": str(TEST_TIMESTAMP),
+        "webhook-id": TEST_WEBHOOK_ID,
+    }
+
+    client.webhooks.verify_signature(TEST_PAYLOAD, headers)
+    event = client.webhooks.verifier().unwrap(TEST_PAYLOAD.encode(), headers)
+
+    assert event.id == "evt_685c059ae3a481909bdc86819b066fb6"
+    assert event.type == "response.completed"
+    WebhookVerifier(TEST_SECRET).verify(TEST_PAYLOAD, headers)
+
+    with pytest.raises(InvalidWebhookSignatureError, match="does not match"):
+        WebhookVerifier("whsec_" + base64.b64encode(b"other").decode()).verify(TEST_PAYLOAD, headers)
+    with pytest.raises(InvalidWebhookSignatureError, match="does not match"):
+        WebhookVerifier(TEST_SECRET).verify(TEST_PAYLOAD + " ", headers)
+
+
+def test_signatures_are_computed_over_the_raw_bytes() -> None:
+    # not valid UTF-8, so it can't be decoded to a string first
+    payload = b'{"id": "evt_1", "note": "\xff"}'
+    verifier = WebhookVerifier(TEST_SECRET)
+
+    verifier.verify(payload, _sign(payload, "wh_1"))
+
+    headers = _sign(payload, "wh_2")
+    headers["webhook-signature"] = f"v1,invalid {headers['webhook-signature']}"
+    verifier.verify(payload, headers)
+
+
+def test_timestamps_are_checked() -> None:
+    verifier = WebhookVerifier(TEST_SECRET, tolerance=10)
+
+    with pytest.raises(InvalidWebhookSignatureError, match="too old"):
+        verifier.verify(TEST_PAYLOAD, _sign(TEST_PAYLOAD, "wh_1", TEST_TIMESTAMP - 11))
+    with pytest.raises(InvalidWebhookSignatureError, match="too new"):
+        verifier.verify(TEST_PAYLOAD, _sign(TEST_PAYLOAD, "wh_1", TEST_TIMESTAMP + 11))
+
+    headers = _sign(TEST_PAYLOAD, "wh_1")
+    headers["webhook-timestamp"] = "soon"
+    with pytest.raises(InvalidWebhookSignatureError, match="timestamp format"):
+        verifier.verify(TEST_PAYLOAD, headers)
+
+    del headers["webhook-id"]
+    with pytest.raises(ValueError, match="webhook-id"):
+        verifier.verify(TEST_PAYLOAD, headers)
+
+
+def test_replays_are_rejected() -> None:
+    verifier = WebhookVerifier(TEST_SECRET, replay_cache_size=2)
+    first = _sign(TEST_PAYLOAD, "wh_1")
+
+    verifier.verify(TEST_PAYLOAD, first)
+    with pytest.raises(InvalidWebhookSignatureError, match="wh_1 has already been received"):
+        verifier.verify(TEST_PAYLOAD, first)
+
+    # a delivery that fails verification isn't remembered
+    with pytest.raises(InvalidWebhookSignatureError, match="does not match"):
+        verifier.verify(TEST_PAYLOAD + " ", _sign(TEST_PAYLOAD, "wh_2"))
+    verifier.verify(TEST_PAYLOAD, _sign(TEST_PAYLOAD, "wh_2"))
+
+    # the cache is bounded, the oldest id is forgotten first
+    verifier.verify(TEST_PAYLOAD, _sign(TEST_PAYLOAD, "wh_3"))
+    verifier.verify(TEST_PAYLOAD, first)
+
+    disabled = WebhookVerifier(TEST_SECRET, replay_cache_size=0)
+    disabled.verify(TEST_PAYLOAD, first)
+    disabled.verify(TEST_PAYLOAD, first)
+
+
+def test_replay_cache_drops_expired_ids() -> None:
+    verifier = WebhookVerifier(TEST_SECRET, tolerance=10)
+    verifier.verify(TEST_PAYLOAD, _sign(TEST_PAYLOAD, "wh_1"))
+
+    with mock.patch("time.time", mock.MagicMock(return_value=TEST_TIMESTAMP + 20)):
+        verifier.verify(TEST_PAYLOAD, _sign(TEST_PAYLOAD, "wh_2", TEST_TIMESTAMP + 20))
+
+    assert list(verifier._seen) == ["wh_2"]
+
+
+def test_batches() -> None:
+    verifier = WebhookVerifier(TEST_SECRET)
+    payloads = [
+        json.dumps(
+            {"id": f"evt_{i}", "object": "event", "created_at": 1, "type": "batch.completed", "data": {"id": "b"}}
+        )
+        for i in range(3)
+    ]
+    requests = [(payload, _sign(payload, f"wh_{i}")) for i, payload in enumerate(payloads)]
+    requests[1] = (payloads[1] + " ", requests[1][1])
+
+    results = verifier.unwrap_many(requests)
+
+    assert [getattr(result, "id", None) for result in results] == ["evt_0", None, "evt_2"]
+    assert isinstance(results[1], InvalidWebhookSignatureError)
+
+    errors = verifier.verify_many(requests)
+    assert [str(error) for error in errors] == [
+        "Webhook wh_0 has already been received",
+        "The given webhook signature does not match the expected signature",
+        "Webhook wh_2 has already been received",
+    ]
+
+
+def test_verifier_requires_a_secret() -> None:
+    with pytest.raises(ValueError, match="webhook secret"):
+        AsyncAIMLAPI(api_key="test").webhooks.verifier()
+
+    verifier = AsyncAIMLAPI(api_key="test").webhooks.verifier(secret=TEST_SECRET, tolerance=5)
+    assert verifier.tolerance == 5
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import random
+from typing import Any, List, Tuple, cast
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from openai.lib._validators import Remediation, get_validators, read_any_format
+from openai.lib._chunked_validators import read_chunks, validate_chunks
+
+from .utils import random_rows
+
+
+def summarize(remediation: Remediation) -> Tuple[Any, ...]:
+    return (
+        remediation.name,
+        remediation.immediate_msg,
+        remediation.necessary_msg,
+        remediation.optional_msg,
+        remediation.error_msg,
+        remediation.necessary_fn is None,
+        remediation.optional_fn is None,
+    )
+
+
+def validate_in_memory(fname: str) -> Tuple[List[Tuple[Any, ...]], Any]:
+    df, remediation = read_any_format(fname)
+    summaries = [summarize(remediation)]
+    if df is None or remediation.error_msg is not None:
+        return summaries, None
+
+    remediations: List[Remediation] = []
+    for validator in get_validators():
+        result = validator(df)
+        if result is None:
+            continue
+        summaries.append(summarize(result))
+        remediations.append(result)
+        if result.error_msg is not None:
+            return summaries, None
+        if result.necessary_fn is not None:
+            df = result.necessary_fn(df)
+
+    for result in remediations:
+        if result.optional_fn is not None:
+            df = result.optional_fn(df)
+    prepared = cast(pd.DataFrame, df[["prompt", "completion"]])
+    return summaries, prepared.reset_index(drop=True)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+
+def validate_in_chunks(fname: str, chunksize: int) -> Tuple[List[Tuple[Any, ...]], Any]:
+    chunks, remediation = read_chunks(fname, chunksize=chunksize)
+    summaries = [summarize(remediation)]
+    if chunks is None:
+        return summaries, None
+
+    remediations = validate_chunks(chunks)
+    summaries.extend(summarize(remediation) for remediation in remediations)
+    if any(remediation.error_msg is not None for remediation in remediations):
+        return summaries, None
+
+    prepared: List[pd.DataFrame] = []
+    for chunk in chunks:
+        for remediation in remediations:
+            if remediation.necessary_fn is not None:
+                chunk = remediation.necessary_fn(chunk)
+        for remediation in remediations:
+            if remediation.optional_fn is not None:
+                chunk = remediation.optional_fn(chunk)
+        prepared.append(cast(pd.DataFrame, chunk[["prompt", "completion"]]))
+    return summaries, pd.concat(prepared).reset_index(drop=True)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+
+def assert_same_results(fname: str, chunksize: int) -> None:
+    in_memory, in_memory_prepared = validate_in_memory(fname)
+    in_chunks, in_chunks_prepared = validate_in_chunks(fname, chunksize)
+
+    assert in_chunks == in_memory
+    if in_memory_prepared is None:
+        assert in_chunks_prepared is None
+    else:
+        pd.testing.assert_frame_equal(in_chunks_prepared, in_memory_prepared)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_chunked_csv_matches_in_memory(tmp_path: Path, seed: int) -> None:
+    rng = random.Random(seed)
+    fname = str(tmp_path / "data.csv")
+    columns = rng.choice([["prompt", "completion"], ["Prompt", "completion"], ["prompt", "completion", "source"]])
+    rows = [(*row, "test")[: len(columns)] for row in random_rows(rng, rng.randint(0, 40))]
+    pd.DataFrame(rows, columns=columns).to_csv(fname, index=False)  # pyright: ignore[reportUnknownMemberType]
+
+    assert_same_results(fname, chunksize=rng.randint(1, 7))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_chunked_jsonl_matches_in_memory(tmp_path: Path, seed: int) -> None:
+    rng = random.Random(seed)
+    fname = tmp_path / "data.jsonl"
+    with fname.open("w") as f:
+        for prompt, completion in random_rows(rng, rng.randint(2, 40)):
+            example = {"prompt": prompt, "completion": completion}
+            if rng.random() < 0.1:
+                example["source"] = "test"
+            f.write(json.dumps(example) + "\n")
+
+    assert_same_results(str(fname), chunksize=rng.randint(1, 7))
+
+
+def test_columns_first_seen_in_a_later_chunk(tmp_path: Path) -> None:
+    fname = tmp_path / "data.jsonl"
+    examples = [{"Prompt": f"question {i} ->", "completion": f" answer {i % 3}"} for i in range(6)]
+    examples += [{"prompt": "late ->", "completion": " answer", "id": "7"}]
+    fname.write_text("".join(json.dumps(example) + "\n" for example in examples))
+
+    assert_same_results(str(fname), chunksize=2)
+
+
+def test_duplicates_across_chunks_are_dropped_once(tmp_path: Path) -> None:
+    fname = tmp_path / "data.csv"
+    rows = [(f"question {i % 4} ->", f" answer {i % 4}") for i in range(10)]
+    pd.DataFrame(rows, columns=["prompt", "completion"]).to_csv(fname, index=False)  # pyright: ignore[reportUnknownMemberType]
+
+    chunks, _ = read_chunks(str(fname), chunksize=3)
+    assert chunks is not None
+    duplicated_rows = next(
+        remediation for remediation in validate_chunks(chunks) if remediation.name == "duplicated_rows"
+    )
+
+    assert duplicated_rows.immediate_msg is not None
+    assert "These are rows: [4, 5, 6, 7, 8, 9]" in duplicated_rows.immediate_msg
+    assert duplicated_rows.optional_fn is not None
+    kept = [index for chunk in chunks for index in duplicated_rows.optional_fn(chunk).index.tolist()]
+    assert kept == [0, 1, 2, 3]
+
+
+def test_malformed_chunk_is_reported(tmp_path: Path) -> None:
+    fname = tmp_path / "data.jsonl"
+    fname.write_text('{"prompt": "a", "completion": " b"}\n{"prompt": "c", "completion": " d"}\n{"prompt": \n')
+
+    chunks, remediation = read_chunks(str(fname), chunksize=2)
+    assert remediation.error_msg is None
+    assert chunks is not None
+
+    remediations = validate_chunks(chunks)
+    assert [remediation.name for remediation in remediations] == ["read_any_format"]
+    assert remediations[0].error_msg == (
+        f"Your file `{fname}` does not appear to be in valid JSONL format. Please ensure your file is formatted as a valid JSONL file."
+    )
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List, Union, AsyncGenerator
+
+import httpx
+import numpy as np
+import pytest
+import numpy.typing as npt
+
+from openai.helpers import NullAudioSink, LocalAudioPlayer
+from openai.helpers._audio import PCMDecoder, RingBuffer
+from openai._legacy_response import HttpxBinaryResponseContent
+
+# no zero samples, so the audio can be told apart from the silence padding blocks
+SAMPLES = (np.arange(1, 4001, dtype=np.int16) * 7) % 30000 + 1
+PCM = SAMPLES.tobytes()
+EXPECTED = (SAMPLES.astype(np.float32) / 32767.0).reshape(-1, 1)
+
+
+def _played(sink: NullAudioSink) -> npt.NDArray[np.float32]:
+    output: npt.NDArray[np.float32] = sink.output
+    played: npt.NDArray[np.float32] = output[output != 0].reshape(-1, 1)
+    return played
+
+
+def test_pcm_decoder_handles_odd_boundaries() -> None:
+    decoder = PCMDecoder()
+    blocks = [decoder.decode(PCM[i : i + 333]) for i in range(0, len(PCM), 333)]
+
+    assert any(len(block) == 166 for block in blocks)
+    np.testing.assert_array_equal(np.concatenate(blocks), EXPECTED)
+
+    stereo = PCMDecoder(channels=2)
+    assert stereo.decode(PCM[:3]).shape == (0, 2)
+    assert stereo.decode(PCM[3:8]).shape == (2, 2)
+
+
+def test_ring_buffer_wraps_around() -> None:
+    ring = RingBuffer(5)
+    out = np.ones((3, 1), dtype=np.float32)
+
+    assert ring.write(np.arange(4, dtype=np.float32).reshape(-1, 1)) == 4
+    assert ring.read_into(out) == 3
+    assert ring.write(np.arange(10, 20, dtype=np.float32).reshape(-1, 1)) == 4
+    assert len(ring) == 5
+
+    assert ring.read_into(out) == 3
+    assert out[:, 0].tolist() == [3, 10, 11]
+    out = np.ones((4, 1), dtype=np.float32)
+    assert ring.read_into(out) == 2
+    assert out[:, 0].tolist() == [12, 13, 0, 0]
+
+    with pytest.raises(ValueError, match="frames"):
+        RingBuffer(0)
+
+
+async def test_play_stream_decodes_pcm_chunks() -> None:
+    sink = NullAudioSink(keep=True)
+
+    async def chunks() -> AsyncGenerator[Union[bytes, None], None]:
+        for i in range(0, len(PCM), 1001):
+            yield PCM[i : i + 1001]
+            await asyncio.sleep(0)
+
+    await LocalAudioPlayer(sink=sink, buffer_seconds=0.01).play_stream(chunks())
+
+    np.testing.assert_array_equal(_played(sink), EXPECTED)
+
+
+async def test_playback_starts_on_the_first_chunk() -> None:
+    sink = NullAudioSink(keep=True)
+    received_first_block = asyncio.Event()
+
+    async def chunks() -> AsyncGenerator[Union[bytes, None], None]:
+        yield PCM[:1000]
+        # the rest only arrives once the first chunk is playing
+        while sink.first_block_at is None:
+            await asyncio.sleep(0.001)
+        received_first_block.set()
+        yield PCM[1000:]
+        yield None
+        raise AssertionError("the stream is not read after `None`")
+
+    await asyncio.wait_for(LocalAudioPlayer(sink=sink).play_stream(chunks()), timeout=5)
+
+    assert received_first_block.is_set()
+    np.testing.assert_array_equal(_played(sink), EXPECTED)
+
+
+async def test_play_response_and_arrays() -> None:
+    sink = NullAudioSink(keep=True)
+    player = LocalAudioPlayer(sink=sink)
+
+    await player.play(HttpxBinaryResponseContent(httpx.Response(200, content=PCM)))
+    np.testing.assert_array_equal(_played(sink), EXPECTED)
+
+    sink = NullAudioSink(keep=True)
+    await LocalAudioPlayer(sink=sink).play(SAMPLES)
+    np.testing.assert_array_equal(_played(sink), EXPECTED)
+
+    with pytest.raises(ValueError, match="Unsupported dtype"):
+        await player.play(SAMPLES.astype(np.int32))  # type: ignore[arg-type]
+
+
+async def test_should_stop_ends_playback() -> None:
+    sink = NullAudioSink(realtime=True)
+    player = LocalAudioPlayer(should_stop=lambda: sink.blocks_played >= 2, sink=sink)
+
+    async def endless() -> AsyncGenerator[Union[bytes, None], None]:
+        while True:
+            yield PCM
+
+    await asyncio.wait_for(player.play_stream(endless()), timeout=5)
+
+    assert sink.blocks_played == 2
+
+
+async def test_stream_errors_are_raised_after_playing_what_arrived() -> None:
+    sink = NullAudioSink(keep=True)
+
+    async def failing() -> AsyncGenerator[Union[bytes, None], None]:
+        yield PCM[:1001]
+        raise RuntimeError("stream failed")
+
+    with pytest.raises(RuntimeError, match="stream failed"):
+        await LocalAudioPlayer(sink=sink).play_stream(failing())
+
+    played: List[float] = _played(sink)[:, 0].tolist()
+    assert played == EXPECTED[:500, 0].tolist()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import io
+import wave
+import asyncio
+from typing import List
+
+import numpy as np
+import pytest
+import numpy.typing as npt
+
+from openai.helpers import Microphone, SyntheticAudioSource
+
+SAMPLES = (np.arange(24_000, dtype=np.int64) % 2000 - 1000).astype(np.int16)
+
+
+async def test_record_returns_the_captured_audio() -> None:
+    microphone: Microphone[np.int16] = Microphone(source=SyntheticAudioSource(SAMPLES))
+
+    recording = await microphone.record(return_ndarray=True)
+
+    assert recording.shape == (len(SAMPLES), 1)
+    np.testing.assert_array_equal(recording[:, 0], SAMPLES)
+
+    name, wav, content_type = await Microphone(source=SyntheticAudioSource(SAMPLES)).record()  # type: ignore[misc]
+    assert (name, content_type) == ("audio.wav", "audio/wav")
+    assert isinstance(wav, io.BytesIO)
+    with wave.open(wav) as wav_file:
+        assert wav_file.getframerate() == 24_000
+        assert wav_file.readframes(wav_file.getnframes()) == SAMPLES.tobytes()
+
+
+async def test_record_stops_at_max_duration() -> None:
+    microphone: Microphone[np.int16] = Microphone(max_duration=0.25, source=SyntheticAudioSource(SAMPLES))
+
+    recording = await microphone.record(return_ndarray=True)
+
+    np.testing.assert_array_equal(recording[:, 0], SAMPLES[:6000])
+    assert microphone.dropped_frames > 0
+
+
+async def test_long_recordings_stop_at_max_duration() -> None:
+    # longer than the buffer allocated up front, which then grows up to the cap
+    samples = np.tile(SAMPLES, 25)
+    microphone: Microphone[np.int16] = Microphone(max_duration=12, source=SyntheticAudioSource(samples, blocksize=7000))
+
+    recording = await microphone.record(return_ndarray=True)
+
+    np.testing.assert_array_equal(recording[:, 0], samples[: 12 * 24_000])
+    assert microphone.dropped_frames > 0
+
+
+async def test_record_without_a_cap_keeps_all_of_the_audio() -> None:
+    # longer than the first chunk of the buffer
+    samples = np.tile(SAMPLES, 25)
+    microphone: Microphone[np.int16] = Microphone(
+        max_duration=None, source=SyntheticAudioSource(samples, blocksize=7000)
+    )
+
+    recording = await microphone.record(return_ndarray=True)
+
+    np.testing.assert_array_equal(recording[:, 0], samples)
+    assert microphone.dropped_frames == 0
+
+
+async def test_record_stops_when_should_record_is_false() -> None:
+    blocks = 0
+
+    def should_record() -> bool:
+        nonlocal blocks
+        blocks += 1
+        return blocks <= 3
+
+    microphone: Microphone[np.int16] = Microphone(
+        should_record=should_record, source=SyntheticAudioSource(SAMPLES, blocksize=100)
+    )
+    recording = await microphone.record(return_ndarray=True)
+
+    np.testing.assert_array_equal(recording[:, 0], SAMPLES[:300])
+
+
+async def test_frames_have_a_fixed_size() -> None:
+    microphone: Microphone[np.int16] = Microphone(source=SyntheticAudioSource(SAMPLES, blocksize=333))
+
+    frames: List[npt.NDArray[np.int16]] = [frame async for frame in microphone.frames(1000)]
+
+    assert [len(frame) for frame in frames] == [1000] * 24
+    np.testing.assert_array_equal(np.concatenate(frames)[:, 0], SAMPLES)
+
+    frames = [frame async for frame in microphone.frames(7000)]
+    assert [len(frame) for frame in frames] == [7000, 7000, 7000, 3000]
+
+    with pytest.raises(ValueError, match="frame_size"):
+        async for _ in microphone.frames(0):
+            pass
+
+
+async def test_frames_drop_new_audio_when_the_backlog_is_full() -> None:
+    microphone: Microphone[np.int16] = Microphone(source=SyntheticAudioSource(SAMPLES, blocksize=480))
+    frames = microphone.frames(480, max_backlog=0.1)
+
+    first = await frames.__anext__()
+    # the source runs ahead while the frames aren't read
+    await asyncio.sleep(0.2)
+    rest = [frame async for frame in frames]
+
+    received = np.concatenate([first, *rest])[:, 0]
+    assert microphone.dropped_frames > 0
+    assert len(received) + microphone.dropped_frames == len(SAMPLES)
+    np.testing.assert_array_equal(received[:2400], SAMPLES[:2400])
+
+
+async def test_frames_stream_in_realtime() -> None:
+    blocks = 0
+
+    def should_record() -> bool:
+        nonlocal blocks
+        blocks += 1
+        return blocks <= 5
+
+    # a fixed number of paced blocks rather than a wall-clock timeout, which depends on scheduling
+    microphone: Microphone[np.int16] = Microphone(
+        should_record=should_record, source=SyntheticAudioSource(SAMPLES, realtime=True)
+    )
+
+    frames = [frame async for frame in microphone.frames()]
+
+    assert [len(frame) for frame in frames] == [480] * 5
+    np.testing.assert_array_equal(np.concatenate(frames)[:, 0], SAMPLES[: 480 * 5])
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import random
+import multiprocessing
+from typing import Dict, Tuple, Optional
+from pathlib import Path
+
+import pytest
+
+from openai.cli._errors import CLIError
+from openai.cli._tools.fine_tunes import PrepareDataArgs, prepare_data
+
+from .utils import random_rows
+
+
+def run_prepare_data(
+    capsys: pytest.CaptureFixture[str], fname: Path, *, workers: int = 1, chunk_size: Optional[int] = None
+) -> Tuple[str, Dict[str, bytes]]:
+    prepare_data(PrepareDataArgs(file=str(fname), quiet=True, workers=workers, chunk_size=chunk_size))
+    out = capsys.readouterr().out
+    files: Dict[str, bytes] = {}
+    for path in sorted(fname.parent.glob("*_prepared*.jsonl")):
+        files[path.name] = path.read_bytes()
+        path.unlink()
+    # the estimate depends on the type of the index of the prepared DataFrame
+    return "\n".join(line for line in out.splitlines() if "approximately take" not in line), files
+
+
+def assert_same_output(capsys: pytest.CaptureFixture[str], fname: Path, chunk_size: int) -> None:
+    expected = run_prepare_data(capsys, fname)
+
+    assert run_prepare_data(capsys, fname, chunk_size=chunk_size) == expected
+    assert run_prepare_data(capsys, fname, workers=3, chunk_size=chunk_size) == expected
+    assert sorted(path.name for path in fname.parent.iterdir()) == [fname.name]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_prepare_data_in_parts_matches_in_memory(tmp_path: Path, capsys: pytest.CaptureFixture[str], seed: int) -> None:
+    rng = random.Random(seed)
+    fname = tmp_path / "data.jsonl"
+    with fname.open("w") as f:
+        for prompt, completion in random_rows(rng, rng.randint(2, 60)):
+            example = {"prompt": prompt, "completion": completion}
+            if rng.random() < 0.1:
+                example["source"] = "test"
+            f.write(json.dumps(example) + "\n")
+
+    assert_same_output(capsys, fname, chunk_size=rng.randint(1, 7))
+
+
+def test_classification_is_split_like_in_memory(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    rng = random.Random(0)
+    fname = tmp_path / "data.jsonl"
+    with fname.open("w") as f:
+        for i in range(1500):
+            label = rng.choice([" positive", " negative"])
+            f.write(json.dumps({"prompt": f"review {i} ->", "completion": label}) + "\n")
+
+    out, files = run_prepare_data(capsys, fname)
+    assert list(files) == ["data_prepared_train.jsonl", "data_prepared_valid.jsonl"]
+    assert "--classification_positive_class" in out
+
+    assert_same_output(capsys, fname, chunk_size=100)
+
+
+def test_prepare_data_in_spawned_processes(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # the start method of macOS and Windows, the work of a part has to be pickled to it
+    monkeypatch.setattr(multiprocessing, "Pool", multiprocessing.get_context("spawn").Pool)
+    rng = random.Random(0)
+    fname = tmp_path / "data.jsonl"
+    with fname.open("w") as f:
+        for prompt, completion in random_rows(rng, 40):
+            f.write(json.dumps({"Prompt": prompt, "completion": completion, "source": "test"}) + "\n")
+
+    expected = run_prepare_data(capsys, fname)
+    assert run_prepare_data(capsys, fname, workers=2, chunk_size=7) == expected
+
+
+def test_csv_is_prepared_in_chunks(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    fname = tmp_path / "data.csv"
+    rows = [f"Question {i % 7}?,Answer {i % 5}" for i in range(30)]
+    fname.write_text("prompt,completion\n" + "\n".join(rows) + "\n")
+
+    assert_same_output(capsys, fname, chunk_size=4)
+
+
+@pytest.mark.parametrize(
+    "workers, chunk_size, message", [(0, None, "--workers"), (1, 0, "--chunk-size"), (2, -5, "--chunk-size")]
+)
+def test_prepare_data_rejects_invalid_parts(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], workers: int, chunk_size: Optional[int], message: str
+) -> None:
+    fname = tmp_path / "data.jsonl"
+    fname.write_text(json.dumps({"prompt": "a ->", "completion": " b"}) + "\n")
+
+    with pytest.raises(CLIError, match=message):
+        run_prepare_data(capsys, fname, workers=workers, chunk_size=chunk_size)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [fname.name]
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import hashlib
+import threading
+from typing import List
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI, BadRequestError
+
+base_url = "http://127.0.0.1:4010"
+
+UPLOAD = {
+    "id": "upload_1",
+    "object": "upload",
+    "bytes": 10,
+    "created_at": 0,
+    "expires_at": 0,
+    "filename": "data.jsonl",
+    "purpose": "batch",
+    "status": "pending",
+}
+
+CONTENT = b"0123456789"
+
+
+def _mock_upload_routes(respx_mock: MockRouter) -> tuple[dict[str, bytes], list[dict[str, object]]]:
+    received: dict[str, bytes] = {}
+    completed: list[dict[str, object]] = []
+    lock = threading.Lock()
+
+    def create_part(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        with lock:
+            part_id = f"part_{len(received) + 1}"
+            received[part_id] = _part_payload(body)
+        return httpx.Response(
+            200, json={"id": part_id, "object": "upload.part", "created_at": 0, "upload_id": "upload_1"}
+        )
+
+    def complete(request: httpx.Request) -> httpx.Response:
+        completed.append(json.loads(request.read()))
+        return httpx.Response(200, json={**UPLOAD, "status": "completed"})
+
+    respx_mock.post("/uploads").mock(return_value=httpx.Response(200, json=UPLOAD))
+    respx_mock.post("/uploads/upload_1/parts").mock(side_effect=create_part)
+    respx_mock.post("/uploads/upload_1/complete").mock(side_effect=complete)
+    return received, completed
+
+
+def _part_payload(body: bytes) -> bytes:
+    for chunk in (b"0123", b"4567", b"89"):
+        if b"\r\n\r\n" + chunk + b"\r\n" in body:
+            return chunk
+    raise AssertionError("part payload not found")
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_upload_file_chunked_parallel_keeps_part_order(respx_mock: MockRouter, tmp_path: Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(CONTENT)
+    received, completed = _mock_upload_routes(respx_mock)
+
+    with OpenAI(base_url=base_url, api_key="My API Key") as client:
+        upload = client.uploads.upload_file_chunked(
+            file=path,
+            mime_type="application/jsonl",
+            purpose="batch",
+            part_size=4,
+            max_concurrency=3,
+            compute_md5=True,
+        )
+
+    assert upload.status == "completed"
+    assert [received[part_id] for part_id in completed[0]["part_ids"]] == [b"0123", b"4567", b"89"]  # type: ignore[union-attr]
+    assert completed[0]["md5"] == hashlib.md5(CONTENT).hexdigest()
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_upload_file_chunked_sequential_part_ids(respx_mock: MockRouter) -> None:
+    received, completed = _mock_upload_routes(respx_mock)
+
+    with OpenAI(base_url=base_url, api_key="My API Key") as client:
+        client.uploads.upload_file_chunked(
+            file=CONTENT,
+            filename="data.jsonl",
+            bytes=len(CONTENT),
+            mime_type="application/jsonl",
+            purpose="batch",
+            part_size=4,
+        )
+
+    assert completed[0]["part_ids"] == ["part_1", "part_2", "part_3"]
+    assert [received[part_id] for part_id in completed[0]["part_ids"]] == [b"0123", b"4567", b"89"]  # type: ignore[union-attr]
+    assert "md5" not in completed[0]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_upload_file_chunked_parallel(respx_mock: MockRouter, tmp_path: Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(CONTENT)
+    received, completed = _mock_upload_routes(respx_mock)
+
+    async with AsyncOpenAI(base_url=base_url, api_key="My API Key") as client:
+        await client.uploads.upload_file_chunked(
+            file=path,
+            mime_type="application/jsonl",
+            purpose="batch",
+            part_size=4,
+            max_concurrency=2,
+            compute_md5=True,
+        )
+
+    assert [received[part_id] for part_id in completed[0]["part_ids"]] == [b"0123", b"4567", b"89"]  # type: ignore[union-attr]
+    assert completed[0]["md5"] == hashlib.md5(CONTENT).hexdigest()
+
+
+def test_upload_file_chunked_rejects_invalid_concurrency() -> None:
+    with OpenAI(base_url=base_url, api_key="My API Key") as client:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            client.uploads.upload_file_chunked(
+                file=CONTENT,
+                filename="data.jsonl",
+                bytes=10,
+                mime_type="text/plain",
+                purpose="batch",
+                max_concurrency=0,
+            )
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_files_create_streams_path(respx_mock: MockRouter, tmp_path: Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(CONTENT)
+    requests: List[httpx.Request] = []
+
+    def create_file(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "id": "file_1",
+                "object": "file",
+                "bytes": 10,
+                "created_at": 0,
+                "filename": "data.jsonl",
+                "purpose": "batch",
+                "status": "uploaded",
+            },
+        )
+
+    respx_mock.post("/files").mock(side_effect=create_file)
+
+    async with AsyncOpenAI(base_url=base_url, api_key="My API Key") as client:
+        file = await client.files.create(file=path, purpose="batch")
+
+    assert file.id == "file_1"
+    body = requests[0].content
+    assert b'filename="data.jsonl"' in body
+    assert CONTENT in body
+    assert int(requests[0].headers["content-length"]) == len(body)
+
+
+@pytest.mark.respx(base_url=base_url)
+@pytest.mark.parametrize("max_concurrency", [1, 2])
+async def test_async_upload_file_chunked_raises_part_errors(respx_mock: MockRouter, max_concurrency: int) -> None:
+    respx_mock.post("/uploads").mock(return_value=httpx.Response(200, json=UPLOAD))
+    parts = respx_mock.post("/uploads/upload_1/parts").mock(
+        return_value=httpx.Response(400, json={"error": {"message": "bad part"}})
+    )
+
+    async with AsyncOpenAI(base_url=base_url, api_key="My API Key", max_retries=0) as client:
+        with pytest.raises(BadRequestError, match="bad part"):
+            await client.uploads.upload_file_chunked(
+                file=CONTENT,
+                filename="data.jsonl",
+                bytes=len(CONTENT),
+                mime_type="application/jsonl",
+                purpose="batch",
+                part_size=4,
+                max_concurrency=max_concurrency,
+            )
+
+    # complete() is never called, respx would reject the unmocked request
+    assert parts.call_count <= max_concurrency + 1
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import random
 import inspect
-from typing import Any, Iterable
+from typing import Any, List, Tuple, Iterable
 from typing_extensions import TypeAlias
 
 import pytest
@@ -38,6 +39,23 @@ def print_obj(obj: object, monkeypatch: pytest.MonkeyPatch) -> str:
         return clear_locals(string, stacklevel=2)
 
 
+def random_rows(rng: random.Random, count: int) -> List[Tuple[str, str]]:
+    """Prompts and completions of a fine-tuning dataset, with the quirks its validators look for"""
+    words = ["alpha", "Beta", "GAMMA", "délta", "\n", "->", "END", ".", "ß"]
+    prefix = rng.choice(["", "Classify this: "])
+    suffix = rng.choice(["", " ->", "\n\n###\n\n"])
+    rows: List[Tuple[str, str]] = []
+    for _ in range(count):
+        prompt = prefix + " ".join(rng.choice(words) for _ in range(rng.randint(0, 4))) + suffix
+        completion = rng.choice(["", " yes", " no", " " + rng.choice(words) + " END", "maybe END"])
+        if rows and rng.random() < 0.1:
+            prompt, completion = rng.choice(rows)
+        if rng.random() < 0.05:
+            prompt += "x" * 10_000
+        rows.append((prompt, completion))
+    return rows
+
+
 def get_caller_name(*, stacklevel: int = 1) -> str:
     frame = inspect.currentframe()
     assert frame is not None
@@ -1,10 +1,22 @@
+import io
+from typing import List, Iterable, AsyncGenerator, cast
 from pathlib import Path
 
 import anyio
+import httpx
 import pytest
-from dirty_equals import IsDict, IsList, IsBytes, IsTuple
+from dirty_equals import IsDict, IsList, IsTuple, IsInstance
 
-from openai._files import to_httpx_files, async_to_httpx_files
+import openai
+from openai._files import (
+    UPLOAD_CHUNK_SIZE,
+    LazyFileReader,
+    AsyncFileStream,
+    UploadBufferBudget,
+    to_httpx_files,
+    async_to_httpx_files,
+    set_upload_buffer_limit,
+)
 
 readme_path = Path(__file__).parent.parent.joinpath("README.md")
 
@@ -12,34 +24,111 @@ readme_path = Path(__file__).parent.parent.joinpath("README.md")
 def test_pathlib_includes_file_name() -> None:
     result = to_httpx_files({"file": readme_path})
     print(result)
-    assert result == IsDict({"file": IsTuple("README.md", IsBytes())})
+    assert result == IsDict({"file": IsTuple("README.md", IsInstance(io.BufferedReader))})
 
 
 def test_tuple_input() -> None:
     result = to_httpx_files([("file", readme_path)])
     print(result)
-    assert result == IsList(IsTuple("file", IsTuple("README.md", IsBytes())))
+    assert result == IsList(IsTuple("file", IsTuple("README.md", IsInstance(io.BufferedReader))))
+
+
+def test_lazy_file_reader_streams_and_rewinds() -> None:
+    reader = LazyFileReader(readme_path)
+    expected = readme_path.read_bytes()
+
+    assert reader.seek(0, 2) == len(expected)
+    reader.seek(0)
+    assert reader._file is None
+
+    chunks: List[bytes] = []
+    while chunk := reader.read(1024):
+        chunks.append(chunk)
+    assert b"".join(chunks) == expected
+    assert reader._file is None
+
+    reader.seek(0)
+    assert reader.read(10) == expected[:10]
+    reader.close()
+    assert reader._file is None
 
 
 @pytest.mark.asyncio
 async def test_async_pathlib_includes_file_name() -> None:
     result = await async_to_httpx_files({"file": readme_path})
     print(result)
-    assert result == IsDict({"file": IsTuple("README.md", IsBytes())})
+    assert result == IsDict({"file": IsTuple("README.md", IsInstance(io.BufferedReader))})
 
 
 @pytest.mark.asyncio
 async def test_async_supports_anyio_path() -> None:
     result = await async_to_httpx_files({"file": anyio.Path(readme_path)})
     print(result)
-    assert result == IsDict({"file": IsTuple("README.md", IsBytes())})
+    assert result == IsDict({"file": IsTuple("README.md", IsInstance(io.BufferedReader))})
 
 
 @pytest.mark.asyncio
 async def test_async_tuple_input() -> None:
     result = await async_to_httpx_files([("file", readme_path)])
     print(result)
-    assert result == IsList(IsTuple("file", IsTuple("README.md", IsBytes())))
+    assert result == IsList(IsTuple("file", IsTuple("README.md", IsInstance(io.BufferedReader))))
+
+
+@pytest.mark.asyncio
+async def test_async_file_stream_matches_sync_multipart_body() -> None:
+    request = httpx.Request("POST", "https://example.com", files=to_httpx_files({"file": readme_path}))
+    expected = b"".join(request.stream)  # type: ignore[arg-type]
+
+    budget = UploadBufferBudget(UPLOAD_CHUNK_SIZE)
+    chunks = [chunk async for chunk in AsyncFileStream(request.stream, budget=budget)]  # type: ignore[arg-type]
+
+    assert b"".join(chunks) == expected
+    assert readme_path.read_bytes() in expected
+
+
+def test_upload_buffer_budget_is_per_event_loop() -> None:
+    expected = readme_path.read_bytes()
+    budget = UploadBufferBudget(UPLOAD_CHUNK_SIZE)
+
+    async def upload() -> bytes:
+        stream = httpx.Request("POST", "https://example.com", files=to_httpx_files({"file": readme_path})).stream
+        return b"".join([chunk async for chunk in AsyncFileStream(stream, budget=budget)])  # type: ignore[arg-type]
+
+    # the same budget works across loops and backends
+    assert expected in anyio.run(upload, backend="asyncio")
+    assert expected in anyio.run(upload, backend="trio")
+
+
+@pytest.mark.asyncio
+async def test_async_file_stream_holds_slot_until_next_chunk() -> None:
+    budget = UploadBufferBudget(UPLOAD_CHUNK_SIZE)
+    first = _iter_body(budget)
+    await first.__anext__()
+
+    # the only slot is held by the chunk the first body has not sent yet
+    with pytest.raises(TimeoutError):
+        with anyio.fail_after(0.1):
+            await _iter_body(budget).__anext__()
+
+    await first.aclose()
+    second = _iter_body(budget)
+    with anyio.fail_after(1):
+        await second.__anext__()
+    await second.aclose()
+
+
+def _iter_body(budget: UploadBufferBudget) -> AsyncGenerator[bytes, None]:
+    stream = httpx.Request("POST", "https://example.com", files=to_httpx_files({"file": readme_path})).stream
+    return cast(AsyncGenerator[bytes, None], AsyncFileStream(cast(Iterable[bytes], stream), budget=budget).__aiter__())
+
+
+def test_public_upload_buffer_limit() -> None:
+    assert openai.set_upload_buffer_limit is set_upload_buffer_limit
+
+
+def test_upload_buffer_budget_rejects_tiny_limits() -> None:
+    with pytest.raises(ValueError, match="max_bytes"):
+        UploadBufferBudget(1)
 
 
 def test_string_not_allowed() -> None:
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import anyio
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI
+from openai.pagination import SyncCursorPage, AsyncCursorPage
+
+base_url = "http://127.0.0.1:4010"
+
+PAGES = {
+    None: ["file_1", "file_2"],
+    "file_2": ["file_3", "file_4"],
+    "file_4": ["file_5"],
+}
+
+
+def _file(file_id: str) -> dict[str, object]:
+    return {
+        "id": file_id,
+        "object": "file",
+        "bytes": 1,
+        "created_at": 0,
+        "filename": f"{file_id}.jsonl",
+        "purpose": "batch",
+        "status": "uploaded",
+    }
+
+
+def _list_files(request: httpx.Request) -> httpx.Response:
+    ids = PAGES[request.url.params.get("after")]
+    return httpx.Response(
+        200,
+        json={"object": "list", "data": [_file(i) for i in ids], "has_more": ids[-1] != "file_5"},
+    )
+
+
+@pytest.mark.respx(base_url=base_url)
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_pages_prefetch(respx_mock: MockRouter, prefetch: int) -> None:
+    respx_mock.get("/files").mock(side_effect=_list_files)
+
+    with OpenAI(base_url=base_url, api_key="My API Key") as client:
+        pages = list(client.files.list().iter_pages(prefetch=prefetch))
+
+    assert [[f.id for f in page.data] for page in pages] == list(PAGES.values())
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_iter_pages_prefetch_stops_early(respx_mock: MockRouter) -> None:
+    respx_mock.get("/files").mock(side_effect=_list_files)
+
+    with OpenAI(base_url=base_url, api_key="My API Key") as client:
+        for page in client.files.list().iter_pages(prefetch=1):
+            assert page.data[0].id == "file_1"
+            break
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_iter_pages_prefetch_overlaps_first_page(respx_mock: MockRouter) -> None:
+    second_requested = threading.Event()
+
+    def list_files(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("after") == "file_2":
+            second_requested.set()
+        return _list_files(request)
+
+    respx_mock.get("/files").mock(side_effect=list_files)
+
+    with OpenAI(base_url=base_url, api_key="My API Key") as client:
+        pages = client.files.list().iter_pages(prefetch=1)
+        assert next(pages).data[0].id == "file_1"
+        # the next page is requested while the caller still holds the first one
+        assert second_requested.wait(timeout=5)
+        pages.close()  # type: ignore[attr-defined]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_iter_pages_prefetch_propagates_errors(respx_mock: MockRouter) -> None:
+    respx_mock.get("/files", params={"after": "file_2"}).mock(return_value=httpx.Response(400, json={}))
+    respx_mock.get("/files").mock(side_effect=_list_files)
+
+    with OpenAI(base_url=base_url, api_key="My API Key", max_retries=0) as client:
+        pages = client.files.list().iter_pages(prefetch=2)
+        assert next(pages).data[0].id == "file_1"
+        with pytest.raises(Exception, match="400"):
+            next(pages)
+
+
+@pytest.mark.respx(base_url=base_url)
+@pytest.mark.parametrize("prefetch", [0, 2])
+async def test_async_iter_pages_prefetch(respx_mock: MockRouter, prefetch: int) -> None:
+    respx_mock.get("/files").mock(side_effect=_list_files)
+
+    async with AsyncOpenAI(base_url=base_url, api_key="My API Key") as client:
+        first_page = await client.files.list()
+        async with first_page.iter_pages(prefetch=prefetch) as iterator:
+            pages = [page async for page in iterator]
+
+    assert [[f.id for f in page.data] for page in pages] == list(PAGES.values())
+
+
+@pytest.mark.respx(base_url=base_url)
+@pytest.mark.parametrize("prefetch", [0, 1])
+def test_iter_items_prefetch(respx_mock: MockRouter, prefetch: int) -> None:
+    respx_mock.get("/files").mock(side_effect=_list_files)
+
+    with OpenAI(base_url=base_url, api_key="My API Key") as client:
+        ids = [f.id for f in client.files.list().iter_items(prefetch=prefetch)]
+
+    assert ids == [file_id for page in PAGES.values() for file_id in page]
+
+
+@pytest.mark.respx(base_url=base_url)
+@pytest.mark.parametrize("prefetch", [0, 2])
+async def test_async_paginator_iter_items_prefetch(respx_mock: MockRouter, prefetch: int) -> None:
+    respx_mock.get("/files").mock(side_effect=_list_files)
+
+    async with AsyncOpenAI(base_url=base_url, api_key="My API Key") as client:
+        async with client.files.list().iter_items(prefetch=prefetch) as files:
+            ids = [f.id async for f in files]
+
+    assert ids == [file_id for page in PAGES.values() for file_id in page]
+
+
+def test_async_iter_pages_prefetch_on_trio(respx_mock: MockRouter) -> None:
+    respx_mock.get(f"{base_url}/files").mock(side_effect=_list_files)
+
+    async def list_pages() -> list[list[str]]:
+        async with AsyncOpenAI(base_url=base_url, api_key="My API Key") as client:
+            async with client.files.list().iter_pages(prefetch=1) as pages:
+                return [[f.id for f in page.data] async for page in pages]
+
+    assert anyio.run(list_pages, backend="trio") == list(PAGES.values())
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_iter_pages_prefetch_requires_async_with(respx_mock: MockRouter) -> None:
+    respx_mock.get("/files").mock(side_effect=_list_files)
+
+    async with AsyncOpenAI(base_url=base_url, api_key="My API Key") as client:
+        first_page = await client.files.list()
+        with pytest.raises(RuntimeError, match="async with"):
+            await first_page.iter_pages(prefetch=1).__anext__()
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_iter_pages_prefetch_overlaps_first_page(respx_mock: MockRouter) -> None:
+    second_requested = asyncio.Event()
+
+    def list_files(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("after") == "file_2":
+            second_requested.set()
+        return _list_files(request)
+
+    respx_mock.get("/files").mock(side_effect=list_files)
+
+    async with AsyncOpenAI(base_url=base_url, api_key="My API Key") as client:
+        first_page = await client.files.list()
+        async with first_page.iter_pages(prefetch=1) as pages:
+            assert (await pages.__anext__()).data[0].id == "file_1"
+            # the next page is requested while the caller still holds the first one
+            await asyncio.wait_for(second_requested.wait(), timeout=5)
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_iter_pages_prefetch_cancels_request_when_left_early(respx_mock: MockRouter) -> None:
+    cancelled = asyncio.Event()
+
+    async def list_files(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("after") == "file_2":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return _list_files(request)
+
+    respx_mock.get("/files").mock(side_effect=list_files)
+
+    async with AsyncOpenAI(base_url=base_url, api_key="My API Key") as client:
+        first_page = await client.files.list()
+        async with first_page.iter_pages(prefetch=1) as pages:
+            async for page in pages:
+                assert page.data[0].id == "file_1"
+                await asyncio.sleep(0.05)
+                break
+
+        # the request for the second page did not outlive the block
+        assert cancelled.is_set()
+
+
+def test_iter_pages_rejects_negative_prefetch() -> None:
+    # raised by the call itself rather than once iteration starts, for both clients
+    sync_page = SyncCursorPage[object].construct(data=[])
+    async_page = AsyncCursorPage[object].construct(data=[])
+    with pytest.raises(ValueError, match="prefetch"):
+        sync_page.iter_pages(prefetch=-1)
+    with pytest.raises(ValueError, match="prefetch"):
+        sync_page.iter_items(prefetch=-1)
+    with pytest.raises(ValueError, match="prefetch"):
+        async_page.iter_pages(prefetch=-1)
+    with pytest.raises(ValueError, match="prefetch"):
+        async_page.iter_items(prefetch=-1)